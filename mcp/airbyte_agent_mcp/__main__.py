@@ -1,25 +1,139 @@
 """Entry point for running airbyte-agent-mcp server."""
 
-import sys
+import argparse
 
+from airbyte_agent_mcp.catalog import DEFAULT_CATALOG_LOAD_TIMEOUT
+from airbyte_agent_mcp.concurrency import DEFAULT_MAX_IN_FLIGHT, DEFAULT_MAX_QUEUED
+from airbyte_agent_mcp.registry_client import DEFAULT_CACHE_DIR, DEFAULT_REGISTRY_TTL
+from airbyte_agent_mcp.result_store import DEFAULT_MAX_MEMORY_BYTES
 from airbyte_agent_mcp.server import run_server
+from airbyte_agent_mcp.workers import DEFAULT_GRACEFUL_TIMEOUT
 
 
-def main():
-    """Main entry point."""
-    # Support optional command-line arguments
-    config_path = "configured_connectors.yaml"
-    dotenv_path = ".env"
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="airbyte-agent-mcp",
+        description="MCP server that exposes Airbyte connectors as MCP tools.",
+    )
+    parser.add_argument("config_path", nargs="?", default="configured_connectors.yaml", help="Path to configured_connectors.yaml")
+    parser.add_argument("dotenv_path", nargs="?", default=".env", help="Path to the .env file with connector secrets")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default="stdio",
+        help="stdio serves the spawning client; http (streamable HTTP) and sse serve many clients (default: stdio)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on for http/sse (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on for http/sse (default: 8000)")
+    parser.add_argument("--path", default=None, help="URL path of the MCP endpoint for http/sse (default: /mcp)")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Tool calls running at once (default: {DEFAULT_MAX_IN_FLIGHT})",
+    )
+    parser.add_argument(
+        "--max-queued",
+        type=int,
+        default=DEFAULT_MAX_QUEUED,
+        help=f"Tool calls waiting for a slot before new calls get a busy error (default: {DEFAULT_MAX_QUEUED})",
+    )
+    parser.add_argument("--queue-timeout", type=float, default=None, help="Seconds a tool call may wait for a slot (default: no limit)")
+    parser.add_argument("--no-uvloop", action="store_true", help="Use the default asyncio event loop even if uvloop is installed")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes sharing one socket, http transport only (default: 1)")
+    parser.add_argument(
+        "--max-worker-memory-mb",
+        type=float,
+        default=None,
+        help="Replace a worker whose resident memory exceeds this many MiB (default: no limit)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=DEFAULT_GRACEFUL_TIMEOUT,
+        help=f"Seconds a stopping worker gets to finish in-flight requests (default: {DEFAULT_GRACEFUL_TIMEOUT:.0f})",
+    )
+    parser.add_argument(
+        "--drain-delay",
+        type=float,
+        default=0.0,
+        help="Seconds a stopping worker keeps serving with /readyz failing, so load balancers stop routing to it (default: 0)",
+    )
+    parser.add_argument(
+        "--result-store-mb",
+        type=float,
+        default=DEFAULT_MAX_MEMORY_BYTES / (1024 * 1024),
+        help=f"Memory for truncated results kept for fetch_result; older ones spill to disk (default: {DEFAULT_MAX_MEMORY_BYTES // (1024 * 1024)})",
+    )
+    parser.add_argument(
+        "--catalog-timeout",
+        type=float,
+        default=DEFAULT_CATALOG_LOAD_TIMEOUT,
+        help=f"Seconds one connector may take to load at startup; slower ones load on first use (default: {DEFAULT_CATALOG_LOAD_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Create every connector's executor before accepting tool calls, so the first call doesn't pay for it",
+    )
+    parser.add_argument(
+        "--warmup-connect",
+        action="store_true",
+        help="With warm-up, also open a keep-alive connection (DNS and TLS) to each connector's API; implies --warmup",
+    )
+    parser.add_argument(
+        "--registry-cache-dir",
+        default=None,
+        help=f"Persistent cache of registry.json and downloaded connector definitions (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--registry-ttl",
+        type=float,
+        default=DEFAULT_REGISTRY_TTL,
+        help=f"Seconds registry.json is used before it is revalidated (default: {DEFAULT_REGISTRY_TTL:g})",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never contact the registry; serve registry connectors from the cache (pin versions to be safe)",
+    )
+    return parser
+
 
-    # Simple argument parsing
-    args = sys.argv[1:]
-    if len(args) >= 1:
-        config_path = args[0]
-    if len(args) >= 2:
-        dotenv_path = args[1]
+def main(argv: list[str] | None = None):
+    """Main entry point."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.transport != "http":
+        parser.error("--workers needs --transport http")
 
     # Run the server
-    run_server(config_path, dotenv_path)
+    run_server(
+        args.config_path,
+        args.dotenv_path,
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+        path=args.path,
+        max_in_flight=args.max_in_flight,
+        max_queued=args.max_queued,
+        queue_timeout=args.queue_timeout,
+        use_uvloop=not args.no_uvloop,
+        workers=args.workers,
+        max_worker_memory_mb=args.max_worker_memory_mb,
+        graceful_timeout=args.graceful_timeout,
+        drain_delay=args.drain_delay,
+        result_store_mb=args.result_store_mb,
+        catalog_timeout=args.catalog_timeout,
+        warmup=args.warmup,
+        warmup_connect=args.warmup_connect,
+        registry_cache_dir=args.registry_cache_dir,
+        registry_ttl=args.registry_ttl,
+        offline=args.offline,
+    )
 
 
 if __name__ == "__main__":
@@ -18,6 +18,8 @@ from .executor import (
     ExecutorProtocol,
     ExecutionConfig,
     ExecutionResult,
+    BatchResult,
+    BatchStats,
     ExecutorError,
     EntityNotFoundError,
     ActionNotSupportedError,
@@ -37,6 +39,7 @@ from .exceptions import (
     TimeoutError,
 )
 from .utils import save_download
+from .mirror import LocalMirror, MirrorQueryResult
 
 __version__ = SDK_VERSION
 
@@ -49,6 +52,8 @@ __all__ = [
     # Execution Config and Result Types
     "ExecutionConfig",
     "ExecutionResult",
+    "BatchResult",
+    "BatchStats",
     # Types
     "ConnectorConfig",
     "Action",
@@ -79,4 +84,7 @@ __all__ = [
     "instrument",
     # Utilities
     "save_download",
+    # Local mirror
+    "LocalMirror",
+    "MirrorQueryResult",
 ]
@@ -347,6 +347,13 @@ def convert_openapi_to_connector_config(spec: OpenAPIConnector) -> ConnectorConf
                 response_schema=response_schema,
                 graphql_body=graphql_body,
                 file_field=file_field,
+                batch_read=operation.x_airbyte_batch_read,
+                batch_write=operation.x_airbyte_batch_write,
+                relationships=operation.x_airbyte_relationships,
+                pagination=operation.x_airbyte_pagination,
+                sharding=operation.x_airbyte_sharding,
+                incremental=operation.x_airbyte_incremental,
+                filters=operation.x_airbyte_filters,
             )
 
             # Add to entities map
@@ -662,11 +669,20 @@ def _parse_auth_from_openapi(spec: OpenAPIConnector) -> AuthConfig:
     )
 
 
+_CONFIG_CACHE: dict[Path, tuple[int, int, ConnectorConfig]] = {}
+"""Parsed configs by resolved path, with the (mtime_ns, size) they were parsed at."""
+
+
 def load_connector_config(config_path: str | Path) -> ConnectorConfig:
     """Load connector configuration from YAML file.
 
     Supports both OpenAPI 3.1 format and legacy format.
 
+    Parsed configs are cached per file and re-parsed when its mtime or size
+    changes, so every executor for a connector shares one definition (and
+    worker processes forked after loading share its memory). Treat the
+    returned config as read-only.
+
     Args:
         config_path: Path to connector.yaml file
 
@@ -682,6 +698,18 @@ def load_connector_config(config_path: str | Path) -> ConnectorConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Connector config not found: {config_path}")
 
+    stat = config_path.stat()
+    key = config_path.resolve()
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    config = _parse_connector_config(config_path)
+    _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def _parse_connector_config(config_path: Path) -> ConnectorConfig:
     # Load YAML with error handling
     try:
         with open(config_path) as f:
@@ -36,6 +36,33 @@ DEFAULT_POOL_TIMEOUT = 5.0
 DEFAULT_REQUEST_TIMEOUT = 30.0
 """Default overall request timeout (seconds)."""
 
+DEFAULT_HOSTED_REQUEST_TIMEOUT = 300.0
+"""Default timeout for hosted executor calls, which run the whole operation server-side (seconds)."""
+
+DEFAULT_HOSTED_BATCH_SIZE = 100
+"""Maximum number of operations sent in one hosted batch execute request."""
+
+DEFAULT_GZIP_MIN_BYTES = 1024
+"""Request bodies at least this large are gzip-compressed when compression is enabled."""
+
+DEFAULT_BATCH_CONCURRENCY = 10
+"""Default maximum number of operations in flight for one batch."""
+
+DEFAULT_GRAPHQL_BATCH_WINDOW_MS = 5.0
+"""How long concurrent GraphQL queries are collected before being sent as one document (ms)."""
+
+DEFAULT_GRAPHQL_BATCH_MAX_SIZE = 25
+"""Maximum number of GraphQL queries merged into one document."""
+
+DEFAULT_GRAPHQL_BATCH_MAX_COST = 2000
+"""Maximum estimated cost (selection sets plus requested page sizes) of one merged GraphQL document."""
+
+DEFAULT_SCAN_SHARDS = 8
+"""Number of time windows a sharded scan starts with, before adaptive splitting."""
+
+DEFAULT_WHERE_LIMIT = 100
+"""Records returned by a where= filtered list/search when the caller sets no limit."""
+
 # ============================================================================
 # OpenAPI Specification
 # ============================================================================
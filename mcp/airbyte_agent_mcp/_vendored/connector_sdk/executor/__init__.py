@@ -3,6 +3,11 @@
 from .models import (
     ExecutionConfig,
     ExecutionResult,
+    BatchResult,
+    BatchStats,
+    SyncResult,
+    PaginateResult,
+    ScanResult,
     ExecutorProtocol,
     ExecutorError,
     EntityNotFoundError,
@@ -10,6 +15,7 @@ from .models import (
     MissingParameterError,
     InvalidParameterError,
 )
+from .incremental import FileStateStore, MemoryStateStore, StateStore
 from .local_executor import LocalExecutor
 from .hosted_executor import HostedExecutor
 
@@ -17,8 +23,17 @@ __all__ = [
     # Config and Result types
     "ExecutionConfig",
     "ExecutionResult",
+    "BatchResult",
+    "BatchStats",
+    "SyncResult",
+    "PaginateResult",
+    "ScanResult",
     # Protocol
     "ExecutorProtocol",
+    # Incremental sync state
+    "StateStore",
+    "MemoryStateStore",
+    "FileStateStore",
     # Executors
     "LocalExecutor",
     "HostedExecutor",
@@ -0,0 +1,196 @@
+"""Filter planning for where= on list/search operations (x-airbyte-filters).
+
+A where= filter is parsed into predicates, then split into the predicates the
+API can evaluate (pushed into the request as the operation's x-airbyte-filters
+declares) and the residual ones LocalExecutor evaluates on each page.
+
+where= maps fields (dot notation) to:
+    - a value: equality
+    - a list: any of the values
+    - a dict of operator -> value, e.g. {"gt": 100, "lte": 500}
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, get_args
+
+from ..schema.components import FilterOperator, FiltersConfig
+from .models import InvalidParameterError
+from .sharding import set_dotted
+
+OPERATORS = get_args(FilterOperator)
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """One field/operator/value condition of a where= filter."""
+
+    field: str
+    op: str
+    value: Any
+
+    def __str__(self) -> str:
+        return f"{self.field} {self.op} {self.value!r}"
+
+
+def parse_where(where: dict[str, Any]) -> list[Predicate]:
+    """Parse a where= filter into predicates.
+
+    Raises:
+        InvalidParameterError: If an operator is unknown or a value doesn't fit it
+    """
+    if not isinstance(where, dict):
+        raise InvalidParameterError(
+            f"where must be a mapping of field to condition, got {type(where).__name__}"
+        )
+    predicates = []
+    for field, condition in where.items():
+        if isinstance(condition, dict):
+            conditions = condition.items()
+        elif isinstance(condition, (list, tuple, set)):
+            conditions = [("in", list(condition))]
+        else:
+            conditions = [("eq", condition)]
+        for op, value in conditions:
+            if op not in OPERATORS:
+                raise InvalidParameterError(
+                    f"Unknown operator '{op}' for {field}. Supported operators: {list(OPERATORS)}"
+                )
+            if op == "in" and not isinstance(value, (list, tuple, set)):
+                raise InvalidParameterError(f"Operator 'in' for {field} needs a list")
+            predicates.append(Predicate(field, op, value))
+    return predicates
+
+
+def plan(
+    predicates: list[Predicate],
+    config: FiltersConfig | None,
+    params: dict[str, Any],
+) -> tuple[list[Predicate], list[Predicate]]:
+    """Split predicates into (pushed, residual).
+
+    A predicate is pushed when its field and operator are declared. In params
+    style it is kept local instead if its parameter is already set, by the
+    caller or by another predicate.
+    """
+    if config is None:
+        return [], list(predicates)
+    pushed: list[Predicate] = []
+    residual: list[Predicate] = []
+    used_params = set(params)
+    for predicate in predicates:
+        field = config.fields.get(predicate.field)
+        mapping = field.operators.get(predicate.op) if field else None
+        if mapping is None or (config.style == "params" and mapping in used_params):
+            residual.append(predicate)
+            continue
+        if config.style == "params":
+            used_params.add(mapping)
+        pushed.append(predicate)
+    return pushed, residual
+
+
+def _render(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple, set)):
+        return ",".join(_render(item) for item in value)
+    return str(value)
+
+
+def apply_pushdown(
+    params: dict[str, Any], config: FiltersConfig, pushed: list[Predicate]
+) -> dict[str, Any]:
+    """Return a copy of params with the pushed predicates added to the request."""
+    params = copy.deepcopy(params)
+    if not pushed:
+        return params
+    if config.style == "params":
+        for predicate in pushed:
+            mapping = config.fields[predicate.field].operators[predicate.op]
+            value = predicate.value
+            set_dotted(params, mapping, list(value) if predicate.op == "in" else value)
+    elif config.style == "query":
+        qualifiers = [
+            config.fields[p.field].operators[p.op].format(value=_render(p.value))
+            for p in pushed
+        ]
+        query = str(params.get(config.query_param) or "").strip()
+        params[config.query_param] = config.separator.join(
+            [query, *qualifiers] if query else qualifiers
+        )
+    else:
+        filters = []
+        for predicate in pushed:
+            field = config.fields[predicate.field]
+            entry: dict[str, Any] = {
+                "propertyName": field.property or predicate.field,
+                "operator": field.operators[predicate.op],
+            }
+            if predicate.op == "in":
+                entry["values"] = [_render(item) for item in predicate.value]
+            else:
+                entry["value"] = _render(predicate.value)
+            filters.append(entry)
+        groups = params.get(config.filter_groups_param) or [{"filters": []}]
+        for group in groups:
+            group["filters"] = [*group.get("filters", []), *filters]
+        params[config.filter_groups_param] = groups
+    return params
+
+
+def _lookup(record: Any, field: str) -> Any:
+    value = record
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _equal(actual: Any, expected: Any) -> bool:
+    if actual == expected:
+        return True
+    # APIs are inconsistent about IDs and numbers as strings: 123 == "123"
+    if actual is None or expected is None or isinstance(actual, (dict, list)):
+        return False
+    return _render(actual) == _render(expected)
+
+
+def _compare(actual: Any, expected: Any) -> int | None:
+    """-1/0/1 comparing actual to expected, or None if they aren't comparable."""
+    if actual is None or expected is None or isinstance(actual, bool):
+        return None
+    try:
+        left, right = float(actual), float(expected)
+    except (TypeError, ValueError):
+        # ISO 8601 timestamps and dates order correctly as strings
+        left, right = str(actual), str(expected)
+    return (left > right) - (left < right)
+
+
+def _matches(actual: Any, predicate: Predicate) -> bool:
+    op, expected = predicate.op, predicate.value
+    if op == "eq":
+        return _equal(actual, expected)
+    if op == "ne":
+        return not _equal(actual, expected)
+    if op == "in":
+        return any(_equal(actual, item) for item in expected)
+    if op == "contains":
+        if isinstance(actual, str):
+            return str(expected).lower() in actual.lower()
+        if isinstance(actual, list):
+            return any(_equal(item, expected) for item in actual)
+        return False
+    order = _compare(actual, expected)
+    if order is None:
+        return False
+    return {"gt": order > 0, "gte": order >= 0, "lt": order < 0, "lte": order <= 0}[op]
+
+
+def matches(record: Any, predicates: list[Predicate]) -> bool:
+    """Whether a record satisfies every predicate."""
+    return all(_matches(_lookup(record, p.field), p) for p in predicates)
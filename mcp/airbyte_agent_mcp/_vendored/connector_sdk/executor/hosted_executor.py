@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
 import os
+import time
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
 import httpx
 from opentelemetry import trace
 
+from ..constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_GZIP_MIN_BYTES,
+    DEFAULT_HOSTED_BATCH_SIZE,
+    DEFAULT_HOSTED_REQUEST_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+from ..http_client import calculate_retry_delay
+from ..schema.extensions import RetryConfig
+from ..types import Action
 from .models import (
     ExecutionConfig,
     ExecutionResult,
 )
 
+# Operations the backend can safely run twice
+_IDEMPOTENT_ACTIONS = frozenset(
+    {Action.GET.value, Action.LIST.value, Action.SEARCH.value, Action.DOWNLOAD.value}
+)
+
+# Capabilities probe answers meaning the backend has no such endpoint
+_NOT_SUPPORTED_STATUSES = frozenset({404, 405, 501})
+
+# Seconds before a capabilities probe that failed transiently is tried again
+_CAPABILITIES_RETRY_SECONDS = 30.0
+
+# Failures where the request never reached the backend
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
 
 class HostedExecutor:
     """Executor that proxies execution through the Sonar backend API.
@@ -22,25 +54,31 @@ class HostedExecutor:
     The API URL is configured at initialization via the api_url parameter,
     which defaults to the AIRBYTE_CONNECTOR_API_URL environment variable.
 
+    Requests go through a pooled httpx.AsyncClient (keep-alive, optional HTTP/2),
+    so concurrent execute() calls run concurrently instead of blocking the event
+    loop. Transient failures are retried with the same backoff as HTTPClient.
+    Reads (get, list, search, download) are retried on any retryable error;
+    writes only when the backend cannot have run them: rate limited (429) or
+    the connection was never made.
+
     Implements ExecutorProtocol.
 
     Example:
-        executor = HostedExecutor(
+        async with HostedExecutor(
             connector_id="stripe-prod-123",
             airbyte_client_id="client_abc123",
             airbyte_client_secret="secret_xyz789"
-        )
-
-        config = ExecutionConfig(
-            entity="customers",
-            action="list"
-        )
+        ) as executor:
+            config = ExecutionConfig(
+                entity="customers",
+                action="list"
+            )
 
-        result = await executor.execute(config)
-        if result.success:
-            print(f"Data: {result.data}")
-        else:
-            print(f"Error: {result.error}")
+            result = await executor.execute(config)
+            if result.success:
+                print(f"Data: {result.data}")
+            else:
+                print(f"Error: {result.error}")
     """
 
     def __init__(
@@ -49,6 +87,13 @@ class HostedExecutor:
         airbyte_client_id: str,
         airbyte_client_secret: str,
         api_url: str | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: float = DEFAULT_HOSTED_REQUEST_TIMEOUT,
+        http2: bool = False,
+        compress_requests: bool = True,
+        retry_config: RetryConfig | None = None,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize hosted executor.
 
@@ -58,6 +103,18 @@ class HostedExecutor:
             airbyte_client_secret: Airbyte client secret for authentication
             api_url: API URL for the hosted executor backend. Defaults to
                 AIRBYTE_CONNECTOR_API_URL environment variable or "http://localhost:8001"
+            max_connections: Maximum number of concurrent connections to the backend
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            timeout: Request timeout in seconds (the backend runs the whole operation)
+            http2: Negotiate HTTP/2 with the backend. Requires the h2 package
+                (pip install httpx[http2]).
+            compress_requests: Gzip request bodies of at least DEFAULT_GZIP_MIN_BYTES.
+                Responses are always accepted gzip-compressed.
+            retry_config: Retry configuration for transient errors (429, 5xx,
+                timeouts, network errors). Defaults to RetryConfig(). Writes are
+                only retried on 429 and connection failures.
+            client: Optional pre-configured httpx.AsyncClient (e.g. for tests).
+                The executor does not close a client it did not create.
 
         Example:
             executor = HostedExecutor(
@@ -81,13 +138,61 @@ class HostedExecutor:
             "AIRBYTE_CONNECTOR_API_URL", "http://localhost:8001"
         )
 
-        # Create synchronous HTTP client
-        # We use sync client even though execute() is async for simplicity
-        # The async wrapper allows it to work with the protocol
-        self.client = httpx.Client(
-            timeout=httpx.Timeout(300.0),  # 5 minute timeout
-            follow_redirects=True,
+        self.max_connections = max_connections
+        self.compress_requests = compress_requests
+        self.retry_config = retry_config or RetryConfig()
+
+        self._owns_client = client is None
+        if client is None:
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError as e:
+                    raise ImportError(
+                        "http2=True requires the h2 package: pip install 'httpx[http2]'"
+                    ) from e
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(timeout, connect=DEFAULT_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                headers={"Accept-Encoding": "gzip"},
+                http2=http2,
+                follow_redirects=True,
+            )
+        self.client = client
+        self._supports_batch: bool | None = None
+        self._capabilities_retry_at = 0.0
+        self._close_task: asyncio.Task | None = None
+
+    @staticmethod
+    def _is_idempotent(config: ExecutionConfig) -> bool:
+        """Whether running config twice has the same effect as running it once."""
+        action = (
+            config.action.value if isinstance(config.action, Action) else config.action
         )
+        return action in _IDEMPOTENT_ACTIONS
+
+    @staticmethod
+    def _request_body(config: ExecutionConfig) -> dict[str, Any]:
+        """Build the ExecutionRequest body for a config."""
+        body = {
+            "entity": config.entity,
+            "action": config.action,
+            "params": config.params,
+        }
+        if config.expand:
+            body["expand"] = config.expand
+        if config.where is not None:
+            body["where"] = config.where
+        if config.limit is not None:
+            body["limit"] = config.limit
+        if config.fields is not None:
+            body["fields"] = config.fields
+        if config.exclude is not None:
+            body["exclude"] = config.exclude
+        return body
 
     async def execute(self, config: ExecutionConfig) -> ExecutionResult:
         """Execute connector via backend API (ExecutorProtocol implementation).
@@ -129,17 +234,12 @@ class HostedExecutor:
             span.set_attribute("http.url", url)
 
             # Build request body matching ExecutionRequest model
-            # Extract entity, action, and params from config attributes
-            request_body = {
-                "entity": config.entity,
-                "action": config.action,
-                "params": config.params,
-            }
+            request_body = self._request_body(config)
 
             try:
-                # Make synchronous HTTP request
-                # (wrapped in async method for protocol compatibility)
-                response = self.client.post(url, json=request_body)
+                response = await self._post(
+                    url, request_body, idempotent=self._is_idempotent(config)
+                )
 
                 # Add response status code to span
                 span.set_attribute("http.status_code", response.status_code)
@@ -171,19 +271,335 @@ class HostedExecutor:
                 span.record_exception(e)
                 raise
 
-    def close(self):
+    async def supports_batch(self) -> bool:
+        """Whether the backend advertises the batch execute endpoint.
+
+        Probes GET /connectors/{connector_id}/capabilities and caches a definite
+        answer: the advertised flag, or no when the endpoint doesn't exist (404,
+        405, 501). Any other failure (network error, 5xx, malformed body) means
+        no for now, and the probe is tried again after
+        _CAPABILITIES_RETRY_SECONDS.
+        """
+        if self._supports_batch is not None:
+            return self._supports_batch
+        if time.monotonic() < self._capabilities_retry_at:
+            return False
+
+        url = f"{self.api_url}/connectors/{self.connector_id}/capabilities"
+        try:
+            response = await self.client.get(url)
+            if response.status_code in _NOT_SUPPORTED_STATUSES:
+                self._supports_batch = False
+                return False
+            response.raise_for_status()
+            self._supports_batch = bool(response.json().get("batch_execute"))
+        except Exception:
+            self._capabilities_retry_at = time.monotonic() + _CAPABILITIES_RETRY_SECONDS
+            return False
+        return self._supports_batch
+
+    async def execute_batch(
+        self,
+        configs: Sequence[ExecutionConfig],
+        batch_size: int = DEFAULT_HOSTED_BATCH_SIZE,
+        max_concurrency: int | None = None,
+    ) -> list[ExecutionResult]:
+        """Execute many configs, batched into as few requests as the backend allows.
+
+        Failures are reported per item (success=False) rather than raised, so
+        one bad operation doesn't discard the others.
+
+        Args:
+            configs: Operations to execute
+            batch_size: Maximum configs per batch request
+            max_concurrency: Maximum in-flight requests (batches, or single
+                calls in fallback mode). Defaults to the connection pool size.
+
+        Returns:
+            One ExecutionResult per config, in input order
+
+        Example:
+            results = await executor.execute_batch([
+                ExecutionConfig(entity="customers", action="get", params={"id": cid})
+                for cid in customer_ids
+            ])
+        """
+        results: list[ExecutionResult | None] = [None] * len(configs)
+        async for index, result in self.iter_batch(
+            configs, batch_size=batch_size, max_concurrency=max_concurrency
+        ):
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    async def iter_batch(
+        self,
+        configs: Sequence[ExecutionConfig],
+        batch_size: int = DEFAULT_HOSTED_BATCH_SIZE,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, ExecutionResult]]:
+        """Like execute_batch(), but yields (index, result) pairs as they complete.
+
+        When the backend supports batching, configs are sent in chunks of
+        batch_size to POST /connectors/{connector_id}/execute/batch and results
+        are read from a streamed NDJSON response as the backend finishes them.
+        Otherwise each config is sent through execute() concurrently.
+
+        Example:
+            async for index, result in executor.iter_batch(configs):
+                print(configs[index].entity, result.success)
+        """
+        if not configs:
+            return
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_connections)
+        queue: asyncio.Queue[tuple[int, ExecutionResult] | None] = asyncio.Queue()
+
+        if await self.supports_batch():
+            chunks = [
+                list(range(start, min(start + batch_size, len(configs))))
+                for start in range(0, len(configs), batch_size)
+            ]
+            producers = [
+                self._run_batch_chunk(configs, indices, semaphore, queue)
+                for indices in chunks
+            ]
+        else:
+            producers = [
+                self._run_single(index, config, semaphore, queue)
+                for index, config in enumerate(configs)
+            ]
+
+        async def produce_all() -> None:
+            try:
+                await asyncio.gather(*producers)
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(produce_all())
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _run_single(
+        self,
+        index: int,
+        config: ExecutionConfig,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
+    ) -> None:
+        """Fallback path: one execute() call, with errors captured per item."""
+        async with semaphore:
+            try:
+                result = await self.execute(config)
+            except Exception as e:
+                result = ExecutionResult(success=False, data={}, error=str(e))
+        await queue.put((index, result))
+
+    async def _run_batch_chunk(
+        self,
+        configs: Sequence[ExecutionConfig],
+        indices: list[int],
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
+    ) -> None:
+        """Send one chunk to the batch endpoint and stream its results into queue."""
+        url = f"{self.api_url}/connectors/{self.connector_id}/execute/batch"
+        body = {"requests": [self._request_body(configs[i]) for i in indices]}
+        pending = set(range(len(indices)))
+
+        async with semaphore:
+            try:
+                response = await self._post(
+                    url,
+                    body,
+                    headers={"Accept": "application/x-ndjson, application/json"},
+                    stream=True,
+                    idempotent=all(self._is_idempotent(configs[i]) for i in indices),
+                )
+                try:
+                    async for position, result in self._read_batch_response(response):
+                        if position in pending:
+                            pending.discard(position)
+                            await queue.put((indices[position], result))
+                finally:
+                    await response.aclose()
+            except Exception as e:
+                error = str(e)
+            else:
+                error = "No result returned for this operation in the batch response"
+
+        # Anything the backend didn't answer (or everything, if the request failed)
+        for position in sorted(pending):
+            await queue.put(
+                (indices[position], ExecutionResult(success=False, data={}, error=error))
+            )
+
+    @staticmethod
+    async def _read_batch_response(
+        response: httpx.Response,
+    ) -> AsyncIterator[tuple[int, ExecutionResult]]:
+        """Parse a batch response body into (position, result) pairs.
+
+        Accepts either NDJSON (one {"index", "success", "data", "error", "meta"}
+        object per line, in completion order) or a single JSON document
+        {"results": [...]} from backends that don't stream.
+        """
+
+        def to_result(item: dict[str, Any]) -> ExecutionResult:
+            return ExecutionResult(
+                success=bool(item.get("success")),
+                data=item.get("data") or {},
+                error=item.get("error"),
+                meta=item.get("meta"),
+            )
+
+        content_type = response.headers.get("content-type", "")
+        if "ndjson" in content_type:
+            async for line in response.aiter_lines():
+                if line.strip():
+                    item = json.loads(line)
+                    yield item["index"], to_result(item)
+            return
+
+        body = json.loads(await response.aread())
+        for position, item in enumerate(body.get("results", [])):
+            yield item.get("index", position), to_result(item)
+
+    def _encode_body(self, body: Any) -> tuple[bytes, dict[str, str]]:
+        """Serialize a JSON body, gzip-compressing it if large enough."""
+        content = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.compress_requests and len(content) >= DEFAULT_GZIP_MIN_BYTES:
+            content = gzip.compress(content)
+            headers["Content-Encoding"] = "gzip"
+        return content, headers
+
+    def _should_retry(
+        self,
+        exception: Exception | None,
+        status_code: int | None,
+        attempt: int,
+        idempotent: bool = True,
+    ) -> bool:
+        """Same retry rules as HTTPClient, applied to httpx exceptions.
+
+        Non-idempotent requests are only retried when the backend cannot have
+        run them: a 429 response or a connection that was never made.
+        """
+        if attempt >= self.retry_config.max_attempts - 1:
+            return False
+        if not idempotent and status_code != 429:
+            if not isinstance(exception, _NOT_SENT_ERRORS):
+                return False
+        if status_code and status_code in self.retry_config.retry_on_status_codes:
+            return True
+        if self.retry_config.retry_on_timeout and isinstance(
+            exception, httpx.TimeoutException
+        ):
+            return True
+        if self.retry_config.retry_on_network_error and isinstance(
+            exception, httpx.TransportError
+        ):
+            return not isinstance(exception, httpx.TimeoutException)
+        return False
+
+    async def _post(
+        self,
+        url: str,
+        body: Any,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+        idempotent: bool = True,
+    ) -> httpx.Response:
+        """POST a JSON body with retries, returning the successful response.
+
+        With stream=True the body is not read; the caller must aclose() the
+        response. idempotent=False limits retries to failures where the backend
+        cannot have run the request (see _should_retry()).
+
+        Raises:
+            httpx.HTTPStatusError: If the final attempt returns 4xx/5xx
+            httpx.RequestError: If the final attempt fails at the network level
+        """
+        content, request_headers = self._encode_body(body)
+        if headers:
+            request_headers.update(headers)
+
+        attempt = 0
+        while True:
+            try:
+                request = self.client.build_request(
+                    "POST", url, content=content, headers=request_headers
+                )
+                response = await self.client.send(request, stream=stream)
+                if stream and response.is_error:
+                    await response.aclose()
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                if not self._should_retry(
+                    e, e.response.status_code, attempt, idempotent
+                ):
+                    raise
+                delay = calculate_retry_delay(
+                    self.retry_config, attempt, dict(e.response.headers)
+                )
+            except httpx.RequestError as e:
+                if not self._should_retry(e, None, attempt, idempotent):
+                    raise
+                delay = calculate_retry_delay(self.retry_config, attempt, {})
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
         """Close the HTTP client.
 
-        Call this when you're done using the executor to clean up resources.
+        Call this when you're done using the executor to clean up pooled
+        connections, or use the executor as an async context manager.
 
         Example:
             executor = HostedExecutor(
-                workspace_id="workspace-123",
-                connector_id="my-connector"
+                connector_id="my-connector",
+                airbyte_client_id="client_abc123",
+                airbyte_client_secret="secret_xyz789"
             )
             try:
                 result = await executor.execute(config)
             finally:
-                executor.close()
+                await executor.aclose()
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    def close(self) -> asyncio.Task | None:
+        """Close the HTTP client.
+
+        Kept callable without await for code written against the synchronous
+        close() of earlier versions. Inside an event loop the client is closed
+        in a task, which `await executor.close()` waits for (as with
+        LocalExecutor); outside one it is closed before close() returns.
+        Prefer aclose() in new code.
         """
-        self.client.close()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.aclose())
+            return None
+        self._close_task = loop.create_task(self.aclose())
+        return self._close_task
+
+    async def __aenter__(self) -> HostedExecutor:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
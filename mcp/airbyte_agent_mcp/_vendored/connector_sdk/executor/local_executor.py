@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
+import json
 import os
 import re
+import statistics
 import time
 import logging
 
+from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Protocol
 from urllib.parse import quote
 
@@ -15,13 +20,21 @@ from jsonpath_ng import parse as parse_jsonpath
 from opentelemetry import trace
 
 from ..constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_GRAPHQL_BATCH_MAX_COST,
+    DEFAULT_GRAPHQL_BATCH_MAX_SIZE,
+    DEFAULT_GRAPHQL_BATCH_WINDOW_MS,
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_SCAN_SHARDS,
+    DEFAULT_WHERE_LIMIT,
 )
 from ..secrets import SecretStr
 from ..http_client import HTTPClient, TokenRefreshCallback
 from ..config_loader import load_connector_config
 from ..logging import NullLogger, RequestLogger
+from ..logging.logger import ChunkCaptureMode, LogFormat
+from ..logging.writer import Compression, OverflowPolicy
 from ..observability import ObservabilitySession
 from ..auth_template import apply_auth_mapping
 from ..telemetry import SegmentTracker
@@ -31,12 +44,21 @@ from ..types import (
     Action,
     EndpointDefinition,
 )
+from ..schema.components import BatchJobConfig, BatchWriteConfig, RelationshipConfig
 from ..schema.extensions import RetryConfig
 
+from . import filters, incremental, pagination, projection, sharding
+from .graphql import CompiledGraphQLBody, credentials_fingerprint, get_batcher
+from .incremental import StateStore
 from .models import (
+    BatchResult,
+    BatchStats,
     ExecutionConfig,
     ExecutionResult,
     StandardExecuteResult,
+    SyncResult,
+    PaginateResult,
+    ScanResult,
     ExecutorError,
     EntityNotFoundError,
     ActionNotSupportedError,
@@ -111,6 +133,19 @@ class LocalExecutor:
         config_values: dict[str, str] | None = None,
         on_token_refresh: TokenRefreshCallback = None,
         retry_config: RetryConfig | None = None,
+        graphql_batch_window_ms: float = DEFAULT_GRAPHQL_BATCH_WINDOW_MS,
+        graphql_batch_max_size: int = DEFAULT_GRAPHQL_BATCH_MAX_SIZE,
+        graphql_batch_max_cost: int = DEFAULT_GRAPHQL_BATCH_MAX_COST,
+        chunk_capture: ChunkCaptureMode = "spill",
+        max_chunk_bytes: int | None = None,
+        max_chunk_refs: int | None = 10000,
+        chunk_sample_every: int = 1,
+        log_format: LogFormat = "json",
+        log_compression: Compression | None = None,
+        log_rotate_max_bytes: int | None = None,
+        log_rotate_interval_seconds: float | None = None,
+        log_queue_size: int = 1000,
+        log_overflow: OverflowPolicy = "block",
     ):
         """Initialize async executor.
 
@@ -138,6 +173,31 @@ class LocalExecutor:
             retry_config: Optional retry configuration override. If provided, overrides
                 the connector.yaml x-airbyte-retry-config. If None, uses connector.yaml
                 config or SDK defaults.
+            graphql_batch_window_ms: How long concurrent GraphQL queries to the same
+                endpoint are collected and merged into one aliased document. Queries
+                from other executors with the same connector, base URL and
+                credentials share the window. Set to 0 to send every query alone.
+            graphql_batch_max_size: Maximum number of queries merged into one document.
+            graphql_batch_max_cost: Maximum estimated cost of one merged document
+                (see executor.graphql.estimate_query_cost).
+            chunk_capture: How downloaded chunks are logged (if enable_logging=True):
+                "spill" (default) writes them to a sidecar file next to the log,
+                so logging can stay on for large downloads; "memory" keeps them
+                in the session until save(); "off" skips them.
+            max_chunk_bytes: Maximum chunk bytes logged per session (None for no cap).
+            max_chunk_refs: Maximum spilled chunk refs kept in the session; past
+                it, chunks extend the last ref.
+            chunk_sample_every: Log only every Nth chunk.
+            log_format: "json" writes the session as one document on save();
+                "jsonl" streams one line per entry from a background writer,
+                so memory stays constant while logging.
+            log_compression: JSONL only. Optional "gzip" or "zstd" compression.
+            log_rotate_max_bytes: JSONL only. Start a new file after this many bytes.
+            log_rotate_interval_seconds: JSONL only. Start a new file after this
+                many seconds.
+            log_queue_size: JSONL only. Maximum entries waiting for the writer.
+            log_overflow: JSONL only. "block" applies backpressure when the
+                writer falls behind, "drop" discards and counts entries.
         """
         # Validate mutual exclusivity
         if secrets is not None and auth_config is not None:
@@ -162,6 +222,9 @@ class LocalExecutor:
             self.secrets = None
 
         self.config_values = config_values or {}
+        self.graphql_batch_window_ms = graphql_batch_window_ms
+        self.graphql_batch_max_size = graphql_batch_max_size
+        self.graphql_batch_max_cost = graphql_batch_max_cost
 
         # Create shared observability session
         self.session = ObservabilitySession(
@@ -184,6 +247,16 @@ class LocalExecutor:
                 log_file=log_file,
                 connector_name=self.config.name,
                 max_logs=max_logs,
+                chunk_capture=chunk_capture,
+                max_chunk_bytes=max_chunk_bytes,
+                max_chunk_refs=max_chunk_refs,
+                chunk_sample_every=chunk_sample_every,
+                log_format=log_format,
+                compression=log_compression,
+                rotate_max_bytes=log_rotate_max_bytes,
+                rotate_interval_seconds=log_rotate_interval_seconds,
+                queue_size=log_queue_size,
+                overflow=log_overflow,
             )
         else:
             self.logger = NullLogger()
@@ -214,11 +287,19 @@ class LocalExecutor:
                 if endpoint:
                     self._operation_index[(entity.name, action)] = endpoint
 
+        # Compile GraphQL body templates once rather than on every request
+        self._graphql_templates: dict[tuple[str, str], CompiledGraphQLBody] = {
+            (endpoint.method, endpoint.path): CompiledGraphQLBody(endpoint.graphql_body)
+            for endpoint in self._operation_index.values()
+            if endpoint.graphql_body
+        }
+
         # Register operation handlers (order matters for can_handle priority)
         op_context = _OperationContext(self)
+        self._standard_handler = _StandardOperationHandler(op_context)
         self._operation_handlers: list[_OperationHandler] = [
             _DownloadOperationHandler(op_context),
-            _StandardOperationHandler(op_context),
+            self._standard_handler,
         ]
 
     def _apply_auth_config_mapping(
@@ -311,6 +392,37 @@ class LocalExecutor:
             )
             params = config.params or {}
 
+            if config.where is not None or config.limit is not None:
+                filtered = await self._execute_filtered(
+                    config.entity,
+                    action,
+                    params,
+                    config.where,
+                    config.limit,
+                    config.expand,
+                )
+                return ExecutionResult(
+                    success=True,
+                    data=projection.project(
+                        filtered.data, config.fields, config.exclude
+                    ),
+                    error=None,
+                    meta=filtered.metadata,
+                )
+
+            if config.expand:
+                expanded = await self._execute_expanded(
+                    config.entity, action, params, config.expand
+                )
+                return ExecutionResult(
+                    success=True,
+                    data=projection.project(
+                        expanded.data, config.fields, config.exclude
+                    ),
+                    error=None,
+                    meta=expanded.metadata,
+                )
+
             # Dispatch to handler (handlers handle telemetry internally)
             handler = next(
                 (h for h in self._operation_handlers if h.can_handle(action)), None
@@ -339,7 +451,9 @@ class LocalExecutor:
                 handler_result = await result
                 return ExecutionResult(
                     success=True,
-                    data=handler_result.data,
+                    data=projection.project(
+                        handler_result.data, config.fields, config.exclude
+                    ),
                     error=None,
                     meta=handler_result.metadata,
                 )
@@ -455,6 +569,1407 @@ class LocalExecutor:
 
         return extracted_results
 
+    async def execute_many(
+        self,
+        configs: list[ExecutionConfig],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        dedupe: bool = True,
+    ) -> BatchResult:
+        """Execute many operations with a concurrency cap and per-item results.
+
+        Unlike execute_batch(), a failing operation never cancels or hides the
+        others: every config gets its own ExecutionResult (success or error).
+        Identical read operations (same entity, action and params) are executed
+        once; each duplicate gets its own copy of the result, so callers may modify
+        them independently. Writes and downloads are never deduplicated.
+
+        Args:
+            configs: Operations to execute
+            max_concurrency: Maximum number of operations in flight
+            dedupe: Execute identical read operations only once
+
+        Returns:
+            BatchResult with results in input order and per-batch timing stats
+
+        Example:
+            batch = await executor.execute_many(
+                [ExecutionConfig(entity="customers", action="get", params={"id": i}) for i in ids],
+                max_concurrency=5,
+            )
+            customers = [r.data for r in batch.results if r.success]
+        """
+        results: list[ExecutionResult | None] = [None] * len(configs)
+        timings: list[float] = []
+        start = time.perf_counter()
+
+        async for indices, result, elapsed_ms in self._iter_unique(
+            configs, max_concurrency, dedupe
+        ):
+            timings.append(elapsed_ms)
+            for index, copy_of_result in self._result_copies(indices, result):
+                results[index] = copy_of_result
+
+        wall_time_ms = (time.perf_counter() - start) * 1000
+        return BatchResult(
+            results=results,  # type: ignore[arg-type]
+            stats=self._batch_stats(results, timings, max_concurrency, wall_time_ms),
+        )
+
+    async def execute_as_completed(
+        self,
+        configs: list[ExecutionConfig],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        dedupe: bool = True,
+    ) -> AsyncIterator[tuple[int, ExecutionResult]]:
+        """Like execute_many(), but yield (index, result) pairs as operations finish.
+
+        Callers can start processing fast results while slow ones are still in
+        flight. Breaking out of the loop cancels the remaining operations.
+
+        Example:
+            async for index, result in executor.execute_as_completed(configs):
+                print(configs[index].entity, result.success)
+        """
+        async for indices, result, _ in self._iter_unique(
+            configs, max_concurrency, dedupe
+        ):
+            for pair in self._result_copies(indices, result):
+                yield pair
+
+    async def _iter_unique(
+        self,
+        configs: list[ExecutionConfig],
+        max_concurrency: int,
+        dedupe: bool,
+    ) -> AsyncIterator[tuple[list[int], ExecutionResult, float]]:
+        """Run unique operations under a semaphore, yielding as each completes.
+
+        Yields:
+            (input indices sharing this result, result, elapsed ms)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        groups: dict[Any, list[int]] = {}
+        for index, config in enumerate(configs):
+            key = self._dedupe_key(config) if dedupe else None
+            groups.setdefault(key if key is not None else ("#", index), []).append(
+                index
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(indices: list[int]):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result = await self.execute(configs[indices[0]])
+                except Exception as e:
+                    # Infrastructure errors become per-item failures
+                    result = ExecutionResult(
+                        success=False, data={}, error=f"{type(e).__name__}: {e}"
+                    )
+                return indices, result, (time.perf_counter() - start) * 1000
+
+        tasks = [asyncio.create_task(run(indices)) for indices in groups.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _result_copies(
+        indices: list[int], result: ExecutionResult
+    ) -> list[tuple[int, ExecutionResult]]:
+        """Pair the first index with result and each duplicate with a deep copy."""
+        return [(indices[0], result)] + [
+            (index, copy.deepcopy(result)) for index in indices[1:]
+        ]
+
+    @staticmethod
+    def _dedupe_key(config: ExecutionConfig) -> tuple[str, str, str] | None:
+        """Key identifying identical read operations, or None if not dedupable."""
+        action = (
+            config.action.value if isinstance(config.action, Action) else config.action
+        )
+        if action not in (Action.GET.value, Action.LIST.value, Action.SEARCH.value):
+            return None
+        try:
+            params = json.dumps(config.params or {}, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return (config.entity, action, params)
+
+    @staticmethod
+    def _batch_stats(
+        results: list[ExecutionResult | None],
+        timings: list[float],
+        max_concurrency: int,
+        wall_time_ms: float,
+    ) -> BatchStats:
+        """Summarize a finished batch."""
+        succeeded = sum(1 for r in results if r is not None and r.success)
+        stats = BatchStats(
+            total=len(results),
+            unique=len(timings),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            max_concurrency=max_concurrency,
+            wall_time_ms=wall_time_ms,
+        )
+        if timings:
+            ordered = sorted(timings)
+            stats.min_ms = ordered[0]
+            stats.max_ms = ordered[-1]
+            stats.mean_ms = statistics.fmean(ordered)
+            stats.p50_ms = statistics.median(ordered)
+            stats.p95_ms = ordered[max(0, int(len(ordered) * 0.95 + 0.5) - 1)]
+        return stats
+
+    async def get_many(
+        self,
+        entity: str,
+        ids: list[Any],
+        params: dict[str, Any] | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        id_param: str | None = None,
+    ) -> dict[Any, Any]:
+        """Fetch many records of an entity by ID.
+
+        Uses the entity's x-airbyte-batch-read endpoint when declared: IDs are
+        split into chunks of the API's max_batch_size and the chunks are sent
+        concurrently. Otherwise (or if a bulk request fails) falls back to
+        concurrent single `get` calls capped at max_concurrency.
+
+        Args:
+            entity: Entity name (e.g., "contacts")
+            ids: Record IDs to fetch. IDs that are equal as strings (10 and "10")
+                are fetched once, and each appears in the result as given.
+            params: Extra parameters (path placeholders, query/body fields such
+                as HubSpot "properties") applied to every request
+            max_concurrency: Maximum requests in flight
+            id_param: Parameter name for the ID in single `get` calls. Defaults
+                to the last path parameter of the get endpoint (e.g. "contactId").
+
+        Returns:
+            Dict mapping each requested ID to its record, or None if the record
+            was not found or could not be fetched
+
+        Raises:
+            EntityNotFoundError: If the entity doesn't exist
+            ActionNotSupportedError: If the entity has no get action
+
+        Example:
+            contacts = await executor.get_many("contacts", ["101", "102", "103"])
+            for contact_id, contact in contacts.items():
+                if contact is None:
+                    print(f"{contact_id} not found")
+        """
+        endpoint = self._get_endpoint(entity, Action.GET)
+        params = params or {}
+
+        # APIs return IDs as strings or numbers, so records are matched on str(id)
+        results: dict[str, Any] = dict.fromkeys(str(record_id) for record_id in ids)
+        if not results:
+            return {}
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        unique_ids = list(results)
+        pending: list[str] = []
+
+        if endpoint.batch_read:
+            size = endpoint.batch_read.max_batch_size
+            chunks = [unique_ids[i : i + size] for i in range(0, len(unique_ids), size)]
+
+            async def read_chunk(chunk: list[str]) -> None:
+                async with semaphore:
+                    try:
+                        records = await self._batch_read(endpoint, chunk, params)
+                    except Exception as e:
+                        logging.warning(
+                            f"Bulk read for {entity} failed ({type(e).__name__}: {e}); "
+                            f"falling back to single gets for {len(chunk)} IDs"
+                        )
+                        pending.extend(chunk)
+                        return
+                for key, record in records.items():
+                    if key in results:
+                        results[key] = record
+
+            await asyncio.gather(*(read_chunk(chunk) for chunk in chunks))
+        else:
+            pending = unique_ids
+
+        if pending:
+            if id_param is None:
+                id_param = endpoint.path_params[-1] if endpoint.path_params else "id"
+            configs = [
+                ExecutionConfig(
+                    entity=entity, action="get", params={**params, id_param: key}
+                )
+                for key in pending
+            ]
+            batch = await self.execute_many(
+                configs, max_concurrency=max_concurrency, dedupe=False
+            )
+            for key, result in zip(pending, batch.results):
+                if result.success:
+                    results[key] = result.data
+                else:
+                    logging.debug(f"get {entity} {key} failed: {result.error}")
+
+        return {record_id: results[str(record_id)] for record_id in ids}
+
+    async def create_many(
+        self,
+        entity: str,
+        records: list[dict[str, Any]],
+        params: dict[str, Any] | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[ExecutionResult]:
+        """Create many records of an entity.
+
+        Uses the entity's x-airbyte-batch-write endpoint when declared on its
+        create operation (records are chunked to the API's max_batch_size and
+        the chunks sent concurrently, polling async jobs where configured).
+        Otherwise falls back to concurrent single `create` calls.
+
+        Args:
+            entity: Entity name (e.g., "contacts")
+            records: Record fields to create, one dict per record
+            params: Extra parameters (e.g. path placeholders) for every request
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            One ExecutionResult per record, aligned with the inputs
+
+        Example:
+            results = await executor.create_many(
+                "contacts", [{"email": "a@example.com"}, {"email": "b@example.com"}]
+            )
+            failed = [r.error for r in results if not r.success]
+        """
+        return await self._write_many(
+            entity, Action.CREATE, records, params, max_concurrency, id_param=None
+        )
+
+    async def update_many(
+        self,
+        entity: str,
+        records: list[dict[str, Any]],
+        params: dict[str, Any] | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        id_param: str | None = None,
+    ) -> list[ExecutionResult]:
+        """Update many records of an entity.
+
+        Same strategy as create_many(), using the update operation's
+        x-airbyte-batch-write endpoint. Each record must contain its ID under
+        id_param.
+
+        Args:
+            entity: Entity name (e.g., "tickets")
+            records: Fields to update, one dict per record, each including its ID
+            params: Extra parameters (e.g. path placeholders) for every request
+            max_concurrency: Maximum requests in flight
+            id_param: Record key holding the ID. Defaults to the last path
+                parameter of the update endpoint (e.g. "ticket_id").
+
+        Returns:
+            One ExecutionResult per record, aligned with the inputs
+
+        Example:
+            results = await executor.update_many(
+                "tickets", [{"ticket_id": 1, "status": "solved"}, {"ticket_id": 2, "status": "open"}]
+            )
+        """
+        return await self._write_many(
+            entity, Action.UPDATE, records, params, max_concurrency, id_param
+        )
+
+    async def _write_many(
+        self,
+        entity: str,
+        action: Action,
+        records: list[dict[str, Any]],
+        params: dict[str, Any] | None,
+        max_concurrency: int,
+        id_param: str | None,
+    ) -> list[ExecutionResult]:
+        """Shared implementation of create_many() and update_many()."""
+        endpoint = self._get_endpoint(entity, action)
+        params = params or {}
+        if action == Action.UPDATE and id_param is None:
+            id_param = endpoint.path_params[-1] if endpoint.path_params else "id"
+
+        if not endpoint.batch_write:
+            configs = [
+                ExecutionConfig(
+                    entity=entity, action=action.value, params={**params, **record}
+                )
+                for record in records
+            ]
+            batch = await self.execute_many(
+                configs, max_concurrency=max_concurrency, dedupe=False
+            )
+            return batch.results
+
+        results: list[ExecutionResult | None] = [None] * len(records)
+        size = endpoint.batch_write.max_batch_size
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def write_chunk(start: int) -> None:
+            chunk = records[start : start + size]
+            async with semaphore:
+                try:
+                    chunk_results = await self._batch_write(
+                        endpoint, chunk, params, id_param
+                    )
+                except Exception as e:
+                    # Never retry a failed bulk write as single writes: part of
+                    # it may have been applied already.
+                    error = f"{type(e).__name__}: {e}"
+                    chunk_results = [
+                        ExecutionResult(success=False, data={}, error=error)
+                        for _ in chunk
+                    ]
+            results[start : start + len(chunk)] = chunk_results
+
+        await asyncio.gather(
+            *(write_chunk(start) for start in range(0, len(records), size))
+        )
+        return results  # type: ignore[return-value]
+
+    async def _batch_write(
+        self,
+        endpoint: EndpointDefinition,
+        records: list[dict[str, Any]],
+        params: dict[str, Any],
+        id_param: str | None,
+    ) -> list[ExecutionResult]:
+        """Send one x-airbyte-batch-write request and align results with records."""
+        config = endpoint.batch_write
+
+        record_ids: list[Any] = []
+        items = []
+        for record in records:
+            fields = dict(record)
+            record_id = fields.pop(id_param, None) if id_param else None
+            record_ids.append(record_id)
+
+            if config.action:
+                path_values = {**params, **record}
+                items.append(
+                    {
+                        "method": config.action.method,
+                        "relative_path": self._build_path(
+                            config.action.relative_path, path_values
+                        ),
+                        config.action.data_field: fields,
+                    }
+                )
+                continue
+
+            item = {config.item_wrapper: fields} if config.item_wrapper else fields
+            if record_id is not None:
+                item[config.item_id_field] = record_id
+            if config.trace_field:
+                item[config.trace_field] = str(len(items))
+            items.append(item)
+
+        body = dict(config.body or {})
+        self._set_dotted(body, config.items_field, items)
+        response = await self.http_client.request(
+            method=config.method,
+            path=self._build_path(config.path, params),
+            json=body,
+        )
+
+        if config.job:
+            response = await self._wait_for_batch_job(config.job, response)
+
+        matches = [
+            m.value for m in parse_jsonpath(config.results_extractor).find(response)
+        ]
+        raw_results = (
+            matches[0]
+            if len(matches) == 1 and isinstance(matches[0], list)
+            else matches
+        )
+
+        # Align results with inputs
+        aligned: list[Any] = [None] * len(records)
+        if config.result_match == "order":
+            for position, item in enumerate(raw_results[: len(records)]):
+                aligned[position] = item
+        elif config.result_match == "index":
+            for item in raw_results:
+                index = item.get(config.result_index_field)
+                if isinstance(index, int) and 0 <= index < len(records):
+                    aligned[index] = item
+        elif config.result_match == "trace":
+            for item in raw_results:
+                trace = self._get_dotted(item, config.trace_field)
+                if str(trace).isdigit() and int(trace) < len(records):
+                    aligned[int(trace)] = item
+        else:
+            positions = {str(rid): i for i, rid in enumerate(record_ids)}
+            for item in raw_results:
+                rid = self._get_dotted(item, config.result_id_field)
+                if str(rid) in positions:
+                    aligned[positions[str(rid)]] = item
+
+        return [self._batch_write_result(config, item) for item in aligned]
+
+    def _batch_write_result(
+        self, config: BatchWriteConfig, item: Any
+    ) -> ExecutionResult:
+        """Turn one provider result entry into an ExecutionResult."""
+        if item is None:
+            return ExecutionResult(
+                success=False,
+                data={},
+                error="No result returned for this record in the batch response",
+            )
+
+        error = (
+            self._get_dotted(item, config.result_error_field)
+            if config.result_error_field
+            else None
+        )
+        status = (
+            self._get_dotted(item, config.result_status_field)
+            if config.result_status_field
+            else None
+        )
+        try:
+            status_ok = status is None or 200 <= int(status) < 300
+        except (TypeError, ValueError):
+            # A status that isn't a number (e.g. "error") can't mean success
+            status_ok = False
+        success = error is None and status_ok
+        data = (
+            self._get_dotted(item, config.result_record_field)
+            if config.result_record_field
+            else item
+        )
+        if success:
+            return ExecutionResult(success=True, data=data)
+        return ExecutionResult(
+            success=False,
+            data=data if isinstance(data, dict) else {},
+            error=str(error) if error is not None else f"Status {status}",
+        )
+
+    async def _wait_for_batch_job(
+        self, job: BatchJobConfig, response: dict[str, Any]
+    ) -> Any:
+        """Poll an asynchronous batch job until it completes; return its final status."""
+        job_ids = [m.value for m in parse_jsonpath(job.id_path).find(response)]
+        if not job_ids:
+            raise ExecutorError(f"No job ID found at {job.id_path} in batch response")
+
+        poll_path = self._build_path(job.poll_path, {"job_id": job_ids[0]})
+        deadline = time.monotonic() + job.timeout_seconds
+        while True:
+            status_response = await self.http_client.request(
+                method="GET", path=poll_path
+            )
+            statuses = [
+                m.value for m in parse_jsonpath(job.status_path).find(status_response)
+            ]
+            status = statuses[0] if statuses else None
+            if status in job.done_values:
+                return status_response
+            if status in job.failed_values:
+                raise ExecutorError(
+                    f"Batch job {job_ids[0]} ended with status {status}"
+                )
+            if time.monotonic() >= deadline:
+                raise ExecutorError(
+                    f"Batch job {job_ids[0]} did not finish within {job.timeout_seconds}s"
+                )
+            await asyncio.sleep(job.poll_interval_seconds)
+
+    async def iter_pages(
+        self,
+        entity: str,
+        action: str | Action,
+        params: dict[str, Any] | None = None,
+        max_pages: int | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[StandardExecuteResult]:
+        """Yield every page of a list or search result.
+
+        Follows the operation's x-airbyte-pagination until the API reports no more
+        pages, a page comes back empty, or a cursor repeats. Operations without
+        pagination yield a single page.
+
+        Args:
+            entity: Entity name
+            action: list or search
+            params: Operation parameters for the first page
+            max_pages: Stop after this many pages (None for no limit)
+            prefetch: Request the next page before yielding the current one, so
+                the upstream round trip overlaps with processing the page. Stop
+                early with contextlib.aclosing() to cancel the prefetched request.
+
+        Yields:
+            StandardExecuteResult per page (data is the page's extracted records)
+
+        Example:
+            async for page in executor.iter_pages("calls", "list", {"fromDateTime": "2024-01-01T00:00:00Z"}):
+                process(page.data)
+        """
+        async with contextlib.aclosing(
+            self._walk_pages(entity, action, params, max_pages, prefetch)
+        ) as pages:
+            async for _, page, _ in pages:
+                yield page
+
+    async def _walk_pages(
+        self,
+        entity: str,
+        action: str | Action,
+        params: dict[str, Any] | None = None,
+        max_pages: int | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[
+        tuple[dict[str, Any], StandardExecuteResult, dict[str, Any] | None]
+    ]:
+        """Yield (page params, page, next page params or None) for each page."""
+        action = Action(action) if isinstance(action, str) else action
+        endpoint = self._get_endpoint(entity, action)
+        pagination = endpoint.pagination
+        if pagination and (
+            pagination.style == "link" or pagination.cursor_source == "headers"
+        ):
+            raise ExecutorError(
+                f"{entity}.{action.value}: link and header-based pagination are not supported"
+            )
+
+        params = copy.deepcopy(params or {})
+        page_size = None
+        if pagination:
+            declared = pagination.limit_param in (
+                endpoint.query_params + endpoint.body_fields
+            )
+            if declared:
+                params.setdefault(pagination.limit_param, pagination.default_page_size)
+                page_size = params[pagination.limit_param]
+
+        def fetch(page_params: dict[str, Any]) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self._standard_handler.execute_operation(entity, action, page_params)
+            )
+
+        seen_cursors: set[str] = set()
+        pages = 0
+        pending: asyncio.Task | None = fetch(params)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                pages += 1
+                next_params = None
+                if pagination is not None and (max_pages is None or pages < max_pages):
+                    next_params = self._next_page_params(
+                        pagination, params, page, page_size, seen_cursors
+                    )
+                if next_params is not None and prefetch:
+                    pending = fetch(next_params)
+                yield params, page, next_params
+                if next_params is not None and pending is None:
+                    pending = fetch(next_params)
+                params = next_params
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    def _next_page_params(
+        self,
+        pagination: Any,
+        params: dict[str, Any],
+        page: StandardExecuteResult,
+        page_size: Any,
+        seen_cursors: set[str],
+    ) -> dict[str, Any] | None:
+        """Params requesting the page after `page`, or None if it was the last."""
+        records = self._page_records(page, pagination)
+        if not records:
+            return None
+        if pagination.has_more_path and not self._jsonpath_first(
+            pagination.has_more_path, page.response
+        ):
+            return None
+
+        params = copy.deepcopy(params)
+        if pagination.style == "cursor":
+            cursor = self._jsonpath_first(pagination.cursor_path, page.response)
+            if not cursor or str(cursor) in seen_cursors:
+                return None
+            seen_cursors.add(str(cursor))
+            self._set_dotted(params, pagination.cursor_param, cursor)
+            return params
+
+        if page_size is not None and len(records) < int(page_size):
+            return None
+        if pagination.style == "offset":
+            offset = int(params.get(pagination.offset_param) or 0)
+            params[pagination.offset_param] = offset + len(records)
+        else:
+            params[pagination.page_param] = (
+                int(params.get(pagination.page_param) or 1) + 1
+            )
+        return params
+
+    async def iter_records(
+        self,
+        entity: str,
+        action: str | Action = Action.LIST,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield every record of a list or search result, across all pages.
+
+        Example:
+            async for contact in executor.iter_records("contacts"):
+                index(contact)
+        """
+        action = Action(action) if isinstance(action, str) else action
+        pagination = self._get_endpoint(entity, action).pagination
+        async for page in self.iter_pages(entity, action, params):
+            for record in self._page_records(page, pagination):
+                yield record
+
+    async def paginate(
+        self,
+        entity: str,
+        action: str | Action = Action.LIST,
+        params: dict[str, Any] | None = None,
+        max_records: int | None = None,
+        max_bytes: int | None = None,
+        max_seconds: float | None = None,
+        cursor: str | None = None,
+        prefetch: bool = True,
+        fields: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> PaginateResult:
+        """Read pages of a list or search result until the data or a budget runs out.
+
+        Pages are followed as in iter_pages(), with the next page prefetched
+        while the current one is processed. Reading stops at whichever comes
+        first: the last page, max_records records, max_bytes of records (as
+        compact JSON; at least one record is always returned) or max_seconds
+        (checked between pages). The result's next_cursor continues exactly
+        after the last returned record, even when a budget cut a page short.
+
+        Args:
+            entity: Entity name
+            action: list or search
+            params: Operation parameters for the first page (ignored with cursor)
+            max_records: Record budget (None for no limit)
+            max_bytes: Byte budget (None for no limit)
+            max_seconds: Time budget (None for no limit)
+            cursor: next_cursor of a previous result, to continue from there
+            prefetch: Request the next page while processing the current one
+            fields: Dotted paths to keep in each record (see ExecutionConfig.fields);
+                max_bytes counts the projected records
+            exclude: Dotted paths to drop from each record
+
+        Returns:
+            PaginateResult with the records, next_cursor and why reading stopped
+
+        Raises:
+            InvalidParameterError: If a budget is not positive or the cursor is malformed
+        """
+        for name, budget in (
+            ("max_records", max_records),
+            ("max_bytes", max_bytes),
+            ("max_seconds", max_seconds),
+        ):
+            if budget is not None and budget <= 0:
+                raise InvalidParameterError(f"{name} must be positive, got {budget}")
+
+        action = Action(action) if isinstance(action, str) else action
+        skip = 0
+        if cursor is not None:
+            params, skip = pagination.decode_cursor(cursor)
+        page_config = self._get_endpoint(entity, action).pagination
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+
+        result = PaginateResult(records=[])
+        async with contextlib.aclosing(
+            self._walk_pages(entity, action, params, prefetch=prefetch)
+        ) as walk:
+            async for page_params, page, next_params in walk:
+                result.pages += 1
+                page_records = projection.project(
+                    self._page_records(page, page_config), fields, exclude
+                )
+                for index in range(skip, len(page_records)):
+                    record = page_records[index]
+                    size = pagination.record_size(record)
+                    if max_records is not None and len(result.records) >= max_records:
+                        result.stopped_by = "max_records"
+                    elif (
+                        max_bytes is not None
+                        and result.records
+                        and result.bytes + size > max_bytes
+                    ):
+                        result.stopped_by = "max_bytes"
+                    if result.stopped_by != "end":
+                        result.next_cursor = pagination.encode_cursor(
+                            page_params, index
+                        )
+                        return result
+                    result.records.append(record)
+                    result.bytes += size
+                skip = 0
+
+                if next_params is None:
+                    break
+                if max_records is not None and len(result.records) >= max_records:
+                    result.stopped_by = "max_records"
+                elif deadline is not None and time.monotonic() >= deadline:
+                    result.stopped_by = "max_seconds"
+                if result.stopped_by != "end":
+                    result.next_cursor = pagination.encode_cursor(next_params)
+                    return result
+        return result
+
+    async def scan_time_range(
+        self,
+        entity: str,
+        action: str | Action,
+        start: Any,
+        end: Any,
+        params: dict[str, Any] | None = None,
+        shards: int = DEFAULT_SCAN_SHARDS,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        descending: bool = False,
+    ) -> ScanResult:
+        """Fetch every record in a time range by walking time windows concurrently.
+
+        Uses the operation's x-airbyte-sharding: the range is split into `shards`
+        windows whose pages are fetched concurrently (at most max_concurrency
+        requests in flight). A window whose results reach the API's result_cap is
+        split in half and re-walked, down to min_window_seconds, so capped search
+        APIs still return everything. Records are merged in time order.
+
+        A window of min_window_seconds that still reaches result_cap can't be
+        split further, so the API may have left records out of it. Such windows
+        are logged and listed in the result's truncated_windows.
+
+        Args:
+            entity: Entity name
+            action: list or search
+            start: Range start (datetime, date, ISO 8601 string or epoch seconds)
+            end: Range end, exclusive (same types as start)
+            params: Other operation parameters, applied to every window
+            shards: Initial number of windows
+            max_concurrency: Maximum requests in flight
+            descending: Return newest records first
+
+        Returns:
+            ScanResult with the records from all windows, ordered by
+            record_time_field, and the windows that may be incomplete
+
+        Raises:
+            ExecutorError: If the operation doesn't declare x-airbyte-sharding
+            InvalidParameterError: If the range is empty or can't be parsed
+
+        Example:
+            result = await executor.scan_time_range(
+                "calls", "list", "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z", shards=12
+            )
+            calls = result.records
+        """
+        action = Action(action) if isinstance(action, str) else action
+        endpoint = self._get_endpoint(entity, action)
+        config = endpoint.sharding
+        if config is None:
+            raise ExecutorError(
+                f"{entity}.{action.value} does not declare x-airbyte-sharding"
+            )
+        try:
+            lower, upper = sharding.to_datetime(start), sharding.to_datetime(end)
+        except ValueError as e:
+            raise InvalidParameterError(str(e)) from e
+        if upper <= lower:
+            raise InvalidParameterError(
+                f"scan_time_range: end ({end}) must be after start ({start})"
+            )
+
+        params = params or {}
+        granularity = sharding.granularity_seconds(config)
+        min_window = max(config.min_window_seconds, granularity)
+        cap = config.result_cap
+        semaphore = asyncio.Semaphore(max_concurrency)
+        truncated: list[tuple[datetime, datetime]] = []
+
+        async def scan(window_start: datetime, window_end: datetime) -> list[Any]:
+            splittable = (window_end - window_start).total_seconds() >= 2 * min_window
+            pages = self.iter_pages(
+                entity,
+                action,
+                sharding.apply_window(params, config, window_start, window_end),
+            )
+            records: list[Any] = []
+            try:
+                while True:
+                    async with semaphore:
+                        page = await anext(pages, None)
+                    if page is None:
+                        return records
+                    if cap:
+                        total = (
+                            self._jsonpath_first(config.total_path, page.response)
+                            if config.total_path and not records
+                            else None
+                        )
+                        fetched = len(records) + len(
+                            self._page_records(page, endpoint.pagination)
+                        )
+                        capped = (
+                            total is not None and int(total) >= cap
+                        ) or fetched >= cap
+                        if capped and splittable:
+                            break
+                        if capped and (window_start, window_end) not in truncated:
+                            logging.warning(
+                                f"scan_time_range: {entity}.{action.value} window "
+                                f"{window_start.isoformat()} to {window_end.isoformat()} "
+                                f"reached result_cap ({cap}) and can't be split further; "
+                                "records may be missing"
+                            )
+                            truncated.append((window_start, window_end))
+                    records.extend(self._page_records(page, endpoint.pagination))
+            finally:
+                await pages.aclose()
+
+            # The window hit the API's result cap: split it and walk both halves
+            middle = sharding.midpoint(window_start, window_end, granularity)
+            halves = await asyncio.gather(
+                scan(window_start, middle), scan(middle, window_end)
+            )
+            return halves[0] + halves[1]
+
+        if granularity > 1:
+            lower = sharding.floor(lower, granularity)
+        windows = sharding.split_range(lower, upper, shards, granularity)
+        results = await asyncio.gather(*(scan(*window) for window in windows))
+
+        records = [record for window in results for record in window]
+        records.sort(
+            key=lambda record: (
+                sharding.record_time(record, config.record_time_field) is None,
+                sharding.record_time(record, config.record_time_field) or 0.0,
+            ),
+        )
+        if descending:
+            records.reverse()
+        return ScanResult(
+            records=records, windows=len(windows), truncated_windows=sorted(truncated)
+        )
+
+    async def sync(
+        self,
+        entity: str,
+        state_store: StateStore,
+        params: dict[str, Any] | None = None,
+        action: str | Action | None = None,
+    ) -> SyncResult:
+        """Fetch the records of an entity changed since its previous sync.
+
+        Uses the x-airbyte-incremental cursor of the entity's list (or search)
+        operation. The previous sync's cursor is read from state_store and sent
+        as a server-side filter, starting lookback_seconds early; every page is
+        then read via x-airbyte-pagination. Records are deduplicated by primary
+        key (the newest version wins), and records re-read inside the lookback
+        window that haven't changed since the previous sync are dropped. The new
+        state is written only once all pages have been read.
+
+        Args:
+            entity: Entity name
+            state_store: Where cursors are kept between syncs
+            params: Other operation parameters
+            action: list or search (default: whichever declares x-airbyte-incremental)
+
+        Returns:
+            SyncResult with the changed records, oldest first
+
+        Raises:
+            ExecutorError: If no list/search operation declares x-airbyte-incremental
+
+        Example:
+            store = FileStateStore("sync-state.json")
+            result = await executor.sync("tickets", store)  # first run: everything
+            result = await executor.sync("tickets", store)  # later runs: changes only
+        """
+        candidates = (
+            [Action(action) if isinstance(action, str) else action]
+            if action is not None
+            else [Action.LIST, Action.SEARCH]
+        )
+        for candidate in candidates:
+            endpoint = self._operation_index.get((entity, candidate))
+            if endpoint is not None and endpoint.incremental is not None:
+                action = candidate
+                break
+        else:
+            # Unknown entities and actions get the same errors as execute()
+            self._get_endpoint(entity, candidates[0])
+            raise ExecutorError(
+                f"{entity} has no list or search operation declaring x-airbyte-incremental"
+            )
+        config = endpoint.incremental
+
+        key = f"{self.config.name}/{entity}"
+        previous = await state_store.get(key)
+        state = previous or {}
+        params = copy.deepcopy(params or {})
+        if state.get("resume_cursor") and config.resume_cursor_param:
+            self._set_dotted(params, config.resume_cursor_param, state["resume_cursor"])
+        else:
+            since = None
+            if state.get("cursor_time") is not None:
+                since = datetime.fromtimestamp(
+                    state["cursor_time"] - config.lookback_seconds, tz=timezone.utc
+                )
+            elif config.start:
+                since = sharding.to_datetime(config.start)
+            if since is not None:
+                params = incremental.apply_since(params, config, since)
+
+        cursor = state.get("cursor")
+        cursor_time = state.get("cursor_time")
+        resume_cursor = state.get("resume_cursor")
+        boundary: dict[str, list[Any]] = dict(state.get("boundary") or {})
+        changed: dict[str, tuple[float | None, Any, Any]] = {}
+        pages = read = 0
+
+        async for page in self.iter_pages(entity, action, params):
+            pages += 1
+            if config.resume_cursor_path:
+                resume_cursor = (
+                    self._jsonpath_first(config.resume_cursor_path, page.response)
+                    or resume_cursor
+                )
+            for record in self._page_records(page, endpoint.pagination):
+                read += 1
+                pk = (
+                    self._get_dotted(record, config.primary_key)
+                    if isinstance(record, dict)
+                    else None
+                )
+                record_key = str(pk) if pk is not None else f"#{read}"
+                value = (
+                    self._get_dotted(record, config.cursor_field)
+                    if isinstance(record, dict)
+                    else None
+                )
+                moment = sharding.record_time(record, config.cursor_field)
+                delivered = boundary.get(record_key)
+                if value is not None and delivered and delivered[0] == value:
+                    continue  # Re-read inside the lookback window, unchanged
+                existing = changed.get(record_key)
+                if existing is None or (moment or 0.0) >= (existing[0] or 0.0):
+                    changed[record_key] = (moment, value, record)
+                if moment is not None and (cursor_time is None or moment > cursor_time):
+                    cursor_time, cursor = moment, value
+
+        if cursor_time is not None:
+            horizon = cursor_time - config.lookback_seconds
+            boundary.update(
+                (record_key, [value, moment])
+                for record_key, (moment, value, _) in changed.items()
+                if moment is not None and not record_key.startswith("#")
+            )
+            boundary = {
+                record_key: entry
+                for record_key, entry in boundary.items()
+                if entry[1] is not None and entry[1] >= horizon
+            }
+
+        new_state = {
+            "cursor": cursor,
+            "cursor_time": cursor_time,
+            "resume_cursor": resume_cursor,
+            "boundary": boundary,
+        }
+        await state_store.set(key, new_state)
+
+        ordered = sorted(
+            changed.values(), key=lambda entry: (entry[0] is None, entry[0] or 0.0)
+        )
+        return SyncResult(
+            records=[record for _, _, record in ordered],
+            state=new_state,
+            previous_state=previous,
+            pages=pages,
+            skipped=read - len(changed),
+        )
+
+    @classmethod
+    def _page_records(cls, page: StandardExecuteResult, pagination: Any) -> list[Any]:
+        """Records on one page, for emptiness checks and cursor bookkeeping."""
+        data = page.data
+        if isinstance(data, dict) and pagination and pagination.data_path:
+            data = cls._get_dotted(data, pagination.data_path)
+        if isinstance(data, list):
+            return data
+        return [data] if data else []
+
+    @staticmethod
+    def _jsonpath_first(expression: str | None, data: Any) -> Any:
+        """First value matched by a JSONPath expression, or None."""
+        if not expression:
+            return None
+        matches = parse_jsonpath(expression).find(data)
+        return matches[0].value if matches else None
+
+    async def _execute_expanded(
+        self,
+        entity: str,
+        action: Action,
+        params: dict[str, Any],
+        expand: list[str],
+    ) -> StandardExecuteResult:
+        """Execute a read and attach the related records named in expand.
+
+        Relationships come from the operation's x-airbyte-relationships. Native
+        sideload parameters are added to the request; remaining foreign keys are
+        collected across all records, deduped and resolved with one get_many()
+        per target entity.
+        """
+        selected = self._select_relationships(entity, action, expand)
+
+        # Several relationships may share one sideload parameter (include=users,groups)
+        sideload_values: dict[str, list[str]] = {}
+        csv_params: set[str] = set()
+        for relationship in selected.values():
+            sideload = relationship.sideload
+            if not sideload:
+                continue
+            values = sideload_values.setdefault(sideload.param, [])
+            if sideload.param in params and not values:
+                existing = params[sideload.param]
+                values.extend(
+                    existing if isinstance(existing, list) else str(existing).split(",")
+                )
+            if sideload.value not in values:
+                values.append(sideload.value)
+            if sideload.style == "csv":
+                csv_params.add(sideload.param)
+        extra_query_params = {
+            param: ",".join(values) if param in csv_params else values
+            for param, values in sideload_values.items()
+        }
+
+        result = await self._standard_handler.execute_operation(
+            entity, action, params, extra_query_params=extra_query_params
+        )
+        await self._expand_records(result.data, selected, result.response)
+        return result
+
+    def _select_relationships(
+        self, entity: str, action: Action, expand: list[str]
+    ) -> dict[str, RelationshipConfig]:
+        """Look up the relationships named in expand, rejecting unknown names."""
+        if action not in (Action.GET, Action.LIST, Action.SEARCH):
+            raise InvalidParameterError(
+                f"expand is only supported for get, list and search, not '{action.value}'"
+            )
+        relationships = self._get_endpoint(entity, action).relationships or {}
+        unknown = [name for name in expand if name not in relationships]
+        if unknown:
+            raise InvalidParameterError(
+                f"Cannot expand {unknown} on {entity}.{action.value}. "
+                f"Available relationships: {list(relationships)}"
+            )
+        return {name: relationships[name] for name in dict.fromkeys(expand)}
+
+    async def _execute_filtered(
+        self,
+        entity: str,
+        action: Action,
+        params: dict[str, Any],
+        where: dict[str, Any] | None,
+        limit: int | None,
+        expand: list[str] | None = None,
+    ) -> StandardExecuteResult:
+        """Execute a list/search with a where= filter and/or a record limit.
+
+        Predicates on fields the operation's x-airbyte-filters declares are pushed
+        into the request. Pages are then read one at a time and the remaining
+        predicates applied to each record, stopping as soon as limit records have
+        matched, so no more pages are fetched than needed.
+
+        Without a limit, at most DEFAULT_WHERE_LIMIT records are returned.
+        metadata["has_more"] is true when reading stopped at the limit before
+        the last page, so more matches may exist. The metadata extracted from
+        the last page read is kept. Unless records were filtered locally,
+        metadata["next_cursor"] continues right after the last returned record
+        with paginate(cursor=...); it is None after the last page.
+        """
+        if action not in (Action.LIST, Action.SEARCH):
+            raise InvalidParameterError(
+                f"where and limit are only supported for list and search, not '{action.value}'"
+            )
+        if limit is not None and limit < 1:
+            raise InvalidParameterError(f"limit must be at least 1, got {limit}")
+        endpoint = self._get_endpoint(entity, action)
+        selected = self._select_relationships(entity, action, expand) if expand else {}
+
+        predicates = filters.parse_where(where or {})
+        pushed, residual = filters.plan(predicates, endpoint.filters, params)
+        if pushed:
+            params = filters.apply_pushdown(params, endpoint.filters, pushed)
+        limit = limit if limit is not None else DEFAULT_WHERE_LIMIT
+
+        page_config = endpoint.pagination
+        if (
+            not residual
+            and page_config
+            and page_config.limit_param in endpoint.query_params + endpoint.body_fields
+            and page_config.limit_param not in params
+        ):
+            # Every record on a page counts toward limit: don't fetch more
+            page_size = page_config.max_page_size or page_config.default_page_size
+            params = {**params, page_config.limit_param: min(limit, page_size)}
+
+        records: list[Any] = []
+        pages = scanned = 0
+        page_meta: dict[str, Any] = {}
+        next_cursor = None
+        has_more = False
+        async with contextlib.aclosing(
+            self._walk_pages(entity, action, params)
+        ) as walk:
+            async for page_params, page, next_params in walk:
+                pages += 1
+                page_meta = page.metadata or {}
+                page_records = self._page_records(page, page_config)
+                for index, record in enumerate(page_records):
+                    scanned += 1
+                    if filters.matches(record, residual):
+                        records.append(record)
+                        if len(records) >= limit:
+                            break
+                if len(records) >= limit:
+                    if index + 1 < len(page_records):
+                        next_cursor = pagination.encode_cursor(page_params, index + 1)
+                    elif next_params is not None:
+                        next_cursor = pagination.encode_cursor(next_params)
+                    has_more = next_cursor is not None
+                    break
+
+        if selected:
+            await self._expand_records(records, selected, {})
+        return StandardExecuteResult(
+            data=records,
+            metadata={
+                **page_meta,
+                "pages": pages,
+                "scanned": scanned,
+                "pushed_down": [str(p) for p in pushed],
+                "filtered_locally": [str(p) for p in residual],
+                "has_more": has_more,
+                # A cursor would resume without the local filters
+                "next_cursor": None if residual else next_cursor,
+            },
+        )
+
+    async def _expand_records(
+        self,
+        data: Any,
+        relationships: dict[str, RelationshipConfig],
+        response: Any,
+    ) -> None:
+        """Resolve relationships for every record in data, in place."""
+        records = [
+            record
+            for record in (data if isinstance(data, list) else [data])
+            if isinstance(record, dict)
+        ]
+        if not records:
+            return
+
+        # Identity map for this call: target entity -> {str(id): record}
+        identity: dict[str, dict[str, Any]] = {}
+        for relationship in relationships.values():
+            known = identity.setdefault(relationship.entity, {})
+            sideload = relationship.sideload
+            if not (sideload and sideload.records_extractor):
+                continue
+            for match in parse_jsonpath(sideload.records_extractor).find(response):
+                items = match.value if isinstance(match.value, list) else [match.value]
+                for item in items:
+                    key = self._get_dotted(item, relationship.target_key)
+                    if key is not None:
+                        known.setdefault(str(key), item)
+
+        # Foreign keys that weren't sideloaded, deduped per target entity
+        missing: dict[str, dict[str, Any]] = {}
+        for relationship in relationships.values():
+            known = identity[relationship.entity]
+            for record in records:
+                keys, _ = self._collect_dotted(record, relationship.foreign_key)
+                for key in keys:
+                    if not isinstance(key, dict) and str(key) not in known:
+                        missing.setdefault(relationship.entity, {}).setdefault(
+                            str(key), key
+                        )
+
+        entities = list(missing)
+        resolved = await asyncio.gather(
+            *(
+                self.get_many(entity, list(missing[entity].values()))
+                for entity in entities
+            )
+        )
+        for entity, records_by_id in zip(entities, resolved):
+            for key, related in records_by_id.items():
+                identity[entity][str(key)] = related
+
+        for name, relationship in relationships.items():
+            known = identity[relationship.entity]
+            target_field = relationship.target_field or name
+            for record in records:
+                keys, many = self._collect_dotted(record, relationship.foreign_key)
+                # Inline expansions (e.g. Stripe expand[]) are already records
+                related = [
+                    key if isinstance(key, dict) else known.get(str(key))
+                    for key in keys
+                ]
+                if many:
+                    self._set_dotted(
+                        record, target_field, [r for r in related if r is not None]
+                    )
+                elif related and related[0] is not None:
+                    self._set_dotted(record, target_field, related[0])
+                elif target_field != relationship.foreign_key:
+                    # Keep the raw ID when the record would overwrite it with nothing
+                    self._set_dotted(record, target_field, None)
+
+    @staticmethod
+    def _collect_dotted(data: Any, path: str) -> tuple[list[Any], bool]:
+        """Collect values at a dot-notation path, traversing lists along the way.
+
+        Returns the non-null values found and whether any list was traversed
+        (i.e. whether the path is to-many).
+        """
+        values = [data]
+        many = False
+        for part in path.split("."):
+            found = []
+            for value in values:
+                if isinstance(value, list):
+                    many = True
+                    items = value
+                else:
+                    items = [value]
+                found.extend(
+                    item[part]
+                    for item in items
+                    if isinstance(item, dict) and item.get(part) is not None
+                )
+            values = found
+        collected = []
+        for value in values:
+            if isinstance(value, list):
+                many = True
+                collected.extend(item for item in value if item is not None)
+            else:
+                collected.append(value)
+        return collected, many
+
+    def _get_endpoint(self, entity: str, action: Action) -> EndpointDefinition:
+        """Look up an endpoint, raising the same errors as execute()."""
+        entity_def = self._entity_index.get(entity)
+        if not entity_def:
+            raise EntityNotFoundError(
+                f"Entity '{entity}' not found in connector. "
+                f"Available entities: {list(self._entity_index.keys())}"
+            )
+        endpoint = self._operation_index.get((entity, action))
+        if action not in entity_def.actions or not endpoint:
+            supported_actions = [a.value for a in entity_def.actions]
+            raise ActionNotSupportedError(
+                f"Action '{action.value}' not supported for entity '{entity}'. "
+                f"Supported actions: {supported_actions}"
+            )
+        return endpoint
+
+    async def _batch_read(
+        self,
+        endpoint: EndpointDefinition,
+        ids: list[str],
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Send one x-airbyte-batch-read request and map records by ID."""
+        config = endpoint.batch_read
+        path = self._build_path(config.path, params)
+        path_placeholders = set(re.findall(r"\{(\w+)\}", config.path))
+        extra = {k: v for k, v in params.items() if k not in path_placeholders}
+
+        if config.ids_format == "csv":
+            encoded_ids: Any = ",".join(ids)
+        elif config.ids_format == "objects":
+            encoded_ids = [{config.id_key: i} for i in ids]
+        else:
+            encoded_ids = ids
+
+        query: dict[str, Any] | None = None
+        body: dict[str, Any] | None = None
+        if config.ids_location == "query":
+            query = {**extra, config.ids_field: encoded_ids}
+        else:
+            body = {**(config.body or {}), **extra}
+            self._set_dotted(body, config.ids_field, encoded_ids)
+
+        response = await self.http_client.request(
+            method=config.method,
+            path=path,
+            params=query,
+            json=body,
+        )
+
+        matches = [
+            m.value for m in parse_jsonpath(config.record_extractor).find(response)
+        ]
+        records = (
+            matches[0]
+            if len(matches) == 1 and isinstance(matches[0], list)
+            else matches
+        )
+
+        by_id: dict[str, Any] = {}
+        for record in records:
+            record_id = self._get_dotted(record, config.record_id_field)
+            if record_id is not None:
+                by_id[str(record_id)] = record
+        return by_id
+
+    @staticmethod
+    def _get_dotted(data: Any, path: str) -> Any:
+        """Read a nested value using dot notation (e.g. "metaData.id")."""
+        for part in path.split("."):
+            if not isinstance(data, dict):
+                return None
+            data = data.get(part)
+        return data
+
+    @staticmethod
+    def _set_dotted(data: dict[str, Any], path: str, value: Any) -> None:
+        """Set a nested value using dot notation, creating dicts as needed."""
+        *parents, leaf = path.split(".")
+        for part in parents:
+            data = data.setdefault(part, {})
+        data[leaf] = value
+
     def _build_path(self, path_template: str, params: dict[str, Any]) -> str:
         """Build path by replacing {param} placeholders with URL-encoded values.
 
@@ -651,7 +2166,7 @@ class LocalExecutor:
             Request body dict or None if no body needed
         """
         if endpoint.graphql_body:
-            return self._build_graphql_body(endpoint.graphql_body, params)
+            return self._build_graphql_body(endpoint, params)
         elif endpoint.body_fields:
             return self._extract_body(endpoint.body_fields, params)
         return None
@@ -682,175 +2197,60 @@ class LocalExecutor:
 
         return {}
 
-    def _process_graphql_fields(
-        self, query: str, graphql_config: dict[str, Any], params: dict[str, Any]
-    ) -> str:
-        """Process GraphQL query field selection.
-
-        Handles:
-        - Dynamic fields from params['fields']
-        - Default fields from config
-        - String vs list format for default_fields
-
-        Args:
-            query: GraphQL query string (may contain {{ fields }} placeholder)
-            graphql_config: GraphQL configuration dict
-            params: Parameters from execute() call
-
-        Returns:
-            Processed query string with fields injected
-        """
-        if "{{ fields }}" not in query:
-            return query
-
-        # Check for explicit fields parameter
-        if "fields" in params and params["fields"]:
-            return self._inject_graphql_fields(query, params["fields"])
-
-        # Use default fields if available
-        if "default_fields" not in graphql_config:
-            return query  # Placeholder remains (could raise error in the future)
-
-        default_fields = graphql_config["default_fields"]
-        if isinstance(default_fields, str):
-            # Already in GraphQL format - direct replacement
-            return query.replace("{{ fields }}", default_fields)
-        elif isinstance(default_fields, list):
-            # List format - convert to GraphQL
-            return self._inject_graphql_fields(query, default_fields)
+    async def _send_graphql(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any],
+        query_params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a GraphQL body, merging it with concurrent queries to the same endpoint."""
+
+        async def send(request_body: dict[str, Any]) -> dict[str, Any]:
+            return await self.http_client.request(
+                method=method,
+                path=path,
+                params=query_params or None,
+                json=request_body,
+            )
 
-        return query
+        # Query-string parameters belong to this one request, and a merged document
+        # could only carry one caller's, so such queries are never batched
+        if self.graphql_batch_window_ms <= 0 or query_params:
+            return await send(body)
+        batcher = get_batcher(
+            (
+                self.config.name,
+                self.http_client.base_url,
+                method,
+                path,
+                credentials_fingerprint(self.secrets),
+            ),
+            window_ms=self.graphql_batch_window_ms,
+            max_batch_size=self.graphql_batch_max_size,
+            max_cost=self.graphql_batch_max_cost,
+        )
+        return await batcher.execute(body, send)
 
     def _build_graphql_body(
-        self, graphql_config: dict[str, Any], params: dict[str, Any]
+        self, endpoint: EndpointDefinition, params: dict[str, Any]
     ) -> dict[str, Any]:
         """Build GraphQL request body with variable substitution and field selection.
 
         Args:
-            graphql_config: GraphQL configuration from x-airbyte-body-type extension
+            endpoint: Endpoint definition with an x-airbyte-body-type GraphQL config
             params: Parameters from execute() call
 
         Returns:
             GraphQL request body: {"query": "...", "variables": {...}}
         """
-        query = graphql_config["query"]
-
-        # Process field selection (dynamic fields or default fields)
-        query = self._process_graphql_fields(query, graphql_config, params)
-
-        body = {"query": query}
-
-        # Substitute variables from params
-        if "variables" in graphql_config and graphql_config["variables"]:
-            body["variables"] = self._interpolate_variables(
-                graphql_config["variables"], params
+        key = (endpoint.method, endpoint.path)
+        template = self._graphql_templates.get(key)
+        if template is None:
+            template = self._graphql_templates[key] = CompiledGraphQLBody(
+                endpoint.graphql_body
             )
-
-        # Add operation name if specified
-        if "operationName" in graphql_config:
-            body["operationName"] = graphql_config["operationName"]
-
-        return body
-
-    def _convert_nested_field_to_graphql(self, field: str) -> str:
-        """Convert dot-notation field to GraphQL field selection.
-
-        Example: "primaryLanguage.name" -> "primaryLanguage { name }"
-
-        Args:
-            field: Field name in dot notation (e.g., "primaryLanguage.name")
-
-        Returns:
-            GraphQL field selection string
-        """
-        if "." not in field:
-            return field
-
-        parts = field.split(".")
-        result = parts[0]
-        for part in parts[1:]:
-            result += f" {{ {part}"
-        result += " }" * (len(parts) - 1)
-        return result
-
-    def _inject_graphql_fields(self, query: str, fields: list[str]) -> str:
-        """Inject field selection into GraphQL query.
-
-        Replaces field selection placeholders ({{ fields }}) with actual field list.
-        Supports nested fields using dot notation (e.g., "primaryLanguage.name").
-
-        Args:
-            query: GraphQL query string (may contain {{ fields }} placeholder)
-            fields: List of fields to select (e.g., ["id", "name", "primaryLanguage.name"])
-
-        Returns:
-            GraphQL query with fields injected
-
-        Example:
-            Input query: "query { repository { {{ fields }} } }"
-            Fields: ["id", "name", "primaryLanguage { name }"]
-            Output: "query { repository { id name primaryLanguage { name } } }"
-        """
-        # Check if query has field placeholder
-        if "{{ fields }}" not in query:
-            # No placeholder - return query as-is (backward compatible)
-            return query
-
-        # Convert field list to GraphQL field selection
-        graphql_fields = [
-            self._convert_nested_field_to_graphql(field) for field in fields
-        ]
-
-        # Replace placeholder with field list
-        fields_str = " ".join(graphql_fields)
-        return query.replace("{{ fields }}", fields_str)
-
-    def _interpolate_variables(
-        self, variables: dict[str, Any], params: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Recursively interpolate variables using params.
-
-        Preserves types (doesn't stringify everything).
-
-        Supports:
-        - Direct replacement: "{{ owner }}" → params["owner"] (preserves type)
-        - Nested objects: {"input": {"name": "{{ name }}"}}
-        - Arrays: [{"id": "{{ id }}"}]
-        - Unsubstituted placeholders: "{{ states }}" → None (for optional params)
-
-        Args:
-            variables: Variables dict with template placeholders
-            params: Parameters to substitute
-
-        Returns:
-            Interpolated variables dict with types preserved
-        """
-
-        def interpolate_value(value: Any) -> Any:
-            if isinstance(value, str):
-                # Check for exact template match (preserve type)
-                for key, param_value in params.items():
-                    placeholder = f"{{{{ {key} }}}}"
-                    if value == placeholder:
-                        return param_value  # Return actual value (int, list, etc.)
-                    elif placeholder in value:
-                        # Partial match - do string replacement
-                        value = value.replace(placeholder, str(param_value))
-
-                # Check if any unsubstituted placeholders remain
-                # If so, return None (treats as "not provided" for optional params)
-                if re.search(r"\{\{\s*\w+\s*\}\}", value):
-                    return None
-
-                return value
-            elif isinstance(value, dict):
-                return {k: interpolate_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [interpolate_value(item) for item in value]
-            else:
-                return value
-
-        return interpolate_value(variables)
+        return template.build(params)
 
     def _extract_records(
         self,
@@ -1003,6 +2403,13 @@ class LocalExecutor:
                 f"Provided parameters: {list(params.keys())}"
             )
 
+    async def warm_up(self) -> bool:
+        """Pre-open a keep-alive connection to the connector's API.
+
+        See HTTPClient.warm_up.
+        """
+        return await self.http_client.warm_up()
+
     async def close(self):
         """Close async HTTP client and logger."""
         self.tracker.track_session_end()
@@ -1042,9 +2449,17 @@ class _StandardOperationHandler:
         }
 
     async def execute_operation(
-        self, entity: str, action: Action, params: dict[str, Any]
+        self,
+        entity: str,
+        action: Action,
+        params: dict[str, Any],
+        extra_query_params: dict[str, Any] | None = None,
     ) -> StandardExecuteResult:
-        """Execute standard REST operation with full telemetry and error handling."""
+        """Execute standard REST operation with full telemetry and error handling.
+
+        extra_query_params are sent even if the operation doesn't declare them
+        (used for relationship sideloading).
+        """
         tracer = trace.get_tracer("airbyte.connector-sdk.executor.local")
 
         with tracer.start_as_current_span(
@@ -1105,6 +2520,8 @@ class _StandardOperationHandler:
                 query_params = self.ctx.extract_query_params(
                     endpoint.query_params, params
                 )
+                if extra_query_params:
+                    query_params = {**query_params, **extra_query_params}
 
                 # Build request body (GraphQL or standard)
                 body = self.ctx.build_request_body(endpoint, params)
@@ -1113,18 +2530,24 @@ class _StandardOperationHandler:
                 request_kwargs = self.ctx.determine_request_format(endpoint, body)
 
                 # Execute async HTTP request
-                response = await self.ctx.http_client.request(
-                    method=endpoint.method,
-                    path=path,
-                    params=query_params if query_params else None,
-                    json=request_kwargs.get("json"),
-                    data=request_kwargs.get("data"),
-                )
+                if endpoint.graphql_body and request_kwargs.get("json"):
+                    response = await self.ctx.executor._send_graphql(
+                        endpoint.method, path, request_kwargs["json"], query_params
+                    )
+                else:
+                    response = await self.ctx.http_client.request(
+                        method=endpoint.method,
+                        path=path,
+                        params=query_params if query_params else None,
+                        json=request_kwargs.get("json"),
+                        data=request_kwargs.get("data"),
+                    )
 
                 # Extract metadata from original response (before record extraction)
                 metadata = self.ctx.executor._extract_metadata(response, endpoint)
 
                 # Extract records if extractor configured
+                raw_response = response
                 response = self.ctx.extract_records(response, endpoint)
 
                 # Assume success with 200 status code if no exception raised
@@ -1135,7 +2558,9 @@ class _StandardOperationHandler:
                 span.set_attribute("http.status_code", status_code)
 
                 # Return StandardExecuteResult with data and metadata
-                return StandardExecuteResult(data=response, metadata=metadata)
+                return StandardExecuteResult(
+                    data=response, metadata=metadata, response=raw_response
+                )
 
             except (EntityNotFoundError, ActionNotSupportedError) as e:
                 # Validation errors - record in span
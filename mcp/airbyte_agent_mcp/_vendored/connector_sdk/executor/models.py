@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator, Protocol, runtime_checkable
 
@@ -29,6 +30,18 @@ class ExecutionConfig:
             - For GET: {"id": "cus_123"}
             - For LIST: {"limit": 10}
             - For CREATE: {"email": "...", "name": "..."}
+        expand: Optional relationship names (from x-airbyte-relationships) whose
+            related records are resolved and attached to get/list/search results
+        where: Optional list/search filter: field (dot notation) -> value, list of
+            values, or {operator: value} with eq, ne, gt, gte, lt, lte, in, contains.
+            Predicates the API supports (x-airbyte-filters) are pushed down; the
+            rest are applied locally while paging
+        limit: Optional maximum number of list/search records to return; results
+            are paginated until it is reached. Without local filtering,
+            meta["next_cursor"] continues with paginate(cursor=...)
+        fields: Optional dotted paths to keep in each returned record (others are
+            dropped), e.g. ["id", "properties.email"]; paths descend into lists
+        exclude: Optional dotted paths to drop from each returned record
 
     Example:
         config = ExecutionConfig(
@@ -41,6 +54,11 @@ class ExecutionConfig:
     entity: str
     action: str
     params: dict[str, Any] | None = field(default=None, kw_only=True)
+    expand: list[str] | None = field(default=None, kw_only=True)
+    where: dict[str, Any] | None = field(default=None, kw_only=True)
+    limit: int | None = field(default=None, kw_only=True)
+    fields: list[str] | None = field(default=None, kw_only=True)
+    exclude: list[str] | None = field(default=None, kw_only=True)
 
 
 @dataclass
@@ -54,6 +72,7 @@ class StandardExecuteResult:
     Args:
         data: Response data from the operation
         metadata: Optional metadata extracted from response (e.g., pagination info)
+        response: Full response body before record extraction (e.g. for sideloaded records)
 
     Example:
         result = StandardExecuteResult(
@@ -64,6 +83,7 @@ class StandardExecuteResult:
 
     data: dict[str, Any]
     metadata: dict[str, Any] | None = None
+    response: Any = field(default=None, repr=False)
 
 
 @dataclass
@@ -111,6 +131,140 @@ class ExecutionResult:
     meta: dict[str, Any] | None = None
 
 
+@dataclass
+class BatchStats:
+    """Timing and outcome summary for one batch execution.
+
+    Args:
+        total: Number of operations requested
+        unique: Number of operations actually executed after deduplication
+        succeeded: Number of results with success=True (counting duplicates)
+        failed: Number of results with success=False (counting duplicates)
+        max_concurrency: Concurrency cap the batch ran with
+        wall_time_ms: Time from start of the batch to its last result
+        min_ms / mean_ms / p50_ms / p95_ms / max_ms: Per-operation latency
+            across the unique operations
+    """
+
+    total: int = 0
+    unique: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    max_concurrency: int = 0
+    wall_time_ms: float = 0.0
+    min_ms: float = 0.0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def deduplicated(self) -> int:
+        """Number of operations served from another identical operation's result."""
+        return self.total - self.unique
+
+
+@dataclass
+class BatchResult:
+    """Results of a batch execution, in input order, plus batch statistics.
+
+    Example:
+        batch = await executor.execute_many(configs, max_concurrency=5)
+        for config, result in zip(configs, batch.results):
+            if not result.success:
+                print(f"{config.entity}.{config.action} failed: {result.error}")
+        print(f"{batch.stats.succeeded}/{batch.stats.total} in {batch.stats.wall_time_ms:.0f}ms")
+    """
+
+    results: list[ExecutionResult]
+    stats: BatchStats
+
+
+@dataclass
+class SyncResult:
+    """Records changed since the previous sync of an entity, plus the new state.
+
+    Args:
+        records: Changed records, deduplicated by primary key, oldest first
+        state: State persisted for the next sync
+        previous_state: State the sync started from (None on a first sync)
+        pages: Number of pages read
+        skipped: Records dropped as duplicates or unchanged re-reads
+
+    Example:
+        result = await executor.sync("tickets", FileStateStore("state.json"))
+        for ticket in result.records:
+            upsert(ticket)
+    """
+
+    records: list[Any]
+    state: dict[str, Any]
+    previous_state: dict[str, Any] | None = None
+    pages: int = 0
+    skipped: int = 0
+
+    @property
+    def full_refresh(self) -> bool:
+        """Whether this sync read everything because there was no stored cursor."""
+        return self.previous_state is None
+
+
+@dataclass
+class PaginateResult:
+    """Records read across pages until the data or a budget ran out.
+
+    Args:
+        records: Records in API order
+        next_cursor: Token for paginate(cursor=...) continuing right after the
+            last returned record (None when every page was read)
+        pages: Number of pages read
+        bytes: Size of the returned records as compact JSON
+        stopped_by: "end", "max_records", "max_bytes" or "max_seconds"
+
+    Example:
+        result = await executor.paginate("issues", params={"state": "open"}, max_records=500)
+        while result.has_more:
+            result = await executor.paginate("issues", cursor=result.next_cursor, max_records=500)
+    """
+
+    records: list[Any]
+    next_cursor: str | None = None
+    pages: int = 0
+    bytes: int = 0
+    stopped_by: str = "end"
+
+    @property
+    def has_more(self) -> bool:
+        """Whether more records can be read with next_cursor."""
+        return self.next_cursor is not None
+
+
+@dataclass
+class ScanResult:
+    """Records of a time range read by scan_time_range().
+
+    Args:
+        records: Records from all windows, ordered by record_time_field
+        windows: Number of windows the range was initially split into
+        truncated_windows: (start, end) of windows that reached the API's
+            result_cap at min_window_seconds, so may be missing records
+
+    Example:
+        result = await executor.scan_time_range("calls", "list", start, end)
+        if result.truncated:
+            print("incomplete windows:", result.truncated_windows)
+    """
+
+    records: list[Any]
+    windows: int = 0
+    truncated_windows: list[tuple[datetime, datetime]] = field(default_factory=list)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether some windows may be missing records."""
+        return bool(self.truncated_windows)
+
+
 # ============================================================================
 # Executor Protocol
 # ============================================================================
@@ -0,0 +1,47 @@
+"""Resume cursors and size accounting for budgeted pagination.
+
+LocalExecutor.paginate() stops when a record, byte or time budget runs out and
+returns a cursor to continue from. The cursor is an opaque URL-safe token
+holding the request params of the page to fetch next and how many records of
+that page were already returned, so a walk stopped in the middle of a page
+resumes right after the last returned record.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from .models import InvalidParameterError
+
+
+def encode_cursor(params: dict[str, Any], skip: int = 0) -> str:
+    """Encode the params of the next page to fetch and the records to skip on it."""
+    payload = json.dumps(
+        {"params": params, "skip": skip}, separators=(",", ":"), default=str
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[dict[str, Any], int]:
+    """Decode a cursor from encode_cursor() into (params, skip).
+
+    Raises:
+        InvalidParameterError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        params, skip = payload["params"], int(payload["skip"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidParameterError(f"Invalid pagination cursor: {e}") from None
+    if not isinstance(params, dict) or skip < 0:
+        raise InvalidParameterError("Invalid pagination cursor")
+    return params, skip
+
+
+def record_size(record: Any) -> int:
+    """Size of a record serialized as compact JSON, in bytes."""
+    return len(json.dumps(record, separators=(",", ":"), default=str).encode())
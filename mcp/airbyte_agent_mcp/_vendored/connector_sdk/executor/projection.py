@@ -0,0 +1,107 @@
+"""Field projection for execution results (ExecutionConfig.fields / exclude).
+
+fields keeps only the listed dotted paths of each record; exclude drops the
+listed paths. Paths descend through lists, so "lines.amount" keeps the amount
+of every line item. Both are compiled once into a path tree and cached, so
+repeated calls with the same projection don't re-parse it.
+
+Example:
+    projection = compile_projection(("id", "properties.email"), ())
+    projection.apply({"id": 1, "properties": {"email": "a@b.c", "phone": "1"}})
+    # {"id": 1, "properties": {"email": "a@b.c"}}
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from .models import InvalidParameterError
+
+_KEEP = True
+"""Tree leaf: the whole value at this path is selected."""
+
+
+def _build_tree(paths: Iterable[str]) -> dict[str, Any]:
+    tree: dict[str, Any] = {}
+    for path in paths:
+        parts = path.split(".")
+        if not path or not all(parts):
+            raise InvalidParameterError(f"Invalid field path: {path!r}")
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is _KEEP:
+                # A shorter path already selects this whole subtree
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = _KEEP
+    return tree
+
+
+def _include(value: Any, tree: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_include(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, subtree in tree.items():
+        if key in value:
+            projected[key] = (
+                value[key] if subtree is _KEEP else _include(value[key], subtree)
+            )
+    return projected
+
+
+def _exclude(value: Any, tree: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_exclude(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, item in value.items():
+        subtree = tree.get(key)
+        if subtree is _KEEP:
+            continue
+        projected[key] = item if subtree is None else _exclude(item, subtree)
+    return projected
+
+
+class Projection:
+    """A compiled fields/exclude projection; see compile_projection()."""
+
+    def __init__(self, fields: tuple[str, ...], exclude: tuple[str, ...]):
+        self.fields = fields
+        self.exclude = exclude
+        self._include_tree = _build_tree(fields) if fields else None
+        self._exclude_tree = _build_tree(exclude) if exclude else None
+
+    def apply(self, data: Any) -> Any:
+        """Project a record, or each record of a list, returning new objects."""
+        if self._include_tree is not None:
+            data = _include(data, self._include_tree)
+        if self._exclude_tree is not None:
+            data = _exclude(data, self._exclude_tree)
+        return data
+
+
+@lru_cache(maxsize=256)
+def compile_projection(fields: tuple[str, ...], exclude: tuple[str, ...]) -> Projection:
+    """Compile (and cache) a projection for the given dotted paths.
+
+    Raises:
+        InvalidParameterError: If a path is empty or has an empty segment
+    """
+    return Projection(fields, exclude)
+
+
+def project(
+    data: Any,
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> Any:
+    """Apply a fields/exclude projection to a record or list of records."""
+    if not fields and not exclude:
+        return data
+    return compile_projection(tuple(fields or ()), tuple(exclude or ())).apply(data)
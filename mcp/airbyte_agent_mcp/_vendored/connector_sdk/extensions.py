@@ -420,6 +420,551 @@ Example:
 """
 
 
+AIRBYTE_BATCH_READ = "x-airbyte-batch-read"
+"""
+Extension: x-airbyte-batch-read
+Location: Operation object (on individual HTTP operations with x-airbyte-action: get)
+Type: BatchReadConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares a native bulk read endpoint that fetches many records by ID in one
+    request. LocalExecutor.get_many(entity, ids) splits the IDs into chunks of
+    max_batch_size, sends the chunks concurrently, and maps the returned records
+    back to their IDs via record_id_field. Entities without this extension fall
+    back to concurrent single `get` calls.
+
+Structure:
+    - path: Bulk endpoint path (required, may contain {param} placeholders)
+    - method: GET or POST (default: POST)
+    - ids_location: "query" or "body" (default: body)
+    - ids_field: Query parameter or body field receiving the IDs; dot notation
+      for nested body fields (default: ids)
+    - ids_format: "list", "csv" or "objects" (default: list)
+    - id_key: Key for each object when ids_format is "objects" (default: id)
+    - body: Static fields merged into every request body
+    - max_batch_size: Maximum IDs per request (default: 100)
+    - record_extractor: JSONPath to the records array (required)
+    - record_id_field: Field holding each record's ID, dot notation (default: id)
+
+Example (HubSpot):
+    ```yaml
+    /crm/v3/objects/contacts/{contactId}:
+      get:
+        x-airbyte-entity: contacts
+        x-airbyte-action: get
+        x-airbyte-batch-read:
+          path: /crm/v3/objects/contacts/batch/read
+          ids_field: inputs
+          ids_format: objects
+          max_batch_size: 100
+          record_extractor: $.results
+    ```
+
+Example (Zendesk):
+    ```yaml
+    /users/{user_id}.json:
+      get:
+        x-airbyte-entity: users
+        x-airbyte-action: get
+        x-airbyte-batch-read:
+          path: /users/show_many.json
+          method: GET
+          ids_location: query
+          ids_format: csv
+          record_extractor: $.users
+    ```
+
+Example (Gong):
+    ```yaml
+    /v2/calls/{id}:
+      get:
+        x-airbyte-entity: calls
+        x-airbyte-action: get
+        x-airbyte-batch-read:
+          path: /v2/calls/extensive
+          ids_field: filter.callIds
+          record_extractor: $.calls
+          record_id_field: metaData.id
+    ```
+"""
+
+AIRBYTE_BATCH_WRITE = "x-airbyte-batch-write"
+"""
+Extension: x-airbyte-batch-write
+Location: Operation object (on individual HTTP operations with x-airbyte-action: create or update)
+Type: BatchWriteConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares a native bulk write endpoint. LocalExecutor.create_many() and
+    update_many() split records into chunks of max_batch_size, send the chunks
+    concurrently and return one result per input record. Entities without this
+    extension fall back to concurrent single create/update calls. A chunk that
+    fails as a whole is reported as failed for each of its records and is never
+    retried as single writes, since part of it may have been applied.
+
+Structure:
+    - path, method (POST/PUT/PATCH), max_batch_size (default: 100)
+    - items_field: Body field (dot notation) receiving the items (default: inputs)
+    - body: Static fields merged into every request body
+    - item_wrapper: Wrap each record's fields under this key (e.g. properties)
+    - item_id_field: Item field receiving the record ID for updates (default: id)
+    - action: Sub-request envelope per item (method, relative_path, data_field)
+    - job: Async job polling (id_path, poll_path with {job_id}, status_path,
+      done_values, failed_values, poll_interval_seconds, timeout_seconds)
+    - results_extractor: JSONPath to per-item results (required)
+    - result_match: "order", "index", "id" or "trace" (default: order). Use
+      "order" only for APIs that return results in input order.
+    - trace_field: Item field receiving a per-record trace ID (the record's
+      position in its chunk) that the API echoes in results; used by "trace"
+    - result_index_field / result_id_field: Fields used by index/id matching
+    - result_status_field: Per-item status code (2xx = success)
+    - result_record_field: Field holding the written record
+    - result_error_field: Field whose presence marks a failed item
+
+Example (HubSpot):
+    ```yaml
+    /crm/v3/objects/contacts:
+      post:
+        x-airbyte-entity: contacts
+        x-airbyte-action: create
+        x-airbyte-batch-write:
+          path: /crm/v3/objects/contacts/batch/create
+          item_wrapper: properties
+          results_extractor: $.results
+          # Batch create doesn't keep input order; results echo the trace ID
+          result_match: trace
+          trace_field: objectWriteTraceId
+    /crm/v3/objects/contacts/{contactId}:
+      patch:
+        x-airbyte-entity: contacts
+        x-airbyte-action: update
+        x-airbyte-batch-write:
+          path: /crm/v3/objects/contacts/batch/update
+          item_wrapper: properties
+          results_extractor: $.results
+          result_match: id
+    ```
+
+Example (Asana):
+    ```yaml
+    /tasks:
+      post:
+        x-airbyte-entity: tasks
+        x-airbyte-action: create
+        x-airbyte-batch-write:
+          path: /batch
+          max_batch_size: 10
+          items_field: data.actions
+          action:
+            method: post
+            relative_path: /tasks
+          results_extractor: $.data
+          result_status_field: status_code
+          result_record_field: body.data
+          result_error_field: body.errors
+    ```
+
+Example (Zendesk):
+    ```yaml
+    /tickets.json:
+      post:
+        x-airbyte-entity: tickets
+        x-airbyte-action: create
+        x-airbyte-batch-write:
+          path: /tickets/create_many.json
+          items_field: tickets
+          job:
+            id_path: $.job_status.id
+            poll_path: /job_statuses/{job_id}.json
+            status_path: $.job_status.status
+          results_extractor: $.job_status.results
+          result_match: index
+          result_error_field: error
+    ```
+"""
+
+AIRBYTE_RELATIONSHIPS = "x-airbyte-relationships"
+"""
+Extension: x-airbyte-relationships
+Location: Operation object (on individual HTTP operations with x-airbyte-action: get, list or search)
+Type: Dict[str, RelationshipConfig] (strongly-typed Pydantic models)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares foreign keys from this operation's records to other entities, so
+    callers can ask for related records with ExecutionConfig(expand=[...])
+    instead of one extra call per record. For each requested relationship the
+    executor:
+
+    1. Adds the sideload query parameter, if declared, so the API returns the
+       related records (Zendesk include), expands them inline (Stripe expand[])
+       or returns their IDs (HubSpot associations) in the same response
+    2. Collects the foreign keys across all returned records and dedupes them
+    3. Resolves the keys not already sideloaded with the target entity's
+       get_many() (batched where x-airbyte-batch-read is declared, concurrent
+       single gets otherwise), sharing one identity map per call
+    4. Writes the related record (or list of records for to-many keys) to
+       target_field on each record
+
+Structure (per relationship name):
+    - entity: Target entity name (required; must have a get action unless every
+      record is sideloaded)
+    - foreign_key: Record field holding the related ID(s), dot notation; lists
+      along the path are traversed (e.g. associations.contacts.results.id)
+    - target_key: Field identifying sideloaded records (default: id)
+    - target_field: Record field receiving the related record(s)
+      (default: the relationship name)
+    - sideload: Native sideloading, optional
+      - param: Query parameter (e.g. include, expand[], associations)
+      - value: Value requested for this relationship (e.g. users)
+      - style: "csv" (include=users,groups) or "repeat" (expand[]=a&expand[]=b)
+        (default: csv)
+      - records_extractor: JSONPath to sideloaded records in the response
+        (e.g. $.users); omit when the API expands inline or only returns IDs
+
+Example (Zendesk):
+    ```yaml
+    /tickets.json:
+      get:
+        x-airbyte-entity: tickets
+        x-airbyte-action: list
+        x-airbyte-relationships:
+          requester:
+            entity: users
+            foreign_key: requester_id
+            sideload:
+              param: include
+              value: users
+              records_extractor: $.users
+          assignee:
+            entity: users
+            foreign_key: assignee_id
+            sideload:
+              param: include
+              value: users
+              records_extractor: $.users
+    ```
+
+Example (Stripe):
+    ```yaml
+    /v1/charges:
+      get:
+        x-airbyte-entity: charges
+        x-airbyte-action: list
+        x-airbyte-relationships:
+          customer:
+            entity: customers
+            foreign_key: customer
+            sideload:
+              param: expand[]
+              value: data.customer
+              style: repeat
+    ```
+
+Example (HubSpot):
+    ```yaml
+    /crm/v3/objects/deals:
+      get:
+        x-airbyte-entity: deals
+        x-airbyte-action: list
+        x-airbyte-relationships:
+          contacts:
+            entity: contacts
+            foreign_key: associations.contacts.results.id
+            sideload:
+              param: associations
+              value: contacts
+    ```
+"""
+
+AIRBYTE_PAGINATION = "x-airbyte-pagination"
+"""
+Extension: x-airbyte-pagination
+Location: Operation object (on individual HTTP operations with x-airbyte-action: list or search)
+Type: PaginationConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares how to request the next page of a list or search result.
+    LocalExecutor.iter_pages() follows it until the API reports no more pages,
+    a page comes back empty, or a cursor repeats. Cursor paths and has_more_path
+    are JSONPath expressions on the full response body.
+
+Structure:
+    - style: "cursor", "offset" or "page" ("link" is reserved)
+    - limit_param: Page size parameter (default: limit)
+    - default_page_size: Page size used when the caller doesn't set one (default: 100)
+    - cursor_param / cursor_path: Cursor request parameter and its location in the response
+    - offset_param: Offset parameter (offset style)
+    - page_param: Page number parameter (page style)
+    - has_more_path: Boolean in the response that is false on the last page
+    - data_path: Records location (dot notation) when the operation has no record extractor
+
+Example (HubSpot search):
+    ```yaml
+    /crm/v3/objects/contacts/search:
+      post:
+        x-airbyte-entity: contacts
+        x-airbyte-action: search
+        x-airbyte-pagination:
+          style: cursor
+          cursor_param: after
+          cursor_path: $.paging.next.after
+    ```
+"""
+
+AIRBYTE_SHARDING = "x-airbyte-sharding"
+"""
+Extension: x-airbyte-sharding
+Location: Operation object (on individual HTTP operations with x-airbyte-action: list or search)
+Type: ShardingConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares how a list or search operation is filtered by time, so
+    LocalExecutor.scan_time_range() can split a long range into windows and walk
+    them concurrently (each window paginated via x-airbyte-pagination). Windows
+    whose result count reaches result_cap (read from total_path on the first
+    page, or counted while walking) are split in half, down to
+    min_window_seconds; a window that still reaches result_cap at that size is
+    reported as truncated. Records are merged in record_time_field order.
+
+Structure:
+    - One range style:
+      - from_param + to_param: Parameters receiving the bounds (dot notation)
+      - query_param + query_template: Qualifier appended to a search query,
+        with {from} and {to} placeholders
+      - filter_groups_param + filter_property: GTE/LT filters added to each
+        filter group
+    - format: "iso8601", "date", "unix" or "unix_ms" (default: iso8601)
+    - to_inclusive: API treats the end bound as inclusive (default: false)
+    - record_time_field: Record timestamp used for ordering (required)
+    - result_cap: Maximum results one query can return
+    - total_path: JSONPath to the total result count
+    - min_window_seconds: Smallest window (default: 60)
+
+Example (Gong):
+    ```yaml
+    /v2/calls:
+      get:
+        x-airbyte-entity: calls
+        x-airbyte-action: list
+        x-airbyte-pagination:
+          style: cursor
+          cursor_param: cursor
+          cursor_path: $.records.cursor
+        x-airbyte-sharding:
+          from_param: fromDateTime
+          to_param: toDateTime
+          record_time_field: started
+    ```
+
+Example (GitHub issue search):
+    ```yaml
+    /graphql:issues:search:
+      post:
+        x-airbyte-entity: issues
+        x-airbyte-action: search
+        x-airbyte-pagination:
+          style: cursor
+          limit_param: per_page
+          cursor_param: after
+          cursor_path: $.data.search.pageInfo.endCursor
+          has_more_path: $.data.search.pageInfo.hasNextPage
+        x-airbyte-sharding:
+          query_param: query
+          query_template: "created:{from}..{to}"
+          to_inclusive: true
+          record_time_field: createdAt
+          result_cap: 1000
+          total_path: $.data.search.issueCount
+    ```
+
+Example (HubSpot search):
+    ```yaml
+    /crm/v3/objects/contacts/search:
+      post:
+        x-airbyte-entity: contacts
+        x-airbyte-action: search
+        x-airbyte-sharding:
+          filter_groups_param: filterGroups
+          filter_property: createdate
+          format: unix_ms
+          record_time_field: properties.createdate
+          result_cap: 10000
+          total_path: $.total
+    ```
+"""
+
+AIRBYTE_INCREMENTAL = "x-airbyte-incremental"
+"""
+Extension: x-airbyte-incremental
+Location: Operation object (on individual HTTP operations with x-airbyte-action: list or search)
+Type: IncrementalConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares the modification-time cursor of a list or search operation, so
+    LocalExecutor.sync() can fetch only the records changed since the previous
+    sync. The highest cursor_field value seen is persisted in a state store;
+    the next sync sends it (minus lookback_seconds) as a server-side filter and
+    walks the pages via x-airbyte-pagination. Records are deduplicated by
+    primary_key, and records re-read inside the lookback window that haven't
+    changed since they were last delivered are dropped.
+
+Structure:
+    - cursor_field: Record modification time (required, dot notation)
+    - One bound style:
+      - cursor_param: Parameter receiving the lower bound (dot notation)
+      - query_param + query_template: Qualifier appended to a search query,
+        with a {from} placeholder
+      - filter_groups_param + filter_property: GTE filter added to each
+        filter group
+    - format: "iso8601", "date", "unix" or "unix_ms" (default: iso8601)
+    - primary_key: Record identifier (default: id)
+    - lookback_seconds: Overlap with the previous sync (default: 0)
+    - start: Lower bound of the first sync (default: read everything)
+    - resume_cursor_path + resume_cursor_param: Resumable server-issued cursor,
+      preferred over the time bound once stored
+
+Example (Zendesk incremental export):
+    ```yaml
+    /api/v2/incremental/tickets/cursor.json:
+      get:
+        x-airbyte-entity: tickets
+        x-airbyte-action: list
+        x-airbyte-record-extractor: $.tickets
+        x-airbyte-pagination:
+          style: cursor
+          cursor_param: cursor
+          cursor_path: $.after_cursor
+        x-airbyte-incremental:
+          cursor_field: updated_at
+          cursor_param: start_time
+          format: unix
+          start: "2024-01-01T00:00:00Z"
+          resume_cursor_path: $.after_cursor
+          resume_cursor_param: cursor
+    ```
+
+Example (HubSpot search):
+    ```yaml
+    /crm/v3/objects/contacts/search:
+      post:
+        x-airbyte-entity: contacts
+        x-airbyte-action: search
+        x-airbyte-incremental:
+          cursor_field: properties.lastmodifieddate
+          filter_groups_param: filterGroups
+          filter_property: lastmodifieddate
+          format: unix_ms
+          lookback_seconds: 300
+    ```
+
+Example (Gong):
+    ```yaml
+    /v2/calls:
+      get:
+        x-airbyte-entity: calls
+        x-airbyte-action: list
+        x-airbyte-incremental:
+          cursor_field: started
+          cursor_param: fromDateTime
+    ```
+"""
+
+AIRBYTE_FILTERS = "x-airbyte-filters"
+"""
+Extension: x-airbyte-filters
+Location: Operation object (on individual HTTP operations with x-airbyte-action: list or search)
+Type: FiltersConfig (strongly-typed Pydantic model)
+Required: No
+Validation: Strict - enforced at Pydantic model level
+
+Description:
+    Declares which record fields a list or search operation can filter on
+    server-side, and with which operators. When a caller executes the operation
+    with where=..., LocalExecutor plans the filter: predicates on declared
+    fields and operators are pushed down into the request, and the remaining
+    predicates are evaluated locally on each page as it arrives, stopping as
+    soon as limit records have matched.
+
+    where= maps fields (dot notation) to a value (equality), a list (any of) or
+    an {operator: value} dict, with operators eq, ne, gt, gte, lt, lte, in and
+    contains, e.g. {"state": "open", "stargazers_count": {"gt": 100}}.
+
+Structure:
+    - style: How pushed predicates are sent
+      - "params": Each operator maps to the parameter receiving the value
+      - "query": Each operator maps to a qualifier template with {value};
+        qualifiers are joined with separator into query_param
+      - "filter_groups": Each operator maps to the API operator name; filters
+        are added to every group in filter_groups_param
+    - query_param: Search query parameter (query style)
+    - separator: Qualifier separator (query style, default: " ")
+    - filter_groups_param: Filter groups parameter (filter_groups style)
+    - fields: Field name -> {operators: {operator: mapping}, property: API name}
+
+Example (GitHub repository search):
+    ```yaml
+    x-airbyte-filters:
+      style: query
+      query_param: query
+      fields:
+        stargazers_count:
+          operators: {eq: "stars:{value}", gt: "stars:>{value}", gte: "stars:>={value}", lt: "stars:<{value}"}
+        language:
+          operators: {eq: "language:{value}"}
+    ```
+
+Example (Stripe search query language):
+    ```yaml
+    x-airbyte-filters:
+      style: query
+      query_param: query
+      separator: " AND "
+      fields:
+        status:
+          operators: {eq: "status:'{value}'", ne: "-status:'{value}'"}
+        amount:
+          operators: {eq: "amount:{value}", gt: "amount>{value}", lt: "amount<{value}"}
+    ```
+
+Example (Zendesk search):
+    ```yaml
+    x-airbyte-filters:
+      style: query
+      query_param: query
+      fields:
+        status:
+          operators: {eq: "status:{value}", ne: "-status:{value}", lt: "status<{value}"}
+        organization_id:
+          operators: {eq: "organization_id:{value}"}
+    ```
+
+Example (HubSpot search):
+    ```yaml
+    x-airbyte-filters:
+      style: filter_groups
+      filter_groups_param: filterGroups
+      fields:
+        properties.company:
+          property: company
+          operators: {eq: EQ, ne: NEQ, in: IN, contains: CONTAINS_TOKEN}
+        properties.createdate:
+          property: createdate
+          operators: {gt: GT, gte: GTE, lt: LT, lte: LTE}
+    ```
+"""
+
 # =============================================================================
 # Enums and Type Definitions
 # =============================================================================
@@ -508,6 +1053,13 @@ def get_all_extension_names() -> list[str]:
         AIRBYTE_RECORD_EXTRACTOR,
         AIRBYTE_META_EXTRACTOR,
         AIRBYTE_FILE_URL,
+        AIRBYTE_BATCH_READ,
+        AIRBYTE_BATCH_WRITE,
+        AIRBYTE_RELATIONSHIPS,
+        AIRBYTE_PAGINATION,
+        AIRBYTE_SHARDING,
+        AIRBYTE_INCREMENTAL,
+        AIRBYTE_FILTERS,
     ]
 
 
@@ -587,6 +1139,62 @@ EXTENSION_REGISTRY = {
         "required": "conditional",  # Required when action is 'download'
         "description": "Field in metadata response containing download URL (required for download action)",
     },
+    AIRBYTE_BATCH_READ: {
+        "location": "operation",
+        "type": "BatchReadConfig",
+        "model": "BatchReadConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Native bulk read-by-IDs endpoint for get operations, used by get_many()",
+    },
+    AIRBYTE_BATCH_WRITE: {
+        "location": "operation",
+        "type": "BatchWriteConfig",
+        "model": "BatchWriteConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Native bulk write endpoint for create/update operations, used by create_many()/update_many()",
+    },
+    AIRBYTE_RELATIONSHIPS: {
+        "location": "operation",
+        "type": "Dict[str, RelationshipConfig]",
+        "model": "RelationshipConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Foreign keys to other entities, resolved when callers pass expand=[...]",
+    },
+    AIRBYTE_PAGINATION: {
+        "location": "operation",
+        "type": "PaginationConfig",
+        "model": "PaginationConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "How to request further pages of list/search results, used by iter_pages()",
+    },
+    AIRBYTE_SHARDING: {
+        "location": "operation",
+        "type": "ShardingConfig",
+        "model": "ShardingConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Time-range parameters for concurrent windowed scans, used by scan_time_range()",
+    },
+    AIRBYTE_INCREMENTAL: {
+        "location": "operation",
+        "type": "IncrementalConfig",
+        "model": "IncrementalConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Modification-time cursor for incremental sync, used by sync()",
+    },
+    AIRBYTE_FILTERS: {
+        "location": "operation",
+        "type": "FiltersConfig",
+        "model": "FiltersConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Server-side filterable fields and operators, used to push where= predicates down",
+    },
 }
 """
 Complete registry of all Airbyte extensions with metadata.
@@ -101,6 +101,54 @@ class HTTPMetrics:
         }
 
 
+def calculate_retry_delay(
+    retry_config: RetryConfig, attempt: int, response_headers: dict[str, str]
+) -> float:
+    """Calculate delay before the next retry attempt.
+
+    Prefers the Retry-After header (or the configured equivalent) if present,
+    otherwise uses exponential backoff with optional full jitter. Shared by
+    HTTPClient and HostedExecutor so both back off the same way.
+
+    Args:
+        retry_config: Retry configuration
+        attempt: The current attempt number (0-indexed)
+        response_headers: Response headers from the failed request
+
+    Returns:
+        Delay in seconds before the next retry
+    """
+    # Try Retry-After header first
+    header_name = retry_config.retry_after_header
+    header_value = response_headers.get(header_name) or response_headers.get(
+        header_name.lower()
+    )
+
+    if header_value:
+        try:
+            value = float(header_value)
+            if retry_config.retry_after_format == "milliseconds":
+                delay = value / 1000.0
+            elif retry_config.retry_after_format == "unix_timestamp":
+                delay = max(0.0, value - time.time())
+            else:
+                delay = value
+            return min(delay, retry_config.max_delay_seconds)
+        except (ValueError, TypeError):
+            pass  # Fall through to exponential backoff
+
+    # Exponential backoff: initial_delay * (base ^ attempt)
+    delay = retry_config.initial_delay_seconds * (retry_config.exponential_base**attempt)
+    delay = min(delay, retry_config.max_delay_seconds)
+
+    # Apply full jitter to prevent thundering herd
+    # See: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    if retry_config.jitter:
+        delay = random.random() * delay
+
+    return delay
+
+
 class HTTPClient:
     """Async HTTP client for making API requests with authentication and connection pooling."""
 
@@ -302,47 +350,9 @@ class HTTPClient:
     def _calculate_delay(self, attempt: int, response_headers: dict[str, str]) -> float:
         """Calculate delay before the next retry attempt.
 
-        Prefers Retry-After header if present, otherwise uses exponential backoff
-        with optional jitter.
-
-        Args:
-            attempt: The current attempt number (0-indexed)
-            response_headers: Response headers from the failed request
-
-        Returns:
-            Delay in seconds before the next retry
+        See calculate_retry_delay() for details.
         """
-        # Try Retry-After header first
-        header_name = self.retry_config.retry_after_header
-        header_value = response_headers.get(header_name) or response_headers.get(
-            header_name.lower()
-        )
-
-        if header_value:
-            try:
-                value = float(header_value)
-                if self.retry_config.retry_after_format == "milliseconds":
-                    delay = value / 1000.0
-                elif self.retry_config.retry_after_format == "unix_timestamp":
-                    delay = max(0.0, value - time.time())
-                else:
-                    delay = value
-                return min(delay, self.retry_config.max_delay_seconds)
-            except (ValueError, TypeError):
-                pass  # Fall through to exponential backoff
-
-        # Exponential backoff: initial_delay * (base ^ attempt)
-        delay = self.retry_config.initial_delay_seconds * (
-            self.retry_config.exponential_base**attempt
-        )
-        delay = min(delay, self.retry_config.max_delay_seconds)
-
-        # Apply full jitter to prevent thundering herd
-        # See: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
-        if self.retry_config.jitter:
-            delay = random.random() * delay
-
-        return delay
+        return calculate_retry_delay(self.retry_config, attempt, response_headers)
 
     async def _execute_request(
         self,
@@ -374,7 +384,8 @@ class HTTPClient:
         if not is_external_url:
             request_headers = self._inject_auth(request_headers)
 
-        # Log request start
+        # Log request start, once a slow log writer has caught up
+        await self.logger.wait_for_capacity()
         request_id = self.logger.log_request(
             method=method.upper(),
             url=url,
@@ -605,6 +616,36 @@ class HTTPClient:
         # Should not reach here, but just in case
         raise HTTPClientError("Exhausted all retry attempts")
 
+    async def warm_up(self) -> bool:
+        """Open a keep-alive connection to the API ahead of the first request.
+
+        Sends an unauthenticated HEAD request to base_url, so DNS resolution and
+        the TLS handshake are done before the first real request needs them.
+        Any HTTP status will do; only the pooled connection matters.
+
+        Returns:
+            False if base_url has unresolved server variables, True otherwise
+
+        Raises:
+            NetworkError: If the API host can't be reached, including transport
+                errors the client doesn't map to SDK exceptions
+            TimeoutError: If connecting times out
+        """
+        if "{" in self.base_url:
+            return False
+        try:
+            await self.client.request("HEAD", self.base_url)
+        except (AuthenticationError, RateLimitError, HTTPStatusError):
+            pass
+        except HTTPClientError:
+            raise
+        except Exception as e:
+            raise NetworkError(
+                message=f"Could not connect to {self.base_url}: {e}",
+                original_error=e,
+            ) from e
+        return True
+
     async def close(self):
         """Close the async HTTP client."""
         await self.client.aclose()
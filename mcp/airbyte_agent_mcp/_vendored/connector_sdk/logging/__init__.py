@@ -1,11 +1,14 @@
 """Request/response logging for Airbyte SDK."""
 
 from .logger import NullLogger, RequestLogger
-from .types import LogSession, RequestLog
+from .types import ChunkLog, LogSession, RequestLog
+from .writer import JSONLLogWriter
 
 __all__ = [
     "RequestLogger",
     "NullLogger",
     "RequestLog",
     "LogSession",
+    "ChunkLog",
+    "JSONLLogWriter",
 ]
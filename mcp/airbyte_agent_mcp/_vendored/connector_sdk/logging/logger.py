@@ -5,9 +5,16 @@ import json
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, BinaryIO, Dict, Iterator, Literal, Optional, Set
 
-from .types import LogSession, RequestLog
+from .types import ChunkLog, LogSession, RequestLog, _encode_bytes
+from .writer import Compression, JSONLLogWriter, OverflowPolicy
+
+ChunkCaptureMode = Literal["spill", "memory", "off"]
+LogFormat = Literal["json", "jsonl"]
+
+# Largest piece iter_chunks() reads at once from a merged chunk ref
+_CHUNK_READ_SIZE = 1024 * 1024
 
 
 # Headers to redact for security
@@ -24,10 +31,13 @@ SENSITIVE_HEADERS: Set[str] = {
 
 
 class RequestLogger:
-    """Captures HTTP request/response interactions to a JSON file.
+    """Captures HTTP request/response interactions to a JSON or JSONL file.
 
-    Implements bounded logging with automatic rotation and flush-before-discard
-    to prevent unbounded memory growth in long-running processes.
+    In "json" format, at most max_logs entries are kept in memory; older entries
+    are spilled to a JSONL sidecar and streamed back into the JSON file on save().
+    In "jsonl" format, every entry is appended to the log file by a background
+    writer as soon as it completes, so memory stays constant for the lifetime
+    of the session.
     """
 
     def __init__(
@@ -35,6 +45,16 @@ class RequestLogger:
         log_file: Optional[str] = None,
         connector_name: Optional[str] = None,
         max_logs: Optional[int] = 10000,
+        chunk_capture: ChunkCaptureMode = "memory",
+        max_chunk_bytes: Optional[int] = None,
+        max_chunk_refs: Optional[int] = 10000,
+        chunk_sample_every: int = 1,
+        log_format: LogFormat = "json",
+        compression: Optional[Compression] = None,
+        rotate_max_bytes: Optional[int] = None,
+        rotate_interval_seconds: Optional[float] = None,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = "block",
     ):
         """
         Initialize the request logger.
@@ -45,10 +65,33 @@ class RequestLogger:
             max_logs: Maximum number of logs to keep in memory before rotation.
                 Set to None for unlimited (not recommended for production).
                 Defaults to 10000.
+            chunk_capture: How streamed download chunks are captured:
+                "memory" keeps them in session.chunk_logs (default; with
+                log_format="jsonl" each chunk is written as a base64 line
+                instead), "spill" appends them to a binary sidecar file next to
+                the log file and records offsets in session.chunk_refs, so
+                memory use does not grow with download size, "off" skips capture.
+            max_chunk_bytes: Maximum total chunk bytes to capture per session.
+                Chunks past the cap are truncated/dropped. None for no cap.
+            max_chunk_refs: "spill" only. Maximum refs kept in session.chunk_refs;
+                past it, each chunk extends the last ref. None for no cap.
+            chunk_sample_every: Capture only every Nth chunk. Defaults to 1 (all).
+            log_format: "json" writes one JSON document on save()/close();
+                "jsonl" appends one line per entry from a background writer.
+            compression: JSONL only. Optional "gzip" or "zstd" compression.
+            rotate_max_bytes: JSONL only. Start a new file after this many bytes.
+            rotate_interval_seconds: JSONL only. Start a new file after this many seconds.
+            queue_size: JSONL only. Maximum entries waiting for the writer thread.
+            overflow: JSONL only. "block" keeps every entry when the queue is
+                full and applies backpressure through wait_for_capacity(), "drop"
+                discards the entry and counts it.
         """
+        if chunk_sample_every < 1:
+            raise ValueError("chunk_sample_every must be >= 1")
+
         if log_file is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
-            log_file = f".logs/session_{timestamp}.json"
+            log_file = f".logs/session_{timestamp}.{log_format}"
 
         self.log_file = Path(log_file)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -59,8 +102,34 @@ class RequestLogger:
             max_logs=max_logs,
         )
         self._active_requests: Dict[str, Dict[str, Any]] = {}
-        # Store rotated logs that have been flushed from active buffer
-        self._rotated_logs: list[RequestLog] = []
+        self.log_format = log_format
+
+        # JSONL: entries go straight to the writer. JSON: only entries rotated
+        # out of session.logs are spilled, and read back on save().
+        self._writer: Optional[JSONLLogWriter] = None
+        self._rotated_file = self.log_file.with_suffix(".rotated.jsonl")
+        if log_format == "jsonl":
+            self._writer = JSONLLogWriter(
+                self.log_file,
+                compression=compression,
+                max_bytes=rotate_max_bytes,
+                rotate_interval_seconds=rotate_interval_seconds,
+                queue_size=queue_size,
+                overflow=overflow,
+            )
+            header = self.session.model_dump(
+                mode="json", exclude={"logs", "chunk_logs", "chunk_refs"}
+            )
+            self._writer.write({"type": "session", **header})
+
+        # Streamed chunk capture
+        self.chunk_capture = chunk_capture
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_chunk_refs = max_chunk_refs
+        self.chunk_sample_every = chunk_sample_every
+        self.chunk_file = self.log_file.with_suffix(".chunks.bin")
+        self._chunk_fp: Optional[BinaryIO] = None
+        self._chunk_bytes_captured = 0
 
     def _redact_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Redact sensitive headers."""
@@ -75,8 +144,9 @@ class RequestLogger:
     def _rotate_logs_if_needed(self) -> None:
         """Rotate logs if max_logs limit is reached.
 
-        Moves oldest logs to _rotated_logs before removing them from active buffer.
-        This ensures logs are preserved for final save() without memory growth.
+        Appends the oldest logs to the rotated-logs sidecar before removing them
+        from the active buffer, so they are preserved for the final save()
+        without memory growth.
         """
         max_logs = self.session.max_logs
         if max_logs is None:
@@ -88,9 +158,11 @@ class RequestLogger:
             # Calculate how many logs to rotate (keep buffer at ~90% to avoid thrashing)
             num_to_rotate = max(1, current_count - int(max_logs * 0.9))
 
-            # Move oldest logs to rotated buffer
-            rotated = self.session.logs[:num_to_rotate]
-            self._rotated_logs.extend(rotated)
+            # Spill oldest logs to disk (always blocking: rotation must not lose entries)
+            if self._writer is None:
+                self._writer = JSONLLogWriter(self._rotated_file, overflow="block")
+            for log in self.session.logs[:num_to_rotate]:
+                self._writer.write(log.model_dump(mode="json"))
 
             # Remove rotated logs from active buffer
             self.session.logs = self.session.logs[num_to_rotate:]
@@ -170,8 +242,7 @@ class RequestLogger:
             timing_ms=timing_ms,
         )
 
-        self.session.logs.append(log_entry)
-        self._rotate_logs_if_needed()
+        self._append(log_entry)
 
     def log_error(
         self,
@@ -205,36 +276,191 @@ class RequestLogger:
             error=error,
         )
 
+        self._append(log_entry)
+
+    def _append(self, log_entry: RequestLog) -> None:
+        """Record a completed entry according to the log format."""
+        if self.log_format == "jsonl":
+            self._writer.write({"type": "request", **log_entry.model_dump(mode="json")})
+            return
+
         self.session.logs.append(log_entry)
         self._rotate_logs_if_needed()
 
     def log_chunk_fetch(self, chunk: bytes) -> None:
         """Log a chunk from streaming response.
 
+        In "spill" mode the chunk is written straight to the sidecar file and only
+        its offset is kept, so memory use does not grow with download size.
+
         Args:
             chunk: Binary chunk data from streaming response
         """
-        self.session.chunk_logs.append(chunk)
+        sequence = self.session.chunks_seen
+        self.session.chunks_seen += 1
+
+        if self.chunk_capture == "off":
+            return
+
+        if sequence % self.chunk_sample_every != 0:
+            self.session.chunks_dropped += 1
+            return
+
+        captured = chunk
+        if self.max_chunk_bytes is not None:
+            remaining = self.max_chunk_bytes - self._chunk_bytes_captured
+            if remaining <= 0:
+                self.session.chunks_dropped += 1
+                return
+            if len(chunk) > remaining:
+                captured = chunk[:remaining]
+        self._chunk_bytes_captured += len(captured)
+
+        if self.chunk_capture == "memory":
+            if self.log_format == "jsonl":
+                # save() never writes chunk_logs in JSONL format: stream the bytes
+                self._writer.write(
+                    {
+                        "type": "chunk",
+                        "sequence": sequence,
+                        "length": len(captured),
+                        "original_length": len(chunk),
+                        "data": _encode_bytes(captured),
+                    }
+                )
+            else:
+                self.session.chunk_logs.append(captured)
+            return
+
+        if self._chunk_fp is None:
+            # Truncate on first open; append if reopened after close()
+            mode = "ab" if self.session.chunk_file else "wb"
+            self._chunk_fp = open(self.chunk_file, mode)
+            self.session.chunk_file = self.chunk_file.name
+
+        offset = self._chunk_fp.tell()
+        self._chunk_fp.write(captured)
+        ref = ChunkLog(
+            sequence=sequence,
+            offset=offset,
+            length=len(captured),
+            original_length=len(chunk),
+        )
+        refs = self.session.chunk_refs
+        if self.log_format == "jsonl":
+            self._writer.write({"type": "chunk", **ref.model_dump(mode="json")})
+        elif self.max_chunk_refs is not None and len(refs) >= self.max_chunk_refs:
+            # Chunks are appended back to back, so the last ref can cover this one too
+            last = refs[-1]
+            last.length += ref.length
+            last.original_length += ref.original_length
+            last.chunks += 1
+        else:
+            refs.append(ref)
+
+    @staticmethod
+    def iter_chunks(session: LogSession, log_dir: str | Path) -> Iterator[bytes]:
+        """Yield captured chunks for a loaded session in fetch order.
+
+        Handles both in-memory (chunk_logs) and spilled (chunk_refs) sessions, reading
+        spilled chunks one at a time from the sidecar file.
+
+        Args:
+            session: Session loaded from a log file
+            log_dir: Directory containing the log file (and its sidecar)
+        """
+        yield from session.chunk_logs
+
+        if not session.chunk_file or not session.chunk_refs:
+            return
+
+        with open(Path(log_dir) / session.chunk_file, "rb") as f:
+            for ref in session.chunk_refs:
+                f.seek(ref.offset)
+                if ref.chunks == 1:
+                    yield f.read(ref.length)
+                    continue
+                # A merged ref may span a whole download; read it in pieces
+                remaining = ref.length
+                while remaining > 0:
+                    piece = f.read(min(remaining, _CHUNK_READ_SIZE))
+                    if not piece:
+                        break
+                    remaining -= len(piece)
+                    yield piece
 
     def save(self) -> None:
         """Write the current session to the log file.
 
-        Includes both rotated logs and current active logs to ensure
-        no data loss during bounded logging.
+        JSON format: streams rotated logs from the sidecar followed by the active
+        logs into the file, one entry at a time, so no data is lost and the full
+        session is never materialized in memory. JSONL format: flushes the writer.
         """
-        # Combine rotated logs with current logs for complete session
-        all_logs = self._rotated_logs + self.session.logs
+        if self._chunk_fp is not None:
+            self._chunk_fp.flush()
+
+        if self.log_format == "jsonl":
+            self._writer.flush()
+            return
+
+        if self._writer is not None:
+            self._writer.flush()
 
-        # Create a temporary session with all logs for serialization
-        session_data = self.session.model_dump(mode="json")
-        session_data["logs"] = [log.model_dump(mode="json") for log in all_logs]
+        session_data = self.session.model_dump(mode="json", exclude={"logs"})
 
         with open(self.log_file, "w") as f:
-            json.dump(session_data, f, indent=2, default=str)
+            f.write("{\n")
+            for key, value in session_data.items():
+                f.write(f"  {json.dumps(key)}: {json.dumps(value, default=str)},\n")
+            f.write('  "logs": [')
+            separator = "\n    "
+            for line in self._iter_rotated_lines():
+                f.write(separator + line)
+                separator = ",\n    "
+            for log in self.session.logs:
+                f.write(separator + json.dumps(log.model_dump(mode="json"), default=str))
+                separator = ",\n    "
+            f.write("\n  ]\n}\n")
+
+    async def wait_for_capacity(self) -> None:
+        """Wait, without blocking the event loop, until the log writer has caught up."""
+        if self._writer is not None:
+            await self._writer.wait_for_capacity()
+
+    def _iter_rotated_lines(self) -> Iterator[str]:
+        """Yield rotated entries (already JSON-encoded) from the sidecar file."""
+        if self._writer is None or not self._rotated_file.exists():
+            return
+        with open(self._rotated_file) as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line:
+                    yield line
 
     def close(self) -> None:
         """Finalize and save the logging session."""
-        self.save()
+        if self.log_format == "jsonl":
+            self._writer.write(
+                {
+                    "type": "session_end",
+                    "chunk_file": self.session.chunk_file,
+                    "chunks_seen": self.session.chunks_seen,
+                    "chunks_dropped": self.session.chunks_dropped,
+                    "logs_dropped": self._writer.dropped,
+                }
+            )
+        else:
+            self.save()
+
+        if self._writer is not None:
+            self._writer.close()
+            if self.log_format == "json":
+                self._rotated_file.unlink(missing_ok=True)
+                self._writer = None
+
+        if self._chunk_fp is not None:
+            self._chunk_fp.close()
+            self._chunk_fp = None
 
 
 class NullLogger:
@@ -256,6 +482,10 @@ class NullLogger:
         """No-op chunk logging for production."""
         pass
 
+    async def wait_for_capacity(self) -> None:
+        """No-op wait_for_capacity."""
+        pass
+
     def save(self) -> None:
         """No-op save."""
         pass
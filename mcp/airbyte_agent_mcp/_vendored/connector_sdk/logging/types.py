@@ -39,6 +39,28 @@ class RequestLog(BaseModel):
         return value.isoformat()
 
 
+class ChunkLog(BaseModel):
+    """Reference to a streamed chunk spilled to the session's sidecar file.
+
+    The chunk bytes live in the binary sidecar file at [offset, offset + length).
+    Once a session holds max_chunk_refs refs, further chunks extend the last ref,
+    which then covers `chunks` consecutive chunks.
+    """
+
+    model_config = ConfigDict()
+
+    sequence: int
+    offset: int
+    length: int
+    original_length: int
+    chunks: int = 1
+    timestamp: datetime = Field(default_factory=_utc_now)
+
+    @field_serializer("timestamp")
+    def serialize_datetime(self, value: datetime) -> str:
+        return value.isoformat()
+
+
 class LogSession(BaseModel):
     """Collection of request logs with session metadata.
 
@@ -60,9 +82,21 @@ class LogSession(BaseModel):
     )
     chunk_logs: List[bytes] = Field(
         default_factory=list,
-        description="Captured chunks from streaming responses. "
-        "Each chunk is logged when log_chunk_fetch() is called.",
+        description="Captured chunks from streaming responses held in memory. "
+        "Only populated by sessions recorded with chunk_capture='memory'; "
+        "spilled chunks are referenced from chunk_refs instead.",
+    )
+    chunk_file: Optional[str] = Field(
+        default=None,
+        description="Name of the binary sidecar file holding spilled chunks, "
+        "relative to the log file's directory.",
+    )
+    chunk_refs: List[ChunkLog] = Field(
+        default_factory=list,
+        description="Offsets of spilled chunks within chunk_file, in fetch order.",
     )
+    chunks_seen: int = 0
+    chunks_dropped: int = 0
 
     @field_validator("chunk_logs", mode="before")
     @classmethod
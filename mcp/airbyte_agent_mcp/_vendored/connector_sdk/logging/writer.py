@@ -0,0 +1,262 @@
+"""Append-only JSONL writer for request logs.
+
+Entries are handed to a bounded queue and written by a background thread, so
+callers never wait on disk I/O and memory stays constant regardless of session
+length. write() never blocks an event loop: with the "block" overflow policy,
+async callers apply backpressure by awaiting wait_for_capacity(), which waits
+in a worker thread.
+"""
+
+import asyncio
+import collections
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+Compression = Literal["gzip", "zstd"]
+OverflowPolicy = Literal["block", "drop"]
+
+_CLOSE = object()
+_FLUSH = object()
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class JSONLLogWriter:
+    """Writes one JSON object per line from a background thread.
+
+    Files can be compressed (gzip, or zstd when the zstandard package is
+    installed) and rotated by size and/or age. Rotated files are named
+    ``<stem>.<n><suffix>`` next to the first file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: Optional[Compression] = None,
+        max_bytes: Optional[int] = None,
+        rotate_interval_seconds: Optional[float] = None,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = "block",
+    ):
+        """
+        Initialize the writer and start its background thread.
+
+        Args:
+            path: Path of the first log file. A ".gz"/".zst" suffix is added when
+                compression is enabled and the path doesn't already have it.
+            compression: Optional compression ("gzip" or "zstd").
+            max_bytes: Rotate to a new file after this many uncompressed bytes.
+            rotate_interval_seconds: Rotate to a new file after this many seconds.
+            queue_size: Maximum number of entries waiting to be written.
+            overflow: What to do when the queue is full: "block" keeps every
+                entry and applies backpressure (see write()), "drop" discards
+                the entry.
+        """
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "compression='zstd' requires the zstandard package"
+                ) from e
+
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.rotate_interval_seconds = rotate_interval_seconds
+        self.overflow = overflow
+        self.dropped = 0
+        self.written = 0
+
+        path = Path(path)
+        suffix = {"gzip": ".gz", "zstd": ".zst"}.get(compression or "", "")
+        if suffix and path.suffix != suffix:
+            path = path.with_name(path.name + suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.files: list[Path] = []
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # "block" entries that didn't fit in the queue, written in order after it
+        self._overflow: collections.deque = collections.deque()
+        self._lock = threading.Lock()
+        self._caught_up = threading.Condition(self._lock)
+        self._fp: Optional[IO[bytes]] = None
+        self._file_bytes = 0
+        self._file_opened_at = 0.0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="airbyte-jsonl-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, entry: Dict[str, Any]) -> bool:
+        """Queue an entry for writing.
+
+        When the queue is full, the "drop" policy discards the entry. The
+        "block" policy waits for room when called outside an event loop; on an
+        event loop thread it never blocks, and the entry waits in an overflow
+        buffer until the writer thread catches up (await wait_for_capacity()
+        to keep that buffer from growing).
+
+        Returns:
+            False if the entry was dropped (closed writer or full queue with the
+            "drop" policy), True otherwise.
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+
+        with self._lock:
+            if not self._overflow:
+                try:
+                    self._queue.put_nowait(entry)
+                    return True
+                except queue.Full:
+                    pass
+            if self.overflow == "drop":
+                self.dropped += 1
+                return False
+            self._overflow.append(entry)
+
+        if not _on_event_loop():
+            self._wait_caught_up()
+        return True
+
+    @property
+    def backlog(self) -> int:
+        """Number of entries waiting to be written."""
+        return self._queue.qsize() + len(self._overflow)
+
+    async def wait_for_capacity(self) -> None:
+        """Wait, off the event loop, until the writer has room for more entries."""
+        if self._overflow or self._queue.full():
+            await asyncio.to_thread(self._wait_caught_up)
+
+    def _wait_caught_up(self) -> None:
+        with self._caught_up:
+            self._caught_up.wait_for(
+                lambda: not self._overflow and not self._queue.full()
+            )
+
+    def flush(self) -> None:
+        """Block until every queued entry is written and flushed to disk."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._put_marker((_FLUSH, done))
+        done.wait()
+
+    def close(self) -> None:
+        """Drain the queue, close the current file and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._put_marker(_CLOSE)
+        self._thread.join()
+
+    def _put_marker(self, marker: Any) -> None:
+        # Markers go after every entry written before them, overflow included
+        with self._lock:
+            if self._overflow:
+                self._overflow.append(marker)
+                return
+        self._queue.put(marker)
+
+    def _next_item(self) -> Any:
+        with self._lock:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                item = self._overflow.popleft() if self._overflow else None
+            else:
+                # Refill from the overflow buffer so entries keep their order
+                while self._overflow and not self._queue.full():
+                    self._queue.put_nowait(self._overflow.popleft())
+            if not self._overflow and not self._queue.full():
+                self._caught_up.notify_all()
+        if item is None:
+            item = self._queue.get()
+        return item
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_item()
+            if item is _CLOSE:
+                self._close_file()
+                return
+            if isinstance(item, tuple) and item and item[0] is _FLUSH:
+                if self._fp is not None:
+                    self._fp.flush()
+                item[1].set()
+                continue
+            try:
+                self._write_line(item)
+            except Exception as e:
+                # Never let a bad entry kill the writer thread
+                self.dropped += 1
+                logger.warning(f"Failed to write request log entry: {e}")
+
+    def _write_line(self, entry: Dict[str, Any]) -> None:
+        line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+
+        if self._fp is None or self._should_rotate(len(line)):
+            self._close_file()
+            self._open_file()
+
+        self._fp.write(line)
+        self._file_bytes += len(line)
+        self.written += 1
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._file_bytes == 0:
+            return False
+        if self.max_bytes is not None and self._file_bytes + incoming > self.max_bytes:
+            return True
+        if self.rotate_interval_seconds is not None:
+            age = time.monotonic() - self._file_opened_at
+            if age >= self.rotate_interval_seconds:
+                return True
+        return False
+
+    def _next_path(self) -> Path:
+        if not self.files:
+            return self.path
+        # session.jsonl.gz -> session.1.jsonl.gz
+        name = self.path.name
+        stem, dot, rest = name.partition(".")
+        return self.path.with_name(f"{stem}.{len(self.files)}{dot}{rest}")
+
+    def _open_file(self) -> None:
+        path = self._next_path()
+        if self.compression == "gzip":
+            self._fp = gzip.open(path, "wb")
+        elif self.compression == "zstd":
+            import zstandard
+
+            raw = open(path, "wb")
+            self._fp = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            self._fp = open(path, "wb")
+        self.files.append(path)
+        self._file_bytes = 0
+        self._file_opened_at = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
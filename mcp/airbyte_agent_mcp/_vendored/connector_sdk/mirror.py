@@ -0,0 +1,487 @@
+"""
+Local SQLite mirror of connector entities.
+
+LocalMirror copies list results into a SQLite database (WAL journal, JSON1 and
+FTS5) so repeated reads - "find tickets mentioning X", "which contacts are at
+ACME" - are answered locally instead of costing an API round trip each.
+
+Each entity gets its own table:
+    - _key: the record's primary key (unique); records without one are keyed
+      by a hash of their content, so re-listing them never duplicates rows
+    - one typed column per scalar property of the entity schema
+    - _data: the full record as JSON (filters on other fields use json_extract)
+    - _synced_at: when the row was last written
+plus an FTS5 table over every string in the record, and secondary indexes on
+the keys the connector declares (relationship foreign keys, incremental cursor
+fields, sharding time fields).
+
+Entities whose list operation declares x-airbyte-incremental are refreshed with
+LocalExecutor.sync(), so only changed records are fetched; the sync cursor is
+kept in the mirror itself. Other entities are re-listed in full, and rows that
+disappeared from the API are removed.
+
+Example:
+    mirror = LocalMirror(executor, "~/.airbyte/zendesk.db", max_age_seconds=900)
+    result = await mirror.query("tickets", filter={"status": "open"}, text="refund")
+    print(len(result.records), "tickets, as of", result.refreshed_at)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .executor import ExecutorError, InvalidParameterError, LocalExecutor
+from .types import Action
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SQL_TYPES = {
+    "string": "TEXT",
+    "integer": "INTEGER",
+    "number": "REAL",
+    "boolean": "INTEGER",
+}
+_RESERVED_COLUMNS = {"_key", "_data", "_synced_at"}
+# Bumped when the table DDL changes, so existing mirrors are rebuilt
+_TABLE_VERSION = 2
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _strings(value: Any) -> list[str]:
+    """Every string in a record, for full-text indexing."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [s for item in value.values() for s in _strings(item)]
+    if isinstance(value, list):
+        return [s for item in value for s in _strings(item)]
+    return []
+
+
+def _get_dotted(record: dict[str, Any], path: str) -> Any:
+    value: Any = record
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _content_key(record: dict[str, Any]) -> str:
+    """Row key of a record without a primary key: a hash of its content."""
+    content = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return "sha256:" + hashlib.sha256(content.encode()).hexdigest()
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+@dataclass
+class MirrorQueryResult:
+    """Records answered from the mirror, with how fresh they are.
+
+    Args:
+        records: Matching records, as returned by the API
+        refreshed_at: When the entity was last refreshed from the API
+        refreshed: Whether this query refreshed the entity before answering
+    """
+
+    records: list[Any]
+    refreshed_at: datetime | None
+    refreshed: bool = False
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the entity was last refreshed."""
+        if self.refreshed_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.refreshed_at).total_seconds()
+
+
+@dataclass
+class _EntityTable:
+    """Table layout of one mirrored entity."""
+
+    name: str
+    primary_key: str
+    columns: dict[str, str]
+    index_keys: list[str]
+    incremental: bool = False
+
+    @property
+    def table(self) -> str:
+        return _quote(self.name)
+
+    @property
+    def fts(self) -> str:
+        return _quote(f"{self.name}__fts")
+
+    @property
+    def signature(self) -> str:
+        return json.dumps(
+            [_TABLE_VERSION, self.primary_key, self.columns, self.index_keys]
+        )
+
+    def expression(self, key: str) -> str:
+        """SQL expression for a (dot notation) record field."""
+        if key in self.columns:
+            return _quote(key)
+        if not all(_IDENTIFIER.match(part) for part in key.split(".")):
+            raise InvalidParameterError(
+                f"Cannot filter {self.name} on '{key}': use dot notation field names"
+            )
+        return f"json_extract(_data, '$.{key}')"
+
+    def values(self, record: dict[str, Any]) -> list[Any]:
+        """Column values of a record, in column order."""
+        values = []
+        for column in self.columns:
+            value = record.get(column)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            elif isinstance(value, bool):
+                value = int(value)
+            values.append(value)
+        return values
+
+
+class _MirrorStateStore:
+    """StateStore keeping incremental sync cursors inside the mirror database.
+
+    set() doesn't commit: the new cursor is committed together with the records
+    it covers, so a failed refresh never advances the cursor past unsaved rows.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT state FROM _mirror_state WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def set(self, key: str, state: dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT INTO _mirror_state (key, state) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET state = excluded.state",
+            (key, json.dumps(state)),
+        )
+
+
+class LocalMirror:
+    """SQLite mirror of a connector's list endpoints, queried locally.
+
+    Args:
+        executor: LocalExecutor used to refresh entities
+        path: Database file, or ":memory:" for a mirror that lives as long as
+            this object
+        max_age_seconds: Refresh an entity before answering a query if its
+            data is older than this (None: only refresh entities never mirrored)
+    """
+
+    def __init__(
+        self,
+        executor: LocalExecutor,
+        path: str | Path = ":memory:",
+        max_age_seconds: float | None = None,
+    ):
+        self.executor = executor
+        self.max_age_seconds = max_age_seconds
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _mirror_meta ("
+                "entity TEXT PRIMARY KEY, signature TEXT, refreshed_at REAL, mode TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _mirror_state (key TEXT PRIMARY KEY, state TEXT)"
+            )
+        self._state_store = _MirrorStateStore(self._conn)
+        self._tables: dict[str, _EntityTable] = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _layout(self, entity: str) -> _EntityTable:
+        """Derive an entity's table layout from the connector definition."""
+        entity_def = next(
+            (e for e in self.executor.config.entities if e.name == entity), None
+        )
+        if entity_def is None or Action.LIST not in entity_def.actions:
+            raise ExecutorError(f"Entity '{entity}' has no list operation to mirror")
+
+        endpoints = list(entity_def.endpoints.values())
+        list_endpoint = entity_def.endpoints[Action.LIST]
+        primary_key = (
+            list_endpoint.incremental.primary_key if list_endpoint.incremental else "id"
+        )
+
+        columns: dict[str, str] = {}
+        properties = (entity_def.entity_schema or {}).get("properties") or {}
+        for name, prop in properties.items():
+            types = (prop or {}).get("type")
+            if isinstance(types, list):
+                types = next((t for t in types if t != "null"), None)
+            if (
+                types in _SQL_TYPES
+                and _IDENTIFIER.match(name)
+                and name not in _RESERVED_COLUMNS
+            ):
+                columns[name] = _SQL_TYPES[types]
+
+        index_keys: list[str] = []
+        for endpoint in endpoints:
+            for relationship in (endpoint.relationships or {}).values():
+                index_keys.append(relationship.foreign_key)
+            if endpoint.incremental:
+                index_keys.append(endpoint.incremental.cursor_field)
+            if endpoint.sharding:
+                index_keys.append(endpoint.sharding.record_time_field)
+        index_keys = [
+            key
+            for key in dict.fromkeys(index_keys)
+            if key != primary_key
+            and all(_IDENTIFIER.match(part) for part in key.split("."))
+        ]
+        return _EntityTable(
+            entity,
+            primary_key,
+            columns,
+            index_keys,
+            incremental=list_endpoint.incremental is not None,
+        )
+
+    def _ensure_table(self, entity: str) -> _EntityTable:
+        """Create (or, if the connector's layout changed, recreate) an entity's tables."""
+        if entity in self._tables:
+            return self._tables[entity]
+        layout = self._layout(entity)
+        row = self._conn.execute(
+            "SELECT signature FROM _mirror_meta WHERE entity = ?", (entity,)
+        ).fetchone()
+        with self._conn:
+            if row and row[0] != layout.signature:
+                self._conn.execute(f"DROP TABLE IF EXISTS {layout.table}")
+                self._conn.execute(f"DROP TABLE IF EXISTS {layout.fts}")
+                self._conn.execute(
+                    "DELETE FROM _mirror_meta WHERE entity = ?", (entity,)
+                )
+                self._conn.execute(
+                    "DELETE FROM _mirror_state WHERE key = ?",
+                    (f"{self.executor.config.name}/{entity}",),
+                )
+            columns = "".join(
+                f"{_quote(name)} {sql_type}, "
+                for name, sql_type in layout.columns.items()
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {layout.table} "
+                f"(_key TEXT NOT NULL UNIQUE, {columns}_data TEXT NOT NULL, _synced_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {layout.fts} USING fts5(body)"
+            )
+            for key in layout.index_keys:
+                index = _quote(f"{entity}__{key.replace('.', '_')}")
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index} "
+                    f"ON {layout.table} ({layout.expression(key)})"
+                )
+            self._conn.execute(
+                "INSERT INTO _mirror_meta (entity, signature) VALUES (?, ?) "
+                "ON CONFLICT(entity) DO UPDATE SET signature = excluded.signature",
+                (entity, layout.signature),
+            )
+        self._tables[entity] = layout
+        return layout
+
+    def _upsert(
+        self, layout: _EntityTable, records: list[Any], synced_at: float
+    ) -> None:
+        """Write records and their full-text rows (inside the caller's transaction)."""
+        names = ["_key", *layout.columns, "_data", "_synced_at"]
+        columns = ", ".join(_quote(name) for name in names)
+        placeholders = ", ".join("?" for _ in names)
+        updates = ", ".join(
+            f"{_quote(name)} = excluded.{_quote(name)}" for name in names[1:]
+        )
+        sql = (
+            f"INSERT INTO {layout.table} ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(_key) DO UPDATE SET {updates} RETURNING rowid"
+        )
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            key = _get_dotted(record, layout.primary_key)
+            rowid = self._conn.execute(
+                sql,
+                [
+                    str(key) if key is not None else _content_key(record),
+                    *layout.values(record),
+                    json.dumps(record),
+                    synced_at,
+                ],
+            ).fetchone()[0]
+            self._conn.execute(f"DELETE FROM {layout.fts} WHERE rowid = ?", (rowid,))
+            self._conn.execute(
+                f"INSERT INTO {layout.fts} (rowid, body) VALUES (?, ?)",
+                (rowid, " ".join(_strings(record))),
+            )
+
+    async def refresh(self, entity: str, params: dict[str, Any] | None = None) -> int:
+        """Refresh an entity from the API.
+
+        Incremental entities fetch only records changed since the last refresh;
+        others are re-listed, and (when no params narrow the listing) rows no
+        longer returned by the API are removed.
+
+        Args:
+            entity: Entity name
+            params: Extra list parameters
+
+        Returns:
+            Number of records written
+        """
+        layout = self._ensure_table(entity)
+        started = time.time()
+
+        if layout.incremental:
+            result = await self.executor.sync(
+                entity, self._state_store, params=params, action=Action.LIST
+            )
+            records, mode = result.records, "incremental"
+        else:
+            records = [
+                record
+                async for record in self.executor.iter_records(
+                    entity, Action.LIST, params
+                )
+            ]
+            mode = "full"
+
+        with self._conn:
+            self._upsert(layout, records, started)
+            if mode == "full" and not params:
+                self._conn.execute(
+                    f"DELETE FROM {layout.fts} WHERE rowid IN "
+                    f"(SELECT rowid FROM {layout.table} WHERE _synced_at < ?)",
+                    (started,),
+                )
+                self._conn.execute(
+                    f"DELETE FROM {layout.table} WHERE _synced_at < ?", (started,)
+                )
+            self._conn.execute(
+                "UPDATE _mirror_meta SET refreshed_at = ?, mode = ? WHERE entity = ?",
+                (time.time(), mode, entity),
+            )
+        return len(records)
+
+    def refreshed_at(self, entity: str) -> datetime | None:
+        """When an entity was last refreshed, or None if it was never mirrored."""
+        row = self._conn.execute(
+            "SELECT refreshed_at FROM _mirror_meta WHERE entity = ?", (entity,)
+        ).fetchone()
+        if not row or row[0] is None:
+            return None
+        return datetime.fromtimestamp(row[0], tz=timezone.utc)
+
+    async def query(
+        self,
+        entity: str,
+        filter: dict[str, Any] | None = None,
+        text: str | None = None,
+        limit: int | None = 100,
+        max_age_seconds: float | None = None,
+        refresh: bool = False,
+    ) -> MirrorQueryResult:
+        """Answer a query from the mirror, refreshing the entity first if needed.
+
+        Args:
+            entity: Entity name
+            filter: Field (dot notation) -> value; a list value matches any of
+                its items and None matches missing/null fields
+            text: Words that must all appear somewhere in the record, ranked by
+                relevance
+            limit: Maximum records returned (None for all)
+            max_age_seconds: Overrides the mirror's max_age_seconds
+            refresh: Refresh from the API before answering
+
+        Returns:
+            MirrorQueryResult with the matching records and freshness metadata
+
+        Example:
+            result = await mirror.query("contacts", filter={"properties.company": "ACME"})
+        """
+        layout = self._ensure_table(entity)
+        refreshed_at = self.refreshed_at(entity)
+        max_age = (
+            max_age_seconds if max_age_seconds is not None else self.max_age_seconds
+        )
+        stale = refreshed_at is None or (
+            max_age is not None
+            and (datetime.now(timezone.utc) - refreshed_at).total_seconds() > max_age
+        )
+        if refresh or stale:
+            await self.refresh(entity)
+            refreshed_at = self.refreshed_at(entity)
+
+        clauses: list[str] = []
+        args: list[Any] = []
+        for key, value in (filter or {}).items():
+            expression = layout.expression(key)
+            if key == layout.primary_key and value is not None:
+                # Look primary keys up through the unique _key index
+                expression = "_key"
+                if isinstance(value, (list, tuple, set)):
+                    value = [str(item) for item in value]
+                else:
+                    value = str(value)
+            if value is None:
+                clauses.append(f"{expression} IS NULL")
+            elif isinstance(value, (list, tuple, set)):
+                values = list(value)
+                clauses.append(f"{expression} IN ({', '.join('?' for _ in values)})")
+                args.extend(values)
+            else:
+                clauses.append(f"{expression} = ?")
+                args.append(value)
+
+        sql = f"SELECT {layout.table}._data FROM {layout.table}"
+        order = f"{layout.table}.rowid"
+        if text and text.strip():
+            sql += f" JOIN {layout.fts} ON {layout.fts}.rowid = {layout.table}.rowid"
+            clauses.insert(0, f"{layout.fts} MATCH ?")
+            args.insert(0, _fts_query(text))
+            order = f"{layout.fts}.rank"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        rows = self._conn.execute(sql, args).fetchall()
+        return MirrorQueryResult(
+            records=[json.loads(row[0]) for row in rows],
+            refreshed_at=refreshed_at,
+            refreshed=refresh or stale,
+        )
@@ -1,6 +1,7 @@
 """Shared session context for both logging and telemetry."""
 
 import logging
+import threading
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
@@ -8,6 +9,16 @@ from typing import Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Process-wide identity cache. Resolving the user ID touches the filesystem and
+# resolving the public IP makes a network call, so each is done at most once per
+# process, lazily, and only from the telemetry worker thread. Each has its own
+# lock, so reading the user ID never waits behind the IP lookup.
+_user_id_lock = threading.Lock()
+_public_ip_lock = threading.Lock()
+_cached_user_id: Optional[str] = None
+_cached_public_ip: Optional[str] = None
+_public_ip_resolved = False
+
 
 def get_persistent_user_id() -> str:
     """
@@ -65,8 +76,35 @@ def get_public_ip() -> Optional[str]:
         return None
 
 
+def get_cached_user_id() -> str:
+    """Return the persistent user ID, reading ~/.airbyte at most once per process."""
+    global _cached_user_id
+    with _user_id_lock:
+        if _cached_user_id is None:
+            _cached_user_id = get_persistent_user_id()
+        return _cached_user_id
+
+
+def get_cached_public_ip() -> Optional[str]:
+    """Return the public IP, fetching it at most once per process.
+
+    This blocks for up to 2 seconds on first call, so it must only be called off
+    the request path (the telemetry pipeline resolves it in its worker thread).
+    """
+    global _cached_public_ip, _public_ip_resolved
+    with _public_ip_lock:
+        if not _public_ip_resolved:
+            _cached_public_ip = get_public_ip()
+            _public_ip_resolved = True
+        return _cached_public_ip
+
+
 class ObservabilitySession:
-    """Shared session context for both logging and telemetry."""
+    """Shared session context for both logging and telemetry.
+
+    Construction does no I/O: user_id and public_ip are resolved lazily from the
+    process-wide cache the first time they are read.
+    """
 
     def __init__(
         self,
@@ -76,14 +114,22 @@ class ObservabilitySession:
         session_id: Optional[str] = None,
     ):
         self.session_id = session_id or str(uuid.uuid4())
-        self.user_id = get_persistent_user_id()
         self.connector_name = connector_name
         self.connector_version = connector_version
         self.execution_context = execution_context
         self.started_at = datetime.now(UTC)
         self.operation_count = 0
         self.metadata: Dict[str, Any] = {}
-        self.public_ip = get_public_ip()
+
+    @property
+    def user_id(self) -> str:
+        """Anonymous persistent user ID (cached per process)."""
+        return get_cached_user_id()
+
+    @property
+    def public_ip(self) -> Optional[str]:
+        """Public IP address (cached per process, may block on first access)."""
+        return get_cached_public_ip()
 
     def increment_operations(self):
         """Increment the operation counter."""
@@ -34,6 +34,16 @@ from .components import (
     Response,
     MediaType,
     Header,
+    BatchReadConfig,
+    BatchWriteConfig,
+    BatchActionConfig,
+    BatchJobConfig,
+    RelationshipConfig,
+    RelationshipSideloadConfig,
+    ShardingConfig,
+    IncrementalConfig,
+    FilterFieldConfig,
+    FiltersConfig,
 )
 from .operations import PathItem, Operation
 from .extensions import PaginationConfig, RateLimitConfig, RetryConfig
@@ -65,6 +75,16 @@ __all__ = [
     "Response",
     "MediaType",
     "Header",
+    "BatchReadConfig",
+    "BatchWriteConfig",
+    "BatchActionConfig",
+    "BatchJobConfig",
+    "RelationshipConfig",
+    "RelationshipSideloadConfig",
+    "ShardingConfig",
+    "IncrementalConfig",
+    "FilterFieldConfig",
+    "FiltersConfig",
     # Operation models
     "PathItem",
     "Operation",
@@ -8,7 +8,7 @@ References:
 """
 
 from typing import Optional, Dict, Any, List, Literal, Union
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from .security import SecurityScheme
 
@@ -167,6 +167,496 @@ class PathOverrideConfig(BaseModel):
     )
 
 
+class BatchReadConfig(BaseModel):
+    """
+    Bulk read configuration for x-airbyte-batch-read extension.
+
+    Declared on a `get` operation when the API can fetch many records by ID in one
+    request (e.g. HubSpot batch/read, Zendesk show_many, Gong calls/extensive).
+    Used by LocalExecutor.get_many().
+
+    Example:
+        HubSpot: POST /crm/v3/objects/contacts/batch/read
+            {"inputs": [{"id": "1"}, {"id": "2"}]} -> {"results": [...]}
+        Zendesk: GET /users/show_many.json?ids=1,2 -> {"users": [...]}
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    path: str = Field(
+        ...,
+        description="HTTP path of the bulk read endpoint. May contain {param} placeholders.",
+    )
+    method: Literal["GET", "POST"] = Field("POST", description="HTTP method")
+    ids_location: Literal["query", "body"] = Field(
+        "body", description="Where the IDs are sent"
+    )
+    ids_field: str = Field(
+        "ids",
+        description=(
+            "Query parameter name, or body field (dot notation for nested fields, "
+            "e.g. 'filter.callIds') that receives the IDs"
+        ),
+    )
+    ids_format: Literal["list", "csv", "objects"] = Field(
+        "list",
+        description=(
+            "How IDs are encoded: a JSON list, a comma-separated string, or a list "
+            "of objects keyed by id_key (e.g. [{'id': '1'}])"
+        ),
+    )
+    id_key: str = Field("id", description="Key used when ids_format is 'objects'")
+    body: Optional[Dict[str, Any]] = Field(
+        None, description="Static fields merged into every request body"
+    )
+    max_batch_size: int = Field(
+        100, ge=1, description="Maximum IDs the API accepts per request"
+    )
+    record_extractor: str = Field(
+        ..., description="JSONPath to the array of records in the response"
+    )
+    record_id_field: str = Field(
+        "id",
+        description="Field (dot notation) holding each record's ID, used to map results back",
+    )
+
+
+class BatchActionConfig(BaseModel):
+    """
+    Per-item action envelope for batch APIs that wrap each write as a sub-request
+    (e.g. Asana's /batch: {"method": "post", "relative_path": "/tasks", "data": {...}}).
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    method: str = Field(
+        ..., description="Method of each sub-request (e.g. 'post', 'put')"
+    )
+    relative_path: str = Field(
+        ...,
+        description="Sub-request path; {param} placeholders are filled from params and the record",
+    )
+    data_field: str = Field(
+        "data", description="Envelope field holding the record body"
+    )
+
+
+class BatchJobConfig(BaseModel):
+    """
+    Asynchronous job polling for batch APIs that return a job instead of results
+    (e.g. Zendesk create_many/update_many returning a job_status).
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    id_path: str = Field(
+        ..., description="JSONPath to the job ID in the initial response"
+    )
+    poll_path: str = Field(
+        ...,
+        description="Path polled for job status; {job_id} is replaced with the job ID",
+    )
+    status_path: str = Field(
+        ..., description="JSONPath to the job status in the poll response"
+    )
+    done_values: List[str] = Field(
+        default_factory=lambda: ["completed"],
+        description="Statuses meaning the job finished",
+    )
+    failed_values: List[str] = Field(
+        default_factory=lambda: ["failed", "killed"],
+        description="Statuses meaning the job failed as a whole",
+    )
+    poll_interval_seconds: float = Field(1.0, gt=0)
+    timeout_seconds: float = Field(300.0, gt=0)
+
+
+class BatchWriteConfig(BaseModel):
+    """
+    Bulk write configuration for x-airbyte-batch-write extension.
+
+    Declared on a `create` or `update` operation when the API can write many
+    records in one request. Used by LocalExecutor.create_many()/update_many().
+
+    Example:
+        HubSpot: POST /crm/v3/objects/contacts/batch/create
+            {"inputs": [{"properties": {...}}]} -> {"results": [...]}
+        Asana: POST /batch
+            {"data": {"actions": [{"method": "post", "relative_path": "/tasks", "data": {...}}]}}
+        Zendesk: POST /tickets/create_many.json {"tickets": [...]} -> job_status, polled
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    path: str = Field(
+        ...,
+        description="HTTP path of the bulk endpoint. May contain {param} placeholders.",
+    )
+    method: Literal["POST", "PUT", "PATCH"] = Field("POST", description="HTTP method")
+    max_batch_size: int = Field(100, ge=1, description="Maximum records per request")
+    items_field: str = Field(
+        "inputs", description="Body field (dot notation) receiving the list of items"
+    )
+    body: Optional[Dict[str, Any]] = Field(
+        None, description="Static fields merged into every request body"
+    )
+    item_wrapper: Optional[str] = Field(
+        None,
+        description="Wrap each record's fields under this key (e.g. HubSpot 'properties')",
+    )
+    item_id_field: str = Field(
+        "id", description="Item field receiving the record ID for updates"
+    )
+    action: Optional[BatchActionConfig] = Field(
+        None, description="Wrap each item in a sub-request envelope (Asana /batch)"
+    )
+    job: Optional[BatchJobConfig] = Field(
+        None, description="Poll an asynchronous job for the results"
+    )
+    results_extractor: str = Field(
+        ...,
+        description="JSONPath to the per-item results (in the job status response when job is set)",
+    )
+    result_match: Literal["order", "index", "id", "trace"] = Field(
+        "order",
+        description=(
+            "How results map back to inputs: by position, by an index field, "
+            "by record ID (updates only), or by trace_field"
+        ),
+    )
+    trace_field: Optional[str] = Field(
+        None,
+        description=(
+            "Item field receiving a per-record trace ID that the API echoes in each "
+            "result (dot notation in results), for result_match 'trace'"
+        ),
+    )
+    result_index_field: str = Field(
+        "index", description="Result field holding the input index"
+    )
+    result_id_field: str = Field(
+        "id", description="Result field (dot notation) holding the record ID"
+    )
+    result_status_field: Optional[str] = Field(
+        None,
+        description="Result field holding a per-item HTTP status code (2xx = success)",
+    )
+    result_record_field: Optional[str] = Field(
+        None, description="Result field (dot notation) holding the written record"
+    )
+    result_error_field: Optional[str] = Field(
+        None,
+        description="Result field (dot notation) whose presence marks a failed item",
+    )
+
+    @model_validator(mode="after")
+    def validate_trace_field(self) -> "BatchWriteConfig":
+        """Matching by trace needs the field that carries it."""
+        if self.result_match == "trace" and not self.trace_field:
+            raise ValueError(
+                "x-airbyte-batch-write result_match 'trace' needs trace_field"
+            )
+        return self
+
+
+class RelationshipSideloadConfig(BaseModel):
+    """
+    Native sideloading for a relationship: a query parameter that makes the API
+    include related records (or their IDs) in the primary response.
+
+    Example:
+        Zendesk: GET /tickets.json?include=users -> {"tickets": [...], "users": [...]}
+        Stripe: GET /v1/charges?expand[]=data.customer (customer expanded inline)
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    param: str = Field(..., description="Query parameter name (e.g. 'include')")
+    value: str = Field(
+        ..., description="Value requested for this relationship (e.g. 'users')"
+    )
+    style: Literal["csv", "repeat"] = Field(
+        "csv",
+        description="Join values with commas, or repeat the parameter once per value",
+    )
+    records_extractor: Optional[str] = Field(
+        None,
+        description=(
+            "JSONPath to the sideloaded records in the response. Omit when the API "
+            "expands records inline or only returns their IDs."
+        ),
+    )
+
+
+class RelationshipConfig(BaseModel):
+    """
+    A foreign key from an operation's records to another entity, declared via the
+    x-airbyte-relationships extension and resolved when callers pass expand=[...].
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    entity: str = Field(..., description="Target entity name")
+    foreign_key: str = Field(
+        ...,
+        description=(
+            "Record field (dot notation) holding the related ID or IDs. Lists along "
+            "the path are traversed, e.g. 'associations.contacts.results.id'."
+        ),
+    )
+    target_key: str = Field(
+        "id", description="Field (dot notation) identifying sideloaded records"
+    )
+    target_field: Optional[str] = Field(
+        None,
+        description="Record field receiving the related record(s); defaults to the relationship name",
+    )
+    sideload: Optional[RelationshipSideloadConfig] = Field(
+        None, description="Native sideloading, when the API supports it"
+    )
+
+
+class ShardingConfig(BaseModel):
+    """
+    Time-window sharding configuration for x-airbyte-sharding extension.
+
+    Declared on a list/search operation whose results can be filtered by a time
+    range. LocalExecutor.scan_time_range() splits a requested range into windows,
+    walks each window's pagination concurrently, splits windows that hit the API's
+    result cap, and merges the records in time order.
+
+    The range is applied in one of three ways:
+        - from_param/to_param: two parameters (dot notation for nested body
+          fields), e.g. Gong fromDateTime/toDateTime
+        - query_param/query_template: appended to a search query string,
+          e.g. GitHub "created:{from}..{to}"
+        - filter_groups_param/filter_property: GTE/LT filters added to every
+          filter group, e.g. HubSpot search filterGroups
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    from_param: Optional[str] = Field(
+        None, description="Parameter receiving the window start (dot notation)"
+    )
+    to_param: Optional[str] = Field(
+        None, description="Parameter receiving the window end (dot notation)"
+    )
+    query_param: Optional[str] = Field(
+        None, description="Search query parameter the window is appended to"
+    )
+    query_template: Optional[str] = Field(
+        None,
+        description="Window qualifier with {from} and {to} placeholders, e.g. 'created:{from}..{to}'",
+    )
+    filter_groups_param: Optional[str] = Field(
+        None, description="Filter groups parameter (HubSpot-style search bodies)"
+    )
+    filter_property: Optional[str] = Field(
+        None, description="Property filtered by the GTE/LT window filters"
+    )
+    format: Literal["iso8601", "date", "unix", "unix_ms"] = Field(
+        "iso8601", description="How window bounds are rendered"
+    )
+    to_inclusive: bool = Field(
+        False,
+        description=(
+            "Whether the API treats the end bound as inclusive; if so, the rendered "
+            "end is one unit (second, or day for 'date') before the next window's start"
+        ),
+    )
+    record_time_field: str = Field(
+        ...,
+        description="Record field (dot notation) holding the timestamp used to merge windows in order",
+    )
+    result_cap: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum results the API returns for one query; windows reaching it are split",
+    )
+    total_path: Optional[str] = Field(
+        None,
+        description="JSONPath to the total result count, used to split windows before walking them",
+    )
+    min_window_seconds: int = Field(
+        60, ge=1, description="Windows are never split below this size"
+    )
+
+    @model_validator(mode="after")
+    def validate_range_style(self) -> "ShardingConfig":
+        """Exactly one way of applying the range must be configured."""
+        styles = [
+            bool(self.from_param and self.to_param),
+            bool(self.query_param and self.query_template),
+            bool(self.filter_groups_param and self.filter_property),
+        ]
+        if sum(styles) != 1:
+            raise ValueError(
+                "x-airbyte-sharding needs exactly one of: from_param and to_param, "
+                "query_param and query_template, or filter_groups_param and filter_property"
+            )
+        return self
+
+
+class IncrementalConfig(BaseModel):
+    """
+    Incremental sync configuration for x-airbyte-incremental extension.
+
+    Declared on a list/search operation that can filter by modification time.
+    LocalExecutor.sync() persists the highest cursor_field value it has seen and,
+    on the next sync, asks the API only for records changed since then (minus
+    lookback_seconds, to catch late-arriving updates).
+
+    The lower bound is applied in one of three ways:
+        - cursor_param: a single parameter (dot notation for nested body fields),
+          e.g. Gong fromDateTime or Zendesk start_time
+        - query_param/query_template: appended to a search query string,
+          e.g. GitHub "updated:>={from}"
+        - filter_groups_param/filter_property: a GTE filter added to every filter
+          group, e.g. HubSpot lastmodifieddate
+
+    APIs with resumable export cursors (e.g. Zendesk's
+    /incremental/tickets/cursor.json after_cursor) also set resume_cursor_path and
+    resume_cursor_param; once a sync has stored that cursor, later syncs resume
+    from it instead of sending a time bound.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    cursor_field: str = Field(
+        ...,
+        description="Record field (dot notation) holding the modification time",
+    )
+    cursor_param: Optional[str] = Field(
+        None, description="Parameter receiving the lower bound (dot notation)"
+    )
+    query_param: Optional[str] = Field(
+        None, description="Search query parameter the bound is appended to"
+    )
+    query_template: Optional[str] = Field(
+        None,
+        description="Bound qualifier with a {from} placeholder, e.g. 'updated:>={from}'",
+    )
+    filter_groups_param: Optional[str] = Field(
+        None, description="Filter groups parameter (HubSpot-style search bodies)"
+    )
+    filter_property: Optional[str] = Field(
+        None, description="Property filtered by the GTE bound filter"
+    )
+    format: Literal["iso8601", "date", "unix", "unix_ms"] = Field(
+        "iso8601", description="How the lower bound is rendered"
+    )
+    primary_key: str = Field(
+        "id", description="Record field (dot notation) identifying a record"
+    )
+    lookback_seconds: int = Field(
+        0,
+        ge=0,
+        description="How far before the stored cursor each sync starts, for late updates",
+    )
+    start: Optional[str] = Field(
+        None,
+        description="Lower bound for the first sync; without it the first sync reads everything",
+    )
+    resume_cursor_path: Optional[str] = Field(
+        None, description="JSONPath to a resumable server-issued cursor on each page"
+    )
+    resume_cursor_param: Optional[str] = Field(
+        None, description="Parameter the stored server-issued cursor is sent in"
+    )
+
+    @model_validator(mode="after")
+    def validate_bound_style(self) -> "IncrementalConfig":
+        """Exactly one way of applying the bound, and resume cursor fields in pairs."""
+        styles = [
+            bool(self.cursor_param),
+            bool(self.query_param and self.query_template),
+            bool(self.filter_groups_param and self.filter_property),
+        ]
+        if sum(styles) != 1:
+            raise ValueError(
+                "x-airbyte-incremental needs exactly one of: cursor_param, "
+                "query_param and query_template, or filter_groups_param and filter_property"
+            )
+        if bool(self.resume_cursor_path) != bool(self.resume_cursor_param):
+            raise ValueError(
+                "x-airbyte-incremental resume_cursor_path and resume_cursor_param must be set together"
+            )
+        return self
+
+
+FilterOperator = Literal["eq", "ne", "gt", "gte", "lt", "lte", "in", "contains"]
+
+
+class FilterFieldConfig(BaseModel):
+    """
+    One filterable field of an x-airbyte-filters declaration.
+
+    operators maps each supported where= operator to how the API expresses it,
+    which depends on the filter style:
+        - params: the parameter receiving the value (dot notation)
+        - query: a qualifier template with a {value} placeholder
+        - filter_groups: the API's operator name (e.g. HubSpot EQ, GT, IN)
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    property: Optional[str] = Field(
+        None,
+        description="API property name for filter_groups style (default: the field name)",
+    )
+    operators: Dict[FilterOperator, str] = Field(
+        ..., description="Supported operators and how the API expresses each"
+    )
+
+
+class FiltersConfig(BaseModel):
+    """
+    Server-side filter configuration for x-airbyte-filters extension.
+
+    Declared on a list/search operation to describe which record fields the API
+    can filter on. When callers pass where=..., predicates on these fields are
+    pushed down into the request; the rest are evaluated locally while paging.
+
+    Styles:
+        - params: each operator maps to its own query/body parameter
+          (e.g. Zendesk ?status=open, Stripe ?created[gte]=...)
+        - query: qualifiers are joined into one search query string
+          (GitHub "stars:>100 language:go", Zendesk "status:open",
+          Stripe "status:'active' AND amount>100")
+        - filter_groups: GTE/EQ/... filters added to every filter group
+          (HubSpot search filterGroups)
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    style: Literal["params", "query", "filter_groups"]
+    query_param: Optional[str] = Field(
+        None, description="Search query parameter for query style"
+    )
+    separator: str = Field(
+        " ",
+        description="How query style qualifiers are joined (e.g. ' AND ' for Stripe)",
+    )
+    filter_groups_param: Optional[str] = Field(
+        None, description="Filter groups parameter for filter_groups style"
+    )
+    fields: Dict[str, FilterFieldConfig] = Field(
+        ..., description="Filterable record fields (dot notation), keyed by field"
+    )
+
+    @model_validator(mode="after")
+    def validate_style_params(self) -> "FiltersConfig":
+        """query style needs query_param; filter_groups style needs filter_groups_param."""
+        if self.style == "query" and not self.query_param:
+            raise ValueError("x-airbyte-filters style 'query' requires query_param")
+        if self.style == "filter_groups" and not self.filter_groups_param:
+            raise ValueError(
+                "x-airbyte-filters style 'filter_groups' requires filter_groups_param"
+            )
+        return self
+
+
 class RequestBody(BaseModel):
     """
     Request body definition.
@@ -1,15 +1,9 @@
 """
-Extension models for future features.
+Extension models for connector-level and operation-level behavior.
 
-These models are defined but NOT yet added to the main schema models.
-They serve as:
-1. Type hints for future use
-2. Documentation of planned extensions
-3. Ready-to-use structures when features are implemented
-
-NOTE: These are not currently active in the schema. They will be added
-to Operation, Schema, or other models when their respective features
-are implemented.
+RetryConfig (x-airbyte-retry-config) and PaginationConfig (x-airbyte-pagination)
+are active. RateLimitConfig is defined for future use and is not yet added to
+the schema models.
 """
 
 from typing import Optional, Literal
@@ -18,12 +12,25 @@ from pydantic import BaseModel, ConfigDict
 
 class PaginationConfig(BaseModel):
     """
-    Configuration for pagination support.
-
-    NOT YET USED - Defined for future implementation.
-
-    When active, will be added to Operation model as:
-        x_pagination: Optional[PaginationConfig] = Field(None, alias="x-pagination")
+    Configuration for x-airbyte-pagination.
+
+    Declared on list/search operations and used by LocalExecutor.iter_pages() to
+    walk every page of a result. Paths into the response are JSONPath expressions
+    evaluated against the full response body (before record extraction).
+
+    Example YAML usage (Gong):
+        x-airbyte-pagination:
+          style: cursor
+          cursor_param: cursor
+          cursor_path: $.records.cursor
+
+    Example YAML usage (GitHub GraphQL search):
+        x-airbyte-pagination:
+          style: cursor
+          limit_param: per_page
+          cursor_param: after
+          cursor_path: $.data.search.pageInfo.endCursor
+          has_more_path: $.data.search.pageInfo.hasNextPage
     """
 
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
@@ -31,7 +38,8 @@ class PaginationConfig(BaseModel):
     style: Literal["cursor", "offset", "page", "link"]
     limit_param: str = "limit"
 
-    # Cursor-based pagination
+    # Cursor-based pagination (cursor_source "headers" and style "link" are not
+    # yet supported by iter_pages(): responses don't expose headers to it)
     cursor_param: Optional[str] = None
     cursor_source: Optional[Literal["body", "headers"]] = "body"
     cursor_path: Optional[str] = None
@@ -42,8 +50,9 @@ class PaginationConfig(BaseModel):
     # Page-based pagination
     page_param: Optional[str] = None
 
-    # Response parsing
-    data_path: str = "data"
+    # Response parsing: records come from x-airbyte-record-extractor; data_path
+    # (dot notation) is only used when the extracted data is not already a list
+    data_path: Optional[str] = None
     has_more_path: Optional[str] = None
 
     # Limits
@@ -9,7 +9,19 @@ References:
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
-from .components import Parameter, RequestBody, Response, PathOverrideConfig
+from .components import (
+    BatchReadConfig,
+    BatchWriteConfig,
+    FiltersConfig,
+    IncrementalConfig,
+    Parameter,
+    PathOverrideConfig,
+    RelationshipConfig,
+    RequestBody,
+    Response,
+    ShardingConfig,
+)
+from .extensions import PaginationConfig
 from .security import SecurityRequirement
 from ..extensions import ActionTypeLiteral
 
@@ -25,9 +37,13 @@ class Operation(BaseModel):
     - x-airbyte-action: Semantic action (Airbyte extension)
     - x-airbyte-path-override: Path override (Airbyte extension)
     - x-airbyte-record-extractor: JSONPath to extract records from response (Airbyte extension)
-
-    Future extensions (not yet active):
-    - x-airbyte-pagination: Pagination configuration for list operations
+    - x-airbyte-batch-read: Bulk read-by-IDs endpoint for get operations (Airbyte extension)
+    - x-airbyte-batch-write: Bulk write endpoint for create/update operations (Airbyte extension)
+    - x-airbyte-relationships: Foreign keys resolved by expand=[...] (Airbyte extension)
+    - x-airbyte-pagination: Pagination configuration for list/search operations (Airbyte extension)
+    - x-airbyte-sharding: Time-window sharding for list/search operations (Airbyte extension)
+    - x-airbyte-incremental: Incremental sync cursor for list/search operations (Airbyte extension)
+    - x-airbyte-filters: Server-side filterable fields for list/search operations (Airbyte extension)
     """
 
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
@@ -79,10 +95,59 @@ class Operation(BaseModel):
         ),
     )
     x_airbyte_file_url: Optional[str] = Field(None, alias="x-airbyte-file-url")
-
-    # Future extensions (commented out, defined for future use)
-    # from .extensions import PaginationConfig
-    # x_pagination: Optional[PaginationConfig] = Field(None, alias="x-airbyte-pagination")
+    x_airbyte_batch_read: Optional[BatchReadConfig] = Field(
+        None,
+        alias="x-airbyte-batch-read",
+        description=(
+            "Bulk read endpoint used by get_many() to fetch many records by ID "
+            "in one request. Only valid on get operations."
+        ),
+    )
+    x_airbyte_batch_write: Optional[BatchWriteConfig] = Field(
+        None,
+        alias="x-airbyte-batch-write",
+        description=(
+            "Bulk write endpoint used by create_many()/update_many(). "
+            "Only valid on create and update operations."
+        ),
+    )
+    x_airbyte_relationships: Optional[Dict[str, RelationshipConfig]] = Field(
+        None,
+        alias="x-airbyte-relationships",
+        description=(
+            "Foreign keys to other entities, resolved when callers pass expand=[...]. "
+            "Only valid on get, list and search operations."
+        ),
+    )
+    x_airbyte_pagination: Optional[PaginationConfig] = Field(
+        None,
+        alias="x-airbyte-pagination",
+        description="How to request further pages. Only valid on list and search operations.",
+    )
+    x_airbyte_sharding: Optional[ShardingConfig] = Field(
+        None,
+        alias="x-airbyte-sharding",
+        description=(
+            "Time-range parameters used by scan_time_range() to split a scan into "
+            "concurrent windows. Only valid on list and search operations."
+        ),
+    )
+    x_airbyte_incremental: Optional[IncrementalConfig] = Field(
+        None,
+        alias="x-airbyte-incremental",
+        description=(
+            "Modification-time cursor used by sync() to fetch only changed records. "
+            "Only valid on list and search operations."
+        ),
+    )
+    x_airbyte_filters: Optional[FiltersConfig] = Field(
+        None,
+        alias="x-airbyte-filters",
+        description=(
+            "Fields and operators the API filters on, used to push where= predicates "
+            "down. Only valid on list and search operations."
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_download_action_requirements(self) -> "Operation":
@@ -113,6 +178,40 @@ class Operation(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_batch_actions(self) -> "Operation":
+        """Check that each batch/read extension is declared on an action it applies to."""
+        if self.x_airbyte_batch_read is not None and self.x_airbyte_action != "get":
+            raise ValueError(
+                f"x-airbyte-batch-read can only be used with x-airbyte-action: get, but action is '{self.x_airbyte_action}'"
+            )
+        if self.x_airbyte_batch_write is not None and self.x_airbyte_action not in (
+            "create",
+            "update",
+        ):
+            raise ValueError(
+                f"x-airbyte-batch-write can only be used with x-airbyte-action: create or update, but action is '{self.x_airbyte_action}'"
+            )
+        if self.x_airbyte_relationships and self.x_airbyte_action not in (
+            "get",
+            "list",
+            "search",
+        ):
+            raise ValueError(
+                f"x-airbyte-relationships can only be used with x-airbyte-action: get, list or search, but action is '{self.x_airbyte_action}'"
+            )
+        for name, value in (
+            ("x-airbyte-pagination", self.x_airbyte_pagination),
+            ("x-airbyte-sharding", self.x_airbyte_sharding),
+            ("x-airbyte-incremental", self.x_airbyte_incremental),
+            ("x-airbyte-filters", self.x_airbyte_filters),
+        ):
+            if value is not None and self.x_airbyte_action not in ("list", "search"):
+                raise ValueError(
+                    f"{name} can only be used with x-airbyte-action: list or search, but action is '{self.x_airbyte_action}'"
+                )
+        return self
+
 
 class PathItem(BaseModel):
     """
@@ -1,10 +1,12 @@
 """Telemetry tracking for Airbyte SDK."""
 
 from .config import TelemetryConfig, TelemetryMode
+from .pipeline import TelemetryPipeline
 from .tracker import SegmentTracker
 
 __all__ = [
     "TelemetryConfig",
     "TelemetryMode",
     "SegmentTracker",
+    "TelemetryPipeline",
 ]
@@ -0,0 +1,208 @@
+"""Background telemetry pipeline.
+
+Trackers enqueue lightweight event descriptions; a single process-wide worker
+thread drains the queue in batches, resolves the (cached) user identity, builds
+the event payloads and hands them to Segment. Nothing on the request path
+performs I/O or blocks on the queue.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+from ..observability import ObservabilitySession
+
+from .events import BaseEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_SHUTDOWN_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass
+class PendingEvent:
+    """An event captured on the request path, built later by the worker.
+
+    fields holds everything that must be snapshotted at call time (timestamp,
+    counters); identity fields are filled in from the session by the worker.
+    """
+
+    session: ObservabilitySession
+    event_name: str
+    event_cls: Type[BaseEvent]
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+
+class _Flush:
+    """Queue marker asking the worker to flush Segment and signal completion."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class TelemetryPipeline:
+    """Bounded queue plus a daemon worker thread that batches telemetry events."""
+
+    def __init__(
+        self,
+        analytics: Any,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize the pipeline. The worker thread starts on the first submit().
+
+        Args:
+            analytics: Segment analytics module (or compatible object with track/flush)
+            queue_size: Maximum pending events; further events are dropped
+            batch_size: Maximum events processed per worker wakeup
+            flush_interval_seconds: How long the worker waits for events before
+                flushing Segment's own buffer
+        """
+        self.analytics = analytics
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.dropped = 0
+        self.sent = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stopped = False
+
+    def submit(self, event: PendingEvent) -> bool:
+        """Enqueue an event without blocking. Returns False if it was dropped."""
+        if self._stopped:
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def request_flush(self) -> Optional[threading.Event]:
+        """Ask the worker to send everything queued so far.
+
+        Returns an Event set once the flush completes, or None if the pipeline
+        is stopped or its queue is full. Callers on the request path should not
+        wait on it.
+        """
+        if self._stopped:
+            return None
+        self._ensure_started()
+        marker = _Flush()
+        try:
+            self._queue.put_nowait(marker)
+        except queue.Full:
+            return None
+        return marker.done
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued events are sent. Only for use off the request path."""
+        done = self.request_flush()
+        if done is None:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Drain the queue (bounded by timeout) and stop the worker."""
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="airbyte-telemetry", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                self._flush_analytics()
+                continue
+
+            batch: List[Any] = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is _STOP:
+                    self._flush_analytics()
+                    return
+                if isinstance(item, _Flush):
+                    self._flush_analytics()
+                    item.done.set()
+                    continue
+                self._send(item)
+
+    def _send(self, pending: PendingEvent) -> None:
+        try:
+            session = pending.session
+            event = pending.event_cls(
+                session_id=session.session_id,
+                user_id=session.user_id,
+                execution_context=session.execution_context,
+                public_ip=session.public_ip,
+                connector_name=session.connector_name,
+                **pending.fields,
+            )
+            self.analytics.track(
+                user_id=event.user_id,
+                anonymous_id=event.session_id,
+                event=pending.event_name,
+                properties=event.to_dict(),
+            )
+            self.sent += 1
+        except Exception as e:
+            # Never let a bad event kill the worker thread
+            logger.error(f"Telemetry error: {e}")
+
+    def _flush_analytics(self) -> None:
+        try:
+            self.analytics.flush()
+        except Exception as e:
+            logger.error(f"Telemetry error: {e}")
+
+
+_pipeline: Optional[TelemetryPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline(analytics: Any) -> TelemetryPipeline:
+    """Return the process-wide pipeline, creating it on first use."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = TelemetryPipeline(analytics)
+                atexit.register(_pipeline.shutdown)
+    return _pipeline
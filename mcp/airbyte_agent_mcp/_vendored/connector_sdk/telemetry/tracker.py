@@ -1,4 +1,8 @@
-"""Anonymous telemetry tracker using Segment."""
+"""Anonymous telemetry tracker using Segment.
+
+Tracking calls only snapshot the event fields and enqueue them on the
+process-wide TelemetryPipeline; building and sending happens in the background.
+"""
 
 import logging
 import platform
@@ -10,6 +14,7 @@ from ..observability import ObservabilitySession
 
 from .config import SEGMENT_WRITE_KEY, TelemetryConfig, TelemetryMode
 from .events import ConnectorInitEvent, OperationEvent, SessionEndEvent
+from .pipeline import PendingEvent, TelemetryPipeline, get_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,7 @@ class SegmentTracker:
         self.failure_count = 0
         self.enabled = TelemetryConfig.is_enabled()
         self._analytics = None
+        self._pipeline: Optional[TelemetryPipeline] = None
 
         if self.enabled:
             try:
@@ -35,6 +41,7 @@ class SegmentTracker:
 
                 analytics.write_key = SEGMENT_WRITE_KEY
                 self._analytics = analytics
+                self._pipeline = get_pipeline(analytics)
                 self._log_startup_message()
             except ImportError:
                 logger.warning(
@@ -47,37 +54,37 @@ class SegmentTracker:
         logger.info(f"Anonymous telemetry enabled (mode: {self.mode.value})")
         logger.info("To opt-out: export AIRBYTE_TELEMETRY_MODE=disabled")
 
+    def _enqueue(self, event_name: str, event_cls: type, **fields) -> None:
+        """Hand an event to the background pipeline without blocking."""
+        try:
+            self._pipeline.submit(
+                PendingEvent(
+                    session=self.session,
+                    event_name=event_name,
+                    event_cls=event_cls,
+                    fields={"timestamp": datetime.utcnow(), **fields},
+                )
+            )
+        except Exception as e:
+            # Never fail on tracking errors
+            logger.error(f"Telemetry error: {e}")
+
     def track_connector_init(
         self,
         connector_version: Optional[str] = None,
     ) -> None:
         """Track connector initialization."""
-        if not self.enabled or not self._analytics:
+        if not self.enabled or not self._pipeline:
             return
 
-        try:
-            event = ConnectorInitEvent(
-                timestamp=datetime.utcnow(),
-                session_id=self.session.session_id,
-                user_id=self.session.user_id,
-                execution_context=self.session.execution_context,
-                public_ip=self.session.public_ip,
-                connector_name=self.session.connector_name,
-                connector_version=connector_version,
-                python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                os_name=platform.system(),
-                os_version=platform.release(),
-            )
-
-            self._analytics.track(
-                user_id=self.session.user_id,
-                anonymous_id=event.session_id,
-                event="Connector Initialized",
-                properties=event.to_dict(),
-            )
-        except Exception as e:
-            # Never fail on tracking errors
-            logger.error(f"Telemetry error: {e}")
+        self._enqueue(
+            "Connector Initialized",
+            ConnectorInitEvent,
+            connector_version=connector_version,
+            python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            os_name=platform.system(),
+            os_version=platform.release(),
+        )
 
     def track_operation(
         self,
@@ -94,60 +101,34 @@ class SegmentTracker:
         else:
             self.failure_count += 1
 
-        if not self.enabled or not self._analytics:
+        if not self.enabled or not self._pipeline:
             return
 
-        try:
-            event = OperationEvent(
-                timestamp=datetime.utcnow(),
-                session_id=self.session.session_id,
-                user_id=self.session.user_id,
-                execution_context=self.session.execution_context,
-                public_ip=self.session.public_ip,
-                connector_name=self.session.connector_name,
-                entity=entity,
-                action=action,
-                status_code=status_code,
-                timing_ms=timing_ms,
-                error_type=error_type,
-            )
-
-            self._analytics.track(
-                user_id=self.session.user_id,
-                anonymous_id=event.session_id,
-                event="Operation Executed",
-                properties=event.to_dict(),
-            )
-        except Exception as e:
-            logger.error(f"Telemetry error: {e}")
+        self._enqueue(
+            "Operation Executed",
+            OperationEvent,
+            entity=entity,
+            action=action,
+            status_code=status_code,
+            timing_ms=timing_ms,
+            error_type=error_type,
+        )
 
     def track_session_end(self) -> None:
-        """Track session end."""
-        if not self.enabled or not self._analytics:
-            return
+        """Track session end.
 
-        try:
-            event = SessionEndEvent(
-                timestamp=datetime.utcnow(),
-                session_id=self.session.session_id,
-                user_id=self.session.user_id,
-                execution_context=self.session.execution_context,
-                public_ip=self.session.public_ip,
-                connector_name=self.session.connector_name,
-                duration_seconds=self.session.duration_seconds(),
-                operation_count=self.session.operation_count,
-                success_count=self.success_count,
-                failure_count=self.failure_count,
-            )
-
-            self._analytics.track(
-                user_id=self.session.user_id,
-                anonymous_id=event.session_id,
-                event="Session Ended",
-                properties=event.to_dict(),
-            )
+        Requests a background flush instead of flushing inline; anything still
+        queued at interpreter exit is drained by the pipeline's atexit hook.
+        """
+        if not self.enabled or not self._pipeline:
+            return
 
-            # Ensure events are sent before shutdown
-            self._analytics.flush()
-        except Exception as e:
-            logger.error(f"Telemetry error: {e}")
+        self._enqueue(
+            "Session Ended",
+            SessionEndEvent,
+            duration_seconds=self.session.duration_seconds(),
+            operation_count=self.session.operation_count,
+            success_count=self.success_count,
+            failure_count=self.failure_count,
+        )
+        self._pipeline.request_flush()
@@ -7,8 +7,16 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field
 
 from .constants import OPENAPI_DEFAULT_VERSION
-from .schema.components import PathOverrideConfig
-from .schema.extensions import RetryConfig
+from .schema.components import (
+    BatchReadConfig,
+    BatchWriteConfig,
+    FiltersConfig,
+    IncrementalConfig,
+    PathOverrideConfig,
+    RelationshipConfig,
+    ShardingConfig,
+)
+from .schema.extensions import PaginationConfig, RetryConfig
 from .schema.security import AirbyteAuthConfig
 
 
@@ -114,6 +122,48 @@ class EndpointDefinition(BaseModel):
         description="Field in metadata response containing download URL (from x-airbyte-file-url extension)",
     )
 
+    # Bulk read support (Airbyte extension)
+    batch_read: BatchReadConfig | None = Field(
+        None,
+        description="Bulk read-by-IDs endpoint from x-airbyte-batch-read extension",
+    )
+
+    # Bulk write support (Airbyte extension)
+    batch_write: BatchWriteConfig | None = Field(
+        None,
+        description="Bulk write endpoint from x-airbyte-batch-write extension",
+    )
+
+    # Relationship expansion support (Airbyte extension)
+    relationships: dict[str, RelationshipConfig] | None = Field(
+        None,
+        description="Foreign keys to other entities from x-airbyte-relationships extension",
+    )
+
+    # Pagination support (Airbyte extension)
+    pagination: PaginationConfig | None = Field(
+        None,
+        description="How to request further pages, from x-airbyte-pagination extension",
+    )
+
+    # Time-window sharding support (Airbyte extension)
+    sharding: ShardingConfig | None = Field(
+        None,
+        description="Time-range parameters for sharded scans, from x-airbyte-sharding extension",
+    )
+
+    # Incremental sync support (Airbyte extension)
+    incremental: IncrementalConfig | None = Field(
+        None,
+        description="Modification-time cursor for incremental sync, from x-airbyte-incremental extension",
+    )
+
+    # Filter pushdown support (Airbyte extension)
+    filters: FiltersConfig | None = Field(
+        None,
+        description="Server-side filterable fields, from x-airbyte-filters extension",
+    )
+
 
 class EntityDefinition(BaseModel):
     """Definition of an API entity."""
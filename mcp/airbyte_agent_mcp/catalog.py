@@ -0,0 +1,171 @@
+"""Precomputed catalog of configured connectors for the discovery tools.
+
+Describing a connector means parsing its definition and walking every OpenAPI
+operation for parameter metadata, and registry connectors first resolve the
+registry. ConnectorCatalog does this once per connector, concurrently at
+startup (build()), and keeps the finished describe_connector response, so the
+discovery tools answer from a dict lookup.
+
+Entries are frozen and replaced as a whole, never modified. An entry is rebuilt
+when it goes stale:
+    - connectors with a local path: the definition file's mtime or size changed
+    - unpinned registry connectors: the registry now resolves a different
+      version, checked at most every registry_check_interval seconds (pinned
+      versions never change)
+
+Connectors that fail or time out at startup are loaded when first described.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from airbyte_agent_mcp.models import ConnectorConfig, ConnectorInfo, ConnectorType, DiscoverConnectorsResponse, ListEntitiesResponse
+
+if TYPE_CHECKING:
+    from airbyte_agent_mcp.connector_manager import ConnectorManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_LOAD_TIMEOUT = 30.0
+"""Seconds one connector may take to load while the catalog is built."""
+
+DEFAULT_REGISTRY_CHECK_INTERVAL = 300.0
+"""Seconds between checks for a newer version of an unpinned registry connector."""
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A connector's describe_connector response and what it was built from."""
+
+    connector_id: str
+    path: str
+    source: Any
+    """(mtime_ns, size) of a local definition, the pinned version or the resolved registry URL."""
+    response: dict[str, Any]
+    load_seconds: float
+    checked_at: float
+
+
+def file_signature(path: str) -> tuple[int, int]:
+    """(mtime_ns, size) of a file, which changes whenever the file is rewritten."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConnectorCatalog:
+    """describe_connector and discover_connectors responses, cached per connector.
+
+    Responses are shared between calls; don't modify them.
+
+    Args:
+        manager: Connector manager whose configuration and registry client to use
+        registry_check_interval: Seconds between version checks of unpinned
+            registry connectors
+    """
+
+    def __init__(self, manager: "ConnectorManager", registry_check_interval: float = DEFAULT_REGISTRY_CHECK_INTERVAL):
+        self.manager = manager
+        self.registry_check_interval = registry_check_interval
+        self._entries: dict[str, CatalogEntry] = {}
+        self._discover_response: dict[str, Any] | None = None
+
+    async def build(self, timeout: float = DEFAULT_CATALOG_LOAD_TIMEOUT) -> dict[str, float | None]:
+        """Load every local connector concurrently, each within timeout seconds.
+
+        Returns:
+            Load time in seconds per connector ID, None for connectors that failed
+        """
+        started = time.perf_counter()
+        connectors = [c for c in self.manager.config.connectors if c.type == ConnectorType.LOCAL]
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._load(c), timeout) for c in connectors),
+            return_exceptions=True,
+        )
+
+        load_times: dict[str, float | None] = {}
+        for connector_config, result in zip(connectors, results):
+            if isinstance(result, BaseException):
+                reason = f"timed out after {timeout}s" if isinstance(result, asyncio.TimeoutError) else str(result)
+                logger.warning(f"Catalog: could not load connector {connector_config.id}: {reason}")
+                load_times[connector_config.id] = None
+                continue
+            self._entries[connector_config.id] = result
+            load_times[connector_config.id] = result.load_seconds
+            logger.info(f"Catalog: loaded connector {connector_config.id} in {result.load_seconds * 1000:.0f}ms")
+
+        loaded = sum(seconds is not None for seconds in load_times.values())
+        logger.info(f"Catalog: {loaded} of {len(connectors)} connector(s) loaded in {time.perf_counter() - started:.2f}s")
+        return load_times
+
+    async def describe(self, connector_id: str) -> dict[str, Any]:
+        """describe_connector response for a connector, rebuilt first if it is stale."""
+        connector_config = self.manager.config.get_connector(connector_id)
+        if connector_config.type != ConnectorType.LOCAL:
+            entities = await self.manager.describe_connector(connector_id)
+            return ListEntitiesResponse(connector_id=connector_id, entities=entities).model_dump()
+
+        return (await self.entry(connector_id)).response
+
+    async def entry(self, connector_id: str) -> CatalogEntry:
+        """Catalog entry of a connector, loaded or rebuilt first if it is missing or stale."""
+        connector_config = self.manager.config.get_connector(connector_id)
+        entry = self._entries.get(connector_id)
+        if entry is None or await self._is_stale(connector_config, entry):
+            entry = await self._load(connector_config)
+            self._entries[connector_id] = entry
+            logger.info(f"Catalog: loaded connector {connector_id} in {entry.load_seconds * 1000:.0f}ms")
+        return entry
+
+    def discover(self) -> dict[str, Any]:
+        """discover_connectors response; the configuration doesn't change while serving."""
+        if self._discover_response is None:
+            connectors = [ConnectorInfo(id=c.id, type=c.type.value, description=c.description) for c in self.manager.config.connectors]
+            self._discover_response = DiscoverConnectorsResponse(connectors=connectors).model_dump()
+        return self._discover_response
+
+    def __contains__(self, connector_id: str) -> bool:
+        return connector_id in self._entries
+
+    async def _is_stale(self, connector_config: ConnectorConfig, entry: CatalogEntry) -> bool:
+        if connector_config.path:
+            try:
+                return file_signature(connector_config.path) != entry.source
+            except OSError:
+                # Let the reload report the missing file
+                return True
+
+        if connector_config.version or time.monotonic() - entry.checked_at < self.registry_check_interval:
+            return False
+        try:
+            url = await self.manager.registry_client.resolve_connector_url(connector_config.connector_name)
+        except Exception as e:
+            logger.warning(f"Catalog: could not check registry for {connector_config.id}, keeping the cached definition: {e}")
+            url = entry.source
+        if url != entry.source:
+            logger.info(f"Catalog: registry has a new version of {connector_config.id}: {url}")
+            return True
+        self._entries[connector_config.id] = replace(entry, checked_at=time.monotonic())
+        return False
+
+    async def _load(self, connector_config: ConnectorConfig) -> CatalogEntry:
+        started = time.perf_counter()
+        if connector_config.path:
+            path = connector_config.path
+            source: Any = file_signature(path)
+        elif connector_config.version:
+            # Pinned versions never change (and offline, may be served without registry.json)
+            source = connector_config.version
+            path = str(await self.manager.registry_client.download_connector(connector_config.connector_name, connector_config.version))
+        else:
+            registry_client = self.manager.registry_client
+            source = await registry_client.resolve_connector_url(connector_config.connector_name)
+            path = str(await registry_client.download_url(source))
+
+        # Parsing is CPU-bound; a thread keeps other connectors' downloads and the event loop going
+        entities = await asyncio.to_thread(self.manager.describe_definition, path)
+        response = ListEntitiesResponse(connector_id=connector_config.id, entities=entities).model_dump()
+        return CatalogEntry(connector_config.id, path, source, response, time.perf_counter() - started, time.monotonic())
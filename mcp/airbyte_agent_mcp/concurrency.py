@@ -0,0 +1,104 @@
+"""Admission control for tool calls.
+
+A long-lived HTTP server is shared by many agents, so a burst of slow upstream
+calls must not pile up unbounded. InFlightLimiter caps the number of tool calls
+running at once, lets a bounded number wait for a slot, and rejects the rest
+immediately with a "busy" error the client can retry, instead of letting every
+call time out.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 64
+"""Tool calls running at once."""
+
+DEFAULT_MAX_QUEUED = 256
+"""Tool calls waiting for a slot before new calls are rejected as busy."""
+
+
+class ServerBusyError(ToolError):
+    """Raised when a tool call is shed because the server is at capacity."""
+
+
+class InFlightLimiter:
+    """Cap concurrent tool calls, queue a bounded number, shed the rest.
+
+    Args:
+        max_in_flight: Tool calls allowed to run at once
+        max_queued: Tool calls allowed to wait for a slot; 0 sheds as soon as all
+            slots are busy
+        queue_timeout: Seconds a call may wait for a slot before it is shed
+            (None waits as long as it takes)
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        queue_timeout: float | None = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        if max_queued < 0:
+            raise ValueError(f"max_queued must not be negative, got {max_queued}")
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.shed = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every slot is busy and the queue is full, so new calls are shed."""
+        return self._slots.locked() and self.queued >= self.max_queued
+
+    def _busy(self, reason: str) -> ServerBusyError:
+        self.shed += 1
+        logger.warning(f"Shedding tool call: {reason} ({self.in_flight} in flight, {self.queued} queued)")
+        return ServerBusyError(f"Server busy: {reason}. Retry shortly.")
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one in-flight slot for the duration of the block.
+
+        Raises:
+            ServerBusyError: If the queue is full, or the wait exceeds queue_timeout
+        """
+        if self.saturated:
+            raise self._busy(f"{self.max_in_flight} tool calls in flight and {self.max_queued} queued")
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            raise self._busy(f"no slot free after {self.queue_timeout}s") from None
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """FastMCP middleware running every tool call through an InFlightLimiter."""
+
+    def __init__(self, limiter: InFlightLimiter):
+        self.limiter = limiter
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext):
+        async with self.limiter.slot():
+            return await call_next(context)
@@ -1,20 +1,60 @@
 """Connector instantiation and execution management."""
 
+import asyncio
 import base64
+import contextlib
 import inspect
 import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
 from ._vendored.connector_sdk import LocalExecutor as ConnectorExecutor
 from ._vendored.connector_sdk.config_loader import load_connector_config
 from ._vendored.connector_sdk.executor.models import ExecutionConfig
 
-from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorInfo, ConnectorType, DiscoverConnectorsResponse
+from airbyte_agent_mcp.catalog import ConnectorCatalog, file_signature
+from airbyte_agent_mcp.models import (
+    BatchItem,
+    Config,
+    ConnectorConfig,
+    ConnectorInfo,
+    ConnectorType,
+    DiscoverConnectorsResponse,
+    ErrorType,
+    ExecuteResponse,
+)
 from airbyte_agent_mcp.registry_client import RegistryClient
 from airbyte_agent_mcp.secret_manager import SecretsManager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_CONCURRENCY = 4
+"""Operations of one execute_batch call running at once against the same connector."""
+
+MAX_BATCH_ITEMS = 100
+
+DEFAULT_PAGINATE_MAX_RECORDS = 500
+DEFAULT_PAGINATE_MAX_BYTES = 200_000
+"""Default byte budget of one paginate call, roughly 50k tokens of JSON."""
+DEFAULT_PAGINATE_MAX_SECONDS = 30.0
+
+DEFAULT_WARMUP_TIMEOUT = 30.0
+"""Seconds one connector may take to warm up at startup."""
+
+
+@dataclass
+class _CachedExecutor:
+    source: Any
+    """What the executor was built from: definition file signature or registry URL."""
+    secrets: dict[str, Any]
+    executor: Any
+    in_use: int = 0
+    """Calls currently using the executor."""
+    retired: bool = False
+    """Replaced by a newer executor; closed once in_use drops to 0."""
+
 
 class ConnectorManager:
     """Manages connector lifecycle and execution."""
@@ -35,6 +75,10 @@ class ConnectorManager:
         self.config = config
         self.secrets_manager = secrets_manager
         self.registry_client = registry_client or RegistryClient()
+        self.catalog = ConnectorCatalog(self)
+        self._executors: dict[str, _CachedExecutor] = {}
+        # Replaced executors that calls are still using; each is closed when its last call ends
+        self._retired: list[_CachedExecutor] = []
 
     async def _get_connector_path(self, connector_config: ConnectorConfig) -> str:
         """Get path to connector.yaml (local file or downloaded from registry).
@@ -62,19 +106,32 @@ class ConnectorManager:
         entity: str,
         action: str,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        expand: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+        limit: int | None = None,
+        fields: list[str] | None = None,
+        exclude: list[str] | None = None,
+        with_meta: bool = False,
+    ) -> Any:
         """Execute an operation on a connector.
 
-        This is stateless - creates a fresh connector instance for each call.
+        The connector's executor is reused across calls (see _use_connector).
 
         Args:
             connector_id: Connector ID from config
             entity: Entity name (e.g., "customers")
             action: Operation action (e.g., "list", "get", "create")
             params: Operation parameters (optional)
+            expand: Relationship names whose related records are attached (optional)
+            where: List/search filter, pushed down to the API where supported (optional)
+            limit: Maximum number of list/search records to return (optional)
+            fields: Dotted paths to keep in each returned record (optional)
+            exclude: Dotted paths to drop from each returned record (optional)
+            with_meta: Also return the execution metadata (e.g. has_more and
+                next_cursor of a where/limit read)
 
         Returns:
-            Result from connector execution
+            Result from connector execution, or (result, metadata) with with_meta
 
         Raises:
             ValueError: If connector not found
@@ -84,30 +141,264 @@ class ConnectorManager:
 
         logger.info(f"Executing: {connector_id}.{entity}.{action} with params: {list(params.keys())}")
 
+        async with self._use_connector(connector_id) as connector:
+            logger.debug(f"Calling connector.execute({entity}, {action}, ...)")
+            result = await connector.execute(
+                ExecutionConfig(entity=entity, action=action, params=params, expand=expand, where=where, limit=limit, fields=fields, exclude=exclude)
+            )
+
+            # Handle ExecutionResult from SDK
+            if not result.success:
+                raise Exception(result.error or "Execution failed")
+
+            # Handle download operations (data is AsyncIterator[bytes]), still streaming from the executor
+            if inspect.isasyncgen(result.data):
+                download = await self._handle_download(result.data)
+                return (download, None) if with_meta else download
+
+        logger.info("Execution successful")
+        return (result.data, result.meta) if with_meta else result.data
+
+    async def paginate(
+        self,
+        connector_id: str,
+        entity: str,
+        action: str = "list",
+        params: dict[str, Any] | None = None,
+        max_records: int | None = DEFAULT_PAGINATE_MAX_RECORDS,
+        max_bytes: int | None = DEFAULT_PAGINATE_MAX_BYTES,
+        max_seconds: float | None = DEFAULT_PAGINATE_MAX_SECONDS,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Read pages of a list/search result server-side within record, byte and time budgets.
+
+        Args:
+            connector_id: Connector ID from config
+            entity: Entity name
+            action: list or search
+            params: Operation parameters for the first page (ignored with cursor)
+            max_records: Record budget
+            max_bytes: Byte budget (records as compact JSON)
+            max_seconds: Time budget, checked between pages
+            cursor: next_cursor from a previous call, to continue from there
+            fields: Dotted paths to keep in each record
+            exclude: Dotted paths to drop from each record
+
+        Returns:
+            Dict with records, next_cursor, has_more, pages, bytes and stopped_by
+
+        Raises:
+            ValueError: If connector not found
+            Exception: Any error from connector execution
+        """
+        logger.info(f"Paginating: {connector_id}.{entity}.{action}" + (" (resumed)" if cursor else ""))
+
+        async with self._use_connector(connector_id) as connector:
+            result = await connector.paginate(
+                entity,
+                action,
+                params=params,
+                max_records=max_records,
+                max_bytes=max_bytes,
+                max_seconds=max_seconds,
+                cursor=cursor,
+                fields=fields,
+                exclude=exclude,
+            )
+
+        logger.info(f"Paginated {len(result.records)} record(s) over {result.pages} page(s), stopped by {result.stopped_by}")
+        return {
+            "records": result.records,
+            "next_cursor": result.next_cursor,
+            "has_more": result.has_more,
+            "pages": result.pages,
+            "bytes": result.bytes,
+            "stopped_by": result.stopped_by,
+        }
+
+    async def execute_batch(
+        self,
+        items: list[BatchItem],
+        max_concurrency_per_connector: int = DEFAULT_BATCH_CONCURRENCY,
+        timeout: float | None = None,
+    ) -> tuple[list[ExecuteResponse], bool]:
+        """Execute many operations concurrently, possibly across connectors.
+
+        Operations on the same connector are capped at max_concurrency_per_connector
+        at a time; different connectors run independently. A failing operation
+        does not affect the others.
+
+        Args:
+            items: Operations to execute
+            max_concurrency_per_connector: Operations running at once per connector
+            timeout: Seconds to wait for the whole batch (None: no limit). Operations
+                still running then are cancelled and reported as timed out.
+
+        Returns:
+            (one ExecuteResponse per item in request order, whether the timeout hit)
+
+        Raises:
+            ValueError: If there are more than MAX_BATCH_ITEMS items or the cap is below 1
+        """
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ValueError(f"A batch may hold at most {MAX_BATCH_ITEMS} items, got {len(items)}")
+        if max_concurrency_per_connector < 1:
+            raise ValueError(f"max_concurrency_per_connector must be at least 1, got {max_concurrency_per_connector}")
+
+        logger.info(f"Executing batch of {len(items)} operation(s)")
+
+        semaphores = {item.connector_id: asyncio.Semaphore(max_concurrency_per_connector) for item in items}
+
+        async def run(item: BatchItem) -> Any:
+            async with semaphores[item.connector_id]:
+                return await self.execute(
+                    connector_id=item.connector_id,
+                    entity=item.entity,
+                    action=item.action,
+                    params=item.params,
+                    expand=item.expand,
+                    where=item.where,
+                    limit=item.limit,
+                    fields=item.fields,
+                    exclude=item.exclude,
+                )
+
+        tasks = [asyncio.create_task(run(item)) for item in items]
+        pending: set[asyncio.Task] = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for item, task in zip(items, tasks):
+            response = ExecuteResponse(success=False, connector_id=item.connector_id, entity=item.entity, action=item.action)
+            if task in pending:
+                response.error = {"type": ErrorType.TIMEOUT.value, "message": f"Not finished within the batch timeout of {timeout}s"}
+            elif task.exception() is not None:
+                error = task.exception()
+                logger.error(f"Batch item {item.connector_id}.{item.entity}.{item.action} failed: {error}")
+                response.error = {"type": ErrorType.UNKNOWN.value, "message": str(error)}
+            else:
+                response.success = True
+                response.data = task.result()
+            results.append(response)
+
+        if pending:
+            logger.warning(f"Batch timeout after {timeout}s: {len(pending)} of {len(items)} operation(s) cancelled")
+        return results, bool(pending)
+
+    async def warm_up(self, connect: bool = False, timeout: float = DEFAULT_WARMUP_TIMEOUT) -> dict[str, str | None]:
+        """Create every local connector's executor ahead of the first call.
+
+        Connectors warm up concurrently, each within timeout seconds: registry
+        connectors are resolved and downloaded, definitions parsed and compiled,
+        and executors created. With connect=True each executor also opens a
+        keep-alive connection to its API. A connector that fails is logged and
+        left to load on first use; the others are unaffected.
+
+        Returns:
+            Error message per connector ID, None for connectors that warmed up
+        """
+        started = time.perf_counter()
+        connectors = [c for c in self.config.connectors if c.type == ConnectorType.LOCAL]
+
+        async def warm(connector_id: str) -> float:
+            connector_started = time.perf_counter()
+            async with self._use_connector(connector_id) as executor:
+                if connect and not await executor.warm_up():
+                    logger.info(f"Warm-up: {connector_id} has a templated base URL; not connecting ahead")
+            return time.perf_counter() - connector_started
+
+        results = await asyncio.gather(*(asyncio.wait_for(warm(c.id), timeout) for c in connectors), return_exceptions=True)
+
+        errors: dict[str, str | None] = {}
+        for connector_config, result in zip(connectors, results):
+            if isinstance(result, BaseException):
+                errors[connector_config.id] = f"timed out after {timeout}s" if isinstance(result, asyncio.TimeoutError) else str(result)
+                logger.warning(f"Warm-up: connector {connector_config.id} failed: {errors[connector_config.id]}")
+            else:
+                errors[connector_config.id] = None
+                logger.info(f"Warm-up: connector {connector_config.id} ready in {result * 1000:.0f}ms")
+
+        warmed = sum(error is None for error in errors.values())
+        logger.info(f"Warm-up: {warmed} of {len(connectors)} connector(s) ready in {time.perf_counter() - started:.2f}s")
+        return errors
+
+    async def aclose(self) -> None:
+        """Close every executor this manager created, with their connections."""
+        executors = list(self._executors.values()) + self._retired
+        self._executors, self._retired = {}, []
+        for cached in executors:
+            await self._close_executor(cached)
+
+    @staticmethod
+    async def _close_executor(cached: _CachedExecutor) -> None:
+        try:
+            await cached.executor.close()
+        except Exception as e:
+            logger.warning(f"Failed to close executor: {e}")
+
+    @contextlib.asynccontextmanager
+    async def _use_connector(self, connector_id: str) -> AsyncIterator[Any]:
+        """Lease the executor of a connector for the duration of one call.
+
+        An executor replaced while calls still use it is closed when the last
+        of them ends, so its connection pool is released without cutting off
+        requests in flight.
+        """
+        cached = await self._connector_for(connector_id)
+        cached.in_use += 1
+        try:
+            yield cached.executor
+        finally:
+            cached.in_use -= 1
+            if cached.retired and cached.in_use == 0 and cached in self._retired:
+                self._retired.remove(cached)
+                await self._close_executor(cached)
+
+    async def _connector_for(self, connector_id: str) -> _CachedExecutor:
+        """Cached executor for a configured connector, with its secrets resolved.
+
+        Executors are reused across calls, so their parsed definitions and
+        connection pools stay warm. One is replaced when its definition file
+        changes, the registry resolves a new version, or its secrets change.
+        Use it through _use_connector().
+        """
         connector_config = self.config.get_connector(connector_id)
 
         secrets = {}
         if connector_config.secrets:
             secrets = self.secrets_manager.get_secrets(connector_config.secrets)
 
-        # Get path (local or from registry)
-        path = await self._get_connector_path(connector_config)
-        logger.info(f"Using connector path: {path}")
-        connector = self._create_yaml_connector(path, secrets)
-
-        logger.debug(f"Calling connector.execute({entity}, {action}, ...)")
-        result = await connector.execute(ExecutionConfig(entity=entity, action=action, params=params))
-
-        # Handle ExecutionResult from SDK
-        if not result.success:
-            raise Exception(result.error or "Execution failed")
-
-        # Handle download operations (data is AsyncIterator[bytes])
-        if inspect.isasyncgen(result.data):
-            return await self._handle_download(result.data)
+        if connector_config.path:
+            path = connector_config.path
+            try:
+                source: Any = file_signature(path)
+            except OSError:
+                # Let the executor report the missing file
+                source = None
+        else:
+            # The catalog resolves and downloads registry connectors once, then rechecks periodically
+            entry = await self.catalog.entry(connector_id)
+            path, source = entry.path, entry.source
+
+        cached = self._executors.get(connector_id)
+        if cached is not None and cached.source == source and cached.secrets == secrets:
+            return cached
 
-        logger.info("Execution successful")
-        return result.data
+        logger.info(f"Using connector path: {path}")
+        replacement = self._executors[connector_id] = _CachedExecutor(source, secrets, self._create_yaml_connector(path, secrets))
+        if cached is not None:
+            cached.retired = True
+            if cached.in_use:
+                self._retired.append(cached)
+            else:
+                await self._close_executor(cached)
+        return replacement
 
     def _create_yaml_connector(self, path: str, secrets: dict[str, Any]) -> Any:
         """Create a YAML-based connector instance.
@@ -157,6 +448,18 @@ class ConnectorManager:
             "encoding": "base64",
         }
 
+    def entity_schema(self, connector_id: str, entity: str) -> dict[str, Any] | None:
+        """JSON schema of an entity's records, if the connector has a local definition.
+
+        Registry connectors return None rather than downloading their definition again.
+        """
+        connector_config = self.config.get_connector(connector_id)
+        if not connector_config.path:
+            return None
+        definition = load_connector_config(connector_config.path)
+        entity_def = next((e for e in definition.entities if e.name == entity), None)
+        return entity_def.entity_schema if entity_def else None
+
     async def describe_connector(self, connector_id: str) -> list[dict[str, Any]]:
         """List available entities for a connector.
 
@@ -182,7 +485,17 @@ class ConnectorManager:
         Returns:
             List of entity info dicts
         """
+        return self.describe_definition(path)
+
+    def describe_definition(self, path: str) -> list[dict[str, Any]]:
+        """List entities from a YAML connector definition, synchronously.
 
+        Args:
+            path: Path to connector.yaml (OpenAPI spec)
+
+        Returns:
+            List of entity info dicts
+        """
         # Load and parse the connector config using SDK
         connector_config = load_connector_config(path)
 
@@ -193,6 +506,8 @@ class ConnectorManager:
         for entity_def in connector_config.entities:
             description = ""
             parameters: dict[str, list[dict[str, Any]]] = {}
+            relationships: dict[str, list[str]] = {}
+            filters: dict[str, dict[str, list[str]]] = {}
 
             # Extract parameters for each action from endpoints
             if entity_def.endpoints:
@@ -253,6 +568,12 @@ class ConnectorManager:
                     if action_params:
                         parameters[action.value] = action_params
 
+                    if endpoint.relationships:
+                        relationships[action.value] = list(endpoint.relationships)
+
+                    if endpoint.filters:
+                        filters[action.value] = {field: list(config.operators) for field, config in endpoint.filters.fields.items()}
+
             # Convert Action enums to strings
             available_actions = [action.value for action in entity_def.actions]
 
@@ -262,6 +583,8 @@ class ConnectorManager:
                     "description": description,
                     "available_actions": available_actions,
                     "parameters": parameters,
+                    "relationships": relationships,
+                    "filters": filters,
                 }
             )
 
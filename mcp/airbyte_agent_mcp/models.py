@@ -69,6 +69,34 @@ class ExecuteResponse(BaseModel):
     connector_id: str
     entity: str
     action: str
+    truncated: bool = Field(default=False, description="Whether records were left out to stay under max_response_bytes")
+    next_cursor: str | None = Field(None, description="paginate(cursor=...) continues the listing after the last returned record")
+    result_handle: str | None = Field(None, description="fetch_result(handle=...) reads the rest of a truncated result")
+    total_records: int | None = Field(None, description="Records in the full result, when it was truncated")
+    has_more: bool = Field(default=False, description="Whether a where/limit read stopped at its limit with more matches possibly left")
+
+
+class BatchItem(BaseModel):
+    """One operation of an execute_batch call."""
+
+    connector_id: str = Field(..., description="Connector identifier from configured_connectors.yaml")
+    entity: str = Field(..., description="Entity name")
+    action: str = Field(..., description="Operation action")
+    params: dict[str, Any] | None = Field(None, description="Operation parameters")
+    expand: list[str] | None = Field(None, description="Relationship names to attach related records for")
+    where: dict[str, Any] | None = Field(None, description="List/search filter")
+    limit: int | None = Field(None, description="Maximum number of list/search records")
+    fields: list[str] | None = Field(None, description="Dotted paths to keep in each record")
+    exclude: list[str] | None = Field(None, description="Dotted paths to drop from each record")
+
+
+class ExecuteBatchResponse(BaseModel):
+    """Response from execute_batch tool."""
+
+    results: list[ExecuteResponse] = Field(..., description="One result per item, in request order")
+    succeeded: int
+    failed: int
+    timed_out: bool = Field(default=False, description="Whether the batch timeout cut off unfinished items")
 
 
 class ParameterInfo(BaseModel):
@@ -91,6 +119,14 @@ class EntityInfo(BaseModel):
         default_factory=dict,
         description="Parameters for each action, keyed by action name. Each parameter has: name, in (path/query/body), required, type, description",
     )
+    relationships: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="Relationship names accepted by execute(expand=...), keyed by action name",
+    )
+    filters: dict[str, dict[str, list[str]]] = Field(
+        default_factory=dict,
+        description="Fields and operators execute(where=...) filters on server-side, keyed by action name",
+    )
 
 
 class ListEntitiesResponse(BaseModel):
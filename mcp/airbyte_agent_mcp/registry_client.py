@@ -1,42 +1,150 @@
 """Client for fetching connectors from the Airbyte registry."""
 
-import atexit
+import asyncio
+import hashlib
+import json
 import logging
-import shutil
-import tempfile
+import os
+import time
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 
+from airbyte_agent_mcp.catalog import file_signature
+
 logger = logging.getLogger(__name__)
 
 REGISTRY_BASE_URL = "https://connectors.airbyte.ai"
 REGISTRY_JSON_URL = f"{REGISTRY_BASE_URL}/registry.json"
 
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "airbyte-agent-mcp" / "registry"
+DEFAULT_REGISTRY_TTL = 300.0
+"""Seconds registry.json is used without revalidating it."""
 
-class RegistryClient:
-    """Client for the Airbyte connector registry.
 
-    Downloads connectors fresh from registry on each use (no caching).
-    Uses temp directory for downloaded connector.yaml files.
-    """
+class RegistryUnavailableError(RuntimeError):
+    """Raised when offline, or the registry is unreachable, and the cache can't answer."""
+
 
-    def __init__(self):
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="airbyte-connectors-"))
-        atexit.register(self._cleanup)
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Several server processes may share the cache; readers never see partial files
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
-    def _cleanup(self):
-        """Clean up temp directory on exit."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+class RegistryClient:
+    """Client for the Airbyte connector registry, with a persistent on-disk cache.
+
+    registry.json is kept in cache_dir and reused for ttl_seconds, then
+    revalidated with If-None-Match, so an unchanged registry costs a 304.
+    When the registry can't be reached, the cached copy is used however old.
+
+    Connector definitions are immutable per version, so each is downloaded
+    once into cache_dir/definitions/<name>/<version>/connector.yaml, next to
+    the SHA-256 of its content. A file whose content no longer matches is
+    downloaded again.
+
+    In offline mode the client never touches the network: pinned versions are
+    served straight from the cache, and latest versions are resolved from
+    the cached registry.json.
+
+    Args:
+        cache_dir: Cache directory (default: ~/.cache/airbyte-agent-mcp/registry)
+        ttl_seconds: Seconds registry.json is used without revalidating it
+        offline: Serve from the cache only
+        base_url: Registry URL
+        timeout: HTTP timeout in seconds
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl_seconds: float = DEFAULT_REGISTRY_TTL,
+        offline: bool = False,
+        base_url: str = REGISTRY_BASE_URL,
+        timeout: float = 30.0,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        self.offline = offline
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._registry: dict[str, Any] | None = None
+        self._registry_signature: tuple[int, int] | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def registry_url(self) -> str:
+        """URL of the registry.json index."""
+        return f"{self.base_url}/registry.json"
+
+    def _http(self) -> httpx.AsyncClient:
+        """Shared pooled client of the running event loop.
+
+        Pooled connections belong to the loop that opened them, so a client
+        made on another loop (a startup phase, or the parent of a forked
+        worker) is replaced rather than reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = self._client_loop = None
 
     async def fetch_registry(self) -> dict[str, Any]:
-        """Fetch the registry.json index (always fresh)."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(REGISTRY_JSON_URL)
-            response.raise_for_status()
-            return response.json()
+        """Return the registry.json index, revalidating the cached copy once it is older than the TTL."""
+        registry_path = self.cache_dir / "registry.json"
+        meta_path = self.cache_dir / "registry.meta.json"
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+
+        if self.offline or time.time() - meta.get("checked_at", 0) < self.ttl_seconds:
+            if registry_path.exists():
+                return self._load_cached(registry_path)
+            if self.offline:
+                raise RegistryUnavailableError(f"Offline and registry.json is not cached in {self.cache_dir}")
+
+        headers = {"If-None-Match": meta["etag"]} if meta.get("etag") and registry_path.exists() else {}
+        try:
+            response = await self._http().get(self.registry_url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            if not registry_path.exists():
+                raise RegistryUnavailableError(f"Registry unreachable and registry.json is not cached: {e}") from e
+            logger.warning(f"Registry unreachable, using cached registry.json: {e}")
+            return self._load_cached(registry_path)
+
+        etag = response.headers.get("etag")
+        if response.status_code == 304:
+            logger.debug("registry.json not modified")
+            registry = self._load_cached(registry_path)
+        else:
+            logger.info("Downloaded registry.json")
+            _write_atomic(registry_path, response.content)
+            registry = self._load_cached(registry_path)
+        _write_atomic(meta_path, json.dumps({"etag": etag or meta.get("etag"), "checked_at": time.time()}).encode())
+        return registry
+
+    def _load_cached(self, registry_path: Path) -> dict[str, Any]:
+        # Parse the file again only when it was replaced, by this or another process
+        signature = file_signature(registry_path)
+        if self._registry is None or signature != self._registry_signature:
+            self._registry, self._registry_signature = json.loads(registry_path.read_bytes()), signature
+        return self._registry
 
     async def resolve_connector_url(
         self,
@@ -78,26 +186,47 @@ class RegistryClient:
         connector_name: str,
         version: str | None = None,
     ) -> Path:
-        """Download connector.yaml and return path (cached within session)."""
-        url = await self.resolve_connector_url(connector_name, version)
-
-        # Create temp path based on URL
-        parts = url.replace(f"{REGISTRY_BASE_URL}/definitions/", "").split("/")
-        name, ver = parts[0], parts[1]
-        temp_path = self.temp_dir / name / ver / "connector.yaml"
+        """Return the path of a connector's connector.yaml, downloading it if it isn't cached."""
+        if self.offline and version:
+            # Pinned versions never change, so the cached file needs no registry lookup
+            path = self._definition_path(connector_name, version)
+            if self._verified(path):
+                return path
+            raise RegistryUnavailableError(f"Offline and {connector_name} {version} is not cached in {self.cache_dir}")
 
-        # Return cached version if already downloaded
-        if temp_path.exists():
-            logger.debug(f"Using cached connector: {temp_path}")
-            return temp_path
+        url = await self.resolve_connector_url(connector_name, version)
+        return await self.download_url(url)
+
+    async def download_url(self, url: str) -> Path:
+        """Return the path of the connector.yaml at a resolved registry URL, downloading it if it isn't cached."""
+        # Registry URLs end in /<name>/<version>/connector.yaml
+        name, version = urlsplit(url).path.split("/")[-3:-1]
+        path = self._definition_path(name, version)
+        if self._verified(path):
+            logger.debug(f"Using cached connector: {path}")
+            return path
+        if self.offline:
+            raise RegistryUnavailableError(f"Offline and {name} {version} is not cached in {self.cache_dir}")
 
-        # Download fresh
         logger.info(f"Downloading connector from: {url}")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            temp_path.parent.mkdir(parents=True, exist_ok=True)
-            temp_path.write_text(response.text)
-
-        return temp_path
+        response = await self._http().get(url)
+        response.raise_for_status()
+
+        _write_atomic(path, response.content)
+        _write_atomic(path.with_name(f"{path.name}.sha256"), hashlib.sha256(response.content).hexdigest().encode())
+        return path
+
+    def _definition_path(self, connector_name: str, version: str) -> Path:
+        return self.cache_dir / "definitions" / connector_name / version / "connector.yaml"
+
+    def _verified(self, path: Path) -> bool:
+        """Whether a cached definition exists and matches the hash recorded when it was downloaded."""
+        try:
+            expected = path.with_name(f"{path.name}.sha256").read_text().strip()
+            actual = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return False
+        if actual != expected:
+            logger.warning(f"Cached connector {path} does not match its recorded hash; downloading it again")
+            return False
+        return True
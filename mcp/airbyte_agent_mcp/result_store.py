@@ -0,0 +1,248 @@
+"""Server-side buffers for results too large to return in one tool call.
+
+When an execute result exceeds the response budget, the server keeps the full
+record list in a ResultStore and returns the first slice plus a handle; the
+fetch_result tool reads further slices by offset without calling the API
+again.
+
+The store is bounded on every axis:
+    - each client session keeps at most max_per_session results; storing
+      another evicts that session's least recently used one, so one busy
+      client never evicts another client's results
+    - results expire ttl_seconds after they were last read
+    - results are held in memory up to max_memory_bytes across all sessions;
+      beyond that the least recently used ones are spilled to JSON-lines files
+      on disk, up to max_disk_bytes, after which the least recently used
+      results are dropped
+
+A result is kept as its compact JSON-lines encoding, in memory or on disk, and
+records are decoded only when a slice is read. The limits therefore bound the
+bytes actually held, not an estimate of Python object sizes. Spill writes and
+reads of spilled slices run in a worker thread, off the event loop.
+
+Handles are random, unguessable tokens: whoever holds one may read the result.
+Sessions only scope eviction, since some transports can't identify a client
+session reliably across calls.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import shutil
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+DEFAULT_RESULT_TTL_SECONDS = 900.0
+DEFAULT_MAX_RESULTS_PER_SESSION = 16
+
+
+class ResultNotFoundError(KeyError):
+    """Raised for unknown, expired or evicted result handles."""
+
+    def __str__(self) -> str:
+        return f"Result {self.args[0]} not found: it expired or was evicted. Run the query again."
+
+
+@dataclass
+class _Entry:
+    session_id: str
+    total: int
+    size: int
+    expires_at: float
+    data: bytes | None = None
+    """JSON-lines encoding of the records while held in memory."""
+    path: Path | None = None
+    """Spill file; set once the result counts against the disk limit."""
+    offsets: array = field(default_factory=lambda: array("Q"))
+    """Byte offset of each record's line, followed by the total size."""
+
+
+def _dumps(record: Any) -> bytes:
+    return json.dumps(record, separators=(",", ":"), default=str).encode()
+
+
+def _decode(lines: bytes) -> list[Any]:
+    return [json.loads(line) for line in lines.splitlines()]
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _read_slice(path: Path, start: int, end: int) -> list[Any]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return _decode(f.read(end - start))
+
+
+class ResultStore:
+    """Bounded, TTL-evicted store of record lists, addressed by handle.
+
+    Args:
+        max_memory_bytes: Bytes of records held in memory across all sessions
+        max_disk_bytes: Bytes of spilled records on disk across all sessions
+        ttl_seconds: Seconds a result lives after it was last read
+        max_per_session: Results one client session keeps at once
+        spill_dir: Directory for spill files (default: a private temp directory)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        ttl_seconds: float = DEFAULT_RESULT_TTL_SECONDS,
+        max_per_session: int = DEFAULT_MAX_RESULTS_PER_SESSION,
+        spill_dir: str | Path | None = None,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_per_session = max_per_session
+        self._spill_dir = Path(spill_dir) if spill_dir else None
+        self._owns_spill_dir = spill_dir is None
+        # Least recently used first
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+
+    async def put(self, session_id: str, records: list[Any]) -> str:
+        """Store a result for a session and return its handle.
+
+        Raises:
+            ValueError: If the result alone exceeds both the memory and the disk limit
+        """
+        offsets = array("Q", [0])
+        lines = []
+        for record in records:
+            lines.append(_dumps(record) + b"\n")
+            offsets.append(offsets[-1] + len(lines[-1]))
+        size = offsets[-1]
+        if size > max(self.max_memory_bytes, self.max_disk_bytes):
+            raise ValueError(f"Result of {size} bytes exceeds the result store limits")
+
+        self._expire()
+        session_handles = [handle for handle, entry in self._entries.items() if entry.session_id == session_id]
+        for handle in session_handles[: max(0, len(session_handles) - self.max_per_session + 1)]:
+            self._drop(handle)
+
+        handle = f"res_{secrets.token_urlsafe(12)}"
+        self._entries[handle] = _Entry(session_id, len(records), size, time.monotonic() + self.ttl_seconds, data=b"".join(lines), offsets=offsets)
+        self.memory_bytes += size
+        await self._enforce_limits()
+        logger.info(f"Stored result {handle} ({len(records)} records, {size} bytes) for session {session_id}")
+        return handle
+
+    async def get(self, handle: str, offset: int = 0, limit: int | None = None) -> tuple[list[Any], int]:
+        """Read records [offset, offset + limit) of a stored result.
+
+        Returns:
+            (records, total number of records in the result)
+
+        Raises:
+            ValueError: If offset is negative
+            ResultNotFoundError: If the handle is unknown, expired or evicted
+        """
+        if offset < 0:
+            raise ValueError(f"offset must be 0 or greater, got {offset}")
+        self._expire()
+        entry = self._entries.get(handle)
+        if entry is None:
+            raise ResultNotFoundError(handle)
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        self._entries.move_to_end(handle)
+
+        end = entry.total if limit is None else min(entry.total, offset + limit)
+        if offset >= end:
+            return [], entry.total
+        start, stop = entry.offsets[offset], entry.offsets[end]
+        if entry.data is not None:
+            return _decode(entry.data[start:stop]), entry.total
+        try:
+            return await asyncio.to_thread(_read_slice, entry.path, start, stop), entry.total
+        except OSError:
+            # Dropped while it was being read
+            raise ResultNotFoundError(handle) from None
+
+    def drop_session(self, session_id: str) -> None:
+        """Drop every result of a session."""
+        for handle in [h for h, entry in self._entries.items() if entry.session_id == session_id]:
+            self._drop(handle)
+
+    def close(self) -> None:
+        """Drop every result and remove spill files."""
+        for handle in list(self._entries):
+            self._drop(handle)
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for handle in [h for h, entry in self._entries.items() if entry.expires_at <= now]:
+            self._drop(handle)
+
+    async def _enforce_limits(self) -> None:
+        # Pick and account for the spills before writing them, so concurrent puts never spill a result twice
+        spills = []
+        for handle, entry in list(self._entries.items()):
+            if self.memory_bytes <= self.max_memory_bytes:
+                break
+            if entry.path is None:
+                if self._spill_dir is None:
+                    self._spill_dir = Path(tempfile.mkdtemp(prefix="airbyte-mcp-results-"))
+                entry.path = self._spill_dir / f"{handle}.jsonl"
+                self.memory_bytes -= entry.size
+                self.disk_bytes += entry.size
+                spills.append((handle, entry))
+        for handle in list(self._entries):
+            if self.disk_bytes <= self.max_disk_bytes:
+                break
+            if self._entries[handle].path is not None:
+                logger.warning(f"Result store over its disk limit; dropping {handle}")
+                self._drop(handle)
+
+        for handle, entry in spills:
+            if self._entries.get(handle) is entry:
+                await self._spill(handle, entry)
+
+    async def _spill(self, handle: str, entry: _Entry) -> None:
+        # Reads are served from memory until the file is complete
+        await asyncio.to_thread(_write_file, entry.path, entry.data)
+        if self._entries.get(handle) is not entry:
+            # Dropped while it was being written
+            self._unlink(entry.path)
+            return
+        entry.data = None
+        logger.info(f"Spilled result {handle} ({entry.size} bytes) to disk")
+
+    def _drop(self, handle: str) -> None:
+        entry = self._entries.pop(handle, None)
+        if entry is None:
+            return
+        if entry.path is None:
+            self.memory_bytes -= entry.size
+        else:
+            self.disk_bytes -= entry.size
+            self._unlink(entry.path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -1,27 +1,104 @@
 """FastMCP server with connector tools."""
 
+import importlib.util
 import logging
-from typing import Any
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Literal
 
-from fastmcp import FastMCP
+import anyio
+from fastmcp import Context, FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
+from ._vendored.connector_sdk.executor.pagination import encode_cursor
+
+from airbyte_agent_mcp.catalog import DEFAULT_CATALOG_LOAD_TIMEOUT
+from airbyte_agent_mcp.concurrency import DEFAULT_MAX_IN_FLIGHT, DEFAULT_MAX_QUEUED, ConcurrencyLimitMiddleware, InFlightLimiter
 from airbyte_agent_mcp.config import load_connector_config, validate_connectors
-from airbyte_agent_mcp.connector_manager import ConnectorManager
-from airbyte_agent_mcp.models import ExecuteResponse, ListEntitiesResponse
+from airbyte_agent_mcp.connector_manager import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_PAGINATE_MAX_BYTES,
+    DEFAULT_PAGINATE_MAX_RECORDS,
+    DEFAULT_PAGINATE_MAX_SECONDS,
+    ConnectorManager,
+)
+from airbyte_agent_mcp.models import BatchItem, ExecuteBatchResponse, ExecuteResponse
+from airbyte_agent_mcp.registry_client import DEFAULT_REGISTRY_TTL, RegistryClient
+from airbyte_agent_mcp.result_store import DEFAULT_MAX_MEMORY_BYTES, ResultStore
 from airbyte_agent_mcp.secret_manager import DotEnvSecretsBackend, SecretsManager
+from airbyte_agent_mcp.shaping import DEFAULT_MAX_RESPONSE_BYTES, cap_records, compact
+from airbyte_agent_mcp.tabular import DEFAULT_FLATTEN_DEPTH, ResultFormat, tabulate
+from airbyte_agent_mcp.workers import DEFAULT_GRACEFUL_TIMEOUT, WorkerSupervisor
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm connectors up before serving; release results and connections when the server stops.
+
+    The lifespan runs in every worker process, on the loop that serves, so
+    pre-opened connections belong to the worker that uses them.
+    """
+    manager = getattr(server, "connector_manager", None)
+    if server.warmup and isinstance(manager, ConnectorManager):
+        await manager.warm_up(connect=server.warmup_connect)
+    try:
+        yield
+    finally:
+        if server.result_store is not None:
+            server.result_store.close()
+        if isinstance(manager, ConnectorManager):
+            await manager.aclose()
+            if isinstance(manager.registry_client, RegistryClient):
+                await manager.registry_client.aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("airbyte-agent-mcp")
+mcp = FastMCP("airbyte-agent-mcp", lifespan=lifespan)
+mcp.limiter = None
+mcp.draining = False
+mcp.result_store = ResultStore()
+mcp.warmup = False
+mcp.warmup_connect = False
+
+
+def _session_key(ctx: Context | None) -> str:
+    """Client session a tool call belongs to, for scoping buffered results."""
+    try:
+        return ctx.session_id if ctx is not None else "default"
+    except RuntimeError:
+        return "default"
 
 
 @mcp.tool()
-async def execute(connector_id: str, entity: str, action: str, params: dict[str, Any] | None = None) -> dict:
+async def execute(
+    connector_id: str,
+    entity: str,
+    action: str,
+    params: dict[str, Any] | None = None,
+    expand: list[str] | None = None,
+    where: dict[str, Any] | None = None,
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    exclude: list[str] | None = None,
+    strip_empty: bool = False,
+    max_string_length: int | None = None,
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    format: ResultFormat = "json",
+    flatten_depth: int = DEFAULT_FLATTEN_DEPTH,
+    ctx: Context | None = None,
+) -> dict:
     """Execute an operation on a connector.
 
-    This is the primary tool for interacting with connectors. It creates a fresh
-    connector instance, executes the operation, and returns the result.
+    This is the primary tool for interacting with connectors. It executes the
+    operation on the connector's cached executor and returns the result.
+    Executors are reused across calls and replaced when the connector's
+    definition or secrets change; a replaced executor is closed once the calls
+    still using it finish.
 
     Args:
         connector_id: Connector identifier from configured_connectors.yaml
@@ -31,6 +108,36 @@ async def execute(connector_id: str, entity: str, action: str, params: dict[str,
             - For "get": {"id": "..."}
             - For "list": {"limit": 10, "starting_after": "..."}
             - For "create": {"field1": "value1", ...}
+        expand: Related records to attach to get/list/search results, by relationship
+            name (see "relationships" in describe_connector). Related records are
+            fetched in bulk instead of one call per record.
+        where: Filter for list/search results: field -> value, list of values, or
+            {operator: value} with eq, ne, gt, gte, lt, lte, in, contains, e.g.
+            {"state": "open", "stargazers_count": {"gt": 100}}. Fields listed under
+            "filters" in describe_connector are filtered by the API; others are
+            filtered while paging.
+        limit: Maximum number of list/search records to return; pages are fetched
+            until it is reached. With where and no limit, at most 100 matching
+            records are returned. When the limit stops reading before the last
+            page, the response has has_more=true; pass a larger limit, or, if
+            no field was filtered while paging, continue from next_cursor with
+            paginate(cursor=...)
+        fields: Only return these fields of each record, as dotted paths, e.g.
+            ["id", "subject", "requester.email"]. Use it to keep large records small.
+        exclude: Drop these fields (dotted paths) from each record
+        strip_empty: Drop fields whose value is null, "", [] or {}
+        max_string_length: Truncate longer string values
+        max_response_bytes: Return only the leading list/search records that fit
+            in this many bytes (default 500000). The response then has
+            truncated=true and a result_handle to pass to fetch_result for the
+            remaining records (kept on the server for a while, so no new API
+            calls). Plain list/search calls also get a next_cursor to pass to
+            paginate(cursor=...), which continues the listing past this page.
+        format: Encoding of list/search results: "json" (list of records),
+            "table" ({"columns": [...], "rows": [[...], ...]}, much smaller for
+            many records), "csv" or "tsv" (text with a header line)
+        flatten_depth: For table/csv/tsv, object nesting levels flattened into
+            dotted columns like "address.city" (default 2)
 
     Returns:
         Execution result with success status and data or error
@@ -49,19 +156,52 @@ async def execute(connector_id: str, entity: str, action: str, params: dict[str,
         logger.info(f"Tool call: execute({connector_id}, {entity}, {action})")
 
         # Execute operation
-        result = await mcp.connector_manager.execute(
+        result, meta = await mcp.connector_manager.execute(
             connector_id=connector_id,
             entity=entity,
             action=action,
             params=params,
+            expand=expand,
+            where=where,
+            limit=limit,
+            fields=fields,
+            exclude=exclude,
+            with_meta=True,
         )
 
+        # Only where/limit reads report has_more and a cursor in their metadata
+        meta = meta if where is not None or limit is not None else None
+        compacted = compact(result, strip_empty, max_string_length)
+        data, omitted = cap_records(compacted, max_response_bytes)
+        next_cursor = result_handle = total_records = None
+        if omitted:
+            logger.info(f"Left out {omitted} record(s) over max_response_bytes={max_response_bytes}")
+            total_records = len(data) + omitted
+            if mcp.result_store is not None:
+                try:
+                    result_handle = await mcp.result_store.put(_session_key(ctx), compacted)
+                except ValueError as e:
+                    logger.warning(f"Not buffering result: {e}")
+            # Re-reading the same request and skipping what was returned continues a plain listing
+            if action in ("list", "search") and not (where or limit or expand):
+                next_cursor = encode_cursor(params, len(data))
+        elif meta:
+            # Null when records were filtered locally
+            next_cursor = meta.get("next_cursor")
+        if format != "json":
+            data = tabulate(data, format, mcp.connector_manager.entity_schema(connector_id, entity), flatten_depth)
+
         response = ExecuteResponse(
             success=True,
-            data=result,
+            data=data,
             connector_id=connector_id,
             entity=entity,
             action=action,
+            truncated=bool(omitted),
+            next_cursor=next_cursor,
+            result_handle=result_handle,
+            total_records=total_records,
+            has_more=bool(meta and meta.get("has_more")),
         )
 
         return response.model_dump()
@@ -84,6 +224,207 @@ async def execute(connector_id: str, entity: str, action: str, params: dict[str,
         return response.model_dump()
 
 
+@mcp.tool()
+async def paginate(
+    connector_id: str,
+    entity: str,
+    action: str = "list",
+    params: dict[str, Any] | None = None,
+    max_records: int = DEFAULT_PAGINATE_MAX_RECORDS,
+    max_bytes: int = DEFAULT_PAGINATE_MAX_BYTES,
+    max_seconds: float = DEFAULT_PAGINATE_MAX_SECONDS,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    exclude: list[str] | None = None,
+    strip_empty: bool = False,
+    max_string_length: int | None = None,
+    format: ResultFormat = "json",
+    flatten_depth: int = DEFAULT_FLATTEN_DEPTH,
+) -> dict:
+    """Fetch many pages of a list/search result in one call.
+
+    Instead of calling execute once per page and passing cursors along, this
+    follows the connector's pagination on the server (prefetching the next page
+    while reading the current one) and returns all records until one of the
+    budgets runs out or there are no more pages.
+
+    Args:
+        connector_id: Connector identifier from configured_connectors.yaml
+        entity: Entity name (e.g., "customers")
+        action: "list" or "search" (default "list")
+        params: Operation parameters for the first page, e.g. filters
+        max_records: Stop after this many records (default 500)
+        max_bytes: Stop before the records exceed this many bytes of JSON (default 200000)
+        max_seconds: Stop fetching new pages after this many seconds (default 30)
+        cursor: next_cursor from a previous paginate call, to continue where it
+            stopped (params are then taken from the cursor; pass fields again)
+        fields: Only return these fields of each record, as dotted paths
+        exclude: Drop these fields (dotted paths) from each record
+        strip_empty: Drop fields whose value is null, "", [] or {}
+        max_string_length: Truncate longer string values
+        format: Encoding of records: "json", "table", "csv" or "tsv" (see execute)
+        flatten_depth: For table/csv/tsv, object nesting levels flattened into
+            dotted columns (default 2)
+
+    Returns:
+        Execution result whose data has:
+        - records: The records, in API order (encoded as format says)
+        - next_cursor: Pass as cursor to get the following records (null when done)
+        - has_more: Whether next_cursor can fetch more
+        - pages / bytes: Pages read and size of the records
+        - stopped_by: "end", "max_records", "max_bytes" or "max_seconds"
+
+    Example:
+        paginate(connector_id="github", entity="issues", params={"owner": "airbytehq", "repo": "airbyte"}, max_records=1000)
+    """
+    try:
+        logger.info(f"Tool call: paginate({connector_id}, {entity}, {action})")
+
+        result = await mcp.connector_manager.paginate(
+            connector_id=connector_id,
+            entity=entity,
+            action=action,
+            params=params,
+            max_records=max_records,
+            max_bytes=max_bytes,
+            max_seconds=max_seconds,
+            cursor=cursor,
+            fields=fields,
+            exclude=exclude,
+        )
+        result["records"] = compact(result["records"], strip_empty, max_string_length)
+        if format != "json":
+            result["records"] = tabulate(result["records"], format, mcp.connector_manager.entity_schema(connector_id, entity), flatten_depth)
+
+        response = ExecuteResponse(success=True, data=result, connector_id=connector_id, entity=entity, action=action)
+
+        return response.model_dump()
+
+    except Exception as e:
+        logger.error(f"Pagination failed: {e}", exc_info=True)
+
+        response = ExecuteResponse(
+            success=False,
+            error={
+                "type": "unknown",
+                "message": str(e),
+                "details": getattr(e, "__dict__", {}),
+            },
+            connector_id=connector_id,
+            entity=entity,
+            action=action,
+        )
+
+        return response.model_dump()
+
+
+@mcp.tool()
+async def fetch_result(
+    handle: str,
+    offset: int = 0,
+    limit: int = 100,
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    format: ResultFormat = "json",
+    flatten_depth: int = DEFAULT_FLATTEN_DEPTH,
+) -> dict:
+    """Read more records of a result that execute truncated.
+
+    When an execute result is too large to return at once, the response has
+    truncated=true, the first records, and a result_handle. The full result is
+    kept on the server for a while; read the rest here by offset instead of
+    running the query again.
+
+    Args:
+        handle: result_handle from an execute response
+        offset: Index of the first record to return
+        limit: Maximum number of records to return (default 100)
+        max_response_bytes: Return fewer records if they exceed this many bytes
+        format: Encoding of records: "json", "table", "csv" or "tsv" (see execute)
+        flatten_depth: For table/csv/tsv, object nesting levels flattened into
+            dotted columns (default 2)
+
+    Returns:
+        - records: The requested slice
+        - offset / total: Position of the slice and records in the full result
+        - next_offset: Offset of the following slice (null after the last one)
+
+    Example:
+        fetch_result(handle="res_Xy3...", offset=120, limit=100)
+    """
+    try:
+        logger.info(f"Tool call: fetch_result({handle}, offset={offset}, limit={limit})")
+        if mcp.result_store is None:
+            raise RuntimeError("Results are not buffered by this server")
+
+        records, total = await mcp.result_store.get(handle, offset, limit)
+        records, _ = cap_records(records, max_response_bytes)
+        end = offset + len(records)
+
+        return {
+            "handle": handle,
+            "records": tabulate(records, format, max_depth=flatten_depth),
+            "offset": offset,
+            "total": total,
+            "next_offset": end if end < total else None,
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to fetch result: {e}", exc_info=True)
+        return {"error": str(e), "handle": handle}
+
+
+@mcp.tool()
+async def execute_batch(
+    items: list[BatchItem],
+    max_concurrency_per_connector: int = DEFAULT_BATCH_CONCURRENCY,
+    timeout: float | None = None,
+) -> dict:
+    """Execute several operations in one call, concurrently on the server.
+
+    Use this instead of many sequential execute calls, e.g. to fetch a list of
+    records by ID or to query several connectors at once. Each item takes the
+    same arguments as execute. Items succeed or fail independently.
+
+    Args:
+        items: Operations to run (at most 100), each with connector_id, entity,
+            action and optionally params, expand, where, limit, fields and exclude
+        max_concurrency_per_connector: Operations running at once against the
+            same connector (default 4)
+        timeout: Seconds to wait for the whole batch (optional). Items still
+            running then fail with error type "timeout"; finished items are
+            returned as usual.
+
+    Returns:
+        - results: One execute-style result per item, in request order
+        - succeeded / failed: Item counts
+        - timed_out: Whether the timeout cut off unfinished items
+
+    Example:
+        execute_batch(items=[
+            {"connector_id": "stripe", "entity": "customers", "action": "get", "params": {"id": "cus_1"}},
+            {"connector_id": "stripe", "entity": "customers", "action": "get", "params": {"id": "cus_2"}},
+            {"connector_id": "github", "entity": "issues", "action": "list", "params": {"owner": "airbytehq", "repo": "airbyte"}}
+        ])
+    """
+    try:
+        logger.info(f"Tool call: execute_batch({len(items)} items)")
+
+        results, timed_out = await mcp.connector_manager.execute_batch(
+            items,
+            max_concurrency_per_connector=max_concurrency_per_connector,
+            timeout=timeout,
+        )
+        succeeded = sum(result.success for result in results)
+
+        response = ExecuteBatchResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded, timed_out=timed_out)
+
+        return response.model_dump()
+
+    except Exception as e:
+        logger.error(f"Batch execution failed: {e}", exc_info=True)
+        return {"error": str(e), "results": []}
+
+
 @mcp.tool()
 async def describe_connector(connector_id: str) -> dict:
     """Describe a connector's available entities and operations.
@@ -102,6 +443,8 @@ async def describe_connector(connector_id: str) -> dict:
           - entity_name: Entity identifier used in operations
           - description: Entity description
           - available_actions: List of supported operation actions
+          - relationships: Relationship names accepted by execute(expand=...), per action
+          - filters: Fields (and operators) execute(where=...) filters on server-side, per action
 
     Example:
         describe_connector(connector_id="stripe")
@@ -122,11 +465,7 @@ async def describe_connector(connector_id: str) -> dict:
     try:
         logger.info(f"Tool call: describe_connector({connector_id})")
 
-        entities = await mcp.connector_manager.describe_connector(connector_id)
-
-        response = ListEntitiesResponse(connector_id=connector_id, entities=entities)
-
-        return response.model_dump()
+        return await mcp.connector_manager.catalog.describe(connector_id)
 
     except Exception as e:
         logger.error(f"Failed to list entities: {e}", exc_info=True)
@@ -169,19 +508,55 @@ async def discover_connectors() -> dict:
     """
     try:
         logger.info("Tool call: discover_connectors()")
-        return mcp.connector_manager.discover_connectors()
+        return mcp.connector_manager.catalog.discover()
 
     except Exception as e:
         logger.error(f"Failed to discover connectors: {e}", exc_info=True)
         return {"error": str(e), "connectors": []}
 
 
-def init_server(config_path: str = "configured_connectors.yaml", dotenv_path: str = ".env"):
+@mcp.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> JSONResponse:
+    """Liveness probe (http/sse transports): the process is up and serving."""
+    return JSONResponse({"status": "ok", "pid": os.getpid()})
+
+
+@mcp.custom_route("/readyz", methods=["GET"])
+async def readyz(request: Request) -> JSONResponse:
+    """Readiness probe (http/sse transports).
+
+    Returns 503 until connectors are configured, while the process drains
+    before shutdown, and while every tool-call slot and queue place is taken.
+    """
+    reason = None
+    if getattr(mcp, "connector_manager", None) is None:
+        reason = "not initialized"
+    elif mcp.draining:
+        reason = "draining"
+    elif mcp.limiter is not None and mcp.limiter.saturated:
+        reason = "saturated"
+
+    body: dict[str, Any] = {"status": "ready" if reason is None else reason, "pid": os.getpid()}
+    if mcp.limiter is not None:
+        body.update(in_flight=mcp.limiter.in_flight, queued=mcp.limiter.queued)
+    return JSONResponse(body, status_code=200 if reason is None else 503)
+
+
+def _start_draining():
+    mcp.draining = True
+
+
+def init_server(
+    config_path: str = "configured_connectors.yaml",
+    dotenv_path: str = ".env",
+    registry_client: RegistryClient | None = None,
+):
     """Initialize the MCP server with configuration.
 
     Args:
         config_path: Path to configured_connectors.yaml
         dotenv_path: Path to .env file with secrets
+        registry_client: Client for registry connectors (default: one with the default cache)
 
     Raises:
         SystemExit: If initialization fails
@@ -212,7 +587,7 @@ def init_server(config_path: str = "configured_connectors.yaml", dotenv_path: st
         logger.info("Initialized secrets manager")
 
         # Store managers on MCP instance (application-wide state)
-        mcp.connector_manager = ConnectorManager(config, secrets_manager)
+        mcp.connector_manager = ConnectorManager(config, secrets_manager, registry_client)
         logger.info("Initialized connector manager")
 
         logger.info(" Server initialization complete")
@@ -222,15 +597,120 @@ def init_server(config_path: str = "configured_connectors.yaml", dotenv_path: st
         raise SystemExit(1)
 
 
-def run_server(config_path: str = "configured_connectors.yaml", dotenv_path: str = ".env"):
+def run_server(
+    config_path: str = "configured_connectors.yaml",
+    dotenv_path: str = ".env",
+    transport: Literal["stdio", "http", "sse"] = "stdio",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    path: str | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+    queue_timeout: float | None = None,
+    use_uvloop: bool = True,
+    workers: int = 1,
+    max_worker_memory_mb: float | None = None,
+    graceful_timeout: float = DEFAULT_GRACEFUL_TIMEOUT,
+    drain_delay: float = 0.0,
+    result_store_mb: float = DEFAULT_MAX_MEMORY_BYTES / (1024 * 1024),
+    catalog_timeout: float = DEFAULT_CATALOG_LOAD_TIMEOUT,
+    warmup: bool = False,
+    warmup_connect: bool = False,
+    registry_cache_dir: str | None = None,
+    registry_ttl: float = DEFAULT_REGISTRY_TTL,
+    offline: bool = False,
+):
     """Run the MCP server.
 
+    With the stdio transport the server serves the one client that spawned it.
+    The http (streamable HTTP) and sse transports run a long-lived server that
+    many clients share, so connector configuration is parsed once.
+
+    Before serving, every connector is loaded into the catalog concurrently
+    (see ConnectorCatalog), so describe_connector answers without parsing.
+    With warmup, the server also creates every connector's executor before it
+    accepts calls, and with warmup_connect opens a keep-alive connection to
+    each API, so the first call is as fast as later ones.
+
+    Every transport limits concurrent tool calls: up to max_in_flight run at
+    once, up to max_queued wait for a slot, and further calls are rejected with
+    a "server busy" error straight away.
+
+    With workers > 1 (http only) the process then forks that many stateless
+    HTTP workers sharing one socket, which inherit the catalog and parsed
+    connector definitions; see WorkerSupervisor. Admission limits then apply
+    per worker, and truncated results are not buffered for fetch_result, since
+    a follow-up call may reach another worker.
+
     Args:
         config_path: Path to configured_connectors.yaml
         dotenv_path: Path to .env file
-    """
-    init_server(config_path, dotenv_path)
+        transport: "stdio", "http" (streamable HTTP) or "sse"
+        host: Interface to listen on (http/sse)
+        port: Port to listen on (http/sse)
+        path: URL path of the MCP endpoint (http/sse, default: FastMCP's)
+        max_in_flight: Tool calls running at once
+        max_queued: Tool calls waiting for a slot before new ones are shed
+        queue_timeout: Seconds a call may wait for a slot (None: no limit)
+        use_uvloop: Run on uvloop when it is installed
+        workers: Worker processes (http only)
+        max_worker_memory_mb: Replace workers whose resident memory exceeds this
+        graceful_timeout: Seconds a stopping worker gets to finish in-flight requests
+        drain_delay: Seconds a stopping worker keeps serving with /readyz failing
+        result_store_mb: Memory for buffered truncated results; older ones spill to disk
+        catalog_timeout: Seconds one connector may take to load into the catalog at startup
+        warmup: Create connector executors before serving
+        warmup_connect: Also pre-open a connection to each connector's API (implies warmup)
+        registry_cache_dir: Persistent cache of registry.json and connector definitions
+        registry_ttl: Seconds registry.json is used before it is revalidated
+        offline: Serve registry connectors from the cache only; see RegistryClient
 
-    # FastMCP handles the server loop
-    logger.info("Starting MCP server on stdio transport...")
-    mcp.run()
+    Raises:
+        ValueError: If workers > 1 with a transport other than http
+    """
+    if workers > 1 and transport != "http":
+        raise ValueError(f"Multiple workers need the http transport, got {transport}")
+
+    init_server(config_path, dotenv_path, RegistryClient(cache_dir=registry_cache_dir, ttl_seconds=registry_ttl, offline=offline))
+
+    mcp.limiter = InFlightLimiter(max_in_flight, max_queued, queue_timeout)
+    mcp.add_middleware(ConcurrencyLimitMiddleware(mcp.limiter))
+    mcp.result_store = ResultStore(max_memory_bytes=int(result_store_mb * 1024 * 1024)) if workers == 1 else None
+    mcp.warmup = warmup or warmup_connect
+    mcp.warmup_connect = warmup_connect
+
+    anyio.run(partial(mcp.connector_manager.catalog.build, catalog_timeout))
+
+    if workers > 1:
+        logger.info(f"Starting MCP server on http transport at {host}:{port} with {workers} workers...")
+        WorkerSupervisor(
+            partial(mcp.http_app, path=path, stateless_http=True),
+            host=host,
+            port=port,
+            workers=workers,
+            max_worker_memory_mb=max_worker_memory_mb,
+            graceful_timeout=graceful_timeout,
+            drain_delay=drain_delay,
+            on_drain=_start_draining,
+            use_uvloop=use_uvloop,
+        ).run()
+        return
+
+    transport_kwargs: dict[str, Any] = {}
+    if transport != "stdio":
+        transport_kwargs = {"host": host, "port": port}
+        if path:
+            transport_kwargs["path"] = path
+
+    backend_options = {}
+    if use_uvloop and importlib.util.find_spec("uvloop") is not None:
+        backend_options["use_uvloop"] = True
+
+    logger.info(
+        f"Starting MCP server on {transport} transport"
+        + (f" at {host}:{port}" if transport != "stdio" else "")
+        + f" (max {max_in_flight} tool calls in flight, {max_queued} queued"
+        + (", uvloop" if backend_options else "")
+        + ")..."
+    )
+    anyio.run(partial(mcp.run_async, transport, **transport_kwargs), backend_options=backend_options)
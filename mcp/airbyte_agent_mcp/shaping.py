@@ -0,0 +1,69 @@
+"""Shrinking tool results before they are returned to the client.
+
+Upstream payloads can run to hundreds of KB per page, and everything returned
+ends up in the model's context. Tools apply field projection in the SDK
+(fields/exclude), then compact() drops empty values and truncates long
+strings, and cap_records() keeps a list result under a byte budget.
+"""
+
+import json
+from typing import Any
+
+DEFAULT_MAX_RESPONSE_BYTES = 500_000
+"""Default byte budget of the data returned by one execute call."""
+
+
+def compact(value: Any, strip_empty: bool = False, max_string_length: int | None = None) -> Any:
+    """Return a copy of value without empty values and with long strings truncated.
+
+    Args:
+        value: Record, list of records or any JSON-like value
+        strip_empty: Drop dict entries whose value is None, "", [] or {} (after
+            compacting nested values)
+        max_string_length: Truncate longer strings, noting how many characters were cut
+    """
+    if not strip_empty and max_string_length is None:
+        return value
+    return _compact(value, strip_empty, max_string_length)
+
+
+def _compact(value: Any, strip_empty: bool, max_string_length: int | None) -> Any:
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            item = _compact(item, strip_empty, max_string_length)
+            if strip_empty and (item is None or (isinstance(item, (str, list, dict)) and not item)):
+                continue
+            compacted[key] = item
+        return compacted
+    if isinstance(value, list):
+        return [_compact(item, strip_empty, max_string_length) for item in value]
+    if isinstance(value, str) and max_string_length is not None and len(value) > max_string_length:
+        return f"{value[:max_string_length]}… [{len(value) - max_string_length} more chars]"
+    return value
+
+
+def json_size(value: Any) -> int:
+    """Size of value serialized as compact JSON, in bytes."""
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode())
+
+
+def cap_records(data: Any, max_bytes: int | None) -> tuple[Any, int]:
+    """Keep the leading records of a list result that fit in max_bytes.
+
+    At least one record is kept. Results that aren't lists are returned as they are.
+
+    Returns:
+        (data, number of records left out)
+    """
+    if max_bytes is None or not isinstance(data, list) or json_size(data) <= max_bytes:
+        return data, 0
+    # "[" and "]", plus a separating comma per record but the first
+    kept, size = [], 1
+    for record in data:
+        record_size = json_size(record) + 1
+        if kept and size + record_size > max_bytes:
+            break
+        kept.append(record)
+        size += record_size
+    return kept, len(data) - len(kept)
@@ -0,0 +1,100 @@
+"""Tabular encoding of list results.
+
+List results are arrays of objects with mostly the same keys, so as JSON every
+key name repeats in every record. tabulate() returns a column header plus one
+row array per record instead, or CSV/TSV text. Nested objects are flattened
+into dotted columns ("address.city") up to a depth; deeper objects and lists
+stay whole values (JSON-encoded in CSV/TSV).
+
+Columns are the keys present in the records, ordered as the entity's JSON
+schema declares them when it is known, then in order of first appearance.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Literal
+
+ResultFormat = Literal["json", "table", "csv", "tsv"]
+
+DEFAULT_FLATTEN_DEPTH = 2
+"""Object nesting levels flattened into dotted columns."""
+
+
+def flatten(record: dict[str, Any], max_depth: int = DEFAULT_FLATTEN_DEPTH) -> dict[str, Any]:
+    """Flatten nested objects of a record into dotted keys, up to max_depth levels."""
+    flat: dict[str, Any] = {}
+    _flatten_into(flat, "", record, max_depth)
+    return flat
+
+
+def _flatten_into(flat: dict[str, Any], prefix: str, value: dict[str, Any], depth: int) -> None:
+    for key, item in value.items():
+        name = f"{prefix}{key}"
+        if isinstance(item, dict) and item and depth > 1:
+            _flatten_into(flat, f"{name}.", item, depth - 1)
+        else:
+            flat[name] = item
+
+
+def schema_columns(schema: dict[str, Any] | None, max_depth: int = DEFAULT_FLATTEN_DEPTH) -> list[str]:
+    """Dotted column names an entity's JSON schema declares, in declaration order."""
+    columns: list[str] = []
+    _schema_columns_into(columns, "", schema or {}, max_depth)
+    return columns
+
+
+def _schema_columns_into(columns: list[str], prefix: str, schema: dict[str, Any], depth: int) -> None:
+    for name, prop in (schema.get("properties") or {}).items():
+        prop = prop or {}
+        if prop.get("properties") and depth > 1:
+            _schema_columns_into(columns, f"{prefix}{name}.", prop, depth - 1)
+        else:
+            columns.append(f"{prefix}{name}")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), default=str)
+    return str(value)
+
+
+def tabulate(
+    records: list[Any],
+    format: ResultFormat = "table",
+    schema: dict[str, Any] | None = None,
+    max_depth: int = DEFAULT_FLATTEN_DEPTH,
+) -> Any:
+    """Encode a list of records as a table, CSV or TSV.
+
+    Args:
+        records: List result; anything else is returned unchanged
+        format: "table" for {"columns": [...], "rows": [[...], ...]}, "csv" or
+            "tsv" for delimited text with a header line, "json" to leave records as they are
+        schema: The entity's JSON schema, used to order columns
+        max_depth: Object nesting levels flattened into dotted columns
+
+    Returns:
+        The encoded records
+    """
+    if format == "json" or not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        return records
+
+    rows = [flatten(record, max_depth) for record in records]
+    present = dict.fromkeys(key for row in rows for key in row)
+    columns = [column for column in schema_columns(schema, max_depth) if column in present]
+    declared = set(columns)
+    columns += [column for column in present if column not in declared]
+
+    if format == "table":
+        return {"columns": columns, "rows": [[row.get(column) for column in columns] for row in rows]}
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t" if format == "tsv" else ",", lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows([_cell(row.get(column)) for column in columns] for row in rows)
+    return buffer.getvalue()
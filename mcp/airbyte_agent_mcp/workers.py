@@ -0,0 +1,296 @@
+"""Pre-fork multi-process serving for the HTTP transport.
+
+One Python process serves tool calls on one core. WorkerSupervisor binds the
+listening socket once, forks N worker processes that all accept on it, and
+keeps them running: a worker that crashes is restarted (with backoff if it
+keeps crashing), and a worker whose resident memory grows past a limit is
+replaced. Connector definitions are parsed in the supervisor before forking,
+so workers share those pages copy-on-write instead of each parsing its own.
+
+On SIGTERM/SIGINT the supervisor drains: every worker marks itself not ready
+(GET /readyz returns 503), keeps serving for drain_delay seconds so load
+balancers stop routing to it, then stops accepting and finishes in-flight
+requests within graceful_timeout before it is killed.
+
+Workers serve the stateless streamable HTTP transport: any worker may accept
+any request, so no MCP session state can live in one process.
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from types import FrameType
+
+import uvicorn
+from starlette.types import ASGIApp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRACEFUL_TIMEOUT = 30.0
+"""Seconds a draining worker gets to finish in-flight requests before it is killed."""
+
+MIN_STABLE_UPTIME = 10.0
+"""Workers exiting sooner than this after start count as crash-looping and restart with backoff."""
+
+MAX_RESTART_BACKOFF = 30.0
+
+
+def worker_rss_mb(pid: int) -> float | None:
+    """Resident memory of a process in MiB, or None if it can't be read.
+
+    Reads /proc on Linux and falls back to psutil elsewhere, when it is installed.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if importlib.util.find_spec("psutil") is not None:
+        import psutil
+
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+    return None
+
+
+def describe_exit(status: int) -> str:
+    """Describe a waitpid() status, e.g. "exit code 1" or "signal SIGKILL"."""
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        return f"signal {signal.Signals(-code).name}"
+    return f"exit code {code}"
+
+
+class _DrainingServer(uvicorn.Server):
+    """uvicorn server that reports not ready for drain_delay seconds before shutting down."""
+
+    def __init__(self, config: uvicorn.Config, on_drain: Callable[[], None] | None, drain_delay: float):
+        super().__init__(config)
+        self.on_drain = on_drain
+        self.drain_delay = drain_delay
+        self._drain_until: float | None = None
+
+    def handle_exit(self, sig: int, frame: FrameType | None) -> None:
+        if self._drain_until is None:
+            if self.on_drain:
+                self.on_drain()
+            self._drain_until = time.monotonic() + self.drain_delay
+            if self.drain_delay > 0:
+                return
+        # A second signal during the drain delay shuts down straight away
+        self.should_exit = True
+
+    async def on_tick(self, counter: int) -> bool:
+        if self._drain_until is not None and time.monotonic() >= self._drain_until:
+            self.should_exit = True
+        return await super().on_tick(counter)
+
+
+class WorkerSupervisor:
+    """Run N worker processes serving one ASGI app on one listening socket.
+
+    Args:
+        app_factory: Builds the ASGI app inside each worker, after the fork
+        host: Interface to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+        max_worker_memory_mb: Replace a worker whose resident memory exceeds this
+            (None: no limit)
+        graceful_timeout: Seconds a stopping worker gets to finish in-flight requests
+        drain_delay: Seconds a stopping worker keeps serving with /readyz failing
+            before it stops accepting connections
+        on_drain: Called in a worker when it starts draining
+        use_uvloop: Run workers on uvloop when it is installed
+        check_interval: Seconds between worker liveness and memory checks
+        backlog: Listen backlog of the shared socket
+    """
+
+    def __init__(
+        self,
+        app_factory: Callable[[], ASGIApp],
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 2,
+        max_worker_memory_mb: float | None = None,
+        graceful_timeout: float = DEFAULT_GRACEFUL_TIMEOUT,
+        drain_delay: float = 0.0,
+        on_drain: Callable[[], None] | None = None,
+        use_uvloop: bool = True,
+        check_interval: float = 1.0,
+        backlog: int = 2048,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self.app_factory = app_factory
+        self.host = host
+        self.port = port
+        self.num_workers = workers
+        self.max_worker_memory_mb = max_worker_memory_mb
+        self.graceful_timeout = graceful_timeout
+        self.drain_delay = drain_delay
+        self.on_drain = on_drain
+        self.use_uvloop = use_uvloop
+        self.check_interval = check_interval
+        self.backlog = backlog
+
+        self.workers: dict[int, float] = {}
+        """Running worker pid -> monotonic start time."""
+        self.retiring: dict[int, float] = {}
+        """Stopping worker pid -> monotonic deadline after which it is killed."""
+        self.restarts = 0
+        self.sock: socket.socket | None = None
+        self._stopping = False
+        self._backoff = 0.0
+        self._next_spawn = 0.0
+
+    def bind(self) -> socket.socket:
+        """Create the listening socket every worker accepts on."""
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        return sock
+
+    def run(self) -> None:
+        """Bind, fork the workers and supervise them until SIGTERM/SIGINT."""
+        self.sock = self.bind()
+        self.port = self.sock.getsockname()[1]
+
+        # Everything loaded so far (configs, parsed connector definitions, imports)
+        # moves to a permanent GC generation, so collections in the workers don't
+        # touch those objects and copy their shared pages.
+        gc.collect()
+        gc.freeze()
+
+        previous = {sig: signal.signal(sig, self._handle_stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        logger.info(f"Supervisor {os.getpid()} starting {self.num_workers} workers on {self.host}:{self.port}")
+        try:
+            next_check = 0.0
+            while not self._stopping:
+                if time.monotonic() >= next_check:
+                    self._reap()
+                    self._check_memory()
+                    self._kill_overdue()
+                    self._spawn_missing()
+                    next_check = time.monotonic() + self.check_interval
+                # Short sleeps so a stop signal is forwarded to the workers promptly
+                time.sleep(min(0.1, self.check_interval))
+            self._shutdown()
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self.sock.close()
+            gc.unfreeze()
+
+    def _handle_stop(self, sig: int, frame: FrameType | None) -> None:
+        if not self._stopping:
+            logger.info(f"Received {signal.Signals(sig).name}, draining workers")
+        self._stopping = True
+
+    def _spawn_missing(self) -> None:
+        while len(self.workers) < self.num_workers and time.monotonic() >= self._next_spawn:
+            self._spawn()
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                for sig in (signal.SIGTERM, signal.SIGINT):
+                    signal.signal(sig, signal.SIG_DFL)
+                self._serve()
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} failed")
+                code = 1
+            finally:
+                # Skip atexit handlers and the parent's finalizers inherited by the fork
+                os._exit(code)
+        self.workers[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+        return pid
+
+    def _serve(self) -> None:
+        """Worker process body: serve the app on the shared socket until told to stop."""
+        loop = "uvloop" if self.use_uvloop and importlib.util.find_spec("uvloop") is not None else "asyncio"
+        config = uvicorn.Config(
+            self.app_factory(),
+            lifespan="on",
+            loop=loop,
+            log_config=None,
+            timeout_graceful_shutdown=max(1, int(self.graceful_timeout)),
+        )
+        _DrainingServer(config, self.on_drain, self.drain_delay).run(sockets=[self.sock])
+
+    def _reap(self) -> None:
+        """Collect exited workers; schedule restarts for the ones that crashed."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            started = self.workers.pop(pid, None)
+            if self.retiring.pop(pid, None) is not None or started is None:
+                logger.info(f"Worker {pid} stopped ({describe_exit(status)})")
+                continue
+
+            self.restarts += 1
+            if time.monotonic() - started < MIN_STABLE_UPTIME:
+                self._backoff = min(max(self._backoff * 2, 0.5), MAX_RESTART_BACKOFF)
+            else:
+                self._backoff = 0.0
+            self._next_spawn = time.monotonic() + self._backoff
+            logger.warning(f"Worker {pid} exited with {describe_exit(status)}; restarting in {self._backoff:.1f}s")
+
+    def _check_memory(self) -> None:
+        if self.max_worker_memory_mb is None:
+            return
+        for pid in list(self.workers):
+            rss = worker_rss_mb(pid)
+            if rss is not None and rss > self.max_worker_memory_mb:
+                logger.warning(f"Worker {pid} uses {rss:.0f} MiB (limit {self.max_worker_memory_mb:.0f} MiB); replacing it")
+                self._retire(pid, replace=True)
+
+    def _retire(self, pid: int, replace: bool = False) -> None:
+        """Stop one worker gracefully, starting its replacement first if asked."""
+        self.workers.pop(pid, None)
+        if replace:
+            self._spawn()
+        self.retiring[pid] = time.monotonic() + self.drain_delay + self.graceful_timeout + 5
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _kill_overdue(self) -> None:
+        now = time.monotonic()
+        for pid, deadline in list(self.retiring.items()):
+            if now >= deadline:
+                logger.warning(f"Worker {pid} did not stop in time; killing it")
+                self.retiring[pid] = float("inf")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    def _shutdown(self) -> None:
+        for pid in list(self.workers):
+            self._retire(pid)
+        while self.retiring:
+            self._reap()
+            self._kill_overdue()
+            if self.retiring:
+                time.sleep(0.1)
+        logger.info("All workers stopped")
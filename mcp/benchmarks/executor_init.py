@@ -0,0 +1,83 @@
+"""Benchmark LocalExecutor construction time with telemetry enabled vs disabled.
+
+The MCP server builds an executor per tool call, so any telemetry work done in the
+constructor is paid on every request. Telemetry should add close to zero overhead:
+identity lookup and event delivery happen on a background thread.
+
+Usage:
+    uv run python benchmarks/executor_init.py [--iterations 200] [--connector stripe] [--send]
+
+By default Segment delivery is disabled (analytics.send = False) so the benchmark
+makes no network calls; pass --send to include real delivery in the background.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import LocalExecutor  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def find_connector_yaml(name: str) -> Path:
+    """Locate a connector.yaml in the repository's connectors/ directory."""
+    matches = sorted((REPO_ROOT / "connectors" / name).glob("*/connector.yaml"))
+    if not matches:
+        raise SystemExit(f"connector.yaml not found for {name!r} under {REPO_ROOT / 'connectors'}")
+    return matches[0]
+
+
+def run(config_path: Path, iterations: int, mode: str) -> list[float]:
+    """Construct the executor `iterations` times and return per-call timings in ms."""
+    os.environ["AIRBYTE_TELEMETRY_MODE"] = mode
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        LocalExecutor(config_path=str(config_path), secrets={}, execution_context="mcp")
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<10} mean={statistics.mean(timings):7.3f}ms  p50={statistics.median(timings):7.3f}ms  p95={p95:7.3f}ms  max={timings[-1]:7.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--connector", default="stripe")
+    parser.add_argument("--send", action="store_true", help="Actually deliver events to Segment")
+    args = parser.parse_args()
+
+    if not args.send:
+        import segment.analytics as analytics
+
+        analytics.send = False
+
+    config_path = find_connector_yaml(args.connector)
+
+    # Warm up imports, the config parser and the telemetry worker (which resolves the
+    # cached user ID / public IP once per process) so neither run pays one-off costs
+    run(config_path, 5, "disabled")
+    run(config_path, 5, "basic")
+    time.sleep(0.5)
+
+    disabled = run(config_path, args.iterations, "disabled")
+    enabled = run(config_path, args.iterations, "basic")
+
+    print(f"LocalExecutor construction, {args.connector}, {args.iterations} iterations")
+    report("disabled", disabled)
+    report("enabled", enabled)
+    print(f"overhead   mean={statistics.mean(enabled) - statistics.mean(disabled):+.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
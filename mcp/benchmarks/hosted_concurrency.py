@@ -0,0 +1,105 @@
+"""Benchmark concurrent HostedExecutor calls against a local stand-in backend.
+
+The stand-in is a threaded stdlib HTTP server that answers
+POST /connectors/{id}/execute after a fixed latency, so the benchmark measures how
+well concurrent execute() calls overlap rather than real backend work. With the
+async, pooled client, wall time for N concurrent calls should be close to a single
+call's latency (bounded by --max-connections), not N times it.
+
+Usage:
+    uv run python benchmarks/hosted_concurrency.py [--calls 100] [--latency-ms 50] [--max-connections 100]
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, HostedExecutor  # noqa: E402
+
+
+def make_handler(latency_s: float) -> type[BaseHTTPRequestHandler]:
+    class StandInBackend(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            request = json.loads(body)
+            time.sleep(latency_s)
+            payload = json.dumps({"data": [{"id": i, "entity": request["entity"]} for i in range(20)]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandInBackend
+
+
+async def timed_execute(executor: HostedExecutor, config: ExecutionConfig) -> float:
+    start = time.perf_counter()
+    await executor.execute(config)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(api_url: str, calls: int, max_connections: int, concurrent: bool) -> tuple[float, list[float]]:
+    config = ExecutionConfig(entity="customers", action="list", params={"limit": 20})
+    async with HostedExecutor(
+        connector_id="bench",
+        airbyte_client_id="id",
+        airbyte_client_secret="secret",
+        api_url=api_url,
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    ) as executor:
+        await executor.execute(config)  # open a pooled connection before timing
+        start = time.perf_counter()
+        if concurrent:
+            latencies = await asyncio.gather(*(timed_execute(executor, config) for _ in range(calls)))
+        else:
+            latencies = [await timed_execute(executor, config) for _ in range(calls)]
+        return time.perf_counter() - start, list(latencies)
+
+
+def report(label: str, calls: int, wall_s: float, latencies: list[float]) -> None:
+    print(
+        f"{label:<12} wall={wall_s * 1000:8.1f}ms  throughput={calls / wall_s:7.1f} req/s  "
+        f"p50={statistics.median(latencies):6.1f}ms  max={max(latencies):6.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--max-connections", type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        print(f"{args.calls} calls, {args.latency_ms:.0f}ms backend latency, max_connections={args.max_connections}")
+        report("sequential", args.calls, *asyncio.run(run(api_url, args.calls, args.max_connections, concurrent=False)))
+        report("concurrent", args.calls, *asyncio.run(run(api_url, args.calls, args.max_connections, concurrent=True)))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
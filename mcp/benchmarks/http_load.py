@@ -0,0 +1,193 @@
+"""Load test the MCP server's HTTP transport against a local mock upstream.
+
+Starts a threaded stdlib HTTP server standing in for a connector's API (it answers
+GET /items after a fixed latency), runs `python -m airbyte_agent_mcp --transport
+http` against it in a subprocess, and has many concurrent MCP clients call the
+execute tool through the one shared server. Reports throughput, latency
+percentiles and how many calls were shed with a "server busy" error.
+
+Lower --max-in-flight / --max-queued below the offered load to watch load
+shedding: shed calls fail fast instead of queueing behind the upstream.
+
+Usage:
+    uv run python benchmarks/http_load.py [--clients 50] [--calls 20] [--latency-ms 50]
+        [--max-in-flight 64] [--max-queued 256]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from fastmcp import Client
+
+MCP_ROOT = Path(__file__).resolve().parents[1]
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Mock
+  version: 1.0.0
+  x-airbyte-connector-name: mock
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: {upstream}
+paths:
+  /items:
+    get:
+      operationId: items_List
+      x-airbyte-entity: items
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.items
+      responses:
+        "200":
+          description: Success
+"""
+
+
+def make_upstream(latency_s: float) -> ThreadingHTTPServer:
+    body = json.dumps({"items": [{"id": i, "name": f"item {i}"} for i in range(10)]}).encode()
+
+    class MockUpstream(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency_s)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockUpstream)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"MCP server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit(f"MCP server did not start listening on port {port}")
+
+
+async def run_client(url: str, calls: int, latencies: list[float], outcomes: dict[str, int]) -> None:
+    async with Client(url) as client:
+        for _ in range(calls):
+            start = time.perf_counter()
+            result = await client.call_tool(
+                "execute",
+                {"connector_id": "mock", "entity": "items", "action": "list"},
+                raise_on_error=False,
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            text = result.content[0].text if result.content else ""
+            if result.is_error and "Server busy" in text:
+                outcomes["busy"] += 1
+            elif not result.is_error and (result.structured_content or {}).get("success"):
+                outcomes["ok"] += 1
+                latencies.append(elapsed)
+            else:
+                outcomes["error"] += 1
+
+
+async def load(url: str, clients: int, calls: int) -> tuple[list[float], dict[str, int], float]:
+    latencies: list[float] = []
+    outcomes = {"ok": 0, "busy": 0, "error": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(url, calls, latencies, outcomes) for _ in range(clients)))
+    return latencies, outcomes, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent MCP clients")
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per client")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mock upstream latency per request")
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--max-queued", type=int, default=256)
+    args = parser.parse_args()
+
+    upstream = make_upstream(args.latency_ms / 1000)
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        connector = tmp_path / "connector.yaml"
+        connector.write_text(CONNECTOR_YAML.format(upstream=f"http://127.0.0.1:{upstream.server_address[1]}"))
+        config = tmp_path / "configured_connectors.yaml"
+        config.write_text(
+            f"connectors:\n  - id: mock\n    type: local\n    path: {connector}\n    secrets:\n      api_key: MOCK_API_KEY\n"
+        )
+        dotenv = tmp_path / ".env"
+        dotenv.write_text("MOCK_API_KEY=test\n")
+
+        command = [
+            sys.executable,
+            "-m",
+            "airbyte_agent_mcp",
+            str(config),
+            str(dotenv),
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--max-in-flight",
+            str(args.max_in_flight),
+            "--max-queued",
+            str(args.max_queued),
+        ]
+        env = {**os.environ, "AIRBYTE_TELEMETRY_MODE": "disabled", "FASTMCP_SHOW_SERVER_BANNER": "false"}
+        server = subprocess.Popen(command, cwd=MCP_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_for_port(port, server)
+            latencies, outcomes, wall = asyncio.run(load(f"http://127.0.0.1:{port}/mcp", args.clients, args.calls))
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+            upstream.shutdown()
+
+    total = args.clients * args.calls
+    print(f"{args.clients} clients x {args.calls} calls = {total} tool calls, upstream latency {args.latency_ms:.0f} ms")
+    print(f"max in flight {args.max_in_flight}, max queued {args.max_queued}")
+    print(f"  ok: {outcomes['ok']}  busy (shed): {outcomes['busy']}  other errors: {outcomes['error']}")
+    print(f"  wall time: {wall:.2f} s  throughput: {outcomes['ok'] / wall:.1f} calls/s")
+    if latencies:
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(
+            f"  latency ms: min {ordered[0]:.1f}  p50 {statistics.median(ordered):.1f}  "
+            f"p95 {p95:.1f}  max {ordered[-1]:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Test batch execution with server-side fan-out."""
+
+import asyncio
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp.connector_manager import MAX_BATCH_ITEMS, ConnectorManager
+from airbyte_agent_mcp.models import BatchItem, Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+
+
+@pytest.fixture
+def manager():
+    config = Config(
+        connectors=[
+            ConnectorConfig(id="stripe", type=ConnectorType.LOCAL, path="/tmp/stripe.yaml"),
+            ConnectorConfig(id="github", type=ConnectorType.LOCAL, path="/tmp/github.yaml"),
+        ]
+    )
+    return ConnectorManager(config, MagicMock())
+
+
+def items(*specs: tuple[str, str]) -> list[BatchItem]:
+    return [BatchItem(connector_id=connector_id, entity="records", action="get", params={"id": record_id}) for connector_id, record_id in specs]
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_concurrently_with_per_connector_caps(manager):
+    running: dict[str, int] = defaultdict(int)
+    peak: dict[str, int] = defaultdict(int)
+
+    async def fake_execute(connector_id, entity, action, params, **kwargs):
+        running[connector_id] += 1
+        peak[connector_id] = max(peak[connector_id], running[connector_id])
+        # Later items finish first, so results must be put back in request order
+        await asyncio.sleep(0.05 / int(params["id"]))
+        running[connector_id] -= 1
+        return {"id": params["id"], "connector": connector_id}
+
+    manager.execute = fake_execute
+    batch = items(*[("stripe", str(i)) for i in range(1, 7)], ("github", "1"), ("github", "2"))
+
+    results, timed_out = await manager.execute_batch(batch, max_concurrency_per_connector=2)
+
+    assert not timed_out
+    assert [(r.connector_id, r.data["id"]) for r in results] == [(item.connector_id, item.params["id"]) for item in batch]
+    assert all(r.success for r in results)
+    assert dict(peak) == {"stripe": 2, "github": 2}
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failures_per_item(manager):
+    async def fake_execute(connector_id, entity, action, params, **kwargs):
+        if params["id"] == "bad":
+            raise Exception("404 Not Found")
+        return {"id": params["id"]}
+
+    manager.execute = fake_execute
+
+    results, _ = await manager.execute_batch(items(("stripe", "1"), ("stripe", "bad"), ("github", "2")))
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == {"type": "unknown", "message": "404 Not Found"}
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout_returns_partial_results(manager):
+    cancelled = []
+
+    async def fake_execute(connector_id, entity, action, params, **kwargs):
+        try:
+            await asyncio.sleep(0 if params["id"] == "fast" else 10)
+        except asyncio.CancelledError:
+            cancelled.append(params["id"])
+            raise
+        return {"id": params["id"]}
+
+    manager.execute = fake_execute
+
+    results, timed_out = await manager.execute_batch(items(("stripe", "fast"), ("github", "slow")), timeout=0.1)
+
+    assert timed_out
+    assert results[0].success and results[0].data == {"id": "fast"}
+    assert not results[1].success and results[1].error["type"] == "timeout"
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_oversized_batches(manager):
+    with pytest.raises(ValueError, match="at most"):
+        await manager.execute_batch(items(*[("stripe", str(i)) for i in range(MAX_BATCH_ITEMS + 1)]))
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_tool(manager, monkeypatch):
+    async def fake_execute(connector_id, entity, action, params, **kwargs):
+        if connector_id == "github":
+            raise Exception("boom")
+        return {"id": params["id"]}
+
+    manager.execute = fake_execute
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "execute_batch",
+            {
+                "items": [
+                    {"connector_id": "stripe", "entity": "customers", "action": "get", "params": {"id": "cus_1"}},
+                    {"connector_id": "github", "entity": "issues", "action": "list"},
+                ]
+            },
+        )
+
+    response = result.structured_content
+    assert (response["succeeded"], response["failed"], response["timed_out"]) == (1, 1, False)
+    assert response["results"][0]["data"] == {"id": "cus_1"}
+    assert response["results"][1]["error"]["message"] == "boom"
@@ -0,0 +1,351 @@
+"""Tests for bulk reads and writes through x-airbyte-batch-read and x-airbyte-batch-write."""
+
+import asyncio
+import random
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import LocalExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.executor.models import ExecutorError
+from airbyte_agent_mcp._vendored.connector_sdk.http import HTTPStatusError
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Contacts
+  version: 1.0.0
+  x-airbyte-connector-name: contacts
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://contacts.example.com
+paths:
+  /contacts:
+    post:
+      operationId: contacts_Create
+      x-airbyte-entity: contacts
+      x-airbyte-action: create
+      x-airbyte-batch-write:
+        path: /contacts/batch/create
+        max_batch_size: 2
+        item_wrapper: properties
+        results_extractor: $.results
+        result_match: trace
+        trace_field: objectWriteTraceId
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                email:
+                  type: string
+      responses:
+        "201":
+          description: Created
+  /contacts/{contact_id}:
+    patch:
+      operationId: contacts_Update
+      x-airbyte-entity: contacts
+      x-airbyte-action: update
+      x-airbyte-batch-write:
+        path: /contacts/batch/update
+        item_wrapper: properties
+        results_extractor: $.results
+        result_match: id
+      parameters:
+        - name: contact_id
+          in: path
+          required: true
+          schema:
+            type: string
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                email:
+                  type: string
+      responses:
+        "200":
+          description: Success
+    get:
+      operationId: contacts_Get
+      x-airbyte-entity: contacts
+      x-airbyte-action: get
+      x-airbyte-batch-read:
+        path: /contacts/batch/read
+        ids_format: objects
+        ids_field: inputs
+        max_batch_size: 3
+        record_extractor: $.results
+      parameters:
+        - name: contact_id
+          in: path
+          required: true
+          schema:
+            type: string
+      responses:
+        "200":
+          description: Success
+  /tasks:
+    post:
+      operationId: tasks_Create
+      x-airbyte-entity: tasks
+      x-airbyte-action: create
+      x-airbyte-batch-write:
+        path: /batch
+        items_field: data.actions
+        action:
+          method: post
+          relative_path: /tasks
+        results_extractor: $.data
+        result_status_field: status_code
+        result_record_field: body.data
+        result_error_field: body.errors
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                name:
+                  type: string
+      responses:
+        "201":
+          description: Created
+  /tickets.json:
+    post:
+      operationId: tickets_Create
+      x-airbyte-entity: tickets
+      x-airbyte-action: create
+      x-airbyte-batch-write:
+        path: /tickets/create_many.json
+        items_field: tickets
+        job:
+          id_path: $.job_status.id
+          poll_path: /job_statuses/{job_id}.json
+          status_path: $.job_status.status
+          poll_interval_seconds: 0.01
+          timeout_seconds: 0.2
+        results_extractor: $.job_status.results
+        result_match: index
+        result_error_field: error
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                subject:
+                  type: string
+      responses:
+        "200":
+          description: Success
+  /notes:
+    post:
+      operationId: notes_Create
+      x-airbyte-entity: notes
+      x-airbyte-action: create
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                text:
+                  type: string
+      responses:
+        "201":
+          description: Created
+"""
+
+CONTACTS = {str(i): {"id": str(i), "email": f"{i}@example.com"} for i in range(1, 11)}
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    executor.bulk_requests = []
+    executor.single_requests = []
+    executor.failing_batches = set()
+
+    async def fake_request(method, path, params=None, json=None, **kwargs):
+        await asyncio.sleep(0)
+        if path == "/contacts/batch/read":
+            ids = [item["id"] for item in json["inputs"]]
+            executor.bulk_requests.append(ids)
+            if executor.failing_batches & set(ids):
+                raise HTTPStatusError(500, "Internal server error")
+            return {"results": [CONTACTS[i] for i in ids if i in CONTACTS]}
+        contact_id = path.rsplit("/", 1)[-1]
+        executor.single_requests.append(contact_id)
+        if contact_id not in CONTACTS:
+            raise HTTPStatusError(404, "Not found")
+        return CONTACTS[contact_id]
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_get_many_chunks_ids_and_maps_missing_to_none(executor):
+    ids = ["1", "2", "3", "4", "5", "404", "6"]
+
+    contacts = await executor.get_many("contacts", ids)
+
+    assert list(contacts) == ids
+    assert contacts["404"] is None
+    assert all(contacts[i] == CONTACTS[i] for i in ids if i != "404")
+    assert sorted(len(chunk) for chunk in executor.bulk_requests) == [1, 3, 3]
+    assert executor.single_requests == []
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_falls_back_to_single_gets(executor):
+    executor.failing_batches = {"4"}
+
+    contacts = await executor.get_many("contacts", ["1", "2", "3", "4", "5", "404"])
+
+    # Only the failed chunk is fetched one by one
+    assert sorted(executor.single_requests) == ["4", "404", "5"]
+    assert contacts["4"] == CONTACTS["4"] and contacts["5"] == CONTACTS["5"]
+    assert contacts["1"] == CONTACTS["1"] and contacts["404"] is None
+
+
+@pytest.mark.asyncio
+async def test_numeric_and_string_ids_are_fetched_once_and_both_returned(executor):
+    contacts = await executor.get_many("contacts", [10, "10", 2, 2])
+
+    assert contacts == {10: CONTACTS["10"], "10": CONTACTS["10"], 2: CONTACTS["2"]}
+    assert executor.bulk_requests == [["10", "2"]]
+    assert await executor.get_many("contacts", []) == {}
+
+
+@pytest.fixture
+def writer(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    executor.sent = []
+    executor.job_statuses = ["queued", "working", "completed"]
+
+    async def fake_request(method, path, params=None, json=None, **kwargs):
+        executor.sent.append((method, path, json))
+        if path == "/contacts/batch/create":
+            inputs = json["inputs"]
+            if any(item["properties"]["email"] == "down@example.com" for item in inputs):
+                raise HTTPStatusError(503, "Service unavailable")
+            results = [
+                {"id": f"new-{item['properties']['email']}", "objectWriteTraceId": item["objectWriteTraceId"], "properties": item["properties"]}
+                for item in inputs
+            ]
+            # The API doesn't promise input order
+            random.Random(len(executor.sent)).shuffle(results)
+            return {"results": results[::-1]}
+        if path == "/contacts/batch/update":
+            return {"results": [{"id": item["id"], "properties": item["properties"]} for item in reversed(json["inputs"]) if item["id"] != "404"]}
+        if path == "/batch":
+            results = []
+            for action in json["data"]["actions"]:
+                name = action["data"]["name"]
+                if name == "invalid":
+                    results.append({"status_code": 400, "body": {"errors": [{"message": "name is invalid"}]}})
+                elif name == "odd":
+                    results.append({"status_code": "error", "body": {}})
+                else:
+                    results.append({"status_code": 201, "body": {"data": {"gid": name, "name": name}}})
+            return {"data": results}
+        if path == "/tickets/create_many.json":
+            return {"job_status": {"id": "job-1", "status": "queued"}}
+        if path == "/job_statuses/job-1.json":
+            status = executor.job_statuses.pop(0) if len(executor.job_statuses) > 1 else executor.job_statuses[0]
+            tickets = executor.sent[0][2]["tickets"]
+            results = [{"index": i, "id": i + 100} if t["subject"] else {"index": i, "error": "Subject missing"} for i, t in enumerate(tickets)]
+            return {"job_status": {"id": "job-1", "status": status, "results": results[::-1]}}
+        if path == "/notes":
+            return {"id": json["text"]}
+        raise AssertionError(f"unexpected request {method} {path}")
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_create_many_matches_unordered_results_by_trace_id(writer):
+    emails = [f"{i}@example.com" for i in range(5)]
+
+    results = await writer.create_many("contacts", [{"email": email} for email in emails])
+
+    assert [r.data["properties"]["email"] for r in results] == emails
+    assert all(r.success for r in results)
+    assert [len(body["inputs"]) for _, _, body in writer.sent] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_reported_per_record_and_not_replayed(writer):
+    records = [{"email": "a@example.com"}, {"email": "down@example.com"}, {"email": "c@example.com"}]
+
+    results = await writer.create_many("contacts", records)
+
+    assert [r.success for r in results] == [False, False, True]
+    assert "Service unavailable" in results[0].error
+    assert len(writer.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_many_matches_by_id_and_reports_missing_results(writer):
+    records = [{"contact_id": "1", "email": "one@example.com"}, {"contact_id": "404", "email": "x@example.com"}, {"contact_id": "3", "email": "three@example.com"}]
+
+    results = await writer.update_many("contacts", records)
+
+    assert results[0].data == {"id": "1", "properties": {"email": "one@example.com"}}
+    assert results[2].data["id"] == "3"
+    assert not results[1].success and "No result" in results[1].error
+    assert writer.sent[0][2]["inputs"][0] == {"properties": {"email": "one@example.com"}, "id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_per_item_status_and_errors_in_action_envelopes(writer):
+    results = await writer.create_many("tasks", [{"name": "first"}, {"name": "invalid"}, {"name": "odd"}])
+
+    assert results[0].success and results[0].data == {"gid": "first", "name": "first"}
+    assert not results[1].success and "name is invalid" in results[1].error
+    # A non-numeric status fails only its own item
+    assert not results[2].success and results[2].error == "Status error"
+    assert writer.sent[0][2]["data"]["actions"][0] == {"method": "post", "relative_path": "/tasks", "data": {"name": "first"}}
+
+
+@pytest.mark.asyncio
+async def test_batch_job_is_polled_until_done(writer):
+    results = await writer.create_many("tickets", [{"subject": "Printer"}, {"subject": ""}])
+
+    assert results[0].data == {"index": 0, "id": 100}
+    assert not results[1].success and results[1].error == "Subject missing"
+    assert [path for _, path, _ in writer.sent].count("/job_statuses/job-1.json") == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_or_stuck_batch_job_fails_the_chunk(writer):
+    writer.job_statuses = ["failed"]
+    results = await writer.create_many("tickets", [{"subject": "Printer"}])
+    assert not results[0].success and "ended with status failed" in results[0].error
+
+    writer.job_statuses = ["working"]
+    with pytest.raises(ExecutorError, match="did not finish"):
+        await writer._wait_for_batch_job(writer._get_endpoint("tickets", "create").batch_write.job, {"job_status": {"id": "job-1"}})
+    with pytest.raises(ExecutorError, match="No job ID"):
+        await writer._wait_for_batch_job(writer._get_endpoint("tickets", "create").batch_write.job, {})
+
+
+@pytest.mark.asyncio
+async def test_entities_without_batch_write_fall_back_to_single_creates(writer):
+    results = await writer.create_many("notes", [{"text": "a"}, {"text": "b"}])
+
+    assert [r.data for r in results] == [{"id": "a"}, {"id": "b"}]
+    assert [path for _, path, _ in writer.sent] == ["/notes", "/notes"]
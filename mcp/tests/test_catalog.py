@@ -0,0 +1,138 @@
+"""Tests for the precomputed connector catalog."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+
+from .test_pagination import CONNECTOR_YAML
+
+URL_V1 = "https://connectors.airbyte.ai/definitions/items/1.0.0/connector.yaml"
+URL_V2 = "https://connectors.airbyte.ai/definitions/items/2.0.0/connector.yaml"
+
+
+def make_manager(*connectors: ConnectorConfig) -> ConnectorManager:
+    manager = ConnectorManager(Config(connectors=list(connectors)), MagicMock(), registry_client=MagicMock())
+    parse = manager.describe_definition
+    manager.parsed = []
+
+    def counting_describe(path):
+        manager.parsed.append(path)
+        return parse(path)
+
+    manager.describe_definition = counting_describe
+    return manager
+
+
+@pytest.fixture
+def connector_path(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_build_then_describe_without_parsing(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path)))
+
+    load_times = await manager.catalog.build()
+    first = await manager.catalog.describe("items")
+    second = await manager.catalog.describe("items")
+
+    assert list(load_times) == ["items"] and load_times["items"] > 0
+    assert first is second
+    assert first["entities"][0]["entity_name"] == "items"
+    assert manager.parsed == [str(connector_path)]
+    assert manager.catalog.discover() is manager.catalog.discover()
+
+
+@pytest.mark.asyncio
+async def test_local_definition_change_rebuilds_entry(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path)))
+    first = await manager.catalog.describe("items")
+
+    connector_path.write_text(CONNECTOR_YAML.replace("x-airbyte-entity: items", "x-airbyte-entity: things"))
+    stat = connector_path.stat()
+    os.utime(connector_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = await manager.catalog.describe("items")
+
+    assert second is not first
+    assert second["entities"][0]["entity_name"] == "things"
+    assert len(manager.parsed) == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_version_change_rebuilds_entry(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, connector_name="items"))
+    manager.catalog.registry_check_interval = 0
+    registry = manager.registry_client
+    registry.resolve_connector_url = AsyncMock(return_value=URL_V1)
+    registry.download_url = AsyncMock(return_value=connector_path)
+
+    first = await manager.catalog.describe("items")
+    assert await manager.catalog.describe("items") is first
+
+    # An unreachable registry keeps the cached definition
+    registry.resolve_connector_url.side_effect = OSError("offline")
+    assert await manager.catalog.describe("items") is first
+
+    registry.resolve_connector_url.side_effect = None
+    registry.resolve_connector_url.return_value = URL_V2
+    assert await manager.catalog.describe("items") is not first
+    assert [call.args[0] for call in registry.download_url.await_args_list] == [URL_V1, URL_V2]
+
+
+@pytest.mark.asyncio
+async def test_pinned_registry_version_is_never_rechecked(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, connector_name="items", version="1.0.0"))
+    manager.catalog.registry_check_interval = 0
+    manager.registry_client.resolve_connector_url = AsyncMock(return_value=URL_V1)
+    manager.registry_client.download_connector = AsyncMock(return_value=connector_path)
+
+    await manager.catalog.build()
+    await manager.catalog.describe("items")
+
+    manager.registry_client.download_connector.assert_awaited_once_with("items", "1.0.0")
+    manager.registry_client.resolve_connector_url.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_slow_connector_times_out_and_loads_on_first_use(connector_path):
+    manager = make_manager(
+        ConnectorConfig(id="local", type=ConnectorType.LOCAL, path=str(connector_path)),
+        ConnectorConfig(id="remote", type=ConnectorType.LOCAL, connector_name="items"),
+    )
+    manager.registry_client.resolve_connector_url = AsyncMock(return_value=URL_V1)
+
+    async def slow_download(url):
+        await asyncio.sleep(10)
+
+    manager.registry_client.download_url = slow_download
+    load_times = await manager.catalog.build(timeout=0.1)
+
+    assert load_times["local"] is not None and load_times["remote"] is None
+    assert "local" in manager.catalog and "remote" not in manager.catalog
+
+    manager.registry_client.download_url = AsyncMock(return_value=connector_path)
+    assert (await manager.catalog.describe("remote"))["connector_id"] == "remote"
+
+
+@pytest.mark.asyncio
+async def test_describe_connector_tool_serves_catalog(connector_path, monkeypatch):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path)))
+    await manager.catalog.build()
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        described = await client.call_tool("describe_connector", {"connector_id": "items"})
+        missing = await client.call_tool("describe_connector", {"connector_id": "nope"})
+
+    assert described.structured_content == await manager.catalog.describe("items")
+    assert "not found" in missing.structured_content["error"]
+    assert len(manager.parsed) == 1
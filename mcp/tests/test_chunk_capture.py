@@ -0,0 +1,86 @@
+"""Tests for capturing streamed download chunks in request logs."""
+
+import base64
+import json
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import LocalExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.logging import LogSession, RequestLogger
+
+from .test_pagination import CONNECTOR_YAML
+
+CHUNKS = [bytes([i]) * (100 + i) for i in range(6)]
+
+
+def load_session(path) -> LogSession:
+    with open(path) as f:
+        return LogSession.model_validate(json.load(f))
+
+
+def test_chunks_are_kept_in_memory_by_default(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.json"))
+    for chunk in CHUNKS:
+        logger.log_chunk_fetch(chunk)
+    logger.close()
+
+    assert logger.session.chunk_logs == CHUNKS
+    assert not logger.chunk_file.exists()
+    assert list(RequestLogger.iter_chunks(load_session(tmp_path / "session.json"), tmp_path)) == CHUNKS
+
+
+def test_spilled_chunks_round_trip_through_the_sidecar(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.json"), chunk_capture="spill")
+    for chunk in CHUNKS:
+        logger.log_chunk_fetch(chunk)
+    logger.close()
+
+    session = load_session(tmp_path / "session.json")
+    assert session.chunk_logs == [] and session.chunk_file == "session.chunks.bin"
+    assert [ref.sequence for ref in session.chunk_refs] == list(range(6))
+    assert list(RequestLogger.iter_chunks(session, tmp_path)) == CHUNKS
+
+
+def test_chunk_refs_stay_bounded(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.json"), chunk_capture="spill", max_chunk_refs=2)
+    for chunk in CHUNKS:
+        logger.log_chunk_fetch(chunk)
+    logger.close()
+
+    session = load_session(tmp_path / "session.json")
+    assert len(session.chunk_refs) == 2
+    assert session.chunk_refs[1].chunks == 5
+    assert session.chunk_refs[1].length == sum(len(chunk) for chunk in CHUNKS[1:])
+    assert b"".join(RequestLogger.iter_chunks(session, tmp_path)) == b"".join(CHUNKS)
+
+
+def test_sampling_and_byte_cap(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.json"), chunk_capture="spill", chunk_sample_every=2, max_chunk_bytes=250)
+    for chunk in CHUNKS:
+        logger.log_chunk_fetch(chunk)
+    logger.close()
+
+    session = load_session(tmp_path / "session.json")
+    # Every other chunk is captured, the last one truncated at the cap
+    assert [(ref.sequence, ref.length, ref.original_length) for ref in session.chunk_refs] == [(0, 100, 100), (2, 102, 102), (4, 48, 104)]
+    assert (session.chunks_seen, session.chunks_dropped) == (6, 3)
+
+
+def test_jsonl_memory_capture_streams_chunks_to_the_log(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.jsonl"), log_format="jsonl")
+    for chunk in CHUNKS[:3]:
+        logger.log_chunk_fetch(chunk)
+    logger.close()
+
+    lines = [json.loads(line) for line in (tmp_path / "session.jsonl").read_text().splitlines()]
+    chunks = [line for line in lines if line["type"] == "chunk"]
+    assert logger.session.chunk_logs == []
+    assert [line["sequence"] for line in chunks] == [0, 1, 2]
+    assert [base64.b64decode(line["data"]["_base64"]) for line in chunks] == CHUNKS[:3]
+
+
+def test_executor_spills_logged_chunks_by_default(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path), enable_logging=True, log_file=str(tmp_path / "session.json"), max_chunk_refs=2)
+
+    assert (executor.logger.chunk_capture, executor.logger.max_chunk_refs) == ("spill", 2)
+    assert LocalExecutor(config_path=str(path), enable_logging=True, log_file=str(tmp_path / "other.json"), chunk_capture="off").logger.chunk_capture == "off"
@@ -0,0 +1,85 @@
+"""Test tool-call admission control and command-line parsing."""
+
+import asyncio
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from airbyte_agent_mcp.__main__ import build_parser
+from airbyte_agent_mcp.concurrency import ConcurrencyLimitMiddleware, InFlightLimiter, ServerBusyError
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_and_sheds_when_queue_is_full():
+    limiter = InFlightLimiter(max_in_flight=2, max_queued=1)
+    release = asyncio.Event()
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(call()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert (limiter.in_flight, limiter.queued) == (2, 1)
+
+    with pytest.raises(ServerBusyError):
+        async with limiter.slot():
+            pass
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert limiter.shed == 1
+    assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_limiter_queue_timeout():
+    limiter = InFlightLimiter(max_in_flight=1, max_queued=5, queue_timeout=0.01)
+
+    async with limiter.slot():
+        with pytest.raises(ServerBusyError, match="no slot free"):
+            async with limiter.slot():
+                pass
+
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_middleware_returns_busy_error_to_clients():
+    server = FastMCP("test")
+    release = asyncio.Event()
+
+    @server.tool()
+    async def slow() -> str:
+        await release.wait()
+        return "done"
+
+    server.add_middleware(ConcurrencyLimitMiddleware(InFlightLimiter(max_in_flight=1, max_queued=0)))
+
+    async with Client(server) as client:
+        first = asyncio.create_task(client.call_tool("slow", {}))
+        await asyncio.sleep(0.05)
+        busy = await client.call_tool("slow", {}, raise_on_error=False)
+        release.set()
+        done = await first
+
+    assert busy.is_error
+    assert "Server busy" in busy.content[0].text
+    assert done.data == "done"
+
+
+def test_cli_keeps_positional_paths_and_defaults_to_stdio():
+    args = build_parser().parse_args(["connectors.yaml", "secrets.env"])
+
+    assert (args.config_path, args.dotenv_path, args.transport) == ("connectors.yaml", "secrets.env", "stdio")
+
+
+def test_cli_http_options():
+    args = build_parser().parse_args(["--transport", "http", "--port", "9000", "--max-in-flight", "8", "--max-queued", "0"])
+
+    assert args.config_path == "configured_connectors.yaml"
+    assert (args.transport, args.port, args.max_in_flight, args.max_queued) == ("http", 9000, 8, 0)
@@ -0,0 +1,108 @@
+"""Tests for executing many operations with per-item results."""
+
+import asyncio
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig
+from airbyte_agent_mcp._vendored.connector_sdk.http import HTTPStatusError
+
+from .test_pagination import CONNECTOR_YAML, make_executor
+
+DELAYS = {"slow": 0.04, "medium": 0.02, "fast": 0.0}
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = make_executor(path)
+    executor.finished = []
+
+    async def fake_request(method, path, params=None, **kwargs):
+        executor.requests.append(dict(params))
+        executor.in_flight += 1
+        executor.peak_in_flight = max(executor.peak_in_flight, executor.in_flight)
+        try:
+            await asyncio.sleep(DELAYS.get(params["color"], 0.01))
+            executor.finished.append(params["color"])
+            if params["color"] == "broken":
+                raise HTTPStatusError(500, "Internal server error")
+            return {"items": [{"id": 1, "color": params["color"]}], "next": None}
+        finally:
+            executor.in_flight -= 1
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+def list_items(color: str) -> ExecutionConfig:
+    return ExecutionConfig(entity="items", action="list", params={"color": color, "limit": 1})
+
+
+@pytest.mark.asyncio
+async def test_results_keep_input_order_and_failures_stay_per_item(executor):
+    configs = [list_items(color) for color in ("slow", "broken", "medium", "fast")]
+
+    batch = await executor.execute_many(configs)
+
+    assert [r.success for r in batch.results] == [True, False, True, True]
+    assert [r.data[0]["color"] for r in batch.results if r.success] == ["slow", "medium", "fast"]
+    assert batch.results[1].error
+    assert (batch.stats.total, batch.stats.unique, batch.stats.succeeded, batch.stats.failed) == (4, 4, 3, 1)
+    assert 0 < batch.stats.min_ms <= batch.stats.p50_ms <= batch.stats.max_ms
+
+
+@pytest.mark.asyncio
+async def test_duplicates_run_once_and_get_their_own_copy(executor):
+    configs = [list_items("red"), list_items("blue"), list_items("red"), ExecutionConfig(entity="items", action="list", params={"limit": 1, "color": "red"})]
+
+    batch = await executor.execute_many(configs)
+
+    assert len(executor.requests) == 2
+    assert (batch.stats.unique, batch.stats.deduplicated) == (2, 2)
+    first, _, second, third = batch.results
+    assert first.data == second.data == third.data
+    first.data[0]["color"] = "changed"
+    assert second.data[0]["color"] == third.data[0]["color"] == "red"
+
+    await executor.execute_many([list_items("red"), list_items("red")], dedupe=False)
+    assert len(executor.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap(executor):
+    configs = [list_items(f"color-{i}") for i in range(10)]
+
+    batch = await executor.execute_many(configs, max_concurrency=3)
+
+    assert all(r.success for r in batch.results)
+    assert executor.peak_in_flight == 3
+    assert batch.stats.max_concurrency == 3
+    with pytest.raises(ValueError):
+        await executor.execute_many(configs, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_as_completed_yields_fastest_first_with_input_indices(executor):
+    configs = [list_items("slow"), list_items("medium"), list_items("fast"), list_items("fast")]
+
+    order = [(index, result.data[0]["color"]) async for index, result in executor.execute_as_completed(configs)]
+
+    assert order[0][1] == order[1][1] == "fast" and {order[0][0], order[1][0]} == {2, 3}
+    assert order[2:] == [(1, "medium"), (0, "slow")]
+
+
+@pytest.mark.asyncio
+async def test_breaking_out_of_as_completed_cancels_the_rest(executor):
+    configs = [list_items("fast"), list_items("slow"), list_items("medium")]
+
+    results = executor.execute_as_completed(configs)
+    async for index, _ in results:
+        assert index == 0
+        break
+    await results.aclose()
+    await asyncio.sleep(0.06)
+
+    assert len(executor.requests) == 3
+    assert executor.finished == ["fast"] and executor.in_flight == 0
@@ -0,0 +1,210 @@
+"""Tests for where= filter pushdown (x-airbyte-filters)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, LocalExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.executor.filters import apply_pushdown, parse_where, plan
+from airbyte_agent_mcp._vendored.connector_sdk.schema import FiltersConfig
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Code Host
+  version: 1.0.0
+  x-airbyte-connector-name: codehost
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://codehost.example.com
+paths:
+  /search/repositories:
+    get:
+      operationId: repositories_Search
+      x-airbyte-entity: repositories
+      x-airbyte-action: search
+      x-airbyte-record-extractor: $.items
+      x-airbyte-meta-extractor:
+        total_count: $.total_count
+      x-airbyte-pagination:
+        style: page
+        page_param: page
+        limit_param: per_page
+        default_page_size: 3
+      x-airbyte-filters:
+        style: query
+        query_param: q
+        fields:
+          stargazers_count:
+            operators: {gt: "stars:>{value}", gte: "stars:>={value}"}
+          language:
+            operators: {eq: "language:{value}"}
+      parameters:
+        - name: q
+          in: query
+          schema:
+            type: string
+        - name: page
+          in: query
+          schema:
+            type: integer
+        - name: per_page
+          in: query
+          schema:
+            type: integer
+      responses:
+        "200":
+          description: Success
+"""
+
+REPOS = [{"id": i, "language": "go" if i % 2 else "python", "stargazers_count": i * 30, "archived": i % 3 == 0} for i in range(1, 21)]
+
+
+def _search(q):
+    """Tiny server-side evaluator for the qualifiers the spec declares."""
+    repos = REPOS
+    for qualifier in (q or "").split():
+        key, _, value = qualifier.partition(":")
+        if key == "language":
+            repos = [r for r in repos if r["language"] == value]
+        elif key == "stars" and value.startswith(">="):
+            repos = [r for r in repos if r["stargazers_count"] >= int(value[2:])]
+        elif key == "stars" and value.startswith(">"):
+            repos = [r for r in repos if r["stargazers_count"] > int(value[1:])]
+    return repos
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    executor.requests = []
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        executor.requests.append(dict(params))
+        page, per_page = int(params.get("page") or 1), int(params["per_page"])
+        matching = _search(params.get("q"))
+        return {"items": matching[(page - 1) * per_page : page * per_page], "total_count": len(matching)}
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_supported_predicates_are_pushed_into_the_query(executor):
+    result = await executor.execute(
+        ExecutionConfig(entity="repositories", action="search", where={"stargazers_count": {"gt": 300}, "language": "go"}, limit=2)
+    )
+
+    assert result.success
+    assert [r["id"] for r in result.data] == [11, 13]
+    assert executor.requests == [{"q": "stars:>300 language:go", "per_page": 2}]
+    assert result.meta["filtered_locally"] == []
+
+
+@pytest.mark.asyncio
+async def test_residual_predicates_filter_while_paging_and_stop_at_limit(executor):
+    result = await executor.execute(
+        ExecutionConfig(entity="repositories", action="search", where={"language": "go", "archived": False, "id": {"lte": 15}}, limit=3)
+    )
+
+    # Go repos 1, 3, 5, 7 ... minus archived (multiples of 3)
+    assert [r["id"] for r in result.data] == [1, 5, 7]
+    assert result.meta["pushed_down"] == ["language eq 'go'"]
+    assert len(result.meta["filtered_locally"]) == 2
+    # Two pages of three were enough; the remaining pages were never requested
+    assert [request.get("page") for request in executor.requests] == [None, 2]
+
+
+@pytest.mark.asyncio
+async def test_limit_alone_paginates_until_reached(executor):
+    result = await executor.execute(ExecutionConfig(entity="repositories", action="search", limit=7))
+
+    assert [r["id"] for r in result.data] == list(range(1, 8))
+    assert result.meta["pages"] == 3
+    assert result.meta["total_count"] == 20
+
+    # The cursor continues after the last returned record, in the middle of the third page
+    rest = await executor.paginate("repositories", "search", cursor=result.meta["next_cursor"], max_records=5)
+    assert [r["id"] for r in rest.records] == list(range(8, 13))
+
+
+@pytest.mark.asyncio
+async def test_limit_keeps_cursor_only_without_local_filters(executor):
+    page_end = await executor.execute(ExecutionConfig(entity="repositories", action="search", limit=3))
+    rest = await executor.paginate("repositories", "search", cursor=page_end.meta["next_cursor"], max_records=2)
+    assert [r["id"] for r in rest.records] == [4, 5]
+
+    everything = await executor.execute(ExecutionConfig(entity="repositories", action="search", limit=50))
+    assert len(everything.data) == 20 and everything.meta["next_cursor"] is None
+
+    filtered = await executor.execute(ExecutionConfig(entity="repositories", action="search", where={"archived": False}, limit=2))
+    assert filtered.meta["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_operator_is_rejected(executor):
+    bad_operator = await executor.execute(ExecutionConfig(entity="repositories", action="search", where={"language": {"like": "g%"}}))
+    assert not bad_operator.success
+    assert "Unknown operator" in bad_operator.error
+
+
+def test_filter_groups_pushdown():
+    config = FiltersConfig(
+        style="filter_groups",
+        filter_groups_param="filterGroups",
+        fields={
+            "properties.company": {"property": "company", "operators": {"eq": "EQ", "in": "IN"}},
+            "properties.createdate": {"property": "createdate", "operators": {"gte": "GTE"}},
+        },
+    )
+    predicates = parse_where({"properties.company": ["ACME", "Initech"], "properties.createdate": {"gte": "2024-01-01"}, "email": {"contains": "@"}})
+
+    pushed, residual = plan(predicates, config, {})
+    params = apply_pushdown({"filterGroups": [{"filters": [{"propertyName": "lifecyclestage", "operator": "EQ", "value": "lead"}]}]}, config, pushed)
+
+    assert [str(p) for p in residual] == ["email contains '@'"]
+    assert params["filterGroups"][0]["filters"] == [
+        {"propertyName": "lifecyclestage", "operator": "EQ", "value": "lead"},
+        {"propertyName": "company", "operator": "IN", "values": ["ACME", "Initech"]},
+        {"propertyName": "createdate", "operator": "GTE", "value": "2024-01-01"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_where_without_limit_reports_more_matches(executor, monkeypatch):
+    monkeypatch.setattr("airbyte_agent_mcp._vendored.connector_sdk.executor.local_executor.DEFAULT_WHERE_LIMIT", 3)
+
+    capped = await executor.execute(ExecutionConfig(entity="repositories", action="search", where={"archived": False}))
+    assert [r["id"] for r in capped.data] == [1, 2, 4]
+    assert capped.meta["has_more"] and capped.meta["next_cursor"] is None
+
+    complete = await executor.execute(ExecutionConfig(entity="repositories", action="search", where={"archived": False, "id": {"lte": 4}}, limit=5))
+    assert [r["id"] for r in complete.data] == [1, 2, 4]
+    assert not complete.meta["has_more"]
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_returns_has_more_and_cursor(executor, tmp_path, monkeypatch):
+    path = tmp_path / "codehost.yaml"
+    path.write_text(CONNECTOR_YAML)
+    manager = ConnectorManager(Config(connectors=[ConnectorConfig(id="codehost", type=ConnectorType.LOCAL, path=str(path))]), MagicMock())
+    manager._create_yaml_connector = lambda path, secrets: executor
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        limited = await client.call_tool("execute", {"connector_id": "codehost", "entity": "repositories", "action": "search", "limit": 2})
+        filtered = await client.call_tool(
+            "execute", {"connector_id": "codehost", "entity": "repositories", "action": "search", "where": {"archived": False}, "limit": 2}
+        )
+
+    assert limited.structured_content["has_more"] and limited.structured_content["next_cursor"]
+    assert filtered.structured_content["has_more"] and filtered.structured_content["next_cursor"] is None
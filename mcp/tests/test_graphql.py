@@ -0,0 +1,215 @@
+"""Tests for compiled GraphQL bodies and merging concurrent queries into aliased documents."""
+
+import asyncio
+import re
+from unittest.mock import AsyncMock
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import LocalExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.executor.graphql import (
+    CompiledGraphQLBody,
+    GraphQLBatcher,
+    merge_operations,
+    parse_operation,
+    split_response,
+)
+from airbyte_agent_mcp._vendored.connector_sdk.http import HTTPStatusError
+
+from .test_pagination import CONNECTOR_YAML
+
+REPOSITORY_QUERY = "query GetRepository($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { id name } }"
+
+
+def repository_body(name: str) -> dict:
+    return {"query": REPOSITORY_QUERY, "variables": {"owner": "airbyte", "name": name}}
+
+
+@pytest.fixture
+def compiled():
+    return CompiledGraphQLBody(
+        {
+            "query": """
+                query GetRepository($owner: String!, $name: String!) {
+                  repository(owner: $owner, name: $name) {
+                    {{ fields }}
+                  }
+                }
+            """,
+            "variables": {"owner": "{{ owner }}", "name": "{{ repo }}", "search": "repo:{{ owner }}/{{ repo }}", "after": "{{ after }}"},
+            "default_fields": "id name primaryLanguage { name }",
+        }
+    )
+
+
+def test_compiled_body_uses_minified_default_fields(compiled):
+    body = compiled.build({"owner": "airbyte", "repo": "airbyte"})
+
+    assert body["query"] == "query GetRepository($owner:String!,$name:String!){repository(owner:$owner,name:$name){id name primaryLanguage{name}}}"
+
+
+def test_compiled_body_renders_explicit_fields(compiled):
+    body = compiled.build({"owner": "airbyte", "repo": "airbyte", "fields": ["id", "owner.login"]})
+
+    assert body["query"].endswith("{repository(owner:$owner,name:$name){id owner{login}}}")
+
+
+def test_compiled_body_interpolates_variables(compiled):
+    body = compiled.build({"owner": "airbyte", "repo": 42})
+
+    # Whole-value placeholders keep the param's type; missing params become None
+    assert body["variables"] == {"owner": "airbyte", "name": 42, "search": "repo:airbyte/42", "after": None}
+
+
+def test_merge_aliases_fields_and_renames_variables():
+    merged, field_maps = merge_operations([repository_body("a"), repository_body("b")])
+
+    assert "b0_repository: repository(owner: $b0_owner, name: $b0_name)" in merged["query"]
+    assert "b1_repository: repository(owner: $b1_owner, name: $b1_name)" in merged["query"]
+    assert merged["variables"] == {"b0_owner": "airbyte", "b0_name": "a", "b1_owner": "airbyte", "b1_name": "b"}
+    assert field_maps == [{"b0_repository": "repository"}, {"b1_repository": "repository"}]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "mutation { createIssue(title: $t) { id } }",
+        "query { ...RepoFields } fragment RepoFields on Repository { id }",
+        "query A { a { id } } query B { b { id } }",
+    ],
+)
+def test_unmergeable_queries_are_rejected(query):
+    assert parse_operation(query, "b0_") is None
+
+
+def test_split_response_routes_data_and_errors_to_each_caller():
+    response = {
+        "data": {"b0_repository": {"id": 1}, "b1_repository": None},
+        "errors": [{"message": "not found", "path": ["b1_repository"]}],
+    }
+
+    assert split_response(response, {"b0_repository": "repository"}) == {"data": {"repository": {"id": 1}}}
+    assert split_response(response, {"b1_repository": "repository"}) == {
+        "data": {"repository": None},
+        "errors": [{"message": "not found", "path": ["repository"]}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_batcher_sends_concurrent_queries_as_one_document():
+    sent = []
+
+    async def send(body):
+        sent.append(body)
+        aliases = re.findall(r"(b\d+_repository):", body["query"])
+        return {"data": {alias: {"name": body["variables"][f"{alias.split('_')[0]}_name"]} for alias in aliases}}
+
+    batcher = GraphQLBatcher(window_ms=5, max_batch_size=3)
+    responses = await asyncio.gather(*(batcher.execute(repository_body(name), send) for name in "abcde"))
+
+    assert [r["data"]["repository"]["name"] for r in responses] == list("abcde")
+    # Five queries with a batch size of three: one full batch, one partial
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_batcher_respects_cost_budget():
+    sent = []
+
+    async def send(body):
+        sent.append(body)
+        return {"data": {}}
+
+    query = "query($first: Int) { issues(first: $first) { nodes { id } } }"
+    batcher = GraphQLBatcher(window_ms=5, max_cost=120)
+    await asyncio.gather(*(batcher.execute({"query": query, "variables": {"first": 50}}, send) for _ in range(4)))
+
+    # Each query costs ~52, so at most two fit in one document
+    assert len(sent) == 2
+
+
+def answer_each(sent):
+    """send() that answers every aliased repository field, or a lone query's, with its name."""
+
+    async def send(body):
+        sent.append(body)
+        if "Batched" not in body["query"]:
+            if body["variables"]["name"] is None:
+                return {"errors": [{"message": "Variable $name of type String! was provided invalid value"}]}
+            return {"data": {"repository": {"name": body["variables"]["name"]}}}
+        if any(value is None for value in body["variables"].values()):
+            return {"errors": [{"message": "Variable $b1_name of type String! was provided invalid value"}]}
+        aliases = re.findall(r"(b\d+_repository):", body["query"])
+        return {"data": {alias: {"name": body["variables"][f"{alias.split('_')[0]}_name"]} for alias in aliases}}
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_document_error_in_merged_batch_resends_each_query():
+    sent = []
+    batcher = GraphQLBatcher(window_ms=5)
+    bodies = [repository_body("a"), repository_body(None), repository_body("c")]
+
+    responses = await asyncio.gather(*(batcher.execute(body, answer_each(sent)) for body in bodies))
+
+    assert responses[0] == {"data": {"repository": {"name": "a"}}}
+    assert "invalid value" in responses[1]["errors"][0]["message"]
+    assert responses[2] == {"data": {"repository": {"name": "c"}}}
+    # The merged document, then each query on its own
+    assert len(sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_merged_request_resends_each_query():
+    sent = []
+    answer = answer_each(sent)
+
+    async def send(body):
+        if "Batched" in body["query"]:
+            sent.append(body)
+            raise HTTPStatusError(400, "Bad request")
+        if body["variables"]["name"] == "b":
+            raise HTTPStatusError(404, "Not found")
+        return await answer(body)
+
+    batcher = GraphQLBatcher(window_ms=5)
+    responses = await asyncio.gather(*(batcher.execute(repository_body(name), send) for name in "abc"), return_exceptions=True)
+
+    assert responses[0] == {"data": {"repository": {"name": "a"}}}
+    assert isinstance(responses[1], HTTPStatusError) and responses[1].status_code == 404
+    assert responses[2] == {"data": {"repository": {"name": "c"}}}
+    assert len(sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_field_errors_stay_with_their_query():
+    sent = []
+
+    async def send(body):
+        sent.append(body)
+        return {"data": {"b0_repository": {"name": "a"}, "b1_repository": None}, "errors": [{"message": "not found", "path": ["b1_repository"]}]}
+
+    batcher = GraphQLBatcher(window_ms=5)
+    first, second = await asyncio.gather(*(batcher.execute(repository_body(name), send) for name in "ab"))
+
+    assert first == {"data": {"repository": {"name": "a"}}}
+    assert second["errors"] == [{"message": "not found", "path": ["repository"]}]
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_queries_with_query_params_are_sent_alone(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path), graphql_batch_window_ms=5)
+    executor.http_client.request = AsyncMock(return_value={"data": {"repository": {"name": "a"}}})
+
+    await asyncio.gather(
+        executor._send_graphql("POST", "/graphql", repository_body("a"), {"org": "airbyte"}),
+        executor._send_graphql("POST", "/graphql", repository_body("a"), {"org": "other"}),
+    )
+
+    sent = executor.http_client.request.await_args_list
+    assert sorted(call.kwargs["params"]["org"] for call in sent) == ["airbyte", "other"]
+    assert all(call.kwargs["json"]["query"] == REPOSITORY_QUERY for call in sent)
@@ -0,0 +1,301 @@
+"""Tests for HostedExecutor: batch execution against a local stand-in backend, retries and compression."""
+
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.constants import DEFAULT_GZIP_MIN_BYTES
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, HostedExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.executor import hosted_executor
+from airbyte_agent_mcp._vendored.connector_sdk.http_client import calculate_retry_delay
+from airbyte_agent_mcp._vendored.connector_sdk.schema.extensions import RetryConfig
+
+
+class StandInBackend(ThreadingHTTPServer):
+    """Minimal hosted backend: single execute, batch execute (NDJSON) and capabilities."""
+
+    daemon_threads = True
+
+    def __init__(self, batch_enabled: bool):
+        self.batch_enabled = batch_enabled
+        self.requests: list[str] = []
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def _execute(request: dict) -> dict:
+    """Fake operation: echo params, fail for entity "broken"."""
+    if request["entity"] == "broken":
+        return {"success": False, "data": {}, "error": "entity broken"}
+    return {"success": True, "data": {"entity": request["entity"], "params": request["params"]}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInBackend
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return json.loads(body)
+
+    def do_GET(self):
+        self.server.requests.append(f"GET {self.path}")
+        if self.path.endswith("/capabilities") and self.server.batch_enabled:
+            self._send(200, json.dumps({"batch_execute": True}).encode())
+        else:
+            self._send(404, b"{}")
+
+    def do_POST(self):
+        self.server.requests.append(f"POST {self.path}")
+        request = self._read_json()
+        if self.path.endswith("/execute/batch"):
+            # Answer in reverse order to exercise out-of-order streaming
+            lines = [
+                json.dumps({"index": i, **_execute(item)})
+                for i, item in reversed(list(enumerate(request["requests"])))
+            ]
+            self._send(200, ("\n".join(lines) + "\n").encode(), "application/x-ndjson")
+        elif self.path.endswith("/execute"):
+            result = _execute(request)
+            if result["success"]:
+                self._send(200, json.dumps(result["data"]).encode())
+            else:
+                self._send(400, json.dumps({"detail": result["error"]}).encode())
+        else:
+            self._send(404, b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(params=[True, False], ids=["batch", "fallback"])
+def backend(request):
+    server = StandInBackend(batch_enabled=request.param)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def configs():
+    return [ExecutionConfig(entity="customers", action="get", params={"id": str(i)}) for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_returns_results_in_input_order(backend, configs):
+    """Results line up with configs whether batched or sent individually."""
+    async with HostedExecutor("conn-1", "id", "secret", api_url=backend.url) as executor:
+        results = await executor.execute_batch(configs, batch_size=2)
+
+    assert [r.success for r in results] == [True] * 5
+    assert [r.data["params"]["id"] for r in results] == ["0", "1", "2", "3", "4"]
+
+    posts = [r for r in backend.requests if r.startswith("POST")]
+    if backend.batch_enabled:
+        assert posts == ["POST /connectors/conn-1/execute/batch"] * 3
+    else:
+        assert posts == ["POST /connectors/conn-1/execute"] * 5
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_reports_failures_per_item(backend, configs):
+    """One failing operation doesn't fail the others."""
+    configs[2] = ExecutionConfig(entity="broken", action="get", params={"id": "2"})
+
+    async with HostedExecutor("conn-1", "id", "secret", api_url=backend.url) as executor:
+        results = await executor.execute_batch(configs)
+
+    assert [r.success for r in results] == [True, True, False, True, True]
+    assert results[2].error
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_yields_every_index_once(backend, configs):
+    """iter_batch streams (index, result) pairs covering each config exactly once."""
+    async with HostedExecutor("conn-1", "id", "secret", api_url=backend.url) as executor:
+        seen = [index async for index, _ in executor.iter_batch(configs)]
+
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+    if backend.batch_enabled:
+        # The stand-in answers in reverse order; results are yielded as they arrive
+        assert seen == [4, 3, 2, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_capabilities_probe_is_cached(backend, configs):
+    """The backend is probed for batch support only once per executor."""
+    async with HostedExecutor("conn-1", "id", "secret", api_url=backend.url) as executor:
+        await executor.execute_batch(configs)
+        await executor.execute_batch(configs)
+
+    assert backend.requests.count("GET /connectors/conn-1/capabilities") == 1
+
+
+class FlakyBackend:
+    """httpx transport answering each request from a script of responses or exceptions."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.script.pop(0) if len(self.script) > 1 else self.script[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        return httpx.Response(status, json={"ok": status < 400}, headers=headers)
+
+
+def flaky_executor(backend: FlakyBackend, monkeypatch, **kwargs) -> tuple[HostedExecutor, list[float]]:
+    delays: list[float] = []
+
+    def recording_delay(*args):
+        delays.append(calculate_retry_delay(*args))
+        return delays[-1]
+
+    monkeypatch.setattr(hosted_executor, "calculate_retry_delay", recording_delay)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(backend))
+    retry_config = RetryConfig(initial_delay_seconds=0.01, jitter=False)
+    return HostedExecutor("conn-1", "id", "secret", api_url="http://backend", client=client, retry_config=retry_config, **kwargs), delays
+
+
+READ = ExecutionConfig(entity="customers", action="list", params={})
+WRITE = ExecutionConfig(entity="customers", action="create", params={"email": "a@example.com"})
+
+
+@pytest.mark.asyncio
+async def test_reads_are_retried_with_backoff(monkeypatch):
+    backend = FlakyBackend(503, (429, {"Retry-After": "0.05"}), 200)
+    executor, delays = flaky_executor(backend, monkeypatch)
+
+    result = await executor.execute(READ)
+
+    assert result.success and len(backend.requests) == 3
+    # Exponential backoff, then the server's Retry-After
+    assert delays == [0.01, 0.05]
+
+    backend.script = [500]
+    with pytest.raises(httpx.HTTPStatusError):
+        await executor.execute(READ)
+    assert len(backend.requests) == 6
+
+
+@pytest.mark.asyncio
+async def test_writes_are_retried_only_when_the_backend_cannot_have_run_them(monkeypatch):
+    backend = FlakyBackend(503, 200)
+    executor, _ = flaky_executor(backend, monkeypatch)
+    with pytest.raises(httpx.HTTPStatusError):
+        await executor.execute(WRITE)
+    assert len(backend.requests) == 1
+
+    backend.script = [httpx.ReadTimeout("timed out"), 200]
+    with pytest.raises(httpx.ReadTimeout):
+        await executor.execute(WRITE)
+    assert len(backend.requests) == 2
+
+    backend.script = [429, httpx.ConnectError("connection refused"), 200]
+    assert (await executor.execute(WRITE)).success
+    assert len(backend.requests) == 5
+
+
+@pytest.mark.asyncio
+async def test_large_request_bodies_are_gzipped(monkeypatch):
+    backend = FlakyBackend(200)
+    executor, _ = flaky_executor(backend, monkeypatch)
+    large = ExecutionConfig(entity="customers", action="search", params={"query": "x" * DEFAULT_GZIP_MIN_BYTES})
+
+    await executor.execute(READ)
+    await executor.execute(large)
+    small_request, large_request = backend.requests
+
+    assert "content-encoding" not in small_request.headers
+    assert large_request.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(large_request.content))["params"] == large.params
+
+    executor, _ = flaky_executor(backend, monkeypatch, compress_requests=False)
+    await executor.execute(large)
+    assert "content-encoding" not in backend.requests[-1].headers
+
+
+def test_close_works_without_await():
+    executor = HostedExecutor("conn-1", "id", "secret", api_url="http://backend")
+    assert executor.close() is None
+    assert executor.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_close_inside_event_loop_with_or_without_await():
+    executor = HostedExecutor("conn-1", "id", "secret", api_url="http://backend")
+    await executor.close()
+    assert executor.client.is_closed
+
+    executor = HostedExecutor("conn-1", "id", "secret", api_url="http://backend")
+    executor.close()
+    await asyncio.sleep(0)
+    assert executor.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_capabilities_probe_retries_after_transient_failure(monkeypatch):
+    answers = [httpx.ConnectError("connection refused"), httpx.Response(503), httpx.Response(200, json={"batch_execute": True})]
+    probes = []
+
+    def transport(request):
+        probes.append(request.url.path)
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    now = [1000.0]
+    monkeypatch.setattr(hosted_executor.time, "monotonic", lambda: now[0])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+    executor = HostedExecutor("conn-1", "id", "secret", api_url="http://backend", client=client)
+
+    assert await executor.supports_batch() is False
+    # Not probed again until the retry delay has passed
+    assert await executor.supports_batch() is False
+    assert len(probes) == 1
+
+    now[0] += 60
+    assert await executor.supports_batch() is False
+    now[0] += 60
+    assert await executor.supports_batch() is True
+    assert await executor.supports_batch() is True
+    assert len(probes) == 3
+
+
+@pytest.mark.asyncio
+async def test_missing_capabilities_endpoint_is_a_definite_no():
+    probes = []
+
+    def transport(request):
+        probes.append(request.url.path)
+        return httpx.Response(404)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+    executor = HostedExecutor("conn-1", "id", "secret", api_url="http://backend", client=client)
+
+    assert await executor.supports_batch() is False
+    assert await executor.supports_batch() is False
+    assert probes == ["/connectors/conn-1/capabilities"]
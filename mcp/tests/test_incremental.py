@@ -0,0 +1,152 @@
+"""Tests for incremental sync (x-airbyte-incremental / LocalExecutor.sync)."""
+
+from datetime import datetime
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutorError, FileStateStore, LocalExecutor, MemoryStateStore
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Helpdesk
+  version: 1.0.0
+  x-airbyte-connector-name: helpdesk
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://helpdesk.example.com
+paths:
+  /tickets:
+    get:
+      operationId: tickets_List
+      x-airbyte-entity: tickets
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.tickets
+      x-airbyte-pagination:
+        style: offset
+        offset_param: offset
+        default_page_size: 2
+      x-airbyte-incremental:
+        cursor_field: updated_at
+        cursor_param: updated_since
+        lookback_seconds: 60
+      parameters:
+        - name: updated_since
+          in: query
+          schema:
+            type: string
+        - name: offset
+          in: query
+          schema:
+            type: integer
+        - name: limit
+          in: query
+          schema:
+            type: integer
+      responses:
+        "200":
+          description: Success
+  /users:
+    get:
+      operationId: users_List
+      x-airbyte-entity: users
+      x-airbyte-action: list
+      responses:
+        "200":
+          description: Success
+"""
+
+
+def _parse(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    executor.tickets = [
+        {"id": 1, "updated_at": "2024-01-01T10:00:00Z"},
+        {"id": 2, "updated_at": "2024-01-01T11:00:00Z"},
+        {"id": 3, "updated_at": "2024-01-01T12:00:00Z"},
+    ]
+    executor.requests = []
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        executor.requests.append(dict(params))
+        since = params.get("updated_since")
+        matching = sorted(
+            (t for t in executor.tickets if since is None or _parse(t["updated_at"]) >= _parse(since)), key=lambda t: t["updated_at"]
+        )
+        offset = int(params.get("offset") or 0)
+        return {"tickets": [dict(t) for t in matching[offset : offset + int(params["limit"])]]}
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_first_sync_reads_everything_and_stores_cursor(executor):
+    store = MemoryStateStore()
+
+    result = await executor.sync("tickets", store)
+
+    assert result.full_refresh
+    assert [t["id"] for t in result.records] == [1, 2, 3]
+    assert result.pages == 2
+    assert "updated_since" not in executor.requests[0]
+    assert store.states["helpdesk/tickets"]["cursor"] == "2024-01-01T12:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_next_sync_fetches_only_changes_with_lookback(executor):
+    store = MemoryStateStore()
+    await executor.sync("tickets", store)
+    executor.requests.clear()
+
+    unchanged = await executor.sync("tickets", store)
+    # Ticket 3 is re-read inside the 60s lookback window but hasn't changed
+    assert executor.requests[0]["updated_since"] == "2024-01-01T11:59:00Z"
+    assert unchanged.records == []
+    assert unchanged.skipped == 1
+
+    executor.tickets[0]["updated_at"] = "2024-01-01T13:00:00Z"
+    executor.tickets.append({"id": 4, "updated_at": "2024-01-01T12:30:00Z"})
+    changed = await executor.sync("tickets", store)
+
+    assert [t["id"] for t in changed.records] == [4, 1]
+    assert changed.state["cursor"] == "2024-01-01T13:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_records_are_deduplicated_by_primary_key(executor):
+    # The same ticket returned twice (e.g. updated while paging): newest version wins
+    executor.tickets.append({"id": 2, "updated_at": "2024-01-01T12:30:00Z", "status": "solved"})
+
+    result = await executor.sync("tickets", MemoryStateStore())
+
+    assert [t["id"] for t in result.records] == [1, 3, 2]
+    assert result.records[-1]["status"] == "solved"
+    assert result.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_file_state_store_persists_between_runs(executor, tmp_path):
+    path = tmp_path / "state" / "sync.json"
+    await executor.sync("tickets", FileStateStore(path))
+
+    executor.requests.clear()
+    await executor.sync("tickets", FileStateStore(path))
+
+    assert executor.requests[0]["updated_since"] == "2024-01-01T11:59:00Z"
+    assert list(path.parent.iterdir()) == [path]
+
+
+@pytest.mark.asyncio
+async def test_entity_without_incremental_is_rejected(executor):
+    with pytest.raises(ExecutorError, match="x-airbyte-incremental"):
+        await executor.sync("users", MemoryStateStore())
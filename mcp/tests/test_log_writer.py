@@ -0,0 +1,213 @@
+"""Tests for the background JSONL request log writer."""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, LocalExecutor
+from airbyte_agent_mcp._vendored.connector_sdk.logging import JSONLLogWriter, RequestLogger
+
+from .test_pagination import CONNECTOR_YAML, ITEMS
+
+
+def read_lines(path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def gate(writer):
+    """Hold the writer thread before each entry until the returned event is set."""
+    release = threading.Event()
+    write_line = writer._write_line
+
+    def held_write_line(entry):
+        release.wait()
+        write_line(entry)
+
+    writer._write_line = held_write_line
+    return release
+
+
+def test_entries_are_written_in_order(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl")
+    for i in range(100):
+        assert writer.write({"n": i})
+    writer.flush()
+
+    assert [entry["n"] for entry in read_lines(writer.path)] == list(range(100))
+    writer.close()
+    assert writer.written == 100 and not writer._thread.is_alive()
+    assert writer.write({"n": 100}) is False and writer.dropped == 1
+
+
+def test_rotates_by_size_and_age(tmp_path, monkeypatch):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", max_bytes=60)
+    for i in range(6):
+        writer.write({"n": i, "pad": "x" * 5})
+    writer.close()
+
+    assert [path.name for path in writer.files] == ["session.jsonl", "session.1.jsonl", "session.2.jsonl"]
+    assert [entry["n"] for path in writer.files for entry in read_lines(path)] == list(range(6))
+    assert all(path.stat().st_size <= 60 for path in writer.files)
+
+    now = [1000.0]
+    monkeypatch.setattr("airbyte_agent_mcp._vendored.connector_sdk.logging.writer.time.monotonic", lambda: now[0])
+    writer = JSONLLogWriter(tmp_path / "aged.jsonl", rotate_interval_seconds=60)
+    writer.write({"n": 0})
+    writer.flush()
+    now[0] += 61
+    writer.write({"n": 1})
+    writer.close()
+
+    assert [read_lines(path) for path in writer.files] == [[{"n": 0}], [{"n": 1}]]
+
+
+def test_gzip_compression(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", compression="gzip", max_bytes=30)
+    for i in range(4):
+        writer.write({"n": i, "pad": "x" * 5})
+    writer.close()
+
+    assert writer.path.name == "session.jsonl.gz"
+    assert writer.files[1].name == "session.1.jsonl.gz"
+    assert [entry["n"] for path in writer.files for entry in read_lines(path)] == list(range(4))
+
+
+def test_zstd_needs_zstandard(tmp_path):
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="zstandard"):
+            JSONLLogWriter(tmp_path / "session.jsonl", compression="zstd")
+    else:
+        writer = JSONLLogWriter(tmp_path / "session.jsonl", compression="zstd")
+        writer.close()
+        assert writer.path.name == "session.jsonl.zst"
+
+
+def test_drop_policy_discards_entries_when_full(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", queue_size=2, overflow="drop")
+    release = gate(writer)
+    results = [writer.write({"n": i}) for i in range(6)]
+    release.set()
+    writer.close()
+
+    # One entry is held by the writer thread, two fit in the queue
+    assert results.count(False) == writer.dropped >= 3
+    assert len(read_lines(writer.path)) == 6 - writer.dropped
+
+
+@pytest.mark.asyncio
+async def test_block_policy_never_blocks_the_event_loop(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", queue_size=2, overflow="block")
+    release = gate(writer)
+
+    started = time.perf_counter()
+    assert all(writer.write({"n": i}) for i in range(10))
+    assert time.perf_counter() - started < 0.5
+    assert writer.backlog >= 8
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    waiter = asyncio.create_task(writer.wait_for_capacity())
+    await asyncio.sleep(0.1)
+    assert not waiter.done() and ticks >= 5
+
+    release.set()
+    await asyncio.wait_for(waiter, 2)
+    ticker.cancel()
+    writer.close()
+
+    assert [entry["n"] for entry in read_lines(writer.path)] == list(range(10))
+    assert writer.dropped == 0
+
+
+def test_block_policy_waits_outside_an_event_loop(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", queue_size=1, overflow="block")
+    release = gate(writer)
+    writer.write({"n": 0})
+    while writer.backlog:
+        time.sleep(0.01)
+    # The writer thread holds entry 0 and entry 1 fills the queue
+    writer.write({"n": 1})
+
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (writer.write({"n": 2}), writer.write({"n": 3}), done.set()))
+    thread.start()
+    assert not done.wait(0.1)
+
+    release.set()
+    assert done.wait(2)
+    writer.close()
+    assert [entry["n"] for entry in read_lines(writer.path)] == [0, 1, 2, 3]
+
+
+def test_flush_waits_for_overflowed_entries(tmp_path):
+    writer = JSONLLogWriter(tmp_path / "session.jsonl", queue_size=1)
+    release = gate(writer)
+
+    async def write_many():
+        for i in range(5):
+            writer.write({"n": i})
+
+    asyncio.run(write_many())
+    threading.Timer(0.05, release.set).start()
+    writer.flush()
+
+    assert len(read_lines(writer.path)) == 5
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_request_logger_jsonl_session(tmp_path):
+    logger = RequestLogger(log_file=str(tmp_path / "session.jsonl"), connector_name="items", log_format="jsonl")
+    request_id = logger.log_request(method="GET", url="https://items.example.com/items", path="/items", headers={"Authorization": "Bearer x"})
+    logger.log_response(request_id=request_id, status_code=200, response_body={"items": []})
+    await logger.wait_for_capacity()
+    logger.close()
+
+    session, request, end = read_lines(tmp_path / "session.jsonl")
+    assert (session["type"], session["connector_name"]) == ("session", "items")
+    assert (request["type"], request["response_status"]) == ("request", 200)
+    assert request["headers"]["Authorization"] == "[REDACTED]"
+    assert end == {"type": "session_end", "chunk_file": None, "chunks_seen": 0, "chunks_dropped": 0, "logs_dropped": 0}
+
+
+@pytest.mark.asyncio
+async def test_executor_streams_jsonl_log(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(
+        config_path=str(path),
+        secrets={"api_key": "token"},
+        enable_logging=True,
+        log_file=str(tmp_path / "session.jsonl"),
+        log_format="jsonl",
+        log_compression="gzip",
+        log_queue_size=10,
+    )
+    executor.http_client.client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"items": ITEMS[:2], "next": None}))
+    )
+
+    result = await executor.execute(ExecutionConfig(entity="items", action="list", params={"limit": 2}))
+    await executor.close()
+
+    lines = read_lines(tmp_path / "session.jsonl.gz")
+    assert result.success
+    assert [line["type"] for line in lines] == ["session", "request", "session_end"]
+    assert lines[1]["response_status"] == 200
+    assert executor.logger.session.logs == []
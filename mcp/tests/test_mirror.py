@@ -0,0 +1,164 @@
+"""Tests for the local SQLite mirror (LocalMirror)."""
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk import LocalMirror
+from airbyte_agent_mcp._vendored.connector_sdk.executor import InvalidParameterError, LocalExecutor
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: CRM
+  version: 1.0.0
+  x-airbyte-connector-name: crm
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://crm.example.com
+paths:
+  /contacts:
+    get:
+      operationId: contacts_List
+      x-airbyte-entity: contacts
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.results
+      x-airbyte-relationships:
+        company:
+          entity: companies
+          foreign_key: properties.company_id
+      responses:
+        "200":
+          description: Success
+  /tickets:
+    get:
+      operationId: tickets_List
+      x-airbyte-entity: tickets
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.tickets
+      x-airbyte-incremental:
+        cursor_field: updated_at
+        cursor_param: updated_since
+      parameters:
+        - name: updated_since
+          in: query
+          schema:
+            type: string
+      responses:
+        "200":
+          description: Success
+components:
+  schemas:
+    Contact:
+      type: object
+      x-airbyte-entity-name: contacts
+      properties:
+        id:
+          type: string
+        email:
+          type: string
+        active:
+          type: boolean
+        properties:
+          type: object
+"""
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    executor.contacts = [
+        {"id": "1", "email": "ada@acme.com", "active": True, "properties": {"company_id": "c1", "notes": "asked about a refund"}},
+        {"id": "2", "email": "grace@navy.mil", "active": False, "properties": {"company_id": "c2", "notes": "renewal due"}},
+        {"id": "3", "email": "alan@acme.com", "active": True, "properties": {"company_id": "c1", "notes": "refund issued"}},
+    ]
+    executor.tickets = [{"id": 1, "updated_at": "2024-01-01T10:00:00Z", "subject": "Printer on fire"}]
+    executor.requests = []
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        executor.requests.append((path, dict(params or {})))
+        if path == "/contacts":
+            return {"results": [dict(c) for c in executor.contacts]}
+        since = (params or {}).get("updated_since")
+        return {"tickets": [dict(t) for t in executor.tickets if since is None or t["updated_at"] >= since]}
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_queries_are_answered_locally_after_first_refresh(executor):
+    mirror = LocalMirror(executor)
+
+    first = await mirror.query("contacts", filter={"active": True})
+    by_id = await mirror.query("contacts", filter={"id": [2, 3]})
+    second = await mirror.query("contacts", filter={"properties.company_id": "c1"}, text="refund")
+
+    assert first.refreshed and not second.refreshed
+    assert [c["id"] for c in first.records] == ["1", "3"]
+    assert [c["id"] for c in by_id.records] == ["2", "3"]
+    assert sorted(c["id"] for c in second.records) == ["1", "3"]
+    assert len(executor.requests) == 1
+    assert second.age_seconds is not None and second.age_seconds < 60
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_removes_deleted_records(executor):
+    mirror = LocalMirror(executor)
+    await mirror.query("contacts")
+
+    executor.contacts.pop(0)
+    result = await mirror.query("contacts", text="refund", refresh=True)
+
+    assert [c["id"] for c in result.records] == ["3"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_entities_fetch_only_changes(executor, tmp_path):
+    path = tmp_path / "mirror.db"
+    await LocalMirror(executor, path).query("tickets")
+
+    executor.tickets.append({"id": 2, "updated_at": "2024-01-02T10:00:00Z", "subject": "Paper jam"})
+    # A new mirror on the same file picks up the stored sync cursor
+    result = await LocalMirror(executor, path).query("tickets", text="jam", refresh=True)
+
+    assert [t["id"] for t in result.records] == [2]
+    assert executor.requests[-1] == ("/tickets", {"updated_since": "2024-01-01T10:00:00Z"})
+
+
+@pytest.mark.asyncio
+async def test_records_without_primary_key_are_not_duplicated(executor):
+    executor.contacts.append({"email": "nokey@acme.com", "active": True, "properties": {"notes": "no id"}})
+    mirror = LocalMirror(executor)
+    await mirror.refresh("contacts")
+    await mirror.refresh("contacts")
+
+    keyless = await mirror.query("contacts", filter={"id": None})
+    assert [c["email"] for c in keyless.records] == ["nokey@acme.com"]
+    assert len((await mirror.query("contacts")).records) == 4
+
+    # A keyless record whose content changed is a new row; the old one goes with the next full refresh
+    executor.contacts[-1]["active"] = False
+    await mirror.refresh("contacts")
+    keyless = await mirror.query("contacts", filter={"id": None})
+    assert [c["active"] for c in keyless.records] == [False]
+
+
+@pytest.mark.asyncio
+async def test_declared_keys_are_indexed(executor):
+    mirror = LocalMirror(executor)
+    await mirror.refresh("contacts")
+
+    plan = mirror._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT _data FROM contacts WHERE json_extract(_data, '$.properties.company_id') = 'c1'"
+    ).fetchall()
+    assert "USING INDEX" in str(plan)
+
+
+@pytest.mark.asyncio
+async def test_invalid_filter_field_is_rejected(executor):
+    with pytest.raises(InvalidParameterError):
+        await LocalMirror(executor).query("contacts", filter={"email') OR 1=1 --": "x"})
@@ -0,0 +1,164 @@
+"""Tests for budgeted, resumable server-side pagination."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import InvalidParameterError, LocalExecutor
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Items
+  version: 1.0.0
+  x-airbyte-connector-name: items
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://items.example.com
+paths:
+  /items:
+    get:
+      operationId: items_List
+      x-airbyte-entity: items
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.items
+      x-airbyte-pagination:
+        style: cursor
+        cursor_param: after
+        cursor_path: $.next
+        default_page_size: 4
+      parameters:
+        - name: after
+          in: query
+          schema:
+            type: string
+        - name: limit
+          in: query
+          schema:
+            type: integer
+        - name: color
+          in: query
+          schema:
+            type: string
+      responses:
+        "200":
+          description: Success
+"""
+
+ITEMS = [{"id": i, "color": "red"} for i in range(10)]
+
+
+def make_executor(path, latency=0.0):
+    executor = LocalExecutor(config_path=str(path))
+    executor.requests = []
+    executor.in_flight = executor.peak_in_flight = 0
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        executor.requests.append(dict(params or {}))
+        executor.in_flight += 1
+        executor.peak_in_flight = max(executor.peak_in_flight, executor.in_flight)
+        await asyncio.sleep(latency)
+        executor.in_flight -= 1
+        offset = int(params.get("after") or 0)
+        limit = int(params["limit"])
+        end = offset + limit
+        return {"items": ITEMS[offset:end], "next": str(end) if end < len(ITEMS) else None}
+
+    executor.http_client.request = fake_request
+    return executor
+
+
+@pytest.fixture
+def connector_path(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_paginate_reads_every_page(connector_path):
+    executor = make_executor(connector_path)
+
+    result = await executor.paginate("items", params={"color": "red"})
+
+    assert [item["id"] for item in result.records] == list(range(10))
+    assert (result.pages, result.stopped_by, result.has_more) == (3, "end", False)
+    assert result.bytes == sum(len(json.dumps(item, separators=(",", ":"))) for item in ITEMS)
+    assert all(request["color"] == "red" for request in executor.requests)
+
+
+@pytest.mark.asyncio
+async def test_record_budget_resumes_mid_page_without_gaps(connector_path):
+    executor = make_executor(connector_path)
+
+    ids = []
+    result = await executor.paginate("items", params={"color": "red"}, max_records=3)
+    while True:
+        ids += [item["id"] for item in result.records]
+        assert len(result.records) <= 3
+        if not result.has_more:
+            break
+        assert result.stopped_by == "max_records"
+        result = await executor.paginate("items", cursor=result.next_cursor, max_records=3)
+
+    assert ids == list(range(10))
+    # The resumed walks keep the original filter
+    assert all(request["color"] == "red" for request in executor.requests)
+
+
+@pytest.mark.asyncio
+async def test_byte_and_time_budgets(connector_path):
+    executor = make_executor(connector_path)
+    record_bytes = len(json.dumps(ITEMS[0], separators=(",", ":")))
+
+    by_bytes = await executor.paginate("items", max_bytes=record_bytes * 5 + 1)
+    assert (len(by_bytes.records), by_bytes.stopped_by) == (5, "max_bytes")
+
+    # A single record larger than the budget is still returned, so callers make progress
+    assert len((await executor.paginate("items", max_bytes=1)).records) == 1
+
+    slow = make_executor(connector_path, latency=0.05)
+    by_time = await slow.paginate("items", max_seconds=0.01)
+    assert (len(by_time.records), by_time.stopped_by) == (4, "max_seconds")
+    rest = await slow.paginate("items", cursor=by_time.next_cursor)
+    assert [item["id"] for item in rest.records] == list(range(4, 10))
+
+    with pytest.raises(InvalidParameterError):
+        await executor.paginate("items", cursor="not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_prefetch_overlaps_the_next_request(connector_path):
+    executor = make_executor(connector_path, latency=0.02)
+    seen_in_flight = []
+
+    async for page in executor.iter_pages("items", "list", prefetch=True):
+        # While a page is processed, the request for the next one is already out
+        await asyncio.sleep(0.005)
+        seen_in_flight.append(executor.in_flight)
+
+    assert seen_in_flight == [1, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_paginate_tool(connector_path, monkeypatch):
+    manager = ConnectorManager(Config(connectors=[ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path))]), MagicMock())
+    manager._create_yaml_connector = lambda path, secrets: make_executor(path)
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        first = (await client.call_tool("paginate", {"connector_id": "items", "entity": "items", "max_records": 6})).structured_content
+        rest = (await client.call_tool("paginate", {"connector_id": "items", "entity": "items", "cursor": first["data"]["next_cursor"]})).structured_content
+
+    assert first["success"] and first["data"]["has_more"]
+    assert [item["id"] for item in first["data"]["records"] + rest["data"]["records"]] == list(range(10))
+    assert rest["data"]["next_cursor"] is None
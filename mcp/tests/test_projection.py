@@ -0,0 +1,96 @@
+"""Tests for field projection, compaction and response size caps."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, InvalidParameterError
+from airbyte_agent_mcp._vendored.connector_sdk.executor.projection import compile_projection, project
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+from airbyte_agent_mcp.shaping import cap_records, compact, json_size
+
+from .test_pagination import CONNECTOR_YAML, ITEMS, make_executor
+
+TICKET = {
+    "id": 7,
+    "subject": "Printer on fire",
+    "requester": {"name": "Ada", "email": "ada@example.com"},
+    "comments": [{"author": "Ada", "body": "Help", "attachments": []}, {"author": "Bob", "body": "On it", "attachments": [{"id": 1}]}],
+    "custom_fields": None,
+}
+
+
+def test_fields_keep_dotted_paths_through_lists():
+    projected = project(TICKET, fields=["id", "requester.email", "comments.author"])
+
+    assert projected == {"id": 7, "requester": {"email": "ada@example.com"}, "comments": [{"author": "Ada"}, {"author": "Bob"}]}
+    # A shorter path selects the whole subtree
+    assert project([TICKET], fields=["requester", "requester.email"]) == [{"requester": TICKET["requester"]}]
+
+
+def test_exclude_and_compiled_projection_cache():
+    assert project(TICKET, exclude=["comments.attachments", "custom_fields", "requester"]) == {
+        "id": 7,
+        "subject": "Printer on fire",
+        "comments": [{"author": "Ada", "body": "Help"}, {"author": "Bob", "body": "On it"}],
+    }
+    assert compile_projection(("id",), ()) is compile_projection(("id",), ())
+    assert project(TICKET) is TICKET
+
+    with pytest.raises(InvalidParameterError):
+        project(TICKET, fields=["requester..email"])
+
+
+def test_compact_strips_empty_values_and_truncates_strings():
+    compacted = compact(TICKET, strip_empty=True, max_string_length=4)
+
+    assert compacted["subject"] == "Prin… [11 more chars]"
+    assert "custom_fields" not in compacted
+    assert compacted["comments"][0] == {"author": "Ada", "body": "Help"}
+    assert compact({"count": 0, "flag": False}, strip_empty=True) == {"count": 0, "flag": False}
+
+
+def test_cap_records_keeps_leading_records_within_budget():
+    records = [{"id": i, "body": "x" * 100} for i in range(10)]
+
+    kept, omitted = cap_records(records, json_size(records[:3]))
+    assert (len(kept), omitted) == (3, 7)
+    assert json_size(kept) <= json_size(records[:3])
+    assert cap_records(records, 1) == ([records[0]], 9)
+    assert cap_records({"id": 1}, 1) == ({"id": 1}, 0)
+
+
+@pytest.mark.asyncio
+async def test_executor_projects_records(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = make_executor(path)
+
+    result = await executor.execute(ExecutionConfig(entity="items", action="list", params={"limit": 2}, exclude=["color"]))
+
+    assert result.data == [{"id": 0}, {"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_caps_response_and_continues_with_paginate(tmp_path, monkeypatch):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    manager = ConnectorManager(Config(connectors=[ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(path))]), MagicMock())
+    manager._create_yaml_connector = lambda path, secrets: make_executor(path)
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        first = await client.call_tool(
+            "execute",
+            {"connector_id": "items", "entity": "items", "action": "list", "params": {"limit": 5}, "fields": ["id"], "max_response_bytes": 30},
+        )
+        first = first.structured_content
+        rest = await client.call_tool(
+            "paginate", {"connector_id": "items", "entity": "items", "cursor": first["next_cursor"], "fields": ["id"]}
+        )
+
+    assert first["truncated"] and first["data"] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert [item["id"] for item in rest.structured_content["data"]["records"]] == list(range(3, len(ITEMS)))
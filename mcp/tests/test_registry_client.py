@@ -1,10 +1,13 @@
 """Tests for registry client."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from airbyte_agent_mcp.registry_client import REGISTRY_BASE_URL, RegistryClient
+from airbyte_agent_mcp.registry_client import REGISTRY_BASE_URL, RegistryClient, RegistryUnavailableError
 
 
 @pytest.fixture
@@ -46,9 +49,73 @@ def mock_registry_response():
 
 
 @pytest.fixture
-def registry_client():
-    """Create a registry client."""
-    return RegistryClient()
+def registry_client(tmp_path):
+    """Create a registry client with a throwaway cache."""
+    return RegistryClient(cache_dir=tmp_path / "cache")
+
+
+class StandInRegistry:
+    """Local HTTP server standing in for the connector registry."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.etag = '"1"'
+        self.requests: list[tuple[str, int]] = []
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status = 404
+                if self.path == "/registry.json" and self.headers.get("If-None-Match") == registry.etag:
+                    status = 304
+                elif self.path in registry.files:
+                    status = 200
+                registry.requests.append((self.path, status))
+                self.send_response(status)
+                if self.path == "/registry.json":
+                    self.send_header("ETag", registry.etag)
+                body = registry.files.get(self.path, b"") if status == 200 else b""
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def publish(self, name: str, versions: dict[str, str]) -> None:
+        """Serve connector.yaml contents per version; the last version is the latest."""
+        urls = {version: f"{self.base_url}/definitions/{name}/{version}/connector.yaml" for version in versions}
+        for version, content in versions.items():
+            self.files[f"/definitions/{name}/{version}/connector.yaml"] = content.encode()
+        index = {
+            "connectors": [
+                {
+                    "connector_name": name,
+                    "latest_version": list(versions)[-1],
+                    "latest_url": urls[list(versions)[-1]],
+                    "versions": [{"version": version, "url": url} for version, url in urls.items()],
+                }
+            ]
+        }
+        self.files["/registry.json"] = json.dumps(index).encode()
+        self.etag = f'"{len(self.requests)}-{len(versions)}"'
+
+    def count(self, path: str, status: int | None = None) -> int:
+        return sum(1 for p, s in self.requests if p == path and status in (None, s))
+
+
+@pytest.fixture
+def stand_in_registry():
+    """Local registry server publishing stripe 1.0.0 and 2.0.0."""
+    registry = StandInRegistry()
+    registry.publish("stripe", {"1.0.0": "openapi: 3.1.0\ninfo:\n  title: Stripe v1.0.0\n", "2.0.0": "openapi: 3.1.0\ninfo:\n  title: Stripe\n"})
+    yield registry
+    registry.server.shutdown()
+    registry.server.server_close()
 
 
 @pytest.mark.asyncio
@@ -94,51 +161,90 @@ async def test_resolve_connector_url_version_not_found(registry_client, mock_reg
 
 
 @pytest.mark.asyncio
-async def test_download_connector(registry_client, mock_registry_response):
+async def test_download_connector(stand_in_registry, tmp_path):
     """Test downloading connector.yaml."""
-    connector_yaml_content = "openapi: 3.1.0\ninfo:\n  title: Stripe\n"
+    registry_client = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url)
 
-    with patch.object(registry_client, "fetch_registry", new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = mock_registry_response
+    path = await registry_client.download_connector("stripe")
+
+    assert path.exists()
+    assert path.read_text() == "openapi: 3.1.0\ninfo:\n  title: Stripe\n"
+    assert "stripe" in str(path)
+    assert "2.0.0" in str(path)
 
-        # Mock the actual HTTP download
-        with patch("airbyte_agent_mcp.registry_client.httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
 
-            mock_response = AsyncMock()
-            mock_response.text = connector_yaml_content
-            mock_response.raise_for_status = lambda: None
-            mock_client.get.return_value = mock_response
+@pytest.mark.asyncio
+async def test_download_connector_with_version(stand_in_registry, tmp_path):
+    """Test downloading specific version of connector.yaml."""
+    registry_client = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url)
 
-            path = await registry_client.download_connector("stripe")
+    path = await registry_client.download_connector("stripe", version="1.0.0")
 
-            assert path.exists()
-            assert path.read_text() == connector_yaml_content
-            assert "stripe" in str(path)
-            assert "2.0.0" in str(path)
+    assert path.exists()
+    assert "stripe" in str(path)
+    assert "1.0.0" in str(path)
 
 
 @pytest.mark.asyncio
-async def test_download_connector_with_version(registry_client, mock_registry_response):
-    """Test downloading specific version of connector.yaml."""
-    connector_yaml_content = "openapi: 3.1.0\ninfo:\n  title: Stripe v1.0.0\n"
+async def test_registry_is_revalidated_with_etag_after_ttl(stand_in_registry, tmp_path):
+    """Test registry.json is reused within the TTL and revalidated with If-None-Match after it."""
+    registry_client = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url)
+    await registry_client.download_connector("stripe")
+    await registry_client.download_connector("stripe")
+    assert stand_in_registry.count("/registry.json") == 1
+    assert stand_in_registry.count("/definitions/stripe/2.0.0/connector.yaml") == 1
 
-    with patch.object(registry_client, "fetch_registry", new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = mock_registry_response
+    registry_client.ttl_seconds = 0
+    await registry_client.resolve_connector_url("stripe")
+    assert stand_in_registry.count("/registry.json", 304) == 1
+
+    stand_in_registry.publish("stripe", {"2.0.0": "v2", "3.0.0": "v3"})
+    assert (await registry_client.download_connector("stripe")).read_text() == "v3"
+    assert stand_in_registry.count("/registry.json", 200) == 2
+    await registry_client.aclose()
 
-        # Mock the actual HTTP download
-        with patch("airbyte_agent_mcp.registry_client.httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
 
-            mock_response = AsyncMock()
-            mock_response.text = connector_yaml_content
-            mock_response.raise_for_status = lambda: None
-            mock_client.get.return_value = mock_response
+@pytest.mark.asyncio
+async def test_cache_survives_restarts_and_verifies_content(stand_in_registry, tmp_path):
+    """Test a new client reuses the cache, and re-downloads definitions whose content changed on disk."""
+    path = await RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url).download_connector("stripe")
+
+    restarted = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url)
+    assert await restarted.download_connector("stripe") == path
+    assert stand_in_registry.requests == [("/registry.json", 200), ("/definitions/stripe/2.0.0/connector.yaml", 200)]
+
+    path.write_text("tampered")
+    assert (await restarted.download_connector("stripe")).read_text() == "openapi: 3.1.0\ninfo:\n  title: Stripe\n"
+    assert stand_in_registry.count("/definitions/stripe/2.0.0/connector.yaml") == 2
+
+
+@pytest.mark.asyncio
+async def test_offline_serves_pinned_versions_from_cache(stand_in_registry, tmp_path):
+    """Test offline mode serves cached pinned versions and never contacts the registry."""
+    await RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url).download_connector("stripe", version="1.0.0")
+    (tmp_path / "registry.json").unlink()
+    requests = len(stand_in_registry.requests)
+
+    offline = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url, offline=True)
+    path = await offline.download_connector("stripe", version="1.0.0")
+
+    assert path.read_text() == "openapi: 3.1.0\ninfo:\n  title: Stripe v1.0.0\n"
+    with pytest.raises(RegistryUnavailableError):
+        await offline.download_connector("stripe", version="2.0.0")
+    with pytest.raises(RegistryUnavailableError):
+        await offline.download_connector("stripe")
+    assert len(stand_in_registry.requests) == requests
+
+
+@pytest.mark.asyncio
+async def test_unreachable_registry_falls_back_to_cached_index(stand_in_registry, tmp_path):
+    """Test a stale cached registry.json is used when the registry can't be reached."""
+    await RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url).download_connector("stripe")
+    stand_in_registry.server.shutdown()
+    stand_in_registry.server.server_close()
 
-            path = await registry_client.download_connector("stripe", version="1.0.0")
+    registry_client = RegistryClient(cache_dir=tmp_path, base_url=stand_in_registry.base_url, ttl_seconds=0)
 
-            assert path.exists()
-            assert "stripe" in str(path)
-            assert "1.0.0" in str(path)
+    assert (await registry_client.download_connector("stripe")).read_text() == "openapi: 3.1.0\ninfo:\n  title: Stripe\n"
+    with pytest.raises(RegistryUnavailableError):
+        await RegistryClient(cache_dir=tmp_path / "empty", base_url=stand_in_registry.base_url).fetch_registry()
@@ -0,0 +1,146 @@
+"""Tests for relationship expansion (x-airbyte-relationships / expand=[...])."""
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import ExecutionConfig, LocalExecutor
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Helpdesk
+  version: 1.0.0
+  x-airbyte-connector-name: helpdesk
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://helpdesk.example.com
+paths:
+  /tickets.json:
+    get:
+      operationId: tickets_List
+      x-airbyte-entity: tickets
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.tickets
+      x-airbyte-relationships:
+        requester:
+          entity: users
+          foreign_key: requester_id
+          sideload:
+            param: include
+            value: users
+            records_extractor: $.users
+        organization:
+          entity: organizations
+          foreign_key: organization_id
+        followers:
+          entity: users
+          foreign_key: follower_ids
+      responses:
+        "200":
+          description: Success
+  /users/{user_id}.json:
+    get:
+      operationId: users_Get
+      x-airbyte-entity: users
+      x-airbyte-action: get
+      x-airbyte-record-extractor: $.user
+      parameters:
+        - name: user_id
+          in: path
+          required: true
+          schema:
+            type: string
+      responses:
+        "200":
+          description: Success
+  /organizations/{organization_id}.json:
+    get:
+      operationId: organizations_Get
+      x-airbyte-entity: organizations
+      x-airbyte-action: get
+      x-airbyte-batch-read:
+        path: /organizations/show_many.json
+        method: GET
+        ids_location: query
+        ids_format: csv
+        record_extractor: $.organizations
+      parameters:
+        - name: organization_id
+          in: path
+          required: true
+          schema:
+            type: string
+      responses:
+        "200":
+          description: Success
+"""
+
+TICKETS = [
+    {"id": 1, "requester_id": 10, "organization_id": 100, "follower_ids": [10, 12]},
+    {"id": 2, "requester_id": 11, "organization_id": 100, "follower_ids": []},
+    {"id": 3, "requester_id": 10, "organization_id": 101, "follower_ids": [12]},
+]
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    requests = []
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        requests.append((path, params))
+        if path == "/tickets.json":
+            response = {"tickets": [dict(ticket) for ticket in TICKETS]}
+            if params and "users" in params.get("include", "").split(","):
+                response["users"] = [{"id": 10, "name": "Ada"}, {"id": 11, "name": "Grace"}]
+            return response
+        if path == "/organizations/show_many.json":
+            return {"organizations": [{"id": int(i), "name": f"org {i}"} for i in params["ids"].split(",")]}
+        if path.startswith("/users/"):
+            user_id = int(path.split("/")[2].removesuffix(".json"))
+            return {"user": {"id": user_id, "name": f"user {user_id}"}}
+        raise AssertionError(f"unexpected request {path}")
+
+    executor.http_client.request = fake_request
+    executor.requests = requests
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_sideloaded_relationship_needs_no_extra_requests(executor):
+    result = await executor.execute(ExecutionConfig(entity="tickets", action="list", expand=["requester"]))
+
+    assert result.success
+    assert [ticket["requester"]["name"] for ticket in result.data] == ["Ada", "Grace", "Ada"]
+    assert executor.requests == [("/tickets.json", {"include": "users"})]
+
+
+@pytest.mark.asyncio
+async def test_foreign_keys_are_deduped_and_batched(executor):
+    result = await executor.execute(ExecutionConfig(entity="tickets", action="list", expand=["organization"]))
+
+    assert [ticket["organization"]["name"] for ticket in result.data] == ["org 100", "org 100", "org 101"]
+    paths = [path for path, _ in executor.requests]
+    assert paths == ["/tickets.json", "/organizations/show_many.json"]
+    assert executor.requests[1][1] == {"ids": "100,101"}
+
+
+@pytest.mark.asyncio
+async def test_identity_map_is_shared_across_relationships(executor):
+    result = await executor.execute(ExecutionConfig(entity="tickets", action="list", expand=["requester", "followers"]))
+
+    assert [[user["name"] for user in ticket["followers"]] for ticket in result.data] == [["Ada", "user 12"], [], ["user 12"]]
+    # Users 10 and 11 came sideloaded with the tickets; only user 12 is fetched, once
+    assert [path for path, _ in executor.requests] == ["/tickets.json", "/users/12.json"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_relationship_is_rejected(executor):
+    result = await executor.execute(ExecutionConfig(entity="tickets", action="list", expand=["assignee"]))
+
+    assert not result.success
+    assert "Available relationships" in result.error
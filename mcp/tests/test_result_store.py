@@ -0,0 +1,157 @@
+"""Tests for buffered results and the fetch_result tool."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.result_store import ResultNotFoundError, ResultStore
+from airbyte_agent_mcp.server import mcp
+
+from .test_pagination import CONNECTOR_YAML, ITEMS, make_executor
+
+RECORDS = [{"id": i, "body": "x" * 50} for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_get_returns_slices_and_total():
+    store = ResultStore()
+    handle = await store.put("s1", RECORDS)
+
+    assert await store.get(handle, 5, 3) == (RECORDS[5:8], 20)
+    assert await store.get(handle, 18, 10) == (RECORDS[18:], 20)
+    assert await store.get(handle, 25, 10) == ([], 20)
+    with pytest.raises(ResultNotFoundError):
+        await store.get("res_unknown")
+    with pytest.raises(ValueError):
+        await store.get(handle, -1)
+
+
+@pytest.mark.asyncio
+async def test_each_session_keeps_its_own_most_recent_results():
+    store = ResultStore(max_per_session=2)
+    first = await store.put("s1", RECORDS)
+    other = await store.put("s2", RECORDS)
+    second = await store.put("s1", RECORDS)
+    await store.get(first)
+    await store.put("s1", RECORDS)
+
+    # Reading first made second the least recently used result of s1
+    with pytest.raises(ResultNotFoundError):
+        await store.get(second)
+    assert (await store.get(first, 0, 1))[1] == 20
+    assert (await store.get(other, 0, 1))[1] == 20
+
+    store.drop_session("s1")
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_results_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("airbyte_agent_mcp.result_store.time.monotonic", lambda: now[0])
+    store = ResultStore(ttl_seconds=60)
+    handle = await store.put("s1", RECORDS)
+
+    now[0] += 59
+    await store.get(handle)
+    now[0] += 59
+    assert (await store.get(handle, 0, 1))[1] == 20
+    now[0] += 61
+    with pytest.raises(ResultNotFoundError):
+        await store.get(handle)
+    assert store.memory_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_spills_to_disk_then_drops_over_limits(tmp_path):
+    size = sum(len(f'{{"id":{r["id"]},"body":"{r["body"]}"}}') + 1 for r in RECORDS)
+    store = ResultStore(max_memory_bytes=size, max_disk_bytes=size, spill_dir=tmp_path)
+    oldest = await store.put("s1", RECORDS)
+    spilled = await store.put("s2", RECORDS)
+
+    assert (store.memory_bytes, store.disk_bytes) == (size, size)
+    assert await store.get(oldest, 10, 2) == (RECORDS[10:12], 20)
+
+    # oldest was just read, so spilled is now the least recently used on disk
+    await store.put("s3", RECORDS)
+    with pytest.raises(ResultNotFoundError):
+        await store.get(spilled)
+    assert (await store.get(oldest, 19))[0] == RECORDS[19:]
+    assert len(list(tmp_path.iterdir())) == 1
+
+    store.close()
+    assert len(store) == 0 and not list(tmp_path.iterdir())
+
+    with pytest.raises(ValueError):
+        await ResultStore(max_memory_bytes=10, max_disk_bytes=10).put("s1", RECORDS)
+
+
+@pytest.mark.asyncio
+async def test_spill_file_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    to_thread = asyncio.to_thread
+    calls = []
+
+    async def recording_to_thread(func, *args):
+        calls.append(func.__name__)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr("airbyte_agent_mcp.result_store.asyncio.to_thread", recording_to_thread)
+    store = ResultStore(max_memory_bytes=1, spill_dir=tmp_path)
+    handle = await store.put("s1", RECORDS)
+
+    # Memory is accounted as the encoded bytes actually held
+    assert store.memory_bytes == 0 and store.disk_bytes == (tmp_path / f"{handle}.jsonl").stat().st_size
+    assert await store.get(handle, 3, 2) == (RECORDS[3:5], 20)
+    assert calls == ["_write_file", "_read_slice"]
+
+
+@pytest.mark.asyncio
+async def test_result_dropped_while_spilling_leaves_no_file(tmp_path):
+    store = ResultStore(max_memory_bytes=1, spill_dir=tmp_path)
+    put = asyncio.create_task(store.put("s1", RECORDS))
+    # Let put register the result and start writing it in a thread
+    while not len(store):
+        await asyncio.sleep(0)
+    handle = next(iter(store._entries))
+    assert await store.get(handle, 0, 1) == (RECORDS[:1], 20)
+    store.drop_session("s1")
+    await put
+
+    assert len(store) == 0 and store.disk_bytes == 0
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_fetch_result_reads_rest_of_truncated_execute(tmp_path, monkeypatch):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    manager = ConnectorManager(Config(connectors=[ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(path))]), MagicMock())
+    executor = make_executor(path)
+    manager._create_yaml_connector = lambda path, secrets: executor
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+    monkeypatch.setattr(mcp, "result_store", ResultStore(spill_dir=tmp_path / "spill"))
+
+    async with Client(mcp) as client:
+        first = await client.call_tool(
+            "execute",
+            {"connector_id": "items", "entity": "items", "action": "list", "params": {"limit": 8}, "fields": ["id"], "max_response_bytes": 30},
+        )
+        first = first.structured_content
+        requests = len(executor.requests)
+        rest = await client.call_tool("fetch_result", {"handle": first["result_handle"], "offset": len(first["data"]), "limit": 3})
+        last = await client.call_tool("fetch_result", {"handle": first["result_handle"], "offset": 6, "format": "table"})
+        missing = await client.call_tool("fetch_result", {"handle": "res_unknown"})
+
+    assert first["truncated"] and first["total_records"] == 8
+    assert rest.structured_content["records"] == [{"id": 3}, {"id": 4}, {"id": 5}]
+    assert rest.structured_content["next_offset"] == 6
+    assert last.structured_content["records"] == {"columns": ["id"], "rows": [[6], [7]]}
+    assert last.structured_content["next_offset"] is None
+    assert "expired" in missing.structured_content["error"]
+    # Slices come from the buffer, not the API
+    assert len(executor.requests) == requests
+    assert len(ITEMS) > 8
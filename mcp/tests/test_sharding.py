@@ -0,0 +1,146 @@
+"""Tests for paginated and time-sharded scans (x-airbyte-pagination / x-airbyte-sharding)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.executor import InvalidParameterError, LocalExecutor
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Events
+  version: 1.0.0
+  x-airbyte-connector-name: events
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://events.example.com
+paths:
+  /events:
+    get:
+      operationId: events_List
+      x-airbyte-entity: events
+      x-airbyte-action: list
+      x-airbyte-record-extractor: $.events
+      x-airbyte-pagination:
+        style: cursor
+        cursor_param: cursor
+        cursor_path: $.next
+        default_page_size: 2
+      x-airbyte-sharding:
+        from_param: since
+        to_param: until
+        record_time_field: created_at
+        result_cap: 4
+        total_path: $.total
+      parameters:
+        - name: since
+          in: query
+          schema:
+            type: string
+        - name: until
+          in: query
+          schema:
+            type: string
+        - name: cursor
+          in: query
+          schema:
+            type: string
+        - name: limit
+          in: query
+          schema:
+            type: integer
+      responses:
+        "200":
+          description: Success
+"""
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Twenty events: sixteen packed into the first hour, four spread over the rest of the day
+EVENTS = [{"id": i, "created_at": (START + timedelta(minutes=3 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")} for i in range(16)] + [
+    {"id": 16 + i, "created_at": (START + timedelta(hours=4 * (i + 1))).strftime("%Y-%m-%dT%H:%M:%SZ")} for i in range(4)
+]
+
+
+def _parse(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@pytest.fixture
+def executor(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    executor = LocalExecutor(config_path=str(path))
+    requests = []
+
+    async def fake_request(method, path, params=None, json=None, data=None, **kwargs):
+        """Cursor-paginated endpoint that, like many search APIs, stops at 4 results per query."""
+        requests.append(dict(params or {}))
+        matching = [e for e in EVENTS if _parse(params["since"]) <= _parse(e["created_at"]) < _parse(params["until"])] if "since" in params else EVENTS
+        offset = int(params.get("cursor") or 0)
+        limit = int(params["limit"])
+        visible = matching[:4]
+        page = visible[offset : offset + limit]
+        next_offset = offset + limit
+        return {"events": page, "total": len(matching), "next": str(next_offset) if next_offset < len(visible) else None}
+
+    executor.http_client.request = fake_request
+    executor.requests = requests
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_follows_cursor_until_exhausted(executor):
+    pages = [page async for page in executor.iter_pages("events", "list")]
+
+    assert [[event["id"] for event in page.data] for page in pages] == [[0, 1], [2, 3]]
+    assert [request.get("cursor") for request in executor.requests] == [None, "2"]
+    assert all(request["limit"] == 2 for request in executor.requests)
+
+
+@pytest.mark.asyncio
+async def test_scan_splits_capped_windows_and_merges_in_time_order(executor):
+    result = await executor.scan_time_range("events", "list", START, START + timedelta(days=1), shards=4)
+    records = result.records
+
+    assert not result.truncated and result.windows == 4
+    # Every event is returned exactly once even though each query sees at most 4
+    assert [event["id"] for event in records] == list(range(20))
+    # The dense first window was split into narrower ones
+    windows = {(request["since"], request["until"]) for request in executor.requests}
+    assert len(windows) > 4
+    assert min(_parse(until) - _parse(since) for since, until in windows) < timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_scan_descending(executor):
+    result = await executor.scan_time_range("events", "list", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", descending=True)
+
+    assert [event["id"] for event in result.records] == list(reversed(range(20)))
+
+
+@pytest.mark.asyncio
+async def test_scan_reports_capped_window_it_cannot_split(executor, monkeypatch, caplog):
+    # Six events within one minute: the smallest window still sees only the first four
+    burst = START + timedelta(hours=2)
+    monkeypatch.setattr(
+        __name__ + ".EVENTS", [{"id": i, "created_at": (burst + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ")} for i in range(6)]
+    )
+
+    with caplog.at_level("WARNING"):
+        result = await executor.scan_time_range("events", "list", START, START + timedelta(days=1), shards=4)
+
+    assert [event["id"] for event in result.records] == [0, 1, 2, 3]
+    assert result.truncated and len(result.truncated_windows) == 1
+    window_start, window_end = result.truncated_windows[0]
+    assert window_start <= burst < window_end and window_end - window_start < timedelta(minutes=2)
+    assert "reached result_cap (4)" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_scan_rejects_empty_range(executor):
+    with pytest.raises(InvalidParameterError):
+        await executor.scan_time_range("events", "list", START, START)
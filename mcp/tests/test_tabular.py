@@ -0,0 +1,80 @@
+"""Tests for tabular encoding of list results."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.server import mcp
+from airbyte_agent_mcp.tabular import flatten, schema_columns, tabulate
+
+from .test_pagination import CONNECTOR_YAML, make_executor
+
+CONTACTS = [
+    {"id": 1, "name": "Ada", "address": {"city": "London", "geo": {"lat": 51.5}}, "tags": ["vip"]},
+    {"id": 2, "name": "Grace, Rear Admiral", "active": True, "address": None},
+]
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "active": {"type": "boolean"},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}, "geo": {"type": "object", "properties": {"lat": {}}}}},
+        "id": {"type": "integer"},
+        "email": {"type": "string"},
+    },
+}
+
+
+def test_flatten_and_schema_columns_respect_depth():
+    assert flatten(CONTACTS[0]) == {"id": 1, "name": "Ada", "address.city": "London", "address.geo": {"lat": 51.5}, "tags": ["vip"]}
+    assert flatten(CONTACTS[0], max_depth=3)["address.geo.lat"] == 51.5
+    assert flatten(CONTACTS[0], max_depth=1)["address"] == CONTACTS[0]["address"]
+    assert schema_columns(SCHEMA) == ["active", "address.city", "address.geo", "id", "email"]
+
+
+def test_table_columns_follow_schema_then_first_appearance():
+    table = tabulate(CONTACTS, "table", schema=SCHEMA)
+
+    # Declared columns come first, in schema order; "email" is declared but never present
+    assert table["columns"] == ["active", "address.city", "address.geo", "id", "name", "tags", "address"]
+    assert table["rows"][0] == [None, "London", {"lat": 51.5}, 1, "Ada", ["vip"], None]
+    assert table["rows"][1] == [True, None, None, 2, "Grace, Rear Admiral", None, None]
+
+
+def test_csv_and_tsv():
+    csv_text = tabulate(CONTACTS, "csv")
+    assert csv_text.splitlines() == [
+        "id,name,address.city,address.geo,tags,active,address",
+        '1,Ada,London,"{""lat"":51.5}","[""vip""]",,',
+        '2,"Grace, Rear Admiral",,,,true,',
+    ]
+    assert tabulate(CONTACTS, "tsv").splitlines()[0].split("\t")[:2] == ["id", "name"]
+
+
+def test_non_list_results_are_left_alone():
+    assert tabulate({"id": 1}, "table") == {"id": 1}
+    assert tabulate(CONTACTS, "json") is CONTACTS
+
+
+def test_table_is_smaller_than_records():
+    records = [{"id": i, "properties": {"email": f"user{i}@example.com", "firstname": "Ada", "lifecyclestage": "lead"}} for i in range(500)]
+
+    assert len(json.dumps(tabulate(records, "table"))) < len(json.dumps(records)) / 2
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_table_format(tmp_path, monkeypatch):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    manager = ConnectorManager(Config(connectors=[ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(path))]), MagicMock())
+    manager._create_yaml_connector = lambda path, secrets: make_executor(path)
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("execute", {"connector_id": "items", "entity": "items", "action": "list", "params": {"limit": 2}, "format": "table"})
+
+    assert result.structured_content["data"] == {"columns": ["id", "color"], "rows": [[0, "red"], [1, "red"]]}
@@ -0,0 +1,141 @@
+"""Tests for lazy session identity and the background telemetry pipeline."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.observability import ObservabilitySession
+from airbyte_agent_mcp._vendored.connector_sdk.observability import session as session_module
+from airbyte_agent_mcp._vendored.connector_sdk.telemetry import TelemetryPipeline
+from airbyte_agent_mcp._vendored.connector_sdk.telemetry.events import OperationEvent
+from airbyte_agent_mcp._vendored.connector_sdk.telemetry.pipeline import PendingEvent
+
+
+@pytest.fixture
+def identity(monkeypatch):
+    """Fresh identity cache with counted, controllable lookups."""
+    calls = {"user_id": 0, "public_ip": 0}
+    ip_release = threading.Event()
+    ip_release.set()
+
+    def user_id():
+        calls["user_id"] += 1
+        return "user-1"
+
+    def public_ip():
+        calls["public_ip"] += 1
+        ip_release.wait(2)
+        return "203.0.113.7"
+
+    monkeypatch.setattr(session_module, "_cached_user_id", None)
+    monkeypatch.setattr(session_module, "_cached_public_ip", None)
+    monkeypatch.setattr(session_module, "_public_ip_resolved", False)
+    monkeypatch.setattr(session_module, "get_persistent_user_id", user_id)
+    monkeypatch.setattr(session_module, "get_public_ip", public_ip)
+    return calls, ip_release
+
+
+class FakeAnalytics:
+    def __init__(self):
+        self.tracked = []
+        self.flushes = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def track(self, user_id, anonymous_id, event, properties):
+        self.release.wait()
+        self.tracked.append((user_id, anonymous_id, event, properties))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def operation(session, entity="items"):
+    fields = {"timestamp": datetime(2026, 1, 1), "entity": entity, "action": "list", "timing_ms": 12.5, "status_code": 200}
+    return PendingEvent(session=session, event_name="Operation Executed", event_cls=OperationEvent, fields=fields)
+
+
+def test_identity_is_resolved_lazily_once_per_process(identity):
+    calls, _ = identity
+
+    first = ObservabilitySession("items")
+    second = ObservabilitySession("items")
+    assert calls == {"user_id": 0, "public_ip": 0}
+
+    assert first.user_id == second.user_id == "user-1"
+    assert first.public_ip == second.public_ip == "203.0.113.7"
+    assert calls == {"user_id": 1, "public_ip": 1}
+
+
+def test_user_id_does_not_wait_for_public_ip_lookup(identity):
+    calls, ip_release = identity
+    ip_release.clear()
+    session = ObservabilitySession("items")
+
+    lookup = threading.Thread(target=lambda: session.public_ip)
+    lookup.start()
+    while calls["public_ip"] == 0:
+        time.sleep(0.01)
+
+    started = time.perf_counter()
+    assert session.user_id == "user-1"
+    assert time.perf_counter() - started < 0.5
+
+    ip_release.set()
+    lookup.join(2)
+    assert session.public_ip == "203.0.113.7" and calls["public_ip"] == 1
+
+
+def test_pipeline_builds_events_in_the_worker(identity):
+    calls, _ = identity
+    analytics = FakeAnalytics()
+    pipeline = TelemetryPipeline(analytics)
+    session = ObservabilitySession("items", session_id="session-1")
+
+    assert pipeline.submit(operation(session))
+    assert pipeline.flush(timeout=2)
+
+    [(user_id, anonymous_id, event, properties)] = analytics.tracked
+    assert (user_id, anonymous_id, event) == ("user-1", "session-1", "Operation Executed")
+    assert properties["public_ip"] == "203.0.113.7" and properties["timestamp"] == "2026-01-01T00:00:00"
+    assert analytics.flushes == 1 and pipeline.sent == 1
+    assert calls == {"user_id": 1, "public_ip": 1}
+    pipeline.shutdown()
+
+
+def test_submit_never_blocks_and_drops_when_full(identity):
+    analytics = FakeAnalytics()
+    analytics.release.clear()
+    pipeline = TelemetryPipeline(analytics, queue_size=2, batch_size=1)
+    session = ObservabilitySession("items")
+
+    pipeline.submit(operation(session, "first"))
+    while pipeline._queue.qsize():
+        time.sleep(0.01)
+    started = time.perf_counter()
+    results = [pipeline.submit(operation(session, f"e{i}")) for i in range(4)]
+
+    assert time.perf_counter() - started < 0.5
+    assert results == [True, True, False, False] and pipeline.dropped == 2
+    assert pipeline.request_flush() is None
+
+    analytics.release.set()
+    pipeline.shutdown()
+    assert [properties["entity"] for *_, properties in analytics.tracked] == ["first", "e0", "e1"]
+    assert pipeline.submit(operation(session)) is False
+
+
+def test_bad_event_does_not_stop_the_worker(identity):
+    analytics = FakeAnalytics()
+    pipeline = TelemetryPipeline(analytics)
+    session = ObservabilitySession("items")
+    broken = PendingEvent(session=session, event_name="Operation Executed", event_cls=OperationEvent, fields={"unknown": 1})
+
+    pipeline.submit(broken)
+    pipeline.submit(operation(session))
+    assert pipeline.flush(timeout=2)
+
+    assert pipeline.sent == 1 and len(analytics.tracked) == 1
+    pipeline.shutdown()
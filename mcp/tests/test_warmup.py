@@ -0,0 +1,149 @@
+"""Tests for executor reuse and startup warm-up."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from airbyte_agent_mcp._vendored.connector_sdk.http import HTTPStatusError, NetworkError
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config, ConnectorConfig, ConnectorType
+from airbyte_agent_mcp.secret_manager import SecretsManager
+from airbyte_agent_mcp.server import mcp
+
+from .test_pagination import CONNECTOR_YAML, make_executor
+
+
+@pytest.fixture
+def connector_path(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    return path
+
+
+def make_manager(*connectors: ConnectorConfig, secret: str = "token-1") -> ConnectorManager:
+    backend = MagicMock()
+    backend.get_secret.side_effect = lambda key: secret
+    manager = ConnectorManager(Config(connectors=list(connectors)), SecretsManager(backend), registry_client=MagicMock())
+    manager.created = []
+
+    def create(path, secrets):
+        executor = make_executor(path)
+        executor.warm_up = AsyncMock(return_value=True)
+        executor.close = AsyncMock()
+        manager.created.append(executor)
+        return executor
+
+    manager._create_yaml_connector = create
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_executor_is_reused_until_definition_or_secrets_change(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path), secrets={"token": "ITEMS_TOKEN"}))
+
+    await manager.execute("items", "items", "list", {"limit": 1})
+    await manager.execute("items", "items", "list", {"limit": 1})
+    assert len(manager.created) == 1
+
+    stat = connector_path.stat()
+    os.utime(connector_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    await manager.execute("items", "items", "list", {"limit": 1})
+    assert len(manager.created) == 2
+
+    manager.secrets_manager.backend.get_secret.side_effect = lambda key: "token-2"
+    await manager.execute("items", "items", "list", {"limit": 1})
+    assert len(manager.created) == 3
+
+    # Replaced executors with no calls in flight are closed right away
+    manager.created[0].close.assert_awaited_once()
+    manager.created[1].close.assert_awaited_once()
+    manager.created[2].close.assert_not_awaited()
+    await manager.aclose()
+    for executor in manager.created:
+        executor.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_replaced_executor_is_closed_when_its_last_call_ends(connector_path):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path), secrets={"token": "ITEMS_TOKEN"}))
+    await manager.execute("items", "items", "list", {"limit": 1})
+    first = manager.created[0]
+    release = asyncio.Event()
+    execute = first.execute
+
+    async def slow_execute(config):
+        await release.wait()
+        return await execute(config)
+
+    first.execute = slow_execute
+    in_flight = [asyncio.create_task(manager.execute("items", "items", "list", {"limit": 1})) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    manager.secrets_manager.backend.get_secret.side_effect = lambda key: "token-2"
+    await manager.execute("items", "items", "list", {"limit": 1})
+    assert len(manager.created) == 2
+    first.close.assert_not_awaited()
+
+    release.set()
+    results = await asyncio.gather(*in_flight)
+    assert all(result for result in results)
+    first.close.assert_awaited_once()
+    assert manager._retired == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_failures_without_affecting_healthy_connectors(connector_path):
+    manager = make_manager(
+        ConnectorConfig(id="local", type=ConnectorType.LOCAL, path=str(connector_path)),
+        ConnectorConfig(id="remote", type=ConnectorType.LOCAL, connector_name="gone"),
+    )
+    manager.registry_client.resolve_connector_url = AsyncMock(side_effect=ValueError("Connector not found in registry: gone"))
+
+    errors = await manager.warm_up(connect=True)
+
+    assert errors == {"local": None, "remote": "Connector not found in registry: gone"}
+    manager.created[0].warm_up.assert_awaited_once()
+    await manager.execute("local", "items", "list", {"limit": 1})
+    assert len(manager.created) == 1
+
+
+@pytest.mark.asyncio
+async def test_http_client_warm_up_opens_connection_whatever_the_status(connector_path):
+    http_client = make_executor(connector_path).http_client
+    http_client.client = AsyncMock()
+
+    http_client.client.request.side_effect = HTTPStatusError(404, "Not found")
+    assert await http_client.warm_up() is True
+    http_client.client.request.assert_awaited_once_with("HEAD", "https://items.example.com")
+
+    http_client.client.request.side_effect = NetworkError("Name or service not known")
+    with pytest.raises(NetworkError):
+        await http_client.warm_up()
+
+    # Transport errors the client doesn't map are reported as NetworkError too
+    http_client.client.request.side_effect = httpx.UnsupportedProtocol("Request URL has an unsupported protocol")
+    with pytest.raises(NetworkError) as excinfo:
+        await http_client.warm_up()
+    assert isinstance(excinfo.value.original_error, httpx.UnsupportedProtocol)
+
+    http_client.base_url = "https://{subdomain}.example.com"
+    assert await http_client.warm_up() is False
+
+
+@pytest.mark.asyncio
+async def test_server_warms_up_before_serving(connector_path, monkeypatch):
+    manager = make_manager(ConnectorConfig(id="items", type=ConnectorType.LOCAL, path=str(connector_path)))
+    monkeypatch.setattr(mcp, "connector_manager", manager, raising=False)
+    monkeypatch.setattr(mcp, "warmup", True)
+
+    async with Client(mcp) as client:
+        assert len(manager.created) == 1
+        await client.call_tool("execute", {"connector_id": "items", "entity": "items", "action": "list", "params": {"limit": 1}})
+
+    assert len(manager.created) == 1
+    manager.created[0].warm_up.assert_not_awaited()
+    manager.created[0].close.assert_awaited_once()
@@ -0,0 +1,174 @@
+"""Test multi-worker serving: shared config cache, probes and the supervisor."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from airbyte_agent_mcp._vendored.connector_sdk.config_loader import _CONFIG_CACHE, load_connector_config
+from airbyte_agent_mcp.__main__ import main
+from airbyte_agent_mcp.concurrency import InFlightLimiter
+from airbyte_agent_mcp.connector_manager import ConnectorManager
+from airbyte_agent_mcp.models import Config
+from airbyte_agent_mcp.server import mcp
+from airbyte_agent_mcp.workers import describe_exit, worker_rss_mb
+
+CONNECTOR_YAML = """
+openapi: 3.1.0
+info:
+  title: Mock
+  version: 1.0.0
+  x-airbyte-connector-name: mock
+  x-airbyte-external-documentation-urls:
+    - type: other
+      title: Airbyte Documentation
+      url: https://docs.airbyte.com/
+servers:
+  - url: https://api.example.com
+paths:
+  /items:
+    get:
+      operationId: items_List
+      x-airbyte-entity: items
+      x-airbyte-action: list
+      responses:
+        "200":
+          description: Success
+"""
+
+
+def test_connector_config_is_parsed_once_and_reparsed_on_change(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+
+    first = load_connector_config(path)
+    assert load_connector_config(str(path)) is first
+
+    path.write_text(CONNECTOR_YAML.replace("title: Mock", "title: Mock v2"))
+    assert load_connector_config(path) is not first
+
+
+@pytest.mark.asyncio
+async def test_catalog_build_parses_local_connectors_before_forking(tmp_path):
+    path = tmp_path / "connector.yaml"
+    path.write_text(CONNECTOR_YAML)
+    config = Config(
+        connectors=[
+            {"id": "mock", "type": "local", "path": str(path)},
+            {"id": "missing", "type": "local", "path": str(tmp_path / "missing.yaml")},
+        ]
+    )
+
+    load_times = await ConnectorManager(config, secrets_manager=None, registry_client=MagicMock()).catalog.build()
+
+    assert load_times["mock"] is not None and load_times["missing"] is None
+    # Workers forked afterwards inherit the parsed definition
+    assert path.resolve() in _CONFIG_CACHE
+
+
+@pytest.mark.asyncio
+async def test_health_and_readiness_probes(monkeypatch):
+    monkeypatch.setattr(mcp, "connector_manager", None, raising=False)
+    monkeypatch.setattr(mcp, "limiter", InFlightLimiter(max_in_flight=1, max_queued=0))
+    monkeypatch.setattr(mcp, "draining", False)
+
+    transport = httpx.ASGITransport(app=mcp.http_app(stateless_http=True))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/healthz")).json()["status"] == "ok"
+        response = await client.get("/readyz")
+        assert (response.status_code, response.json()["status"]) == (503, "not initialized")
+
+        mcp.connector_manager = object()
+        assert (await client.get("/readyz")).status_code == 200
+
+        async with mcp.limiter.slot():
+            response = await client.get("/readyz")
+            assert (response.status_code, response.json()["status"]) == (503, "saturated")
+
+        mcp.draining = True
+        assert (await client.get("/readyz")).json()["status"] == "draining"
+
+
+def test_cli_rejects_workers_without_http():
+    with pytest.raises(SystemExit):
+        main(["--workers", "2"])
+
+
+def test_worker_process_helpers():
+    rss = worker_rss_mb(os.getpid())
+    assert rss is None or rss > 0
+
+    child = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    _, status = os.waitpid(child.pid, 0)
+    assert describe_exit(status) == "exit code 3"
+
+
+SUPERVISOR_SCRIPT = """
+import logging, os, sys
+from airbyte_agent_mcp.workers import WorkerSupervisor
+
+logging.basicConfig(level=logging.INFO)
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({{"type": "http.response.start", "status": 200, "headers": []}})
+    await send({{"type": "http.response.body", "body": str(os.getpid()).encode()}})
+
+WorkerSupervisor(lambda: app, port={port}, workers=2, check_interval=0.1, graceful_timeout=2).run()
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _worker_pids(url: str, attempts: int = 20) -> set[int]:
+    pids = set()
+    deadline = time.monotonic() + 15
+    while len(pids) < 2 and time.monotonic() < deadline:
+        try:
+            # A new connection per request, so the kernel spreads them over the workers
+            pids |= {int(httpx.get(url, timeout=1).text) for _ in range(attempts)}
+        except httpx.TransportError:
+            time.sleep(0.1)
+    return pids
+
+
+def test_supervisor_restarts_crashed_workers_and_drains_on_sigterm():
+    port = _free_port()
+    script = textwrap.dedent(SUPERVISOR_SCRIPT.format(port=port))
+    supervisor = subprocess.Popen([sys.executable, "-c", script], stderr=subprocess.PIPE, text=True)
+    try:
+        url = f"http://127.0.0.1:{port}/"
+        pids = _worker_pids(url)
+        assert len(pids) == 2
+
+        crashed = pids.pop()
+        os.kill(crashed, signal.SIGKILL)
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            current = _worker_pids(url)
+            if crashed not in current and len(current) == 2:
+                break
+        assert crashed not in current and len(current) == 2
+
+        supervisor.send_signal(signal.SIGTERM)
+        _, stderr = supervisor.communicate(timeout=15)
+    finally:
+        if supervisor.poll() is None:
+            supervisor.kill()
+            supervisor.wait()
+
+    assert supervisor.returncode == 0
+    assert f"Worker {crashed} exited with signal SIGKILL" in stderr
+    assert "All workers stopped" in stderr